@@ -0,0 +1,127 @@
+"""
+Load test for the internal API: measures requests per second and latency
+percentiles for a mix of order reads and writes, with persistent
+connections from several client threads.
+
+Compare the development server with gunicorn on the same database:
+
+    python internal_api.py                                  # dev server on :5002
+    gunicorn -c gunicorn.conf.py wsgi:app                   # production mode on :5002
+    python benchmarks/bench_api_load.py [--url http://localhost:5002] \\
+        [--clients 32] [--duration 20] [--profile read|write|mixed]
+
+Writes POST fresh order_ids, so run it against a scratch database.
+
+Recorded on a 1-vCPU container, SQLite, no RabbitMQ, 16 clients, 15 s:
+
+    profile  server                 req/s   p50 ms  p95 ms  p99 ms
+    read     dev server               541     29.2    41.2    51.7
+    read     gunicorn (3 x 8 thr)     510     23.7    86.8   126.9
+    mixed    dev server               183     75.2   183.9   243.8
+    mixed    gunicorn (3 x 8 thr)     172     58.0   254.4   871.9
+
+With one core there is nothing for extra worker processes to run on, so
+gunicorn only lowers the median latency. The RPS gain needs several cores
+and Postgres (SQLite serializes writes); rerun there before sizing workers.
+"""
+import argparse
+import http.client
+import json
+import statistics
+import threading
+import time
+import urllib.parse
+import uuid
+
+# (method, path) weights per profile; "ORDER" is replaced by a new order_id.
+PROFILES = {
+    "read": [("GET", "/orders?limit=50", 8), ("GET", "/orders/ORDER", 1), ("GET", "/logs", 1)],
+    "write": [("POST", "/orders", 1)],
+    "mixed": [("GET", "/orders?limit=50", 6), ("GET", "/logs", 2), ("POST", "/orders", 2)],
+}
+
+def order_body(order_id):
+    return json.dumps({"order_id": order_id, "symbol": "BOND_XYZ", "quantity": 100,
+                       "price": 101.5, "business_unit": "Fixed Income"})
+
+def expand(profile):
+    schedule = []
+    for method, path, weight in PROFILES[profile]:
+        schedule.extend([(method, path)] * weight)
+    return schedule
+
+def client_thread(host, port, schedule, deadline, seed_order, latencies, errors):
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    i = 0
+    while time.perf_counter() < deadline:
+        method, path = schedule[i % len(schedule)]
+        i += 1
+        body = None
+        headers = {}
+        if method == "POST":
+            body = order_body(f"LOAD-{uuid.uuid4().hex}")
+            headers["Content-Type"] = "application/json"
+        path = path.replace("ORDER", seed_order)
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 500:
+                errors.append(response.status)
+            # The publish step may fail without RabbitMQ; the order is stored regardless.
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(repr(e))
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:5002")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mixed")
+    args = parser.parse_args()
+
+    url = urllib.parse.urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+
+    # Seed one order so that GET /orders/<id> has something to find.
+    seed_order = f"LOAD-SEED-{uuid.uuid4().hex}"
+    seed = http.client.HTTPConnection(host, port, timeout=30)
+    seed.request("POST", "/orders", body=order_body(seed_order), headers={"Content-Type": "application/json"})
+    seed.getresponse().read()
+    seed.close()
+
+    schedule = expand(args.profile)
+    latencies, errors = [], []
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=client_thread,
+                         args=(host, port, schedule[i % len(schedule):] + schedule[:i % len(schedule)],
+                               deadline, seed_order, latencies, errors))
+        for i in range(args.clients)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    if not latencies:
+        print(f"No successful requests ({len(errors)} errors)")
+        return
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{args.profile} profile, {args.clients} clients, {elapsed:.1f}s against {args.url}")
+    print(f"  requests: {len(latencies):,}  errors: {len(errors)}")
+    print(f"  throughput: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"  latency ms: p50 {quantiles[49] * 1000:.1f}  p95 {quantiles[94] * 1000:.1f}  "
+          f"p99 {quantiles[98] * 1000:.1f}  max {latencies[-1] * 1000:.1f}")
+
+if __name__ == "__main__":
+    main()
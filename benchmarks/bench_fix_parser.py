@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: simplefix.FixParser versus fix_parser.FixFrameParser.
+
+Frames a corpus of NewOrderSingle messages fed in 4096-byte chunks and reads
+the tags the order pipeline actually uses (11, 34, 38, 44, 49, 55).
+
+    python benchmarks/bench_fix_parser.py [message_count]   # default 1,000,000
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simplefix
+from fix_core import build_order_message
+from fix_parser import FixFrameParser
+
+CHUNK_SIZE = 4096
+TAGS = (11, 34, 38, 44, 49, 55)
+
+def build_corpus(count):
+    # Encoding a million messages through simplefix is slow, so repeat a
+    # block of distinct messages instead.
+    block = b"".join(build_order_message(f"ORDER{i}", "BOND_XYZ", str(100 + i), "101.50") for i in range(1000))
+    repeats, remainder = divmod(count, 1000)
+    corpus = block * repeats
+    if remainder:
+        corpus += b"".join(build_order_message(f"ORDER{i}", "BOND_XYZ", "100", "101.50") for i in range(remainder))
+    return corpus
+
+def chunks(corpus):
+    view = memoryview(corpus)
+    for start in range(0, len(corpus), CHUNK_SIZE):
+        yield view[start:start + CHUNK_SIZE]
+
+def run_simplefix(corpus):
+    parser = simplefix.FixParser()
+    count = 0
+    for chunk in chunks(corpus):
+        parser.append_buffer(bytes(chunk))
+        while (msg := parser.get_message()) is not None:
+            for tag in TAGS:
+                msg.get(tag)
+            count += 1
+    return count
+
+def run_frame_parser(corpus):
+    parser = FixFrameParser()
+    count = 0
+    for chunk in chunks(corpus):
+        parser.append_buffer(chunk)
+        while (frame := parser.get_message()) is not None:
+            for tag in TAGS:
+                frame.get(tag)
+            count += 1
+    return count
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    corpus = build_corpus(count)
+    print(f"Corpus: {count:,} messages, {len(corpus) / 1e6:.1f} MB")
+    for name, run in (("simplefix.FixParser", run_simplefix), ("FixFrameParser", run_frame_parser)):
+        started = time.perf_counter()
+        parsed = run(corpus)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<22} {parsed:>10,} msgs  {elapsed:7.2f} s  {parsed / elapsed:>12,.0f} msgs/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Micro-benchmark: simplefix.FixMessage encoding versus fix_templates.MessageTemplate.
+
+Encodes NewOrderSingle, ExecutionReport and Heartbeat messages with the same
+field values both ways.
+
+    python benchmarks/bench_fix_templates.py [message_count]   # default 200,000
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import simplefix
+from fix_core import EXECUTION_REPORT_TEMPLATE, HEARTBEAT_TEMPLATE, NEW_ORDER_SINGLE_TEMPLATE
+from fix_templates import utc_timestamp
+
+def simplefix_order(i):
+    msg = simplefix.FixMessage()
+    msg.append_pair(8, "FIX.4.2")
+    msg.append_pair(35, "D")
+    msg.append_pair(11, f"ORDER{i}")
+    msg.append_pair(34, i)
+    msg.append_pair(49, "SENDER")
+    msg.append_pair(56, "TARGET")
+    msg.append_utc_timestamp(52)
+    msg.append_pair(55, "BOND_XYZ")
+    msg.append_pair(38, "100")
+    msg.append_pair(44, "101.50")
+    msg.append_pair(98, "0")
+    msg.append_pair(108, "30")
+    return msg.encode()
+
+def template_order(i):
+    return NEW_ORDER_SINGLE_TEMPLATE.encode(order_id=f"ORDER{i}", msg_seq_num=i, sending_time=utc_timestamp(),
+                                            symbol="BOND_XYZ", quantity="100", price="101.50")
+
+def simplefix_execution_report(i):
+    msg = simplefix.FixMessage()
+    msg.append_pair(8, "FIX.4.2")
+    msg.append_pair(35, "8")
+    msg.append_pair(11, b"ORDER1")
+    msg.append_pair(34, i)
+    msg.append_pair(17, "EXEC456")
+    msg.append_pair(39, "2")
+    msg.append_pair(150, "F")
+    msg.append_pair(55, b"BOND_XYZ")
+    msg.append_pair(38, b"100")
+    msg.append_pair(44, b"101.50")
+    return msg.encode()
+
+def template_execution_report(i):
+    return EXECUTION_REPORT_TEMPLATE.encode(cl_ord_id=b"ORDER1", msg_seq_num=i, symbol=b"BOND_XYZ",
+                                            quantity=b"100", price=b"101.50")
+
+def simplefix_heartbeat(i):
+    msg = simplefix.FixMessage()
+    msg.append_pair(8, "FIX.4.2")
+    msg.append_pair(35, "0")
+    msg.append_utc_timestamp(52)
+    return msg.encode()
+
+def template_heartbeat(i):
+    return HEARTBEAT_TEMPLATE.encode(sending_time=utc_timestamp())
+
+CASES = (
+    ("NewOrderSingle", simplefix_order, template_order),
+    ("ExecutionReport", simplefix_execution_report, template_execution_report),
+    ("Heartbeat", simplefix_heartbeat, template_heartbeat),
+)
+
+def measure(encode, count):
+    started = time.perf_counter()
+    for i in range(count):
+        encode(i)
+    return time.perf_counter() - started
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for name, baseline, template in CASES:
+        for label, encode in (("FixMessage", baseline), ("MessageTemplate", template)):
+            elapsed = measure(encode, count)
+            print(f"{name:<16} {label:<16} {elapsed:7.2f} s  {count / elapsed:>12,.0f} msgs/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Micro-benchmark: encoding and decoding realistic order payloads with every
+serializer backend installed (stdlib json, orjson, msgspec), plus typed
+decoding into serializer.Order.
+
+    python benchmarks/bench_serializers.py [iterations]   # default 100,000
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import serializer
+
+def make_order(i):
+    # The shape published to RabbitMQ: transformed FIX fields plus enrichment.
+    return {
+        "order_id": f"ORDER{i}",
+        "symbol": "BOND_XYZ",
+        "quantity": 100 + i % 50,
+        "price": 101.5 + i % 7 / 8,
+        "transact_time": "20250214-12:30:00.000",
+        "business_unit": "BU-001",
+        "trader_id": "TRADER001",
+        "risk_category": "LOW",
+        "processed_timestamp": "2025-02-14T12:30:00.123456+00:00",
+    }
+
+def bench(label, func, argument, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(argument)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {iterations / elapsed:>12,.0f} ops/s  {elapsed / iterations * 1e6:8.2f} us/op")
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    order = make_order(1)
+    page = {"status": "success", "orders": [make_order(i) for i in range(100)], "next_cursor": None}
+    page_iterations = max(1, iterations // 100)
+
+    for backend in sorted(serializer.CODECS):
+        dumps, loads = serializer.CODECS[backend]
+        print(f"{backend}:")
+        bench("dumps order", dumps, order, iterations)
+        bench("loads order", loads, dumps(order), iterations)
+        bench("dumps 100-order page", dumps, page, page_iterations)
+        bench("loads 100-order page", loads, dumps(page), page_iterations)
+
+    typed = "msgspec" if serializer.msgspec is not None and serializer.BACKEND != "json" else "dict + dataclass"
+    print(f"typed decoding into serializer.Order ({typed}):")
+    bench("decode_order", serializer.decode_order, serializer.dumps(order), iterations)
+    bench("decode_orders (100)", serializer.decode_orders, serializer.dumps(page["orders"]), page_iterations)
+
+if __name__ == "__main__":
+    main()
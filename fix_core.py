@@ -1,27 +1,69 @@
-import simplefix
-import time
+from fix_parser import as_message_view
+from fix_session import SequenceCounter, get_msg_seq_num
+from fix_templates import Field, MessageTemplate, utc_timestamp
 
-# Global sequence number for outgoing messages
-sequence_number = 1
+# Sequence number for outgoing messages (thread-safe, reset in forked children)
+outgoing_sequence = SequenceCounter()
+
+# Precompiled message layouts: only the Field placeholders are encoded per message.
+NEW_ORDER_SINGLE_TEMPLATE = MessageTemplate("D", [
+    (11, Field("order_id")),
+    (34, Field("msg_seq_num")),
+    (49, "SENDER"),
+    (56, "TARGET"),
+    (52, Field("sending_time")),
+    (55, Field("symbol")),
+    (38, Field("quantity")),
+    (44, Field("price")),
+    (98, "0"),
+    (108, "30"),
+])
+
+EXECUTION_REPORT_TEMPLATE = MessageTemplate("8", [
+    (11, Field("cl_ord_id")),
+    (34, Field("msg_seq_num", optional=True)),  # Echo the sequence number
+    (17, "EXEC456"),                            # ExecID
+    (39, "2"),                                  # OrdStatus: Filled
+    (150, "F"),                                 # ExecType: Fill
+    (55, Field("symbol", optional=True)),
+    (38, Field("quantity", optional=True)),
+    (44, Field("price", optional=True)),
+])
+
+HEARTBEAT_TEMPLATE = MessageTemplate("0", [
+    (52, Field("sending_time")),
+])
 
 def build_order_message(order_id, symbol, quantity, price):
-    global sequence_number
-    msg = simplefix.FixMessage()
-    msg.append_pair(8, "FIX.4.2")
-    msg.append_pair(35, "D")
-    msg.append_pair(11, order_id)
-    msg.append_pair(34, str(sequence_number))
-    msg.append_pair(49, "SENDER")
-    msg.append_pair(56, "TARGET")
-    msg.append_utc_timestamp(52)
-    msg.append_pair(55, symbol)
-    msg.append_pair(38, quantity)
-    msg.append_pair(44, price)
-    msg.append_pair(98, "0")
-    msg.append_pair(108, "30")
-    sequence_number += 1
-    return msg.encode()
+    return NEW_ORDER_SINGLE_TEMPLATE.encode(
+        order_id=order_id,
+        msg_seq_num=outgoing_sequence.next(),
+        sending_time=utc_timestamp(),
+        symbol=symbol,
+        quantity=quantity,
+        price=price,
+    )
+
+def build_execution_report(order_msg):
+    """
+    Build an Execution Report FIX message in response to an order message.
+    Reads ClOrdID, MsgSeqNum and the order details from the message's tag index.
+    """
+    order_msg = as_message_view(order_msg)
+    return EXECUTION_REPORT_TEMPLATE.encode(
+        cl_ord_id=order_msg.get(11) or "UNKNOWN",
+        msg_seq_num=get_msg_seq_num(order_msg, invalid=0),
+        # Copy order details: Symbol (55), OrderQty (38), Price (44)
+        symbol=order_msg.get(55),
+        quantity=order_msg.get(38),
+        price=order_msg.get(44),
+    )
+
+def build_heartbeat():
+    """
+    Build an encoded Heartbeat FIX message.
+    """
+    return HEARTBEAT_TEMPLATE.encode(sending_time=utc_timestamp())
 
 def reset_sequence():
-    global sequence_number
-    sequence_number = 1
\ No newline at end of file
+    outgoing_sequence.reset()
\ No newline at end of file
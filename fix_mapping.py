@@ -0,0 +1,170 @@
+import datetime
+import json
+import logging
+import os
+
+from fix_parser import as_message_view
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAPPING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fix_mapping.json")
+
+# Supported field types. Each name is also the cast applied to the raw tag value.
+FIELD_TYPES = {"str", "int", "float"}
+
+def _utc_now_isoformat():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+class MappingSpec:
+    """
+    One tag mapping: the fields read from the message (tag, name, type and
+    default, in output order) and the constant enrichment fields.
+    """
+
+    def __init__(self, fields, enrichment=None):
+        self.fields = []
+        for field in fields:
+            field_type = field.get("type", "str")
+            if field_type not in FIELD_TYPES:
+                raise ValueError(f"Unsupported type {field_type!r} for field {field.get('name')!r}")
+            self.fields.append({
+                "tag": int(field["tag"]),
+                "name": field["name"],
+                "type": field_type,
+                "default": field.get("default"),
+            })
+        self.enrichment = dict(enrichment or {})
+
+    def merged(self, override):
+        """
+        Returns a spec for a counterparty: its fields replace these fields if
+        given, and its enrichment values are applied over these.
+        """
+        enrichment = dict(self.enrichment)
+        enrichment.update(override.get("enrichment", {}))
+        return MappingSpec(override.get("fields", self.fields), enrichment)
+
+
+def _guarded_transform(spec, now):
+    """
+    The slow path of a compiled mapping: casts each numeric field on its own,
+    so a value that does not convert only falls back to its field's default.
+    """
+    casts = {"int": int, "float": float}
+
+    def transform(msg):
+        result = {}
+        for field in spec.fields:
+            value = msg.get(field["tag"])
+            if value is None:
+                value = field["default"]
+            elif field["type"] == "str":
+                if value.__class__ is bytes:
+                    value = value.decode("ascii")
+            else:
+                try:
+                    value = casts[field["type"]](value)
+                except (ValueError, TypeError):
+                    value = field["default"]
+            result[field["name"]] = value
+        result.update(spec.enrichment)
+        result["processed_timestamp"] = now()
+        return result
+
+    return transform
+
+def compile_mapping(spec, now=_utc_now_isoformat):
+    """
+    Generates a transform function specialised for spec. Tags, casts and
+    defaults are written into the function body, so a message costs one
+    lookup per mapped tag plus the casts, and builds the result in a single
+    dict display. All casts share one guard: a message with a value that
+    does not convert is handed to the field-by-field slow path.
+    """
+    namespace = {"_now": now, "_slow": _guarded_transform(spec, now)}
+    lines = ["def transform(msg):", "    get = msg.get"]
+    casts = []
+    items = []
+    for index, field in enumerate(spec.fields):
+        default = f"_default{index}"
+        namespace[default] = field["default"]
+        target = f"field{index}"
+        if field["type"] == "str":
+            lines.append(f"    value = get({field['tag']})")
+            lines.append(f"    {target} = {default} if value is None else "
+                         f"(value.decode('ascii') if value.__class__ is bytes else value)")
+        else:
+            lines.append(f"    value{index} = get({field['tag']})")
+            casts.append(f"        {target} = {default} if value{index} is None else {field['type']}(value{index})")
+        items.append(f"{field['name']!r}: {target}")
+    if casts:
+        lines += ["    try:", *casts, "    except (ValueError, TypeError):", "        return _slow(msg)"]
+    for index, (name, value) in enumerate(spec.enrichment.items()):
+        constant = f"_enrichment{index}"
+        namespace[constant] = value
+        items.append(f"{name!r}: {constant}")
+    items.append("'processed_timestamp': _now()")
+    lines.append("    return {" + ", ".join(items) + "}")
+    source = "\n".join(lines)
+    exec(compile(source, "<fix_mapping>", "exec"), namespace)
+    transform = namespace["transform"]
+    transform.source = source
+    return transform
+
+
+class MappingRegistry:
+    """
+    Compiled transforms keyed by SenderCompID (tag 49). Messages from a
+    counterparty without its own mapping use the default mapping.
+    """
+
+    def __init__(self, default_spec, counterparty_specs=None):
+        self.default_spec = default_spec
+        self.default = compile_mapping(default_spec)
+        # Keyed by the raw tag value, so choosing a mapping is one dict hit.
+        self._by_comp_id = {}
+        self._specs_by_comp_id = {}
+        for comp_id, spec in (counterparty_specs or {}).items():
+            transform = compile_mapping(spec)
+            for key in (comp_id, comp_id.encode("ascii")):
+                self._by_comp_id[key] = transform
+                self._specs_by_comp_id[key] = spec
+
+    def spec_for(self, comp_id):
+        """
+        Returns the MappingSpec used for messages with SenderCompID comp_id (str, bytes or None).
+        """
+        return self._specs_by_comp_id.get(comp_id, self.default_spec)
+
+    def transform(self, msg):
+        """
+        Transforms a parsed FIX message with its counterparty's mapping.
+        """
+        msg = as_message_view(msg)
+        return self._by_comp_id.get(msg.get(49), self.default)(msg)
+
+    @classmethod
+    def from_config(cls, config):
+        default_spec = MappingSpec(**config["default"])
+        counterparty_specs = {
+            comp_id: default_spec.merged(override)
+            for comp_id, override in config.get("counterparties", {}).items()
+        }
+        return cls(default_spec, counterparty_specs)
+
+
+def load_mappings(path=None):
+    """
+    Loads and compiles the mapping config at path, FIX_MAPPING_CONFIG, or the
+    bundled fix_mapping.json.
+    """
+    path = path or os.environ.get("FIX_MAPPING_CONFIG", DEFAULT_MAPPING_PATH)
+    with open(path) as config_file:
+        config = json.load(config_file)
+    registry = MappingRegistry.from_config(config)
+    logger.info(f"Loaded FIX mappings from {path} ({len(config.get('counterparties', {}))} counterparty overrides)")
+    return registry
+
+__all__ = ["MappingSpec", "MappingRegistry", "compile_mapping", "load_mappings"]
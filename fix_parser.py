@@ -0,0 +1,223 @@
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+SOH = b"\x01"
+BEGIN_STRING = b"8=FIX"
+BODY_LENGTH = b"\x019="
+CHECKSUM = b"10="
+# "10=" + three digits + SOH
+CHECKSUM_FIELD_LENGTH = 7
+
+DEFAULT_BUFFER_SIZE = 4096
+DEFAULT_MAX_MESSAGE_SIZE = 1024 * 1024
+
+# Cached in FixFrame._fields for tags the message does not contain.
+_ABSENT = object()
+
+class FixFrame:
+    """
+    A complete FIX message as one bytes object. Fields are only located and
+    sliced out when they are read, and each tag is looked up at most once.
+    Iterating yields (tag, value) pairs like simplefix.FixMessage.
+    """
+
+    __slots__ = ("raw", "_fields")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._fields = {}
+
+    def get(self, tag: int, default=None):
+        """
+        Returns the value of the first occurrence of tag as bytes, or default.
+        """
+        value = self._fields.get(tag)
+        if value is not None:
+            return default if value is _ABSENT else value
+        raw = self.raw
+        marker = b"\x01%d=" % tag
+        if raw.startswith(marker[1:]):
+            start = len(marker) - 1
+        else:
+            pos = raw.find(marker)
+            if pos < 0:
+                self._fields[tag] = _ABSENT
+                return default
+            start = pos + len(marker)
+        value = raw[start:raw.index(SOH, start)]
+        self._fields[tag] = value
+        return value
+
+    def __iter__(self):
+        for field in self.raw.split(SOH)[:-1]:
+            tag, _, value = field.partition(b"=")
+            yield int(tag), value
+
+    def __bytes__(self):
+        return self.raw
+
+    def __repr__(self):
+        return f"FixFrame({self.raw.replace(SOH, b'|')!r})"
+
+
+class FixMessageView:
+    """
+    Tag -> value index over a parsed message (e.g. a simplefix.FixMessage),
+    built in a single pass so that every later lookup is a dict hit. As with
+    FixFrame, the first occurrence of a repeated tag wins and iterating yields
+    the original (tag, value) pairs.
+    """
+
+    __slots__ = ("pairs", "fields")
+
+    def __init__(self, pairs):
+        self.pairs = list(pairs)
+        # Building from the reversed pairs lets the first occurrence win.
+        self.fields = dict(reversed(self.pairs))
+
+    def get(self, tag: int, default=None):
+        return self.fields.get(tag, default)
+
+    def __iter__(self):
+        return iter(self.pairs)
+
+    def __repr__(self):
+        return f"FixMessageView({self.pairs!r})"
+
+
+def as_message_view(msg):
+    """
+    Returns msg if it already supports indexed access, otherwise indexes it once.
+    """
+    if isinstance(msg, (FixFrame, FixMessageView)):
+        return msg
+    return FixMessageView(msg)
+
+
+class FixFrameParser:
+    """
+    Streaming FIX framer over a reusable receive buffer. Data is read straight
+    into the buffer (recv_into, or asyncio's BufferedProtocol), frames are
+    delimited using BodyLength (9) and CheckSum (10), and each complete frame
+    is copied out once as a FixFrame.
+    """
+
+    def __init__(self, buffer_size=DEFAULT_BUFFER_SIZE, max_message_size=DEFAULT_MAX_MESSAGE_SIZE,
+                 validate_checksum=True):
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # First byte not yet consumed.
+        self._end = 0    # End of the received data.
+        self.max_message_size = max_message_size
+        self.validate_checksum = validate_checksum
+
+    def _make_room(self):
+        if self._start == self._end:
+            self._start = self._end = 0
+        size = len(self._buffer)
+        if size - self._end >= size // 4:
+            return
+        pending = self._end - self._start
+        if self._start > 0:
+            # Move the partial frame to the front of the buffer.
+            self._buffer[0:pending] = self._buffer[self._start:self._end]
+        elif self._end < size:
+            return
+        else:
+            # A single frame is larger than the buffer: grow it.
+            self._view.release()
+            grown = bytearray(len(self._buffer) * 2)
+            grown[0:pending] = self._buffer[0:pending]
+            self._buffer = grown
+            self._view = memoryview(self._buffer)
+        self._start, self._end = 0, pending
+
+    def get_buffer(self, sizehint=-1):
+        """
+        Returns a writable view of the free space in the receive buffer.
+        """
+        self._make_room()
+        return self._view[self._end:]
+
+    def buffer_updated(self, nbytes):
+        """
+        Records that nbytes were written into the view returned by get_buffer().
+        """
+        self._end += nbytes
+
+    def recv_into(self, sock):
+        """
+        Receives directly from a socket into the buffer. Returns the number
+        of bytes read; zero means the peer closed the connection.
+        """
+        nbytes = sock.recv_into(self.get_buffer())
+        self.buffer_updated(nbytes)
+        return nbytes
+
+    def append_buffer(self, data):
+        """
+        Copies already received bytes into the buffer.
+        """
+        data = memoryview(data)
+        while data:
+            free = self.get_buffer()
+            count = min(len(free), len(data))
+            free[:count] = data[:count]
+            self.buffer_updated(count)
+            data = data[count:]
+
+    def get_message(self):
+        """
+        Returns the next complete FixFrame, or None if more data is needed.
+        """
+        buf = self._buffer
+        while True:
+            start = buf.find(BEGIN_STRING, self._start, self._end)
+            if start < 0:
+                # Keep a trailing partial "8=FIX" that may start the next frame.
+                self._start = max(self._start, self._end - len(BEGIN_STRING) + 1)
+                return None
+            self._start = start
+            # BodyLength must immediately follow BeginString.
+            length_tag = buf.find(SOH, start, self._end)
+            if length_tag < 0 or length_tag + len(BODY_LENGTH) > self._end:
+                return None
+            if buf[length_tag:length_tag + len(BODY_LENGTH)] != BODY_LENGTH:
+                logger.warning("Discarding FIX data: BodyLength (9) does not follow BeginString (8)")
+                self._start = start + 1
+                continue
+            length_start = length_tag + len(BODY_LENGTH)
+            length_end = buf.find(SOH, length_start, self._end)
+            if length_end < 0:
+                return None
+            try:
+                body_length = int(buf[length_start:length_end])
+            except ValueError:
+                body_length = -1
+            if body_length < 0 or body_length > self.max_message_size:
+                logger.warning("Discarding FIX data with an invalid BodyLength (9)")
+                self._start = start + 1
+                continue
+            checksum_start = length_end + 1 + body_length
+            frame_end = checksum_start + CHECKSUM_FIELD_LENGTH
+            if frame_end > self._end:
+                return None
+            if (buf[checksum_start:checksum_start + len(CHECKSUM)] != CHECKSUM
+                    or buf[frame_end - 1] != SOH[0]):
+                logger.warning("Discarding FIX data: CheckSum (10) not found where BodyLength (9) says")
+                self._start = start + 1
+                continue
+            raw = bytes(self._view[start:frame_end])
+            self._start = frame_end
+            if self.validate_checksum:
+                expected = raw[-4:-1]
+                actual = b"%03d" % (sum(raw[:-CHECKSUM_FIELD_LENGTH]) % 256)
+                if expected != actual:
+                    logger.warning(f"Discarding FIX message with bad CheckSum {expected!r} (computed {actual!r})")
+                    continue
+            return FixFrame(raw)
+
+__all__ = ["FixFrame", "FixFrameParser", "FixMessageView", "as_message_view"]
@@ -6,8 +6,10 @@ import time
 import logging
 
 from fix_core import build_order_message  # For building orders if needed
+from fix_core import build_execution_report, build_heartbeat  # Shared FIX message builders
+from fix_parser import FixMessageView  # Single-pass tag index over parsed messages
 from fix_transform import transform_fix_to_json  # Transformation logic
-from rabbitmq_publisher import publish_order  # RabbitMQ publishing function
+from publish_queue import get_publish_queue, PublishQueueFull  # Asynchronous RabbitMQ publishing
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -16,60 +18,29 @@ logger = logging.getLogger(__name__)
 # Set heartbeat interval (seconds)
 HEARTBEAT_INTERVAL = 5
 
-def build_execution_report(order_msg):
-    """
-    Build an Execution Report FIX message in response to an order message.
-    """
-    cl_ord_id = None
-    msg_seq_num = None
-    for tag, value in order_msg:
-        if tag == 11:
-            cl_ord_id = value
-        elif tag == 34:
-            try:
-                msg_seq_num = int(value)
-            except ValueError:
-                msg_seq_num = 0
-    exec_msg = simplefix.FixMessage()
-    exec_msg.append_pair(8, "FIX.4.2")
-    exec_msg.append_pair(35, "8")  # Execution Report
-    exec_msg.append_pair(11, cl_ord_id if cl_ord_id else "UNKNOWN")
-    if msg_seq_num is not None:
-        exec_msg.append_pair(34, str(msg_seq_num))
-    exec_msg.append_pair(17, "EXEC456")
-    exec_msg.append_pair(39, "2")
-    exec_msg.append_pair(150, "F")
-    for tag in [55, 38, 44]:
-        for t, v in order_msg:
-            if t == tag:
-                exec_msg.append_pair(tag, v)
-                break
-    return exec_msg.encode()
-
 def send_heartbeat(conn):
     """
     Sends a heartbeat message to the connected FIX client.
     """
-    hb_msg = simplefix.FixMessage()
-    hb_msg.append_pair(8, "FIX.4.2")
-    hb_msg.append_pair(35, "0")  # Heartbeat message
-    hb_msg.append_utc_timestamp(52)
     try:
-        conn.sendall(hb_msg.encode())
+        conn.sendall(build_heartbeat())
         logger.info("Sent Heartbeat.")
     except Exception as e:
         logger.error(f"Error sending heartbeat: {e}")
 
-def process_order(msg):
+def process_order(msg, block=True):
     """
-    Transforms the FIX message into enriched JSON data and publishes it to RabbitMQ.
+    Transforms the FIX message into enriched JSON data and queues it for
+    publishing to RabbitMQ. The publish itself happens on the publish queue's
+    worker thread, so a slow broker never stalls the FIX session. With
+    block=False a full queue never makes the caller wait.
     """
     enriched_data = transform_fix_to_json(msg)
     try:
-        publish_order(enriched_data)
-        logger.info("Published to RabbitMQ: %s", enriched_data.get("order_id"))
-    except Exception as e:
-        logger.error("Failed to publish to RabbitMQ: %s", e)
+        get_publish_queue().submit(enriched_data, block=block)
+        logger.info("Queued for RabbitMQ: %s", enriched_data.get("order_id"))
+    except PublishQueueFull as e:
+        logger.error("Failed to queue order for RabbitMQ: %s", e)
 
 def handle_client(conn, addr):
     """
@@ -95,6 +66,8 @@ def handle_client(conn, addr):
                     msg = parser.get_message()
                     if msg is None:
                         break
+                    # Index the tags once; every step below reads from this view.
+                    msg = FixMessageView(msg)
                     logger.info("Received FIX message:")
                     for tag, value in msg:
                         logger.info(f"  Tag {tag}: {value}")
@@ -0,0 +1,217 @@
+import asyncio
+import functools
+import logging
+import os
+
+from fix_parser import FixFrameParser
+from fix_server import HEARTBEAT_INTERVAL, build_execution_report, build_heartbeat, process_order
+from publish_queue import get_publish_queue
+from fix_transform import transform_fix_to_json
+
+try:
+    import uvloop  # Optional: a faster drop-in event loop.
+except ImportError:
+    uvloop = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# With an async publisher: unconfirmed publishes allowed before sessions stop reading.
+DEFAULT_MAX_IN_FLIGHT = 1000
+
+class FixSessionProtocol(asyncio.BufferedProtocol):
+    """
+    One FIX session on the asyncio acceptor. Runs the same pipeline as
+    fix_server.handle_client (parse, execution report, publish) and sends a
+    heartbeat when nothing has been received for the heartbeat interval.
+    The event loop reads straight into the session's FixFrameParser buffer.
+    """
+
+    def __init__(self, server):
+        self.server = server
+        self.parser = FixFrameParser()
+        self.transport = None
+        self.addr = None
+        self.last_activity = 0.0
+        self.heartbeat_timer = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.addr = transport.get_extra_info("peername")
+        self.server.session_opened()
+        logger.info(f"Connected by {self.addr}")
+        loop = asyncio.get_running_loop()
+        self.last_activity = loop.time()
+        self.heartbeat_timer = loop.call_later(self.server.heartbeat_interval, self._on_heartbeat_timer)
+
+    def get_buffer(self, sizehint):
+        return self.parser.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        # Only record the activity here; the heartbeat timer reschedules itself
+        # lazily, which avoids cancelling and re-arming a timer on every read.
+        self.last_activity = asyncio.get_running_loop().time()
+        self.parser.buffer_updated(nbytes)
+        while True:
+            msg = self.parser.get_message()
+            if msg is None:
+                break
+            logger.debug(f"Received FIX message from {self.addr}: {msg!r}")
+            self.transport.write(build_execution_report(msg))
+            if self.server.publisher is not None:
+                self.server.publish(self, msg)
+            else:
+                # Waiting for room in a full queue would stall every session on
+                # the loop, so a full queue spools (or rejects) instead.
+                process_order(msg, block=False)
+            self.server.messages_received += 1
+
+    def connection_lost(self, exc):
+        if self.heartbeat_timer is not None:
+            self.heartbeat_timer.cancel()
+        self.server.session_closed()
+        if exc is not None:
+            logger.error(f"Error in session for {self.addr}: {exc}")
+        logger.info(f"Client {self.addr} disconnected.")
+
+    def _on_heartbeat_timer(self):
+        loop = asyncio.get_running_loop()
+        idle_until = self.last_activity + self.server.heartbeat_interval
+        if loop.time() >= idle_until:
+            self.transport.write(build_heartbeat())
+            self.server.heartbeats_sent += 1
+            self.last_activity = loop.time()
+            idle_until = self.last_activity + self.server.heartbeat_interval
+        self.heartbeat_timer = loop.call_at(idle_until, self._on_heartbeat_timer)
+
+
+class AsyncFixServer:
+    """
+    Single event loop FIX acceptor. Sessions are asyncio protocols rather
+    than threads, so idle sessions only cost a socket and a timer.
+
+    With a publisher (rabbitmq_async.AsyncRabbitMQPublisher), orders are
+    published from the event loop itself instead of the publish queue's
+    thread. Once max_in_flight publishes await their confirms, sessions
+    stop reading until half of them have been confirmed. Orders that are
+    not confirmed go to spool (by default the publish queue's spool file,
+    which its worker replays), so a broker outage does not lose them.
+    """
+
+    def __init__(self, heartbeat_interval=HEARTBEAT_INTERVAL, publisher=None, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 spool=None):
+        self.heartbeat_interval = heartbeat_interval
+        self.publisher = publisher
+        self.max_in_flight = max_in_flight
+        self._spool = spool or (lambda orders: get_publish_queue().spool(orders))
+        self._in_flight = set()
+        self._paused_sessions = set()
+        self.publish_failures = 0
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self.messages_received = 0
+        self.heartbeats_sent = 0
+
+    def session_opened(self):
+        self.active_sessions += 1
+        self.total_sessions += 1
+
+    def session_closed(self):
+        self.active_sessions -= 1
+
+    def publish(self, session, msg):
+        """
+        Transforms msg and publishes it on the event loop, pausing reads
+        while too many publishes are unconfirmed.
+        """
+        order = transform_fix_to_json(msg)
+        task = asyncio.get_running_loop().create_task(self.publisher.publish(order))
+        self._in_flight.add(task)
+        task.add_done_callback(functools.partial(self._on_published, order))
+        if len(self._in_flight) >= self.max_in_flight and session not in self._paused_sessions:
+            session.transport.pause_reading()
+            self._paused_sessions.add(session)
+
+    def _on_published(self, order, task):
+        self._in_flight.discard(task)
+        error = "cancelled" if task.cancelled() else task.exception()
+        if error is not None:
+            self.publish_failures += 1
+            logger.error(f"Failed to publish order {order.get('order_id')}: {error}; spooling it for replay")
+            try:
+                self._spool([order])
+            except OSError as e:
+                logger.error(f"Failed to spool order {order.get('order_id')}: {e}")
+        if self._paused_sessions and len(self._in_flight) <= self.max_in_flight // 2:
+            paused, self._paused_sessions = self._paused_sessions, set()
+            for session in paused:
+                if not session.transport.is_closing():
+                    session.transport.resume_reading()
+
+    def stats(self):
+        return {
+            "active_sessions": self.active_sessions,
+            "total_sessions": self.total_sessions,
+            "messages_received": self.messages_received,
+            "heartbeats_sent": self.heartbeats_sent,
+            "publishes_in_flight": len(self._in_flight),
+            "publish_failures": self.publish_failures,
+        }
+
+    async def start(self, host='localhost', port=6000, sock=None):
+        """
+        Starts accepting connections and returns the asyncio server.
+        Either binds host/port or uses an already bound listening socket.
+        """
+        loop = asyncio.get_running_loop()
+        factory = lambda: FixSessionProtocol(self)
+        if sock is not None:
+            server = await loop.create_server(factory, sock=sock, backlog=1024)
+        else:
+            server = await loop.create_server(factory, host, port, reuse_address=True, backlog=1024)
+        for listening in server.sockets:
+            logger.info(f"Server listening on {listening.getsockname()}")
+        return server
+
+    async def serve_forever(self, host='localhost', port=6000, sock=None):
+        server = await self.start(host, port, sock=sock)
+        async with server:
+            await server.serve_forever()
+
+
+def run_event_loop(coro):
+    """
+    Runs a coroutine to completion on uvloop if it is installed, otherwise on asyncio's default loop.
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+async def serve(host='localhost', port=6000):
+    """
+    Serves FIX sessions. With FIX_ASYNC_PUBLISH=true orders are published
+    with aio-pika on this loop rather than through the publish queue.
+    """
+    publisher = None
+    if os.environ.get("FIX_ASYNC_PUBLISH", "false").lower() == "true":
+        from rabbitmq_async import get_async_publisher
+        publisher = get_async_publisher()
+    try:
+        max_in_flight = int(os.environ.get("FIX_ASYNC_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT))
+    except ValueError:
+        logger.warning(f"Invalid FIX_ASYNC_MAX_IN_FLIGHT value. Defaulting to {DEFAULT_MAX_IN_FLIGHT}.")
+        max_in_flight = DEFAULT_MAX_IN_FLIGHT
+    await AsyncFixServer(publisher=publisher, max_in_flight=max_in_flight).serve_forever(host, port)
+
+def run_server(host='localhost', port=6000):
+    """
+    Runs the asyncio FIX acceptor until interrupted.
+    """
+    try:
+        run_event_loop(serve(host, port))
+    except KeyboardInterrupt:
+        logger.info("Server shutting down.")
+
+if __name__ == '__main__':
+    run_server(host='localhost', port=6000)
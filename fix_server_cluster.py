@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import time
+
+from fix_server_async import AsyncFixServer, run_event_loop
+from publish_queue import DEFAULT_SPOOL_PATH, get_publish_queue
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# How often workers report their stats to the supervisor (seconds).
+STATS_INTERVAL = 10
+# Minimum delay before restarting a worker that keeps crashing (seconds).
+RESTART_BACKOFF = 1
+
+def create_reuseport_socket(host='localhost', port=6000, backlog=1024):
+    """
+    Creates a listening socket with SO_REUSEPORT set, so that every worker
+    process can bind the same port and the kernel spreads connections across them.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.setblocking(False)
+    return sock
+
+def worker_main(worker_id, host, port, stats_queue, stats_interval=STATS_INTERVAL):
+    """
+    Entry point of a worker process: runs the asyncio acceptor on its own
+    SO_REUSEPORT socket and periodically reports stats to the supervisor.
+    """
+    # Give each worker its own spool file so restarted workers replay only their own orders.
+    spool_path = os.environ.get("PUBLISH_QUEUE_SPOOL_PATH", DEFAULT_SPOOL_PATH)
+    os.environ["PUBLISH_QUEUE_SPOOL_PATH"] = f"{spool_path}.worker{worker_id}"
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The supervisor handles Ctrl-C.
+
+    async def serve():
+        fix_server = AsyncFixServer()
+        server = await fix_server.start(sock=create_reuseport_socket(host, port))
+        async with server:
+            while True:
+                await asyncio.sleep(stats_interval)
+                stats = fix_server.stats()
+                stats["publish_queue_depth"] = get_publish_queue().depth
+                stats_queue.put((worker_id, stats))
+
+    logger.info(f"Worker {worker_id} (pid {os.getpid()}) starting on {host}:{port}")
+    run_event_loop(serve())
+
+
+class ClusterSupervisor:
+    """
+    Forks N FIX acceptor workers that share one port via SO_REUSEPORT,
+    restarts workers that exit and aggregates the stats they report.
+    """
+
+    def __init__(self, workers=None, host='localhost', port=6000, stats_interval=STATS_INTERVAL):
+        self.workers = workers or os.cpu_count() or 1
+        self.host = host
+        self.port = port
+        self.stats_interval = stats_interval
+        self._context = multiprocessing.get_context("fork")
+        self._stats_queue = self._context.Queue()
+        self._processes = {}
+        self._started_at = {}
+        self.worker_stats = {}
+        self.restarts = 0
+
+    def _spawn(self, worker_id):
+        process = self._context.Process(
+            target=worker_main,
+            args=(worker_id, self.host, self.port, self._stats_queue, self.stats_interval),
+            name=f"fix-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._started_at[worker_id] = time.monotonic()
+
+    def start(self):
+        for worker_id in range(self.workers):
+            self._spawn(worker_id)
+        logger.info(f"Started {self.workers} FIX workers on {self.host}:{self.port}")
+
+    def check_workers(self):
+        """
+        Restarts any worker process that has exited.
+        """
+        for worker_id, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            if time.monotonic() - self._started_at[worker_id] < RESTART_BACKOFF:
+                continue
+            logger.error(f"Worker {worker_id} (pid {process.pid}) exited with code {process.exitcode}; restarting")
+            self.worker_stats.pop(worker_id, None)
+            self.restarts += 1
+            self._spawn(worker_id)
+
+    def collect_stats(self, timeout=0.0):
+        """
+        Drains stats reported by workers, waiting up to timeout seconds for the first one.
+        """
+        try:
+            worker_id, stats = self._stats_queue.get(timeout=timeout)
+            while True:
+                self.worker_stats[worker_id] = stats
+                worker_id, stats = self._stats_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def aggregate_stats(self):
+        """
+        Sums the latest stats of every worker.
+        """
+        totals = {"workers": len(self._processes), "restarts": self.restarts}
+        for stats in self.worker_stats.values():
+            for key, value in stats.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def run(self):
+        """
+        Starts the workers and supervises them until interrupted.
+        """
+        self.start()
+        next_report = time.monotonic() + self.stats_interval
+        try:
+            while True:
+                self.collect_stats(timeout=1.0)
+                self.check_workers()
+                if time.monotonic() >= next_report:
+                    logger.info(f"Cluster stats: {self.aggregate_stats()}")
+                    next_report = time.monotonic() + self.stats_interval
+        except KeyboardInterrupt:
+            logger.info("Supervisor shutting down.")
+        finally:
+            self.stop()
+
+    def stop(self):
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes.values():
+            process.join(timeout=5)
+
+
+if __name__ == '__main__':
+    ClusterSupervisor(
+        workers=int(os.environ.get("FIX_SERVER_WORKERS", 0)) or None,
+        host=os.environ.get("FIX_SERVER_HOST", "localhost"),
+        port=int(os.environ.get("FIX_SERVER_PORT", 6000)),
+    ).run()
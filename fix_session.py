@@ -0,0 +1,110 @@
+import os
+import threading
+import weakref
+
+def _reset_in_forked_child(obj):
+    """
+    Registers obj._reset() to run in every child process forked after this
+    point, so that a worker never inherits its parent's session state or a
+    lock that another parent thread was holding at fork time.
+    """
+    ref = weakref.ref(obj)
+
+    def after_in_child():
+        target = ref()
+        if target is not None:
+            target._reset()
+
+    os.register_at_fork(after_in_child=after_in_child)
+
+def get_msg_seq_num(msg, invalid=None):
+    """
+    Returns MsgSeqNum (tag 34) of an indexed message as an int, None if the
+    tag is absent, or `invalid` if its value is not a number.
+    """
+    value = msg.get(34)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return invalid
+
+def get_sender_comp_id(msg, default=None):
+    """
+    Returns SenderCompID (tag 49) of an indexed message as a str.
+    """
+    value = msg.get(49)
+    if value is None:
+        return default
+    return value.decode() if isinstance(value, bytes) else value
+
+class SequenceCounter:
+    """
+    Thread-safe outgoing MsgSeqNum (tag 34) counter, local to the current process.
+    """
+
+    def __init__(self, start=1):
+        self.start = start
+        self._reset()
+        _reset_in_forked_child(self)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._next = self.start
+
+    def next(self):
+        """
+        Returns the next sequence number and advances the counter.
+        """
+        with self._lock:
+            value = self._next
+            self._next += 1
+            return value
+
+    def reset(self):
+        with self._lock:
+            self._next = self.start
+
+class SessionSequenceStore:
+    """
+    Expected inbound MsgSeqNum per session, keyed by SenderCompID (tag 49).
+    State is local to the current process: when the acceptor runs as several
+    SO_REUSEPORT workers, each worker tracks only the sessions it accepted.
+    """
+
+    def __init__(self):
+        self._reset()
+        _reset_in_forked_child(self)
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._expected = {}
+
+    def expected(self, comp_id):
+        """
+        Returns the sequence number expected next from comp_id.
+        """
+        with self._lock:
+            return self._expected.get(comp_id, 1)
+
+    def advance(self, comp_id, received_seq_num=None):
+        """
+        Records a message from comp_id and returns the new expected sequence
+        number: one past the received number, or one past the previously
+        expected number if the message carried none.
+        """
+        with self._lock:
+            if received_seq_num is None:
+                received_seq_num = self._expected.get(comp_id, 1)
+            self._expected[comp_id] = received_seq_num + 1
+            return received_seq_num + 1
+
+    def reset(self, comp_id=None):
+        with self._lock:
+            if comp_id is None:
+                self._expected.clear()
+            else:
+                self._expected.pop(comp_id, None)
+
+__all__ = ["SequenceCounter", "SessionSequenceStore", "get_msg_seq_num", "get_sender_comp_id"]
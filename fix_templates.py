@@ -0,0 +1,114 @@
+import time
+
+SOH = b"\x01"
+
+class Field:
+    """
+    Placeholder for a variable field in a MessageTemplate. Optional fields
+    are left out of the message when their value is None.
+    """
+
+    __slots__ = ("name", "optional")
+
+    def __init__(self, name, optional=False):
+        self.name = name
+        self.optional = optional
+
+
+class _VariableSegment:
+    __slots__ = ("name", "optional", "prefix", "overhead", "overhead_sum")
+
+    def __init__(self, tag, field):
+        self.name = field.name
+        self.optional = field.optional
+        self.prefix = b"%d=" % tag
+        # Bytes and checksum contributed by "tag=" and the trailing SOH.
+        self.overhead = len(self.prefix) + 1
+        self.overhead_sum = sum(self.prefix) + SOH[0]
+
+
+def fix_value(value):
+    """
+    Encodes a field value the same way simplefix does.
+    """
+    if type(value) is bytes:
+        return value
+    if type(value) is str:
+        return value.encode("UTF-8")
+    return str(value).encode("ASCII")
+
+class MessageTemplate:
+    """
+    Precompiled FIX message layout. Runs of constant fields are encoded once,
+    and their length and checksum contribution are summed once, so encoding
+    a message only touches the variable fields: BodyLength (9) and CheckSum
+    (10) are updated incrementally from the precomputed totals.
+    """
+
+    def __init__(self, msg_type, fields, begin_string="FIX.4.2"):
+        self._begin = b"8=" + fix_value(begin_string) + SOH + b"9="
+        # The SOH that terminates the BodyLength value is counted here too.
+        self._begin_sum = sum(self._begin) + SOH[0]
+        self._segments = []
+        constant = bytearray(b"35=" + fix_value(msg_type) + SOH)
+        for tag, value in fields:
+            if isinstance(value, Field):
+                if constant:
+                    self._segments.append(bytes(constant))
+                    constant = bytearray()
+                self._segments.append(_VariableSegment(tag, value))
+            else:
+                constant += b"%d=" % tag + fix_value(value) + SOH
+        if constant:
+            self._segments.append(bytes(constant))
+        constants = [segment for segment in self._segments if type(segment) is bytes]
+        self._constant_length = sum(len(segment) for segment in constants)
+        self._constant_sum = sum(sum(segment) for segment in constants)
+
+    def encode(self, **values):
+        """
+        Returns the encoded message with the given variable field values.
+        """
+        parts = [self._begin, None, SOH]
+        length = self._constant_length
+        checksum = self._constant_sum
+        for segment in self._segments:
+            if type(segment) is bytes:
+                parts.append(segment)
+                continue
+            value = values.get(segment.name)
+            if value is None:
+                if segment.optional:
+                    continue
+                raise ValueError(f"Missing value for required field {segment.name!r}")
+            value = fix_value(value)
+            parts += (segment.prefix, value, SOH)
+            length += segment.overhead + len(value)
+            checksum += segment.overhead_sum + sum(value)
+        body_length = b"%d" % length
+        parts[1] = body_length
+        checksum += self._begin_sum + sum(body_length)
+        parts.append(b"10=%03d\x01" % (checksum % 256))
+        return b"".join(parts)
+
+
+# The formatted date and time only change once a second, so keep the last one.
+_timestamp_cache = (None, b"")
+
+def utc_timestamp(timestamp=None):
+    """
+    Returns a UTCTimestamp value with millisecond precision, formatted like
+    simplefix's append_utc_timestamp (YYYYMMDD-HH:MM:SS.sss).
+    """
+    global _timestamp_cache
+    if timestamp is None:
+        timestamp = time.time()
+    seconds = int(timestamp)
+    millis = int((timestamp - seconds) * 1000)
+    cached_seconds, prefix = _timestamp_cache
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y%m%d-%H:%M:%S", time.gmtime(seconds)).encode("ASCII")
+        _timestamp_cache = (seconds, prefix)
+    return b"%s.%03d" % (prefix, millis)
+
+__all__ = ["Field", "MessageTemplate", "utc_timestamp", "fix_value"]
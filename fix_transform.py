@@ -1,70 +1,142 @@
-import json
 import datetime
 
-# Mapping dictionary: FIX tag to internal field name.
-FIX_TO_INTERNAL_MAP = {
-    11: "order_id",
-    55: "symbol",
-    38: "quantity",
-    44: "price",
-    60: "transact_time",  # Additional FIX tag.
-}
-
-# Default values for missing fields.
-DEFAULTS = {
-    "order_id": "UNKNOWN",
-    "symbol": "N/A",
-    "quantity": 0,
-    "price": 0.0,
-    "transact_time": None,
-}
+import serializer
+from fix_mapping import load_mappings
+from fix_parser import as_message_view
+
+try:
+    import pyarrow  # Optional: columnar output for transform_batch.
+except ImportError:
+    pyarrow = None
+
+try:
+    import numpy  # Optional: columnar output for transform_batch.
+except ImportError:
+    numpy = None
+
+# Tag mappings compiled from fix_mapping.json (or FIX_MAPPING_CONFIG), keyed by SenderCompID.
+MAPPINGS = load_mappings()
+
+# The default mapping, as plain dictionaries.
+FIX_TO_INTERNAL_MAP = {field["tag"]: field["name"] for field in MAPPINGS.default_spec.fields}
+DEFAULTS = {field["name"]: field["default"] for field in MAPPINGS.default_spec.fields}
+ENRICHMENT = MAPPINGS.default_spec.enrichment
 
 def transform_fix_to_json(fix_message):
     """
-    Transforms a parsed FIX message (an iterable of (tag, value) pairs)
-    into a dictionary representing the internal data model. This function:
+    Transforms a parsed FIX message (an indexed message view, or any iterable
+    of (tag, value) pairs, which is indexed once) into a dictionary representing the internal data model. This function:
       - Maps FIX fields to internal field names.
       - Converts numeric fields to proper types.
       - Uses default values for missing fields.
       - Enriches the data with additional metadata.
+    The mapping used is the one compiled for the message's SenderCompID, or the default mapping.
     """
-    data = {}
-    
-    # Map fields from FIX message.
-    for tag, value in fix_message:
-        # If the value is bytes, decode it.
-        if isinstance(value, bytes):
-            value = value.decode("ascii")
-        if tag in FIX_TO_INTERNAL_MAP:
-            field_name = FIX_TO_INTERNAL_MAP[tag]
-            data[field_name] = value
-
-    # Set default values for missing fields.
-    for field, default in DEFAULTS.items():
-        if field not in data:
-            data[field] = default
-
-    # Data type conversion for numeric fields.
-    try:
-        data["quantity"] = int(data["quantity"])
-    except (ValueError, TypeError):
-        data["quantity"] = DEFAULTS["quantity"]
+    return MAPPINGS.transform(fix_message)
+
+def transform_fix_to_json_str(fix_message):
+    """
+    Returns a JSON string representation of the transformed FIX message.
+    """
+    data = transform_fix_to_json(fix_message)
+    return serializer.dumps_str(data)
+
+# Casts applied to numeric field types in transform_batch.
+CASTS = {"int": int, "float": float}
+
+def _extract_column(messages, tag, default):
+    column = []
+    append = column.append
+    for msg in messages:
+        value = msg.get(tag)
+        if value is None:
+            append(default)
+        elif isinstance(value, bytes):
+            append(value.decode("ascii"))
+        else:
+            append(value)
+    return column
+
+def _coerce_column(values, cast, default):
+    # Fast path: the whole column converts cleanly.
     try:
-        data["price"] = float(data["price"])
+        return list(map(cast, values))
     except (ValueError, TypeError):
-        data["price"] = DEFAULTS["price"]
+        pass
+    coerced = []
+    for value in values:
+        try:
+            coerced.append(cast(value))
+        except (ValueError, TypeError):
+            coerced.append(default)
+    return coerced
 
-    # Enrichment: add additional internal metadata.
-    data["business_unit"] = "BU-001"      # Placeholder for internal business unit.
-    data["trader_id"] = "TRADER001"        # Placeholder for trader ID.
-    data["risk_category"] = "LOW"          # Placeholder for risk category.
-    data["processed_timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+def _numpy_dtype(field_type, values):
+    # Numeric fields get the dtype of their cast (int64, float64); a column with
+    # gaps (None defaults, or rows whose mapping lacks the field) stays object.
+    if field_type in CASTS and None not in values:
+        return numpy.dtype(CASTS[field_type])
+    return object
 
-    return data
+def _spec_columns(spec, messages):
+    columns = {}
+    for field in spec.fields:
+        values = _extract_column(messages, field["tag"], field["default"])
+        if field["type"] in CASTS:
+            values = _coerce_column(values, CASTS[field["type"]], field["default"])
+        columns[field["name"]] = values
+    for field, value in spec.enrichment.items():
+        columns[field] = [value] * len(messages)
+    return columns
 
-def transform_fix_to_json_str(fix_message):
+def transform_batch(messages, backend=None, mappings=None):
     """
-    Returns a JSON string representation of the transformed FIX message.
+    Transforms many parsed FIX messages at once into columns holding the same
+    values transform_fix_to_json produces for each message, with the clock
+    read once for the whole batch. Messages are grouped by SenderCompID and
+    each group uses its counterparty's mapping; a field missing from some
+    counterparties' mappings is None in their rows.
+
+    Returns a pyarrow.Table if pyarrow is installed, otherwise a dict of
+    NumPy arrays if NumPy is installed, otherwise a dict of lists. Pass
+    backend="pyarrow", "numpy" or "list" to choose explicitly.
     """
-    data = transform_fix_to_json(fix_message)
-    return json.dumps(data)
\ No newline at end of file
+    if backend is None:
+        backend = "pyarrow" if pyarrow is not None else "numpy" if numpy is not None else "list"
+    mappings = mappings or MAPPINGS
+    messages = [as_message_view(msg) for msg in messages]
+    count = len(messages)
+
+    groups = {}  # id(spec) -> (spec, row indexes)
+    for row, msg in enumerate(messages):
+        spec = mappings.spec_for(msg.get(49))
+        groups.setdefault(id(spec), (spec, []))[1].append(row)
+    specs = [spec for spec, _rows in groups.values()] or [mappings.default_spec]
+    if len(specs) == 1:
+        columns = _spec_columns(specs[0], messages)
+    else:
+        columns = {}
+        for spec, rows in groups.values():
+            for name, values in _spec_columns(spec, [messages[row] for row in rows]).items():
+                column = columns.setdefault(name, [None] * count)
+                for row, value in zip(rows, values):
+                    column[row] = value
+    # Field name -> mapping type, or None where counterparties' mappings disagree.
+    field_types = {}
+    for spec in specs:
+        for field in spec.fields:
+            if field_types.setdefault(field["name"], field["type"]) != field["type"]:
+                field_types[field["name"]] = None
+    processed_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    columns["processed_timestamp"] = [processed_timestamp] * count
+
+    if backend == "pyarrow":
+        return pyarrow.table(columns)
+    if backend == "numpy":
+        return {field: numpy.array(values, dtype=_numpy_dtype(field_types.get(field), values))
+                for field, values in columns.items()}
+    if backend == "list":
+        return columns
+    raise ValueError(f"Unknown transform_batch backend: {backend!r}")
+
+__all__ = ["transform_fix_to_json", "transform_fix_to_json_str", "transform_batch"]
\ No newline at end of file
@@ -1,14 +1,58 @@
 import React, { useEffect, useState } from 'react';
 import axios from 'axios';
 
+// Orders requested per page; older pages are fetched with "Load more".
+const PAGE_SIZE = 100;
+// Slow refresh alongside the event stream, which only carries other API
+// workers' orders when ORDER_EVENTS_FANOUT is enabled.
+const FALLBACK_POLL_MS = 30000;
+
 function InternalSystemUI() {
-  const [orders, setOrders] = useState([]);
+  // paged is true once older pages have been appended with "Load more".
+  const [view, setView] = useState({ orders: [], nextCursor: null, paged: false });
+  const { orders, nextCursor } = view;
+
+  const fetchPage = async (cursor) => {
+    // Use a relative URL so that the API call goes to the same origin.
+    const params = { limit: PAGE_SIZE };
+    if (cursor) {
+      params.cursor = cursor;
+    }
+    const response = await axios.get('/orders', { params });
+    return response.data;
+  };
 
   const fetchOrders = async () => {
     try {
-      // Use a relative URL so that the API call goes to the same origin.
-      const response = await axios.get('/orders');
-      setOrders(response.data.orders);
+      const data = await fetchPage(null);
+      setView((previous) => {
+        if (!previous.paged) {
+          return { orders: data.orders, nextCursor: data.next_cursor, paged: false };
+        }
+        // Keep the older pages already loaded; only the newest page is refreshed.
+        const last = data.orders[data.orders.length - 1];
+        const fresh = new Set(data.orders.map((order) => order.order_id));
+        const older = previous.orders.filter(
+          (order) => !fresh.has(order.order_id) && (!last || order.ingested_timestamp < last.ingested_timestamp)
+        );
+        return { ...previous, orders: [...data.orders, ...older] };
+      });
+    } catch (error) {
+      console.error('Error fetching orders:', error);
+    }
+  };
+
+  const loadMore = async () => {
+    if (!nextCursor) {
+      return;
+    }
+    try {
+      const data = await fetchPage(nextCursor);
+      setView((previous) => ({
+        orders: [...previous.orders, ...data.orders],
+        nextCursor: data.next_cursor,
+        paged: true,
+      }));
     } catch (error) {
       console.error('Error fetching orders:', error);
     }
@@ -16,9 +60,24 @@ function InternalSystemUI() {
 
   useEffect(() => {
     fetchOrders();
-    // Poll for new orders every 10 seconds.
-    const interval = setInterval(fetchOrders, 10000);
-    return () => clearInterval(interval);
+    // New orders are pushed over Server-Sent Events instead of polling.
+    const events = new EventSource('/events');
+    events.addEventListener('order', (event) => {
+      const order = JSON.parse(event.data);
+      setView((previous) => {
+        if (previous.orders.some((existing) => existing.order_id === order.order_id)) {
+          return previous;
+        }
+        return { ...previous, orders: [order, ...previous.orders] };
+      });
+    });
+    // The stream dropped events (or we were away too long): refetch the newest page.
+    events.addEventListener('resync', fetchOrders);
+    const poll = setInterval(fetchOrders, FALLBACK_POLL_MS);
+    return () => {
+      events.close();
+      clearInterval(poll);
+    };
   }, []);
 
   return (
@@ -52,6 +111,9 @@ function InternalSystemUI() {
           )}
         </tbody>
       </table>
+      {nextCursor && (
+        <button onClick={loadMore}>Load more</button>
+      )}
     </div>
   );
 }
@@ -1,14 +1,30 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import axios from 'axios';
 
+// Oldest lines are dropped once the dashboard holds this many.
+const MAX_LOG_LINES = 1000;
+// Slow catch-up alongside the event stream, which only carries other API
+// workers' orders when ORDER_EVENTS_FANOUT is enabled.
+const FALLBACK_POLL_MS = 30000;
+
 function ServerDashboard() {
   const [logs, setLogs] = useState([]);
+  // Position of the newest log line received; only newer lines are requested.
+  const cursorRef = useRef(null);
 
   // Fetch logs from the back-end using a relative URL.
   const fetchLogs = async () => {
     try {
-      const response = await axios.get('/logs');
-      setLogs(response.data.logs);
+      const since = cursorRef.current;
+      const response = await axios.get('/logs', { params: since ? { since } : {} });
+      cursorRef.current = response.data.cursor;
+      if (since) {
+        if (response.data.logs.length > 0) {
+          setLogs(prevLogs => [...prevLogs, ...response.data.logs].slice(-MAX_LOG_LINES));
+        }
+      } else {
+        setLogs(response.data.logs);
+      }
     } catch (error) {
       console.error('Error fetching logs:', error);
       // Simulate log data if the endpoint isn't available.
@@ -21,9 +37,23 @@ function ServerDashboard() {
 
   useEffect(() => {
     fetchLogs();
-    // Poll every 5 seconds for new logs.
-    const interval = setInterval(fetchLogs, 5000);
-    return () => clearInterval(interval);
+    // New orders are pushed over Server-Sent Events; each one is a log line.
+    const events = new EventSource('/events');
+    events.addEventListener('order', (event) => {
+      const order = JSON.parse(event.data);
+      cursorRef.current = event.lastEventId;
+      setLogs(prevLogs => [
+        ...prevLogs,
+        `Order ${order.order_id} ingested at ${order.ingested_timestamp}`
+      ].slice(-MAX_LOG_LINES));
+    });
+    // The stream dropped events: catch up from the last cursor.
+    events.addEventListener('resync', fetchLogs);
+    const poll = setInterval(fetchLogs, FALLBACK_POLL_MS);
+    return () => {
+      events.close();
+      clearInterval(poll);
+    };
   }, []);
 
   return (
@@ -0,0 +1,48 @@
+"""
+Gunicorn settings for the internal API (see wsgi.py). Every value can be
+overridden from the environment, e.g. on Heroku through WEB_CONCURRENCY.
+"""
+import multiprocessing
+import os
+import tempfile
+
+port = os.environ.get("PORT", "5002")
+bind = f"0.0.0.0:{port}"
+
+# Threaded workers: requests mostly wait on Postgres and RabbitMQ, and each
+# open /events stream holds one thread for as long as the client listens.
+# Streams are capped at half of each worker's threads (EVENTS_MAX_STREAMS),
+# so open UI tabs can never take every thread; clients over the cap poll.
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+os.environ.setdefault("EVENTS_MAX_STREAMS", str(max(1, threads // 2)))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+# Recycle workers now and then so that slow leaks cannot accumulate.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 1000))
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+# Each worker holds its own order cache, so share its generation counters
+# between workers: a write handled by one worker must invalidate them all.
+# Live order events are per worker too, so with several workers they go
+# through the RabbitMQ fanout exchange to every worker's /events streams
+# (and from the order sink, which runs outside the API).
+os.environ.setdefault("ORDER_EVENTS_FANOUT", "true" if workers > 1 else "false")
+os.environ.setdefault("ORDER_CACHE_SHARED_PATH", os.path.join(tempfile.gettempdir(), f"order_cache_{port}.gen"))
+
+def on_starting(server):
+    # Start every master with fresh counters rather than a file left behind
+    # by an earlier run.
+    try:
+        os.remove(os.environ["ORDER_CACHE_SHARED_PATH"])
+    except FileNotFoundError:
+        pass
+
+def post_fork(server, worker):
+    server.log.info(f"Worker {worker.pid} started ({threads} threads)")
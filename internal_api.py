@@ -1,25 +1,96 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, current_app, g, has_app_context, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+import base64
+import click
+import binascii
+import csv
 import datetime
+import hashlib
+import io
+import json
 import logging
 import os
+import urllib.parse
 
-# Import the publisher function
-from rabbitmq_publisher import publish_order
+import serializer
+
+# Import the publisher functions
+from rabbitmq_publisher import publish_order, publish_orders
+from order_events import RESYNC_FRAME, SubscriberLimitReached, add_listener, format_event, get_broker, notify_orders
+from order_cache import LISTS, ORDERS, OrderCache
+from order_partitions import RETENTION_MODES, maintain_partitions
 
 # Initialize the database
 db = SQLAlchemy()
 
+# GET /orders page size when the request gives no limit, and the largest limit accepted.
+DEFAULT_ORDERS_PAGE_SIZE = 100
+DEFAULT_ORDERS_MAX_PAGE_SIZE = 1000
+# Maximum /logs entries returned per request.
+DEFAULT_LOGS_PAGE_SIZE = 500
+
+# Connection pool per worker process. Size it so that
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays below the server's max_connections.
+DEFAULT_DB_POOL_SIZE = 5
+DEFAULT_DB_MAX_OVERFLOW = 10
+DEFAULT_DB_POOL_TIMEOUT = 10
+# Seconds after which pooled connections are replaced (below typical proxy/LB idle timeouts).
+DEFAULT_DB_POOL_RECYCLE = 1800
+# Postgres statement_timeout applied to every request's transaction (ms; 0 disables it).
+DEFAULT_DB_STATEMENT_TIMEOUT_MS = 5000
+# GET /exports/orders reads the whole table, so it gets its own limit (0: none).
+DEFAULT_DB_EXPORT_STATEMENT_TIMEOUT_MS = 0
+
+# Open /events streams per process (0: no limit). Each stream holds a server
+# thread, so gunicorn.conf.py caps them below the worker's thread count.
+DEFAULT_EVENTS_MAX_STREAMS = 0
+# Streams over the limit are told to resync and reconnect after this long,
+# which turns those clients into pollers until a stream frees up.
+DEFAULT_EVENTS_BUSY_RETRY_MS = 10000
+
+# How POST /orders and /orders/bulk store orders: "sync" inserts them on the
+# request path; "async" only publishes them (confirmed) and returns 202, and
+# the consumer in CONSUMER_MODE=postgres writes them (see order_sink.py).
+INGEST_SYNC = "sync"
+INGEST_ASYNC = "async"
+INGEST_MODES = (INGEST_SYNC, INGEST_ASYNC)
+
+# Rows fetched per round trip by GET /exports/orders (server-side cursor on Postgres).
+EXPORT_BATCH_SIZE = 2000
+# Columns written by GET /exports/orders?format=csv.
+EXPORT_CSV_FIELDS = [
+    "order_id", "ingested_timestamp", "symbol", "quantity", "price",
+    "business_unit", "trader_id", "risk_category", "processed_timestamp",
+]
+
 # Define the Order model
 class Order(db.Model):
     __tablename__ = 'orders'
     id = db.Column(db.Integer, primary_key=True)
     order_id = db.Column(db.String, unique=True, nullable=False)
     ingested_timestamp = db.Column(db.DateTime, nullable=False)
-    # Additional order details stored as JSON
-    additional_data = db.Column(db.JSON)
+    # Hot fields promoted out of additional_data so they can be filtered and indexed.
+    symbol = db.Column(db.String)
+    quantity = db.Column(db.BigInteger)
+    price = db.Column(db.Float)
+    trader_id = db.Column(db.String)
+    risk_category = db.Column(db.String)
+    processed_timestamp = db.Column(db.DateTime)
+    # Additional order details stored as JSON (JSONB on Postgres, for the GIN index)
+    additional_data = db.Column(db.JSON().with_variant(postgresql.JSONB(), "postgresql"))
+
+    __table_args__ = (
+        # Keyset pagination key for GET /orders (newest first); also serves
+        # plain ingested_timestamp range scans.
+        db.Index('ix_orders_ingested_timestamp_id', 'ingested_timestamp', 'id'),
+        db.Index('ix_orders_symbol_ingested_timestamp', 'symbol', 'ingested_timestamp'),
+        db.Index('ix_orders_additional_data', 'additional_data', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
 
     def to_dict(self):
         # Base fields
@@ -32,11 +103,285 @@ class Order(db.Model):
             data.update(self.additional_data)
         return data
 
+class InvalidQuery(ValueError):
+    """
+    A request parameter (cursor, limit or filter) could not be parsed.
+    """
+
+def encode_cursor(order):
+    """
+    Returns an opaque cursor holding the (ingested_timestamp, id) position of order.
+    """
+    key = json.dumps([order.ingested_timestamp.isoformat(), order.id])
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+def decode_cursor(cursor):
+    """
+    Returns the (ingested_timestamp, id) key encoded in a cursor from encode_cursor.
+    """
+    try:
+        timestamp, order_pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return parse_timestamp(timestamp, "cursor"), int(order_pk)
+    except (binascii.Error, UnicodeDecodeError, AttributeError, TypeError, ValueError):
+        raise InvalidQuery(f"Invalid cursor: {cursor!r}")
+
+def after_cursor(cursor):
+    """
+    Returns filter criteria for orders after cursor in (ingested_timestamp, id)
+    order. The plain timestamp bound lets Postgres prune partitions.
+    """
+    timestamp, order_pk = decode_cursor(cursor)
+    return (Order.ingested_timestamp >= timestamp,
+            db.tuple_(Order.ingested_timestamp, Order.id) > (timestamp, order_pk))
+
+def parse_timestamp(value, name):
+    """
+    Parses an ISO 8601 query parameter into a naive UTC datetime, the form
+    ingested_timestamp is stored in.
+    """
+    try:
+        timestamp = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise InvalidQuery(f"Invalid {name} timestamp: {value!r}")
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+def whole_number(value):
+    """
+    Returns value as an int, raising ValueError for a non-integral float
+    instead of truncating it.
+    """
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value} is not a whole number")
+    return int(value)
+
+def promoted_columns(data):
+    """
+    Returns the values of the promoted Order columns for an order's JSON
+    data. A value that does not fit its column (including a non-integral
+    quantity) is stored as NULL there; additional_data keeps the original.
+    """
+    columns = {}
+    for field in ("symbol", "trader_id", "risk_category"):
+        value = data.get(field)
+        columns[field] = None if value is None else str(value)
+    try:
+        columns["quantity"] = whole_number(data["quantity"])
+    except (KeyError, TypeError, ValueError, OverflowError):
+        columns["quantity"] = None
+    try:
+        columns["price"] = float(data["price"])
+    except (KeyError, TypeError, ValueError):
+        columns["price"] = None
+    try:
+        columns["processed_timestamp"] = parse_timestamp(data["processed_timestamp"], "processed_timestamp")
+    except (KeyError, AttributeError, InvalidQuery):
+        columns["processed_timestamp"] = None
+    return columns
+
+def filter_orders(query, args):
+    """
+    Applies the GET /orders filters: symbol, trader_id and risk_category
+    (on their promoted columns) and since/until bounds on ingested_timestamp.
+    """
+    for field in ("symbol", "trader_id", "risk_category"):
+        value = args.get(field)
+        if value:
+            query = query.filter(getattr(Order, field) == value)
+    if args.get("since"):
+        query = query.filter(Order.ingested_timestamp >= parse_timestamp(args["since"], "since"))
+    if args.get("until"):
+        query = query.filter(Order.ingested_timestamp < parse_timestamp(args["until"], "until"))
+    return query
+
+def iter_export_rows(args):
+    """
+    Yields orders matching the GET /orders filters as dictionaries (the same
+    shape as Order.to_dict), oldest first, without building ORM objects.
+    Rows are streamed EXPORT_BATCH_SIZE at a time.
+    """
+    query = filter_orders(Order.query, args).with_entities(
+        Order.order_id, Order.ingested_timestamp, Order.additional_data
+    ).order_by(Order.ingested_timestamp, Order.id).yield_per(EXPORT_BATCH_SIZE)
+    for order_id, ingested_timestamp, additional_data in query:
+        data = {"order_id": order_id, "ingested_timestamp": ingested_timestamp.isoformat()}
+        if additional_data:
+            data.update(additional_data)
+        yield data
+
+def export_ndjson(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(serializer.dumps_str(row))
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+def export_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+# Rows per multi-row INSERT in POST /orders/bulk (keeps bound parameters under driver limits).
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING ... RETURNING.
+INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+def parse_bulk_body(body, content_type):
+    """
+    Parses a POST /orders/bulk body: a JSON array, or NDJSON (one order per
+    line). Returns a list with the parsed order, or an InvalidQuery for each
+    NDJSON line that is not valid JSON.
+    """
+    text = body.decode("utf-8")
+    if "ndjson" not in content_type and text.lstrip().startswith("["):
+        try:
+            orders = serializer.loads(text)
+        except ValueError:
+            raise InvalidQuery("Invalid JSON array")
+        if not isinstance(orders, list):
+            raise InvalidQuery("Expected a JSON array of orders")
+        return orders
+    orders = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            orders.append(serializer.loads(line))
+        except ValueError:
+            orders.append(InvalidQuery(f"Line {number} is not valid JSON"))
+    return orders
+
+def validate_order(order):
+    """
+    Returns an error message for an order that cannot be ingested, or None.
+    """
+    if isinstance(order, InvalidQuery):
+        return str(order)
+    if not isinstance(order, dict):
+        return "Order must be a JSON object"
+    order_id = order.get("order_id")
+    if not order_id or not isinstance(order_id, str):
+        return "order_id is required"
+    for field in ("quantity", "price"):
+        value = order.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            return f"{field} must be a number"
+    quantity = order.get("quantity")
+    if isinstance(quantity, float) and not quantity.is_integer():
+        return "quantity must be a whole number"
+    return None
+
+def insert_orders(rows):
+    """
+    Inserts order rows with multi-row INSERT ... ON CONFLICT DO NOTHING and
+    returns the rows actually inserted (id, order_id, ingested_timestamp),
+    keyed by order_id. Rows whose order_id already exists are skipped.
+    The caller commits.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect not in INSERT_BY_DIALECT:
+        raise RuntimeError(f"Bulk insert is not supported on {dialect}")
+    insert = INSERT_BY_DIALECT[dialect]
+    inserted = {}
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        statement = (
+            insert(Order)
+            .values(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing()
+            .returning(Order.id, Order.order_id, Order.ingested_timestamp)
+        )
+        for row in db.session.execute(statement):
+            inserted[row.order_id] = row
+    return inserted
+
+def database_uri():
+    """
+    Returns DATABASE_URL if provided (e.g., on Heroku), otherwise a local database.
+    """
+    uri = os.environ.get('DATABASE_URL', 'postgresql://localhost/my_test_db')
+    # Heroku returns a URI that starts with "postgres://"; SQLAlchemy expects "postgresql://"
+    if uri.startswith("postgres://"):
+        uri = uri.replace("postgres://", "postgresql://", 1)
+    return uri
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logging.getLogger(__name__).warning(f"Invalid {name} value. Defaulting to {default}.")
+        return default
+
+def engine_options(uri):
+    """
+    Returns SQLALCHEMY_ENGINE_OPTIONS for uri, read from DB_POOL_SIZE,
+    DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE and DB_POOL_PRE_PING.
+    SQLite keeps SQLAlchemy's default pool.
+    """
+    options = {
+        "pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true",
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", DEFAULT_DB_POOL_RECYCLE),
+    }
+    if not uri.startswith("sqlite"):
+        options.update(
+            pool_size=_env_int("DB_POOL_SIZE", DEFAULT_DB_POOL_SIZE),
+            max_overflow=_env_int("DB_MAX_OVERFLOW", DEFAULT_DB_MAX_OVERFLOW),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT", DEFAULT_DB_POOL_TIMEOUT),
+        )
+    return options
+
+@sa.event.listens_for(db.session, "after_begin")
+def apply_statement_timeout(session, transaction, connection):
+    """
+    Bounds every statement of the current transaction on Postgres. The
+    timeout comes from DB_STATEMENT_TIMEOUT_MS, or g.statement_timeout_ms
+    when a view overrides it; SET LOCAL ends with the transaction, so
+    pooled connections never carry it over to the next request.
+    """
+    if connection.dialect.name != "postgresql" or not has_app_context():
+        return
+    timeout = g.get("statement_timeout_ms", current_app.config.get("DB_STATEMENT_TIMEOUT_MS"))
+    if timeout is not None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+# Streaming writers for GET /exports/orders, by format: (writer, mimetype, file extension).
+EXPORT_FORMATS = {
+    "ndjson": (export_ndjson, "application/x-ndjson", "ndjson"),
+    "csv": (export_csv, "text/csv", "csv"),
+}
+
+class OrderJSONProvider(DefaultJSONProvider):
+    """
+    Routes jsonify and request.get_json through serializer (orjson or
+    msgspec when installed), which matters for large order pages.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return serializer.dumps_str(obj)
+
+    def loads(self, s, **kwargs):
+        return serializer.loads(s)
+
 def create_app(test_config=None):
     # Set up the static folder path for serving the React app
     static_path = os.path.join(os.path.dirname(__file__), "static")
     app = Flask(__name__, static_folder=static_path, static_url_path="")
     CORS(app)  # Enable CORS for all routes
+    app.json = OrderJSONProvider(app)
 
     # Configure logging
     logging.basicConfig(
@@ -45,24 +390,54 @@ def create_app(test_config=None):
     )
     logger = logging.getLogger(__name__)
 
-    # Database configuration: use DATABASE_URL if provided (e.g., on Heroku),
-    # otherwise fall back to a local database.
-    uri = os.environ.get('DATABASE_URL', 'postgresql://localhost/my_test_db')
-    # Heroku returns a URI that starts with "postgres://"; SQLAlchemy expects "postgresql://"
-    if uri.startswith("postgres://"):
-        uri = uri.replace("postgres://", "postgresql://", 1)
+    uri = database_uri()
     app.config['SQLALCHEMY_DATABASE_URI'] = uri
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(uri)
+    app.config['DB_STATEMENT_TIMEOUT_MS'] = _env_int('DB_STATEMENT_TIMEOUT_MS', DEFAULT_DB_STATEMENT_TIMEOUT_MS)
+    app.config['DB_EXPORT_STATEMENT_TIMEOUT_MS'] = _env_int(
+        'DB_EXPORT_STATEMENT_TIMEOUT_MS', DEFAULT_DB_EXPORT_STATEMENT_TIMEOUT_MS)
+    app.config['ORDERS_PAGE_SIZE'] = _env_int('ORDERS_PAGE_SIZE', DEFAULT_ORDERS_PAGE_SIZE)
+    app.config['ORDERS_MAX_PAGE_SIZE'] = _env_int('ORDERS_MAX_PAGE_SIZE', DEFAULT_ORDERS_MAX_PAGE_SIZE)
+    app.config['LOGS_PAGE_SIZE'] = _env_int('LOGS_PAGE_SIZE', DEFAULT_LOGS_PAGE_SIZE)
+    app.config['EVENTS_MAX_STREAMS'] = _env_int('EVENTS_MAX_STREAMS', DEFAULT_EVENTS_MAX_STREAMS)
+    app.config['EVENTS_BUSY_RETRY_MS'] = _env_int('EVENTS_BUSY_RETRY_MS', DEFAULT_EVENTS_BUSY_RETRY_MS)
+    app.config['ORDERS_INGEST_MODE'] = os.environ.get('ORDERS_INGEST_MODE', INGEST_SYNC).lower()
+    if app.config['ORDERS_INGEST_MODE'] not in INGEST_MODES:
+        raise ValueError(f"Unknown ORDERS_INGEST_MODE {app.config['ORDERS_INGEST_MODE']!r}; expected one of {INGEST_MODES}")
 
     # Initialize SQLAlchemy and Flask-Migrate
     db.init_app(app)
     Migrate(app, db)
 
+    # Read-through cache for GET /orders pages and order lookups.
+    cache = OrderCache.from_env()
+    app.extensions['order_cache'] = cache
+    # Orders stored elsewhere (another worker, the order sink) arrive as
+    # events through the fanout exchange and make cached pages stale.
+    add_listener(lambda frame: cache.orders_changed())
+
+    @app.cli.command('maintain-partitions')
+    @click.option('--days-ahead', type=int, default=None,
+                  help='Daily partitions to create ahead of today (ORDERS_PARTITION_DAYS_AHEAD).')
+    @click.option('--retention-days', type=int, default=None,
+                  help='Days of partitions to keep, 0 for all (ORDERS_RETENTION_DAYS).')
+    @click.option('--retention-mode', type=click.Choice(RETENTION_MODES), default=None,
+                  help='Detach or drop expired partitions (ORDERS_RETENTION_MODE).')
+    def maintain_partitions_command(days_ahead, retention_days, retention_mode):
+        """
+        Creates upcoming daily orders partitions and applies retention. Run daily (e.g. from cron).
+        """
+        created, removed = maintain_partitions(db.engine, days_ahead, retention_days, retention_mode)
+        click.echo(f"Created {len(created)} partitions, removed {len(removed)}")
+
     @app.route('/orders', methods=['POST'])
     def receive_order():
         """
         Receives enriched FIX data in JSON format, stores it in the database,
-        publishes it to RabbitMQ, and returns a success response.
+        publishes it to RabbitMQ, and returns a success response. In async
+        ingest mode the order is only published, and 202 is returned once
+        RabbitMQ has confirmed it.
         """
         try:
             data = request.get_json(silent=True)
@@ -80,15 +455,29 @@ def create_app(test_config=None):
                 logger.error("order_id is missing from data")
                 return jsonify({"status": "error", "message": "order_id is required"}), 400
 
-            # Create and store the Order instance
-            order = Order(
-                order_id=order_id,
-                ingested_timestamp=ingested_ts,
-                additional_data=data  # Storing the full order JSON
-            )
-            db.session.add(order)
+            if app.config['ORDERS_INGEST_MODE'] == INGEST_ASYNC:
+                if not publish_orders([data])[0]:
+                    logger.error(f"Order {order_id} was not confirmed by RabbitMQ")
+                    return jsonify({"status": "error", "message": "Order could not be queued"}), 503
+                logger.info(f"Order queued for ingestion: {order_id}")
+                return jsonify({"status": "accepted", "message": "Order queued for ingestion"}), 202
+
+            # Store the order. Duplicates are detected the same way as in the
+            # bulk path (unique order_id, or the order_ids trigger on a
+            # partitioned Postgres table).
+            inserted = insert_orders([{
+                "order_id": order_id,
+                "ingested_timestamp": ingested_ts,
+                "additional_data": data,  # Storing the full order JSON
+                **promoted_columns(data),
+            }])
             db.session.commit()
+            if order_id not in inserted:
+                logger.warning(f"Duplicate order_id {order_id} rejected")
+                return jsonify({"status": "error", "message": f"Order {order_id} already exists"}), 409
+            cache.orders_changed()
             logger.info(f"Order stored in DB: {data}")
+            notify_orders([(encode_cursor(inserted[order_id]), data)])
 
             # Publish the order to RabbitMQ
             try:
@@ -103,16 +492,204 @@ def create_app(test_config=None):
             logger.error(f"Error in receive_order: {e}")
             return jsonify({"status": "error", "message": "Internal server error"}), 500
 
+    @app.route('/orders/bulk', methods=['POST'])
+    def receive_orders_bulk():
+        """
+        Ingests many orders at once from a JSON array or an NDJSON body.
+        Valid orders are stored in one transaction with multi-row inserts and
+        published as one confirmed batch. The response has a status per
+        order, in request order: inserted (with published true/false),
+        duplicate or invalid. In async ingest mode valid orders are only
+        published, and are reported as accepted (confirmed) or failed.
+        """
+        try:
+            try:
+                orders = parse_bulk_body(request.get_data(), request.content_type or "")
+            except (InvalidQuery, UnicodeDecodeError) as e:
+                logger.error(f"Received invalid bulk body: {e}")
+                return jsonify({"status": "error", "message": str(e)}), 400
+
+            # One ingest timestamp for the whole batch.
+            ingested_ts = datetime.datetime.now(datetime.timezone.utc)
+            results = []
+            rows = []
+            seen = set()
+            for order in orders:
+                error = validate_order(order)
+                if error:
+                    results.append({"order_id": order.get("order_id") if isinstance(order, dict) else None,
+                                    "status": "invalid", "message": error})
+                    continue
+                order_id = order["order_id"]
+                if order_id in seen:
+                    results.append({"order_id": order_id, "status": "duplicate"})
+                    continue
+                seen.add(order_id)
+                order.setdefault("ingested_timestamp", ingested_ts.isoformat())
+                rows.append({"order_id": order_id, "ingested_timestamp": ingested_ts, "additional_data": order,
+                             **promoted_columns(order)})
+                results.append({"order_id": order_id, "status": None, "order": order})
+
+            if app.config['ORDERS_INGEST_MODE'] == INGEST_ASYNC:
+                return queue_bulk_orders(results)
+
+            inserted = insert_orders(rows) if rows else {}
+            db.session.commit()
+            if inserted:
+                cache.orders_changed()
+
+            accepted = [result["order"] for result in results
+                        if result["status"] is None and result["order_id"] in inserted]
+            notify_orders([(encode_cursor(inserted[order["order_id"]]), order) for order in accepted])
+            published = []
+            if accepted:
+                try:
+                    published = publish_orders(accepted)
+                except Exception as pub_err:
+                    logger.error(f"Failed to publish bulk orders to RabbitMQ: {pub_err}")
+            published_by_id = {
+                order["order_id"]: ok for order, ok in zip(accepted, published)
+            }
+            for result in results:
+                if result["status"] is None:
+                    order = result.pop("order")
+                    if order["order_id"] in inserted:
+                        result["status"] = "inserted"
+                        result["published"] = published_by_id.get(order["order_id"], False)
+                    else:
+                        result["status"] = "duplicate"
+
+            counts = {}
+            for result in results:
+                counts[result["status"]] = counts.get(result["status"], 0) + 1
+            logger.info(f"Bulk ingest of {len(results)} orders: {counts}")
+            return jsonify({"status": "success", "counts": counts, "results": results}), 200
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error in receive_orders_bulk: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
+    def queue_bulk_orders(results):
+        """
+        Async ingest for POST /orders/bulk: publishes the valid orders as one
+        confirmed batch and fills in their statuses.
+        """
+        pending = [result for result in results if result["status"] is None]
+        confirmed = publish_orders([result["order"] for result in pending]) if pending else []
+        for result, ok in zip(pending, confirmed):
+            result.pop("order")
+            result["status"] = "accepted" if ok else "failed"
+        counts = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        logger.info(f"Bulk queue of {len(results)} orders: {counts}")
+        return jsonify({"status": "success", "counts": counts, "results": results}), 202
+
+    def cached_json(kind, key, load):
+        """
+        Serves a JSON payload through the order cache with a weak ETag
+        derived from the body. While the body is cached, a matching
+        If-None-Match gets a 304 without calling load(); load() reads
+        (payload, status) from the database and only 200s are cached.
+        """
+        cached = cache.get(kind, key)
+        if cached is None:
+            generation = cache.generation(kind)
+            payload, status = load()
+            if status != 200:
+                return jsonify(payload), status
+            body = jsonify(payload).get_data()
+            cached = (cache.etag(kind, body), body)
+            cache.put(kind, key, cached, generation)
+        etag, body = cached
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype="application/json")
+        response.set_etag(etag, weak=True)
+        return response
+
     @app.route('/orders', methods=['GET'])
     def list_orders():
+        """
+        Returns one page of orders, newest first. Pages are keyed on
+        (ingested_timestamp, id): pass the returned next_cursor as ?cursor=
+        to fetch the following page. Accepts limit, symbol, trader_id,
+        risk_category, since and until query parameters. Pages are cached
+        until the next write (or the cache TTL).
+        """
+        def load_page():
+            try:
+                limit = int(request.args.get("limit", app.config['ORDERS_PAGE_SIZE']))
+            except ValueError:
+                raise InvalidQuery("limit must be an integer")
+            limit = max(1, min(limit, app.config['ORDERS_MAX_PAGE_SIZE']))
+
+            query = filter_orders(Order.query, request.args)
+            cursor = request.args.get("cursor")
+            if cursor:
+                timestamp, order_pk = decode_cursor(cursor)
+                # The plain bound lets Postgres prune partitions; the row comparison breaks ties.
+                query = query.filter(Order.ingested_timestamp <= timestamp,
+                                     db.tuple_(Order.ingested_timestamp, Order.id) < (timestamp, order_pk))
+            # Fetch one extra row to learn whether another page follows.
+            orders = query.order_by(Order.ingested_timestamp.desc(), Order.id.desc()).limit(limit + 1).all()
+            next_cursor = encode_cursor(orders[limit - 1]) if len(orders) > limit else None
+            orders_list = [order.to_dict() for order in orders[:limit]]
+            return {"status": "success", "orders": orders_list, "next_cursor": next_cursor}, 200
+
         try:
-            orders = Order.query.all()
-            orders_list = [order.to_dict() for order in orders]
-            return jsonify({"status": "success", "orders": orders_list}), 200
+            key = hashlib.sha1(urllib.parse.urlencode(sorted(request.args.items(multi=True))).encode()).hexdigest()
+            return cached_json(LISTS, key, load_page)
+        except InvalidQuery as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
         except Exception as e:
             logger.error(f"Error in list_orders: {e}")
             return jsonify({"status": "error", "message": "Internal server error"}), 500
 
+    @app.route('/orders/<order_id>', methods=['GET'])
+    def get_order(order_id):
+        """
+        Returns a single order by order_id, served from the order cache when possible.
+        """
+        def load_order():
+            order = Order.query.filter_by(order_id=order_id).first()
+            if order is None:
+                return {"status": "error", "message": f"Order {order_id} not found"}, 404
+            return {"status": "success", "order": order.to_dict()}, 200
+
+        try:
+            return cached_json(ORDERS, order_id, load_order)
+        except Exception as e:
+            logger.error(f"Error in get_order: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
+    @app.route('/exports/orders', methods=['GET'])
+    def export_orders():
+        """
+        Streams every order matching the GET /orders filters, oldest first,
+        as NDJSON (default) or CSV (?format=csv). The response is written
+        while the rows are read, so memory does not grow with the export size.
+        """
+        export_format = request.args.get("format", "ndjson").lower()
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({"status": "error", "message": f"Unsupported export format: {export_format}"}), 400
+        writer, mimetype, extension = EXPORT_FORMATS[export_format]
+        try:
+            # Parse the filters up front so bad parameters fail before streaming starts.
+            filter_orders(Order.query, request.args)
+        except InvalidQuery as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
+        args = request.args.copy()
+        g.statement_timeout_ms = app.config['DB_EXPORT_STATEMENT_TIMEOUT_MS']
+        logger.info(f"Exporting orders as {export_format} ({args.to_dict()})")
+        return Response(
+            stream_with_context(writer(iter_export_rows(args))),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename=orders.{extension}"},
+        )
+
     @app.route('/orders/<order_id>', methods=['DELETE'])
     def delete_order(order_id):
         try:
@@ -120,6 +697,7 @@ def create_app(test_config=None):
             if order:
                 db.session.delete(order)
                 db.session.commit()
+                cache.order_deleted(order_id)
                 logger.info(f"Order {order_id} deleted")
                 return jsonify({"status": "success", "message": f"Order {order_id} deleted"}), 200
             else:
@@ -129,21 +707,86 @@ def create_app(test_config=None):
             logger.error(f"Error in delete_order: {e}")
             return jsonify({"status": "error", "message": "Internal server error"}), 500
 
+    @app.route('/events', methods=['GET'])
+    def order_events_stream():
+        """
+        Server-Sent Events stream of newly stored orders ("order" events,
+        whose id is the order's /logs cursor). A reconnecting client sends
+        Last-Event-ID (or ?since=) and first receives the orders it missed;
+        if it missed more than LOGS_PAGE_SIZE, or falls behind the live
+        stream, it gets a "resync" event and should refetch instead. When
+        EVENTS_MAX_STREAMS streams are open, a new client gets a "resync" and
+        is asked to reconnect after EVENTS_BUSY_RETRY_MS, without holding a
+        server thread in between.
+        """
+        since = request.headers.get("Last-Event-ID") or request.args.get("since")
+        try:
+            subscription = get_broker().subscribe(app.config['EVENTS_MAX_STREAMS'])
+        except SubscriberLimitReached as e:
+            logger.warning(f"Turning away /events client: {e}")
+            return Response(f"retry: {app.config['EVENTS_BUSY_RETRY_MS']}\n\n{RESYNC_FRAME}",
+                            mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+        try:
+            replay = []
+            if since:
+                limit = app.config['LOGS_PAGE_SIZE']
+                try:
+                    missed = Order.query.filter(*after_cursor(since)) \
+                        .order_by(Order.ingested_timestamp, Order.id).limit(limit + 1).all()
+                except InvalidQuery:
+                    missed = None
+                if missed is None or len(missed) > limit:
+                    replay = [RESYNC_FRAME]
+                else:
+                    replay = [format_event("order", order.to_dict(), encode_cursor(order)) for order in missed]
+        except Exception as e:
+            subscription.close()
+            logger.error(f"Error in order_events_stream: {e}")
+            return jsonify({"status": "error", "message": "Internal server error"}), 500
+
+        def stream():
+            try:
+                yield "retry: 2000\n\n"
+                yield from replay
+                yield from subscription
+            finally:
+                subscription.close()
+
+        return Response(stream(), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
     @app.route('/health', methods=['GET'])
     def health():
         return jsonify({"status": "ok"}), 200
 
     @app.route('/logs', methods=['GET'])
     def get_logs():
+        """
+        Returns ingest log lines in ingestion order. Without ?since= it returns
+        the latest LOGS_PAGE_SIZE entries; with the returned cursor as ?since=
+        it returns only entries ingested after it, so polling costs are
+        proportional to new orders. Both walk the (ingested_timestamp, id) index.
+        """
         try:
-            orders = Order.query.order_by(Order.ingested_timestamp).all()
+            query = Order.query.with_entities(Order.id, Order.order_id, Order.ingested_timestamp)
+            since = request.args.get("since")
+            limit = app.config['LOGS_PAGE_SIZE']
+            if since:
+                orders = query.filter(*after_cursor(since)) \
+                    .order_by(Order.ingested_timestamp, Order.id).limit(limit).all()
+            else:
+                orders = query.order_by(Order.ingested_timestamp.desc(), Order.id.desc()).limit(limit).all()
+                orders.reverse()
             logs = [
                 f"Order {order.order_id} ingested at {order.ingested_timestamp.isoformat()}"
                 for order in orders
             ]
-            if not logs:
+            cursor = encode_cursor(orders[-1]) if orders else since
+            if not logs and not since:
                 logs = ["No orders ingested yet."]
-            return jsonify({"status": "success", "logs": logs}), 200
+            return jsonify({"status": "success", "logs": logs, "cursor": cursor}), 200
+        except InvalidQuery as e:
+            return jsonify({"status": "error", "message": str(e)}), 400
         except Exception as e:
             logger.error(f"Error in get_logs: {e}")
             return jsonify({"status": "error", "message": "Internal server error"}), 500
@@ -161,6 +804,7 @@ def create_app(test_config=None):
     return app
 
 if __name__ == '__main__':
+    # Development server; production runs under gunicorn (see wsgi.py and gunicorn.conf.py).
     app = create_app()
     port = int(os.environ.get("PORT", 5002))
     app.run(host="0.0.0.0", port=port, debug=False)
\ No newline at end of file
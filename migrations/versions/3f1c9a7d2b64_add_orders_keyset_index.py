@@ -0,0 +1,24 @@
+"""Add (ingested_timestamp, id) index for keyset pagination
+
+Revision ID: 3f1c9a7d2b64
+Revises: ade85683388a
+Create Date: 2026-10-17 20:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b64'
+down_revision = 'ade85683388a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_orders_ingested_timestamp_id', 'orders', ['ingested_timestamp', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_orders_ingested_timestamp_id', table_name='orders')
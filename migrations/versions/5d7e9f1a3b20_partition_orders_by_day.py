@@ -0,0 +1,159 @@
+"""Partition orders by day on ingested_timestamp (Postgres)
+
+Revision ID: 5d7e9f1a3b20
+Revises: 8b2e4d6a1c37
+Create Date: 2026-10-17 22:15:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7e9f1a3b20'
+down_revision = '8b2e4d6a1c37'
+branch_labels = None
+depends_on = None
+
+# Partitions created ahead of today; order_partitions.maintain_partitions
+# (flask maintain-partitions) keeps extending this window.
+DAYS_AHEAD = 7
+
+COLUMNS = ("id, order_id, ingested_timestamp, additional_data, symbol, quantity, price, "
+           "trader_id, risk_category, processed_timestamp")
+
+
+def _create_indexes(table):
+    op.execute(f"CREATE INDEX ix_orders_ingested_timestamp_id ON {table} (ingested_timestamp, id)")
+    op.execute(f"CREATE INDEX ix_orders_symbol_ingested_timestamp ON {table} (symbol, ingested_timestamp)")
+    op.execute(f"CREATE INDEX ix_orders_additional_data ON {table} USING gin (additional_data)")
+
+
+def _drop_indexes():
+    op.execute("DROP INDEX ix_orders_ingested_timestamp_id")
+    op.execute("DROP INDEX ix_orders_symbol_ingested_timestamp")
+    op.execute("DROP INDEX ix_orders_additional_data")
+
+
+def upgrade():
+    # Declarative partitioning is Postgres-only; other databases keep the plain table.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE orders RENAME TO orders_unpartitioned")
+    op.execute("ALTER TABLE orders_unpartitioned RENAME CONSTRAINT orders_pkey TO orders_unpartitioned_pkey")
+    op.execute("ALTER TABLE orders_unpartitioned RENAME CONSTRAINT orders_order_id_key TO orders_unpartitioned_order_id_key")
+    _drop_indexes()
+
+    # Unique constraints on a partitioned table must include the partition key,
+    # so the primary key becomes (id, ingested_timestamp) and order_id
+    # uniqueness moves to the order_ids table below.
+    op.execute("""
+        CREATE TABLE orders (
+            id integer NOT NULL DEFAULT nextval('orders_id_seq'),
+            order_id varchar NOT NULL,
+            ingested_timestamp timestamp NOT NULL,
+            additional_data jsonb,
+            symbol varchar,
+            quantity bigint,
+            price double precision,
+            trader_id varchar,
+            risk_category varchar,
+            processed_timestamp timestamp,
+            PRIMARY KEY (id, ingested_timestamp)
+        ) PARTITION BY RANGE (ingested_timestamp)
+    """)
+    op.execute("ALTER SEQUENCE orders_id_seq OWNED BY orders.id")
+    op.execute("CREATE TABLE orders_default PARTITION OF orders DEFAULT")
+    op.execute(f"""
+        DO $$
+        DECLARE
+            day date;
+        BEGIN
+            FOR day IN SELECT generate_series(
+                COALESCE((SELECT min(ingested_timestamp)::date FROM orders_unpartitioned), current_date),
+                GREATEST((SELECT max(ingested_timestamp)::date FROM orders_unpartitioned), current_date) + {DAYS_AHEAD},
+                interval '1 day'
+            )::date
+            LOOP
+                EXECUTE format('CREATE TABLE %I PARTITION OF orders FOR VALUES FROM (%L) TO (%L)',
+                               'orders_p' || to_char(day, 'YYYYMMDD'), day, day + 1);
+            END LOOP;
+        END $$
+    """)
+
+    op.execute(f"INSERT INTO orders ({COLUMNS}) SELECT {COLUMNS} FROM orders_unpartitioned")
+    # Indexes on the parent cascade to every partition; building them after the copy is faster.
+    _create_indexes("orders")
+    # Lookups by order_id (DELETE /orders/<order_id>) probe each partition's index.
+    op.execute("CREATE INDEX ix_orders_order_id ON orders (order_id)")
+
+    # Global order_id uniqueness: one row per order_id, kept in step by triggers.
+    op.execute("""
+        CREATE TABLE order_ids (
+            order_id varchar PRIMARY KEY,
+            ingested_timestamp timestamp NOT NULL
+        )
+    """)
+    op.execute("CREATE INDEX ix_order_ids_ingested_timestamp ON order_ids (ingested_timestamp)")
+    op.execute("INSERT INTO order_ids (order_id, ingested_timestamp) SELECT order_id, ingested_timestamp FROM orders")
+    op.execute("""
+        CREATE FUNCTION orders_claim_order_id() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO order_ids (order_id, ingested_timestamp)
+            VALUES (NEW.order_id, NEW.ingested_timestamp)
+            ON CONFLICT (order_id) DO NOTHING;
+            IF NOT FOUND THEN
+                -- Duplicate order_id: skip the row, like ON CONFLICT DO NOTHING.
+                RETURN NULL;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION orders_release_order_id() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM order_ids WHERE order_id = OLD.order_id;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("CREATE TRIGGER orders_claim_order_id BEFORE INSERT ON orders "
+               "FOR EACH ROW EXECUTE FUNCTION orders_claim_order_id()")
+    op.execute("CREATE TRIGGER orders_release_order_id AFTER DELETE ON orders "
+               "FOR EACH ROW EXECUTE FUNCTION orders_release_order_id()")
+
+    op.execute("DROP TABLE orders_unpartitioned")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("""
+        CREATE TABLE orders_unpartitioned (
+            id integer NOT NULL DEFAULT nextval('orders_id_seq'),
+            order_id varchar NOT NULL,
+            ingested_timestamp timestamp NOT NULL,
+            additional_data jsonb,
+            symbol varchar,
+            quantity bigint,
+            price double precision,
+            trader_id varchar,
+            risk_category varchar,
+            processed_timestamp timestamp,
+            CONSTRAINT orders_unpartitioned_pkey PRIMARY KEY (id),
+            CONSTRAINT orders_unpartitioned_order_id_key UNIQUE (order_id)
+        )
+    """)
+    op.execute(f"INSERT INTO orders_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM orders")
+    op.execute("ALTER SEQUENCE orders_id_seq OWNED BY orders_unpartitioned.id")
+    op.execute("DROP TABLE orders")  # Drops every partition and the triggers with it.
+    op.execute("DROP TABLE order_ids")
+    op.execute("DROP FUNCTION orders_claim_order_id()")
+    op.execute("DROP FUNCTION orders_release_order_id()")
+
+    op.execute("ALTER TABLE orders_unpartitioned RENAME TO orders")
+    op.execute("ALTER TABLE orders RENAME CONSTRAINT orders_unpartitioned_pkey TO orders_pkey")
+    op.execute("ALTER TABLE orders RENAME CONSTRAINT orders_unpartitioned_order_id_key TO orders_order_id_key")
+    _create_indexes("orders")
@@ -0,0 +1,147 @@
+"""Promote hot order fields to columns and index them
+
+Revision ID: 8b2e4d6a1c37
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-17 21:30:00.000000
+
+"""
+import datetime
+import json
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6a1c37'
+down_revision = '3f1c9a7d2b64'
+branch_labels = None
+depends_on = None
+
+# Rows updated per backfill batch. The backfill runs after the DDL has
+# committed, outside the migration transaction, so no batch holds the
+# ALTER TABLE locks and every update commits as soon as it runs. If it
+# fails, the revision stays unstamped: rerunning the upgrade skips the DDL
+# that already exists and only revisits rows the backfill has not filled.
+BACKFILL_BATCH_SIZE = 5000
+
+PROMOTED_COLUMNS = (
+    ('symbol', sa.String),
+    ('quantity', sa.BigInteger),
+    ('price', sa.Float),
+    ('trader_id', sa.String),
+    ('risk_category', sa.String),
+    ('processed_timestamp', sa.DateTime),
+)
+
+
+def _promoted_values(data):
+    # Same coercion as internal_api.promoted_columns; values that do not fit stay NULL.
+    values = {}
+    for field in ("symbol", "trader_id", "risk_category"):
+        value = data.get(field)
+        values[field] = None if value is None else str(value)
+    try:
+        quantity = data["quantity"]
+        if isinstance(quantity, float) and not quantity.is_integer():
+            raise ValueError(quantity)
+        values["quantity"] = int(quantity)
+    except (KeyError, TypeError, ValueError, OverflowError):
+        values["quantity"] = None
+    try:
+        values["price"] = float(data["price"])
+    except (KeyError, TypeError, ValueError):
+        values["price"] = None
+    try:
+        timestamp = datetime.datetime.fromisoformat(data["processed_timestamp"].replace("Z", "+00:00"))
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        values["processed_timestamp"] = timestamp
+    except (KeyError, AttributeError, ValueError):
+        values["processed_timestamp"] = None
+    return values
+
+
+def _backfill(bind):
+    orders = sa.table(
+        'orders',
+        sa.column('id', sa.Integer),
+        sa.column('additional_data', sa.JSON),
+        *(sa.column(name, type_) for name, type_ in PROMOTED_COLUMNS),
+    )
+    update = orders.update().where(orders.c.id == sa.bindparam('order_pk')).values(
+        symbol=sa.bindparam('symbol'),
+        quantity=sa.bindparam('quantity'),
+        price=sa.bindparam('price'),
+        trader_id=sa.bindparam('trader_id'),
+        risk_category=sa.bindparam('risk_category'),
+        processed_timestamp=sa.bindparam('processed_timestamp'),
+    )
+    last_id = 0
+    while True:
+        # Walk the primary key in batches so no single statement touches the whole table.
+        # Rows with any promoted column set were already backfilled (or written by
+        # the application after the DDL), so a rerun skips them.
+        rows = bind.execute(
+            sa.select(orders.c.id, orders.c.additional_data)
+            .where(orders.c.id > last_id)
+            .where(*(orders.c[name].is_(None) for name, _ in PROMOTED_COLUMNS))
+            .order_by(orders.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = []
+        for order_pk, data in rows:
+            if isinstance(data, str):
+                data = json.loads(data)
+            params.append({"order_pk": order_pk, **_promoted_values(data or {})})
+        bind.execute(update, params)
+        last_id = rows[-1].id
+
+
+def upgrade():
+    # Every step checks what exists first: a failed backfill leaves the DDL
+    # committed but the revision unstamped, and the rerun must get past it.
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name']: column for column in inspector.get_columns('orders')}
+    indexes = {index['name'] for index in inspector.get_indexes('orders')}
+
+    missing = [(name, type_) for name, type_ in PROMOTED_COLUMNS if name not in columns]
+    if missing:
+        with op.batch_alter_table('orders') as batch_op:
+            for name, type_ in missing:
+                batch_op.add_column(sa.Column(name, type_(), nullable=True))
+
+    if 'ix_orders_symbol_ingested_timestamp' not in indexes:
+        op.create_index('ix_orders_symbol_ingested_timestamp', 'orders', ['symbol', 'ingested_timestamp'], unique=False)
+    # ingested_timestamp range scans use ix_orders_ingested_timestamp_id (its leading column).
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # GIN needs jsonb; json has no operator class for it.
+        if not isinstance(columns['additional_data']['type'], postgresql.JSONB):
+            op.alter_column('orders', 'additional_data', type_=postgresql.JSONB(),
+                            postgresql_using='additional_data::jsonb')
+        if 'ix_orders_additional_data' not in indexes:
+            op.create_index('ix_orders_additional_data', 'orders', ['additional_data'],
+                            unique=False, postgresql_using='gin')
+
+    # Commits the DDL above first; new orders already fill the columns themselves.
+    with op.get_context().autocommit_block():
+        _backfill(op.get_bind())
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_orders_additional_data', table_name='orders')
+        op.alter_column('orders', 'additional_data', type_=sa.JSON(),
+                        postgresql_using='additional_data::json')
+    op.drop_index('ix_orders_symbol_ingested_timestamp', table_name='orders')
+    with op.batch_alter_table('orders') as batch_op:
+        batch_op.drop_column('processed_timestamp')
+        batch_op.drop_column('risk_category')
+        batch_op.drop_column('trader_id')
+        batch_op.drop_column('price')
+        batch_op.drop_column('quantity')
+        batch_op.drop_column('symbol')
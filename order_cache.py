@@ -0,0 +1,181 @@
+import collections
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+# Seconds a cached response may be served, even if no write was seen.
+DEFAULT_TTL = 5.0
+
+# Cache kinds, each with its own generation counter: any write changes
+# order lists, but only a delete changes an order that was already found.
+LISTS = "lists"
+ORDERS = "orders"
+KINDS = (LISTS, ORDERS)
+
+def _env_number(name, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name} value. Defaulting to {default}.")
+        return default
+
+class LocalGenerations:
+    """
+    Generation counters for a single process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(KINDS, 0)
+
+    def get(self, kind):
+        return self._counters[kind]
+
+    def bump(self, kind):
+        with self._lock:
+            self._counters[kind] += 1
+
+
+class SharedGenerations:
+    """
+    Generation counters in a small memory-mapped file, so that a write
+    handled by one gunicorn worker invalidates the caches of all of them.
+    Layout: one 8-byte counter per kind.
+    """
+
+    _FORMAT = "<Q"
+    _SIZE = 8 * len(KINDS)
+
+    def __init__(self, path):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < self._SIZE:
+                    os.ftruncate(fd, self._SIZE)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self._map = mmap.mmap(fd, self._SIZE)
+        finally:
+            os.close(fd)
+        self._lock_file = open(path, "rb")
+
+    def _offset(self, kind):
+        return 8 * KINDS.index(kind)
+
+    def get(self, kind):
+        return struct.unpack_from(self._FORMAT, self._map, self._offset(kind))[0]
+
+    def bump(self, kind):
+        offset = self._offset(kind)
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            value = struct.unpack_from(self._FORMAT, self._map, offset)[0]
+            struct.pack_into(self._FORMAT, self._map, offset, value + 1)
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+
+class OrderCache:
+    """
+    In-process LRU cache with a TTL for GET /orders pages and order lookups.
+    Each entry remembers the generation of its kind when it was read from the
+    database, and is only served while that generation is current, so a write
+    invalidates every stale entry without scanning the cache. ETags are a
+    digest of the response body, so a client is never told "not modified"
+    about a change the generations did not see (e.g. orders stored by the
+    order sink); the TTL bounds how long such a change takes to show.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, generations=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generations = generations or LocalGenerations()
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # (kind, key) -> (generation, expires_at, value)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls):
+        """
+        Builds a cache configured by ORDER_CACHE_SIZE, ORDER_CACHE_TTL and,
+        for multiple worker processes, ORDER_CACHE_SHARED_PATH.
+        """
+        shared_path = os.environ.get("ORDER_CACHE_SHARED_PATH")
+        generations = SharedGenerations(shared_path) if shared_path else None
+        return cls(
+            max_entries=_env_number("ORDER_CACHE_SIZE", DEFAULT_MAX_ENTRIES, int),
+            ttl=_env_number("ORDER_CACHE_TTL", DEFAULT_TTL, float),
+            generations=generations,
+        )
+
+    def generation(self, kind):
+        return self.generations.get(kind)
+
+    @staticmethod
+    def etag(kind, body):
+        """
+        Returns the ETag of a response of the given kind with body (bytes).
+        """
+        return f"{kind}-{hashlib.blake2b(body, digest_size=12).hexdigest()}"
+
+    def get(self, kind, key):
+        """
+        Returns the cached value for key, or None if it is missing, expired or stale.
+        """
+        generation = self.generation(kind)
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None:
+                entry_generation, expires_at, value = entry
+                if entry_generation == generation and expires_at > time.monotonic():
+                    self._entries.move_to_end((kind, key))
+                    self.hits += 1
+                    return value
+                del self._entries[(kind, key)]
+            self.misses += 1
+            return None
+
+    def put(self, kind, key, value, generation):
+        """
+        Caches value, read from the database while generation was current.
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(kind, key)] = (generation, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def orders_changed(self):
+        """
+        Records that orders were inserted: every cached page is now stale.
+        """
+        self.generations.bump(LISTS)
+
+    def order_deleted(self, order_id):
+        """
+        Records that an order was deleted: pages and that order's lookup are stale.
+        """
+        self.generations.bump(LISTS)
+        self.generations.bump(ORDERS)
+        with self._lock:
+            self._entries.pop((ORDERS, order_id), None)
+
+    def stats(self):
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+__all__ = ["OrderCache", "LocalGenerations", "SharedGenerations", "LISTS", "ORDERS"]
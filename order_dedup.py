@@ -0,0 +1,188 @@
+import collections
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# order_ids remembered exactly, and for how long (seconds).
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_TTL = 3600.0
+# Optional Bloom filter in front of the exact set: 0 disables it.
+DEFAULT_BLOOM_CAPACITY = 0
+DEFAULT_BLOOM_ERROR_RATE = 1e-6
+DEFAULT_BLOOM_WINDOW = 86400.0
+
+def _env_number(name, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name} value. Defaulting to {default}.")
+        return default
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter over strings, sized for capacity entries at
+    error_rate false positives. It never forgets; see RotatingBloomFilter.
+    """
+
+    def __init__(self, capacity, error_rate=DEFAULT_BLOOM_ERROR_RATE):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        # Double hashing: k positions from two 64-bit halves of one digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RotatingBloomFilter:
+    """
+    Two Bloom filters swapped every window seconds, so a key is remembered
+    for between one and two windows in constant memory.
+    """
+
+    def __init__(self, capacity, error_rate=DEFAULT_BLOOM_ERROR_RATE, window=DEFAULT_BLOOM_WINDOW):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window = window
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+
+    def _rotate(self):
+        now = time.monotonic()
+        if now - self._rotated_at >= self.window:
+            self._previous, self._current = self._current, BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+
+    def add(self, key):
+        self._rotate()
+        self._current.add(key)
+
+    def __contains__(self, key):
+        self._rotate()
+        return key in self._current or key in self._previous
+
+
+class OrderDeduplicator:
+    """
+    Remembers processed order_ids so that redelivered or republished orders
+    are skipped without a database round trip. Recent ids are kept exactly
+    in an LRU with a TTL, and only an exact match skips an order, so a new
+    order is never dropped. The optional rotating Bloom filter sits in front
+    of the exact set: a miss proves the order is new without a lookup, and a
+    hit the exact set cannot confirm is processed anyway (counted in
+    bloom_hits), relying on the idempotent writes downstream.
+
+    claim() marks an order in flight, so a copy arriving while the first is
+    being processed is skipped too; complete() records it as processed and
+    release() forgets a claim whose processing failed.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL, bloom_capacity=DEFAULT_BLOOM_CAPACITY,
+                 bloom_error_rate=DEFAULT_BLOOM_ERROR_RATE, bloom_window=DEFAULT_BLOOM_WINDOW):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # The filter must remember ids at least as long as the exact set, or a
+        # Bloom miss would wrongly declare a remembered order new.
+        bloom_window = max(bloom_window, ttl)
+        self.bloom = RotatingBloomFilter(bloom_capacity, bloom_error_rate, bloom_window) if bloom_capacity > 0 else None
+        self._lock = threading.Lock()
+        self._processed = collections.OrderedDict()  # order_id -> expires_at, oldest first
+        self._in_flight = set()
+        self.hits = 0
+        self.misses = 0
+        self.bloom_hits = 0
+
+    @classmethod
+    def from_env(cls):
+        """
+        Builds a deduplicator configured by DEDUP_MAX_ENTRIES, DEDUP_TTL,
+        DEDUP_BLOOM_CAPACITY, DEDUP_BLOOM_ERROR_RATE and DEDUP_BLOOM_WINDOW.
+        """
+        return cls(
+            max_entries=_env_number("DEDUP_MAX_ENTRIES", DEFAULT_MAX_ENTRIES, int),
+            ttl=_env_number("DEDUP_TTL", DEFAULT_TTL, float),
+            bloom_capacity=_env_number("DEDUP_BLOOM_CAPACITY", DEFAULT_BLOOM_CAPACITY, int),
+            bloom_error_rate=_env_number("DEDUP_BLOOM_ERROR_RATE", DEFAULT_BLOOM_ERROR_RATE, float),
+            bloom_window=_env_number("DEDUP_BLOOM_WINDOW", DEFAULT_BLOOM_WINDOW, float),
+        )
+
+    def _is_processed(self, order_id, now):
+        if self.bloom is not None and order_id not in self.bloom:
+            return False  # Never completed within the window: certainly new.
+        expires_at = self._processed.get(order_id)
+        if expires_at is not None:
+            if expires_at > now:
+                return True
+            del self._processed[order_id]
+        if self.bloom is not None:
+            # Possibly seen before, possibly a false positive: never drop on a guess.
+            self.bloom_hits += 1
+        return False
+
+    def claim(self, order_id):
+        """
+        Returns True if the order should be processed (and marks it in
+        flight), or False if it is a duplicate. Orders without an order_id
+        are always processed.
+        """
+        if order_id is None:
+            return True
+        order_id = str(order_id)
+        with self._lock:
+            if order_id in self._in_flight or self._is_processed(order_id, time.monotonic()):
+                self.hits += 1
+                return False
+            self.misses += 1
+            self._in_flight.add(order_id)
+            return True
+
+    def complete(self, order_id):
+        """
+        Records a claimed order as processed.
+        """
+        if order_id is None:
+            return
+        order_id = str(order_id)
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight.discard(order_id)
+            self._processed[order_id] = now + self.ttl
+            self._processed.move_to_end(order_id)
+            # Entries share one TTL, so the expired ones are all at the front.
+            while self._processed and (len(self._processed) > self.max_entries
+                                       or next(iter(self._processed.values())) <= now):
+                self._processed.popitem(last=False)
+            if self.bloom is not None:
+                self.bloom.add(order_id)
+
+    def release(self, order_id):
+        """
+        Forgets a claim whose processing failed, so a redelivery is processed.
+        """
+        if order_id is None:
+            return
+        with self._lock:
+            self._in_flight.discard(str(order_id))
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "bloom_hits": self.bloom_hits,
+                "entries": len(self._processed), "in_flight": len(self._in_flight)}
+
+__all__ = ["OrderDeduplicator", "BloomFilter", "RotatingBloomFilter"]
@@ -0,0 +1,232 @@
+import logging
+import os
+import queue
+import threading
+
+import pika
+
+import serializer
+
+from rabbitmq_publisher import get_publisher, get_rabbitmq_connection
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Frames buffered per subscriber before it is considered too slow and told to resync.
+DEFAULT_MAX_PENDING = 1000
+# Seconds between SSE keepalive comments on an idle stream.
+DEFAULT_KEEPALIVE = 15.0
+# Fanout exchange that carries order events between API processes.
+DEFAULT_FANOUT_EXCHANGE = "order_events"
+# Delay before the fanout bridge reconnects after losing the broker (seconds).
+BRIDGE_RECONNECT_DELAY = 5.0
+
+class SubscriberLimitReached(Exception):
+    """
+    Raised by OrderEventBroker.subscribe() when max_subscribers streams are already open.
+    """
+
+KEEPALIVE_FRAME = ": keepalive\n\n"
+RESYNC_FRAME = "event: resync\ndata: {}\n\n"
+
+def format_event(event, data, event_id=None):
+    """
+    Formats one Server-Sent Events frame. data is serialized to JSON once
+    and the frame is shared by every subscriber.
+    """
+    frame = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{frame}event: {event}\ndata: {serializer.dumps_str(data)}\n\n"
+
+
+class Subscription:
+    """
+    A subscriber's bounded frame queue. Iterating yields frames as they are
+    published, a keepalive comment when the stream is idle, and a resync
+    event if frames were dropped because the subscriber fell behind.
+    """
+
+    def __init__(self, broker, max_pending=DEFAULT_MAX_PENDING, keepalive=DEFAULT_KEEPALIVE):
+        self._broker = broker
+        self._frames = queue.Queue(maxsize=max_pending)
+        self.keepalive = keepalive
+        self.overflowed = False
+        self.closed = False
+
+    def put(self, frame):
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            self.overflowed = True
+
+    def __iter__(self):
+        while not self.closed:
+            if self.overflowed:
+                # Drop the backlog: the client refetches instead of replaying it.
+                self.overflowed = False
+                with self._frames.mutex:
+                    self._frames.queue.clear()
+                yield RESYNC_FRAME
+                continue
+            try:
+                yield self._frames.get(timeout=self.keepalive)
+            except queue.Empty:
+                yield KEEPALIVE_FRAME
+
+    def close(self):
+        self.closed = True
+        self._broker.unsubscribe(self)
+
+
+class OrderEventBroker:
+    """
+    In-process fan-out of pre-formatted event frames to every open stream.
+    Publishing costs one queue put per subscriber; nothing touches the database.
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING, keepalive=DEFAULT_KEEPALIVE, listeners=None):
+        self.max_pending = max_pending
+        self.keepalive = keepalive
+        self.listeners = listeners if listeners is not None else []
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def subscribe(self, max_subscribers=0):
+        """
+        Opens a subscription, unless max_subscribers (0: no limit) are already open.
+        """
+        subscription = Subscription(self, self.max_pending, self.keepalive)
+        with self._lock:
+            if max_subscribers and len(self._subscribers) >= max_subscribers:
+                raise SubscriberLimitReached(f"{len(self._subscribers)} event streams are already open")
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, frame):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.put(frame)
+        for listener in self.listeners:
+            try:
+                listener(frame)
+            except Exception as e:
+                logger.error(f"Order event listener failed: {e}")
+
+
+class FanoutBridge(threading.Thread):
+    """
+    Consumes a RabbitMQ fanout exchange through an exclusive, auto-deleted
+    queue and feeds every frame into the local broker, so that each API
+    process sees the orders ingested by all of them.
+    """
+
+    def __init__(self, broker, exchange=DEFAULT_FANOUT_EXCHANGE, connection_factory=get_rabbitmq_connection):
+        super().__init__(name="order-events-bridge", daemon=True)
+        self.broker = broker
+        self.exchange = exchange
+        self._connection_factory = connection_factory
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            connection = None
+            try:
+                connection = self._connection_factory()
+                channel = connection.channel()
+                channel.exchange_declare(exchange=self.exchange, exchange_type="fanout")
+                result = channel.queue_declare(queue="", exclusive=True, auto_delete=True)
+                channel.queue_bind(queue=result.method.queue, exchange=self.exchange)
+                logger.info(f"Order event bridge bound to exchange {self.exchange}")
+                for _method, _properties, body in channel.consume(result.method.queue, auto_ack=True,
+                                                                  inactivity_timeout=1):
+                    if self._stopped.is_set():
+                        break
+                    if body is not None:
+                        self.broker.publish(body.decode())
+            except pika.exceptions.AMQPError as e:
+                logger.error(f"Order event bridge lost RabbitMQ ({e!r}); reconnecting in {BRIDGE_RECONNECT_DELAY}s")
+                self._stopped.wait(BRIDGE_RECONNECT_DELAY)
+            finally:
+                if connection is not None and connection.is_open:
+                    try:
+                        connection.close()
+                    except pika.exceptions.AMQPError:
+                        pass
+
+    def stop(self):
+        self._stopped.set()
+
+
+_broker = None
+_bridge = None
+_broker_lock = threading.Lock()
+# Called with every frame the process's broker publishes; kept across forks.
+_listeners = []
+
+def _reset_broker_in_child():
+    # Subscribers and the bridge thread belong to the parent process.
+    global _broker, _bridge, _broker_lock
+    _broker = None
+    _bridge = None
+    _broker_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_broker_in_child)
+
+def add_listener(callback):
+    """
+    Calls callback(frame) for every order event this process receives,
+    including events from other processes through the fanout exchange.
+    """
+    _listeners.append(callback)
+
+def fanout_enabled():
+    return os.environ.get("ORDER_EVENTS_FANOUT", "false").lower() == "true"
+
+def get_broker() -> OrderEventBroker:
+    """
+    Returns the process-wide broker, creating it on first use. With
+    ORDER_EVENTS_FANOUT=true this also starts the RabbitMQ fanout bridge.
+    """
+    global _broker, _bridge
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                broker = OrderEventBroker(listeners=_listeners)
+                if fanout_enabled():
+                    _bridge = FanoutBridge(broker, os.environ.get("ORDER_EVENTS_EXCHANGE", DEFAULT_FANOUT_EXCHANGE))
+                    _bridge.start()
+                _broker = broker
+    return _broker
+
+def notify_orders(events):
+    """
+    Pushes (event_id, order) pairs for newly stored orders to live streams:
+    through the fanout exchange when it is enabled, otherwise straight into
+    this process's broker. Delivery is best effort and never raises.
+    """
+    frames = [format_event("order", order, event_id) for event_id, order in events]
+    if not frames:
+        return
+    try:
+        if fanout_enabled():
+            get_broker()  # Make sure this process is bound to the exchange too.
+            exchange = os.environ.get("ORDER_EVENTS_EXCHANGE", DEFAULT_FANOUT_EXCHANGE)
+            get_publisher().broadcast(frames, exchange)
+        else:
+            broker = get_broker()
+            for frame in frames:
+                broker.publish(frame)
+    except Exception as e:
+        logger.error(f"Failed to push {len(frames)} order events: {e}")
+
+__all__ = ["OrderEventBroker", "Subscription", "SubscriberLimitReached", "FanoutBridge", "format_event",
+           "get_broker", "notify_orders", "add_listener"]
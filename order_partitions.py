@@ -0,0 +1,169 @@
+import datetime
+import logging
+import os
+
+import sqlalchemy as sa
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "orders"
+DEFAULT_PARTITION = "orders_default"
+PARTITION_PREFIX = "orders_p"
+PARTITION_DATE_FORMAT = "%Y%m%d"
+
+# Daily partitions created ahead of today by the maintenance command.
+DEFAULT_DAYS_AHEAD = 7
+# Days of partitions kept; 0 keeps everything.
+DEFAULT_RETENTION_DAYS = 0
+RETENTION_DETACH = "detach"
+RETENTION_DROP = "drop"
+RETENTION_MODES = (RETENTION_DETACH, RETENTION_DROP)
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name} value. Defaulting to {default}.")
+        return default
+
+def partition_name(day):
+    return f"{PARTITION_PREFIX}{day.strftime(PARTITION_DATE_FORMAT)}"
+
+def partition_day(name):
+    """
+    Returns the day covered by a daily partition name, or None for any other table.
+    """
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        return datetime.datetime.strptime(name[len(PARTITION_PREFIX):], PARTITION_DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+def missing_partition_days(existing_names, today, days_ahead):
+    """
+    Returns the days from today through today + days_ahead that have no partition yet.
+    """
+    existing = {partition_day(name) for name in existing_names}
+    days = (today + datetime.timedelta(days=offset) for offset in range(days_ahead + 1))
+    return [day for day in days if day not in existing]
+
+def expired_partitions(existing_names, today, retention_days):
+    """
+    Returns the partitions whose whole day is older than the retention window.
+    """
+    if retention_days <= 0:
+        return []
+    cutoff = today - datetime.timedelta(days=retention_days)
+    return sorted(name for name in existing_names
+                  if partition_day(name) is not None and partition_day(name) < cutoff)
+
+def is_partitioned(connection):
+    """
+    Returns whether orders is a partitioned Postgres table (see migration 5d7e9f1a3b20).
+    """
+    if connection.dialect.name != "postgresql":
+        return False
+    relkind = connection.execute(
+        sa.text("SELECT relkind FROM pg_class WHERE relname = :table AND relkind IN ('p', 'r')"),
+        {"table": PARENT_TABLE},
+    ).scalar()
+    return relkind == "p"
+
+def list_partitions(connection):
+    return connection.execute(sa.text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = :table"
+    ), {"table": PARENT_TABLE}).scalars().all()
+
+def create_partition(connection, day):
+    """
+    Creates the daily partition for day. Rows that already landed in the
+    default partition for that day are moved into the new partition first,
+    since Postgres refuses to attach a range the default partition overlaps.
+    """
+    name = partition_name(day)
+    lower, upper = day.isoformat(), (day + datetime.timedelta(days=1)).isoformat()
+    bounds = {"lower": lower, "upper": upper}
+    stray = connection.execute(sa.text(
+        f"SELECT 1 FROM {DEFAULT_PARTITION} "
+        "WHERE ingested_timestamp >= CAST(:lower AS timestamp) AND ingested_timestamp < CAST(:upper AS timestamp) LIMIT 1"
+    ), bounds).first()
+    if stray is None:
+        connection.execute(sa.text(
+            f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        ))
+        return
+    logger.warning(f"Moving rows for {day} out of {DEFAULT_PARTITION} into {name}")
+    connection.execute(sa.text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)"))
+    connection.execute(sa.text(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+        "WHERE ingested_timestamp >= CAST(:lower AS timestamp) AND ingested_timestamp < CAST(:upper AS timestamp) "
+        f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+    ), bounds)
+    connection.execute(sa.text(
+        f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    ))
+
+def ensure_partitions(connection, days_ahead=DEFAULT_DAYS_AHEAD, today=None):
+    """
+    Creates any missing daily partitions from today through today + days_ahead.
+    Returns the names of the partitions created.
+    """
+    today = today or datetime.datetime.now(datetime.timezone.utc).date()
+    created = []
+    for day in missing_partition_days(list_partitions(connection), today, days_ahead):
+        create_partition(connection, day)
+        created.append(partition_name(day))
+    return created
+
+def apply_retention(connection, retention_days=DEFAULT_RETENTION_DAYS, mode=RETENTION_DETACH, today=None):
+    """
+    Detaches (keeping the table for archiving) or drops daily partitions older
+    than retention_days, and releases their order_ids from the dedup table.
+    Only order_ids with a row in a removed partition are released; ids whose
+    rows sit in the default partition keep blocking duplicates.
+    Returns the names of the partitions removed.
+    """
+    if mode not in RETENTION_MODES:
+        raise ValueError(f"Unknown retention mode {mode!r}; expected one of {RETENTION_MODES}")
+    today = today or datetime.datetime.now(datetime.timezone.utc).date()
+    expired = expired_partitions(list_partitions(connection), today, retention_days)
+    for name in expired:
+        # Release the ids while the partition's rows can still be read.
+        connection.execute(sa.text(
+            f"DELETE FROM order_ids USING {name} WHERE order_ids.order_id = {name}.order_id"
+        ))
+        if mode == RETENTION_DROP:
+            connection.execute(sa.text(f"DROP TABLE {name}"))
+        else:
+            connection.execute(sa.text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+    return expired
+
+def maintain_partitions(engine, days_ahead=None, retention_days=None, mode=None):
+    """
+    Runs one maintenance pass (create ahead, then retention) in a single
+    transaction. Settings default to ORDERS_PARTITION_DAYS_AHEAD,
+    ORDERS_RETENTION_DAYS and ORDERS_RETENTION_MODE.
+    """
+    if days_ahead is None:
+        days_ahead = _env_int("ORDERS_PARTITION_DAYS_AHEAD", DEFAULT_DAYS_AHEAD)
+    if retention_days is None:
+        retention_days = _env_int("ORDERS_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+    if mode is None:
+        mode = os.environ.get("ORDERS_RETENTION_MODE", RETENTION_DETACH).lower()
+    with engine.begin() as connection:
+        if not is_partitioned(connection):
+            logger.info("orders is not a partitioned Postgres table; nothing to maintain")
+            return [], []
+        created = ensure_partitions(connection, days_ahead)
+        removed = apply_retention(connection, retention_days, mode)
+    logger.info(f"Partition maintenance: created {created or 'none'}, {mode} {removed or 'none'}")
+    return created, removed
+
+__all__ = ["ensure_partitions", "apply_retention", "maintain_partitions", "partition_name",
+           "missing_partition_days", "expired_partitions", "is_partitioned"]
@@ -0,0 +1,195 @@
+import datetime
+import io
+import logging
+import os
+import types
+
+import sqlalchemy as sa
+
+import serializer
+from internal_api import (InvalidQuery, database_uri, encode_cursor, engine_options, parse_timestamp, promoted_columns,
+                          validate_order)
+from order_cache import LISTS, SharedGenerations
+from order_events import DEFAULT_FANOUT_EXCHANGE, format_event
+from rabbitmq_publisher import get_publisher
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Order columns written by the sink, in COPY order.
+COLUMNS = ("order_id", "ingested_timestamp", "symbol", "quantity", "price",
+           "trader_id", "risk_category", "processed_timestamp", "additional_data")
+_COLUMN_LIST = ", ".join(COLUMNS)
+
+# Per-connection staging table; rows are cleared by every commit.
+STAGING_TABLE = "orders_staging"
+CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    order_id text, ingested_timestamp timestamp, symbol text, quantity bigint,
+    price double precision, trader_id text, risk_category text,
+    processed_timestamp timestamp, additional_data jsonb
+) ON COMMIT DELETE ROWS
+"""
+# ON CONFLICT skips order_ids already stored (including ones the API stored
+# itself in sync ingest mode, and duplicates within the batch).
+INSERT_FROM_STAGING_SQL = (
+    f"INSERT INTO orders ({_COLUMN_LIST}) SELECT {_COLUMN_LIST} FROM {STAGING_TABLE} "
+    "ON CONFLICT DO NOTHING RETURNING id, order_id, ingested_timestamp"
+)
+INSERT_ONE_SQL = (
+    f"INSERT INTO orders ({_COLUMN_LIST}) VALUES ({', '.join(['%s'] * len(COLUMNS))}) "
+    "ON CONFLICT DO NOTHING RETURNING id, order_id, ingested_timestamp"
+)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def copy_value(value):
+    """
+    Formats one value for COPY's text format.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    return str(value).translate(_COPY_ESCAPES)
+
+def order_row(order, ingested_timestamp):
+    """
+    Returns the COLUMNS values for an order message, the same values
+    POST /orders stores. The order's own ingested_timestamp (set by the API)
+    wins over the sink's.
+    """
+    try:
+        ingested_timestamp = parse_timestamp(order["ingested_timestamp"], "ingested_timestamp")
+    except (KeyError, AttributeError, TypeError, InvalidQuery):
+        pass
+    columns = promoted_columns(order)
+    return (
+        order["order_id"], ingested_timestamp, columns["symbol"], columns["quantity"], columns["price"],
+        columns["trader_id"], columns["risk_category"], columns["processed_timestamp"],
+        serializer.dumps_str(order),
+    )
+
+def copy_buffer(rows):
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+class PostgresOrderSink:
+    """
+    Writes batches of consumed orders into the orders table: one COPY into
+    a temporary staging table, then one INSERT ... SELECT ... ON CONFLICT DO
+    NOTHING, in a single transaction. write() is a process_orders hook for
+    the batch consumer, which acks the batch only after write() returns,
+    i.e. after the commit.
+    """
+
+    def __init__(self, engine):
+        if engine.dialect.name != "postgresql" or engine.dialect.driver != "psycopg2":
+            raise ValueError(f"The order sink needs Postgres with psycopg2, "
+                             f"not {engine.dialect.name}+{engine.dialect.driver}")
+        self.engine = engine
+        self._dbapi = engine.dialect.dbapi
+        # On the API's host, invalidate its cached pages directly as well.
+        shared_path = os.environ.get("ORDER_CACHE_SHARED_PATH")
+        self.generations = SharedGenerations(shared_path) if shared_path else None
+        self.stats = {"batches": 0, "inserted": 0, "skipped": 0}
+
+    @classmethod
+    def from_env(cls):
+        """
+        Builds a sink on DATABASE_URL, with the API's pool settings.
+        """
+        uri = database_uri()
+        return cls(sa.create_engine(uri, **engine_options(uri)))
+
+    def write(self, orders):
+        """
+        Stores orders and returns how many from the start of the list were
+        handled (stored, or skipped as duplicates). An order that cannot be
+        stored ends the prefix; connection errors propagate, so the batch is
+        retried.
+        """
+        for index, order in enumerate(orders):
+            error = validate_order(order)
+            if error:
+                logger.error(f"Cannot store order {order!r}: {error}")
+                orders = orders[:index]
+                break
+        if not orders:
+            return 0
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        rows = [order_row(order, now) for order in orders]
+        connection = self.engine.raw_connection()
+        try:
+            try:
+                inserted = self._copy(connection, rows)
+                done = len(rows)
+            except (self._dbapi.DataError, self._dbapi.IntegrityError) as e:
+                connection.rollback()
+                logger.warning(f"COPY of {len(rows)} orders failed ({e}); inserting them one by one")
+                inserted, done = self._insert_each(connection, rows)
+        finally:
+            connection.close()
+        self.stats["batches"] += 1
+        self.stats["inserted"] += len(inserted)
+        self.stats["skipped"] += done - len(inserted)
+        logger.info(f"Stored {len(inserted)} of {done} orders ({done - len(inserted)} already stored)")
+        if inserted and self.generations is not None:
+            self.generations.bump(LISTS)
+        self._notify(orders[:done], inserted)
+        return done
+
+    def _copy(self, connection, rows):
+        cursor = connection.cursor()
+        try:
+            cursor.execute(CREATE_STAGING_SQL)
+            cursor.copy_expert(f"COPY {STAGING_TABLE} ({_COLUMN_LIST}) FROM STDIN", copy_buffer(rows))
+            cursor.execute(INSERT_FROM_STAGING_SQL)
+            inserted = cursor.fetchall()
+            connection.commit()
+        finally:
+            cursor.close()
+        return inserted
+
+    def _insert_each(self, connection, rows):
+        # Slow path: find the first row Postgres refuses; keep the ones before it.
+        cursor = connection.cursor()
+        inserted = []
+        try:
+            for index, row in enumerate(rows):
+                try:
+                    cursor.execute(INSERT_ONE_SQL, row)
+                except (self._dbapi.DataError, self._dbapi.IntegrityError) as e:
+                    logger.error(f"Cannot store order {row[0]}: {e}")
+                    connection.rollback()
+                    # Rows before the bad one are stored on their own.
+                    return self._insert_each(connection, rows[:index])[0], index
+                inserted.extend(cursor.fetchall())
+            connection.commit()
+        finally:
+            cursor.close()
+        return inserted, len(rows)
+
+    def _notify(self, orders, inserted):
+        # Always broadcast: the sink runs outside the API, so the fanout
+        # exchange is the only way its orders reach live /events streams and
+        # invalidate the API processes' order caches.
+        if not inserted:
+            return
+        by_id = {order["order_id"]: order for order in orders}
+        frames = []
+        for order_pk, order_id, ingested_timestamp in inserted:
+            position = types.SimpleNamespace(id=order_pk, ingested_timestamp=ingested_timestamp)
+            frames.append(format_event("order", by_id[order_id], encode_cursor(position)))
+        try:
+            get_publisher().broadcast(frames, os.environ.get("ORDER_EVENTS_EXCHANGE", DEFAULT_FANOUT_EXCHANGE))
+        except Exception as e:
+            logger.error(f"Failed to push {len(frames)} order events: {e}")
+
+__all__ = ["PostgresOrderSink", "order_row", "copy_value", "COLUMNS"]
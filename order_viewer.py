@@ -3,6 +3,9 @@ from tkinter import ttk
 import requests
 import json
 import logging
+import queue
+import threading
+import time
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
@@ -10,6 +13,10 @@ logging.basicConfig(level=logging.INFO,
 
 # URL for the internal API endpoint that provides the list of orders.
 API_URL = "http://localhost:5001/orders"  # Adjust if your API is running on a different port
+# Orders requested per page; older pages are fetched with "Load More".
+PAGE_SIZE = 100
+# Server-Sent Events stream that pushes newly stored orders.
+EVENTS_URL = "http://localhost:5001/events"
 
 class OrderViewer(tk.Tk):
     def __init__(self):
@@ -39,44 +46,116 @@ class OrderViewer(tk.Tk):
         refresh_btn = ttk.Button(self, text="Refresh Orders", command=self.refresh_orders)
         refresh_btn.pack(pady=(0,5))
 
+        # Load the next (older) page of orders
+        self.next_cursor = None
+        self.load_more_btn = ttk.Button(self, text="Load More", command=self.load_more_orders,
+                                        state=tk.DISABLED)
+        self.load_more_btn.pack(pady=(0,5))
+
         # Status label for monitoring messages
         self.status_label = ttk.Label(self, text="Status: Ready")
         self.status_label.pack(pady=(0,10))
 
-        # Start periodic refresh every 10 seconds
-        self.after(10000, self.refresh_orders)
+        # New orders are pushed by the API; a background thread reads the
+        # event stream and hands orders to the Tk thread through this queue.
+        self.events = queue.Queue()
+        threading.Thread(target=self.listen_for_orders, daemon=True).start()
+        self.after(0, self.refresh_orders)
+        self.after(200, self.drain_events)
+
+    def fetch_page(self, cursor=None):
+        """Fetch one page of orders (newest first) from the internal API."""
+        params = {"limit": PAGE_SIZE}
+        if cursor:
+            params["cursor"] = cursor
+        response = requests.get(API_URL, params=params)
+        if response.status_code != 200:
+            raise RuntimeError(f"Error fetching orders (Status code: {response.status_code})")
+        data = response.json()
+        return data.get("orders", []), data.get("next_cursor")
+
+    def show_orders(self, orders, next_cursor, append=False):
+        """Insert a page of orders into the Treeview."""
+        if not append:
+            # Clear existing entries in the Treeview
+            for item in self.tree.get_children():
+                self.tree.delete(item)
+        start = len(self.tree.get_children()) + 1
+        for idx, order in enumerate(orders, start=start):
+            self.tree.insert("", "end", text=str(idx),
+                             values=(order.get("order_id", ""),
+                                     order.get("symbol", ""),
+                                     order.get("quantity", ""),
+                                     order.get("price", ""),
+                                     order.get("ingested_timestamp", "")))
+        self.next_cursor = next_cursor
+        self.load_more_btn.config(state=tk.NORMAL if next_cursor else tk.DISABLED)
+        loaded = len(self.tree.get_children())
+        self.status_label.config(text=f"Status: {loaded} orders loaded")
+        logging.info(f"Loaded {loaded} orders")
 
     def refresh_orders(self):
-        """Fetch orders from the internal API and update the UI."""
+        """Fetch the newest page of orders from the internal API and update the UI."""
         logging.info("Refreshing orders from API...")
         try:
-            response = requests.get(API_URL)
-            if response.status_code == 200:
-                data = response.json()
-                orders = data.get("orders", [])
-                # Clear existing entries in the Treeview
-                for item in self.tree.get_children():
-                    self.tree.delete(item)
-                # Insert each order into the Treeview
-                for idx, order in enumerate(orders, start=1):
-                    self.tree.insert("", "end", text=str(idx),
-                                     values=(order.get("order_id", ""),
-                                             order.get("symbol", ""),
-                                             order.get("quantity", ""),
-                                             order.get("price", ""),
-                                             order.get("ingested_timestamp", "")))
-                self.status_label.config(text=f"Status: {len(orders)} orders loaded")
-                logging.info(f"Loaded {len(orders)} orders")
-            else:
-                err_msg = f"Error fetching orders (Status code: {response.status_code})"
-                self.status_label.config(text=f"Status: {err_msg}")
-                logging.error(err_msg)
+            orders, next_cursor = self.fetch_page()
+            self.show_orders(orders, next_cursor)
         except Exception as e:
             err_msg = f"Exception during fetching orders: {e}"
             self.status_label.config(text="Status: Error fetching orders")
             logging.error(err_msg)
-        # Schedule the next refresh in 10 seconds
-        self.after(10000, self.refresh_orders)
+
+    def load_more_orders(self):
+        """Append the next (older) page of orders."""
+        if not self.next_cursor:
+            return
+        try:
+            orders, next_cursor = self.fetch_page(self.next_cursor)
+            self.show_orders(orders, next_cursor, append=True)
+        except Exception as e:
+            self.status_label.config(text="Status: Error fetching orders")
+            logging.error(f"Exception during fetching orders: {e}")
+
+    def listen_for_orders(self):
+        """Read the API's event stream (runs on a background thread)."""
+        while True:
+            try:
+                with requests.get(EVENTS_URL, stream=True, timeout=(5, 60)) as response:
+                    event = {}
+                    for line in response.iter_lines(decode_unicode=True):
+                        if line:
+                            field, _, value = line.partition(": ")
+                            event[field] = value
+                            continue
+                        # A blank line ends the event.
+                        if event.get("event") == "order":
+                            self.events.put(json.loads(event["data"]))
+                        elif event.get("event") == "resync":
+                            self.events.put(None)
+                        event = {}
+            except Exception as e:
+                logging.error(f"Order event stream error: {e}; reconnecting in 5 seconds")
+                time.sleep(5)
+
+    def drain_events(self):
+        """Insert pushed orders at the top of the Treeview (runs on the Tk thread)."""
+        try:
+            while True:
+                order = self.events.get_nowait()
+                if order is None:
+                    # Events were dropped: reload the newest page.
+                    self.refresh_orders()
+                    continue
+                self.tree.insert("", 0, text="new",
+                                 values=(order.get("order_id", ""),
+                                         order.get("symbol", ""),
+                                         order.get("quantity", ""),
+                                         order.get("price", ""),
+                                         order.get("ingested_timestamp", "")))
+                self.status_label.config(text=f"Status: {len(self.tree.get_children())} orders loaded")
+        except queue.Empty:
+            pass
+        self.after(200, self.drain_events)
 
 if __name__ == '__main__':
     app = OrderViewer()
@@ -0,0 +1,257 @@
+import logging
+import os
+import queue
+import threading
+import time
+
+import serializer
+from rabbitmq_publisher import publish_orders
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Backpressure policies applied when the in-memory queue is full.
+POLICY_BLOCK = "block"    # Wait for the publisher worker to make room.
+POLICY_DISK = "disk"      # Append the order to a spool file and return immediately.
+POLICY_REJECT = "reject"  # Raise PublishQueueFull to the caller.
+BACKPRESSURE_POLICIES = (POLICY_BLOCK, POLICY_DISK, POLICY_REJECT)
+
+DEFAULT_MAX_SIZE = 10000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_SPOOL_PATH = "publish_spool.ndjson"
+# Seconds between replays of the spool file while the queue is idle.
+DEFAULT_REPLAY_INTERVAL = 5.0
+
+class PublishQueueFull(Exception):
+    """
+    Raised by PublishQueue.submit() under the reject policy when the queue is full.
+    """
+
+class PublishQueue:
+    """
+    Bounded in-process queue of orders drained by a dedicated publisher thread,
+    so that callers never wait on RabbitMQ. The worker publishes whatever has
+    accumulated (up to batch_size orders) as one confirmed batch. Orders
+    spooled to disk are replayed at start-up and then whenever the queue has
+    drained, at most every replay_interval seconds.
+    """
+
+    def __init__(self, queue_name="orders", max_size=None, policy=None, spool_path=None,
+                 batch_size=DEFAULT_BATCH_SIZE, publish_batch=publish_orders, replay_interval=None):
+        if max_size is None:
+            try:
+                max_size = int(os.environ.get("PUBLISH_QUEUE_MAX_SIZE", DEFAULT_MAX_SIZE))
+            except ValueError:
+                logger.warning(f"Invalid PUBLISH_QUEUE_MAX_SIZE value. Defaulting to {DEFAULT_MAX_SIZE}.")
+                max_size = DEFAULT_MAX_SIZE
+        if replay_interval is None:
+            try:
+                replay_interval = float(os.environ.get("PUBLISH_QUEUE_REPLAY_INTERVAL", DEFAULT_REPLAY_INTERVAL))
+            except ValueError:
+                logger.warning(f"Invalid PUBLISH_QUEUE_REPLAY_INTERVAL value. Defaulting to {DEFAULT_REPLAY_INTERVAL}.")
+                replay_interval = DEFAULT_REPLAY_INTERVAL
+        if policy is None:
+            policy = os.environ.get("PUBLISH_QUEUE_POLICY", POLICY_BLOCK).lower()
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy {policy!r}; expected one of {BACKPRESSURE_POLICIES}")
+        self.queue_name = queue_name
+        self.max_size = max_size
+        self.policy = policy
+        self.spool_path = spool_path or os.environ.get("PUBLISH_QUEUE_SPOOL_PATH", DEFAULT_SPOOL_PATH)
+        self.batch_size = batch_size
+        self.replay_interval = replay_interval
+        self._publish_batch = publish_batch
+        self._queue = queue.Queue(maxsize=max_size)
+        self._spool_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counters = {"submitted": 0, "published": 0, "failed": 0, "rejected": 0, "spooled": 0}
+        self._stopping = threading.Event()
+        self._worker = None
+
+    @property
+    def depth(self):
+        """
+        Number of orders waiting to be published.
+        """
+        return self._queue.qsize()
+
+    def stats(self):
+        """
+        Returns a snapshot of the queue counters together with the current depth.
+        """
+        with self._stats_lock:
+            snapshot = dict(self._counters)
+        snapshot.update(depth=self.depth, max_size=self.max_size, policy=self.policy)
+        return snapshot
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._counters[name] += amount
+
+    def start(self):
+        """
+        Starts the publisher worker thread, first replaying anything left in the spool file.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._stopping.clear()
+            self._worker = threading.Thread(target=self._run, name="publish-queue", daemon=True)
+            self._worker.start()
+        return self
+
+    def submit(self, order: dict, block: bool = True) -> None:
+        """
+        Hands an order to the publisher worker, applying the backpressure
+        policy if the queue is full. With block=False (e.g. on an event loop)
+        the block policy spools to disk instead of waiting.
+        """
+        if self.policy == POLICY_BLOCK and block:
+            self._queue.put(order)
+        else:
+            try:
+                self._queue.put_nowait(order)
+            except queue.Full:
+                if self.policy == POLICY_REJECT:
+                    self._count("rejected")
+                    raise PublishQueueFull(f"Publish queue is full ({self.max_size} orders)")
+                self.spool([order])
+                logger.warning(f"Publish queue full; spooled order {order.get('order_id')} to {self.spool_path}")
+        self._count("submitted")
+
+    def join(self):
+        """
+        Blocks until every submitted order has been published (or has failed).
+        """
+        self._queue.join()
+
+    def stop(self, timeout=None):
+        """
+        Publishes what is already queued and stops the worker thread.
+        """
+        self._stopping.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    def _replay_safely(self):
+        # A replay failure (e.g. a full disk) must not kill the worker: callers
+        # under the block policy would then wait on a queue nobody drains.
+        try:
+            self.replay_spool()
+        except Exception as e:
+            logger.error(f"Failed to replay {self.spool_path}: {e!r}; retrying later")
+
+    def _run(self):
+        self._replay_safely()
+        last_replay = time.monotonic()
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.5)]
+            except queue.Empty:
+                # Idle: retry what was spooled since (overflow and unconfirmed orders).
+                if not self._stopping.is_set() and time.monotonic() - last_replay >= self.replay_interval:
+                    self._replay_safely()
+                    last_replay = time.monotonic()
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._publish(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _publish(self, batch):
+        """
+        Publishes one batch and spools the orders RabbitMQ did not confirm,
+        whatever the backpressure policy. Returns how many failed.
+        """
+        try:
+            results = self._publish_batch(batch, self.queue_name)
+        except Exception as e:
+            logger.error(f"Failed to publish batch of {len(batch)} orders: {e}")
+            results = [False] * len(batch)
+        failed = [order for order, ok in zip(batch, results) if not ok]
+        self._count("published", len(batch) - len(failed))
+        if failed:
+            self._count("failed", len(failed))
+            logger.error(f"{len(failed)} orders were not confirmed by RabbitMQ; spooling them for replay")
+            self.spool(failed)
+        return len(failed)
+
+    def spool(self, orders):
+        """
+        Appends orders to the spool file; the worker replays it once the queue is idle.
+        """
+        with self._spool_lock:
+            with open(self.spool_path, "a", encoding="utf-8") as spool:
+                for order in orders:
+                    spool.write(serializer.dumps_str(order) + "\n")
+        self._count("spooled", len(orders))
+
+    def replay_spool(self):
+        """
+        Publishes orders spooled to disk by an earlier run or while the queue was full.
+        Orders that are not confirmed go back to the spool. The replay file is
+        only removed once every batch has been confirmed or re-spooled, so a
+        crash part-way through replays it again on the next start. Lines that
+        do not decode (e.g. torn by a crash mid-write) are moved to a .bad file.
+        """
+        replay_path = self.spool_path + ".replay"
+        with self._spool_lock:
+            # A replay file left by a crash is replayed before the spool is moved again.
+            if not os.path.exists(replay_path):
+                if not os.path.exists(self.spool_path):
+                    return
+                os.replace(self.spool_path, replay_path)
+        orders, bad_lines = [], []
+        with open(replay_path, encoding="utf-8", errors="replace") as spool:
+            for line in spool:
+                if not line.strip():
+                    continue
+                try:
+                    order = serializer.loads(line)
+                except ValueError:
+                    order = None
+                if isinstance(order, dict):
+                    orders.append(order)
+                else:
+                    bad_lines.append(line if line.endswith("\n") else line + "\n")
+        if bad_lines:
+            with open(self.spool_path + ".bad", "a", encoding="utf-8") as bad:
+                bad.writelines(bad_lines)
+            logger.error(f"Moved {len(bad_lines)} undecodable spool lines to {self.spool_path}.bad")
+        logger.info(f"Replaying {len(orders)} spooled orders from {self.spool_path}")
+        failed = 0
+        for start in range(0, len(orders), self.batch_size):
+            failed += self._publish(orders[start:start + self.batch_size])
+        os.remove(replay_path)
+        if failed:
+            logger.warning(f"{failed} replayed orders were spooled again")
+
+
+_publish_queue = None
+_publish_queue_lock = threading.Lock()
+
+def _reset_publish_queue_in_child():
+    # The worker thread does not survive a fork; a child starts its own queue on first use.
+    global _publish_queue, _publish_queue_lock
+    _publish_queue = None
+    _publish_queue_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_publish_queue_in_child)
+
+def get_publish_queue() -> PublishQueue:
+    """
+    Returns the process-wide publish queue for the "orders" queue, starting its worker on first use.
+    """
+    global _publish_queue
+    if _publish_queue is None:
+        with _publish_queue_lock:
+            if _publish_queue is None:
+                _publish_queue = PublishQueue().start()
+    return _publish_queue
+
+__all__ = ["PublishQueue", "PublishQueueFull", "get_publish_queue", "BACKPRESSURE_POLICIES"]
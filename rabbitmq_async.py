@@ -0,0 +1,270 @@
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import ssl
+import urllib.parse
+import weakref
+
+import serializer
+from rabbitmq_consumer import DEFAULT_PREFETCH_COUNT, dedup_from_env, order_id_of, process_order
+from rabbitmq_publisher import DEFAULT_POOL_SIZE
+
+try:
+    import aio_pika  # Optional: asyncio RabbitMQ client for the async variants.
+    import aio_pika.pool
+except ImportError:
+    aio_pika = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Maximum number of unconfirmed messages in flight per batch, and how long to
+# wait for the broker to confirm the tail of a batch.
+DEFAULT_CONFIRM_WINDOW = 1000
+DEFAULT_CONFIRM_TIMEOUT = 30.0
+
+def require_aio_pika():
+    if aio_pika is None:
+        raise RuntimeError("The asyncio RabbitMQ variants (FIX_ASYNC_PUBLISH=true, rabbitmq_async.py) "
+                           "need aio-pika; install requirements.txt or pip install aio-pika")
+
+def connection_url():
+    """
+    Returns (url, ssl_context) for the broker, from the same settings as
+    rabbitmq_publisher.get_rabbitmq_connection: CLOUDAMQP_URL over TLS
+    unless USE_LOCAL_RABBITMQ=true, otherwise RABBITMQ_HOST and RABBITMQ_PORT.
+    """
+    use_local = os.environ.get("USE_LOCAL_RABBITMQ", "false").lower() == "true"
+    cloudamqp_url = os.environ.get("CLOUDAMQP_URL")
+    if cloudamqp_url and not use_local:
+        url = urllib.parse.urlsplit(cloudamqp_url)
+        netloc = url.netloc if url.port else f"{url.netloc}:5671"  # CloudAMQP typically uses 5671 for SSL
+        url = urllib.parse.urlunsplit(("amqps", netloc, url.path or "/", url.query, ""))
+        return url, ssl.create_default_context()
+    rabbitmq_host = os.environ.get("RABBITMQ_HOST", "localhost")
+    try:
+        rabbitmq_port = int(os.environ.get("RABBITMQ_PORT", 5672))
+    except ValueError:
+        logger.warning("Invalid RABBITMQ_PORT value. Defaulting to 5672.")
+        rabbitmq_port = 5672
+    return f"amqp://guest:guest@{rabbitmq_host}:{rabbitmq_port}/", None
+
+async def get_async_connection():
+    """
+    Opens a robust (auto-reconnecting) asyncio connection to RabbitMQ.
+    """
+    require_aio_pika()
+    url, ssl_context = connection_url()
+    logger.info(f"Connecting asynchronously to RabbitMQ at {urllib.parse.urlsplit(url).hostname}")
+    if ssl_context is not None:
+        return await aio_pika.connect_robust(url, ssl_context=ssl_context)
+    return await aio_pika.connect_robust(url)
+
+
+class AsyncRabbitMQPublisher:
+    """
+    The asyncio counterpart of RabbitMQPublisher: one robust connection and
+    a pool of confirm-mode channels, shared by every task on the event loop.
+    publish() returns once the broker has confirmed the message.
+    """
+
+    def __init__(self, pool_size=None, connection_factory=get_async_connection):
+        require_aio_pika()
+        if pool_size is None:
+            try:
+                pool_size = int(os.environ.get("RABBITMQ_PUBLISHER_POOL_SIZE", DEFAULT_POOL_SIZE))
+            except ValueError:
+                logger.warning(f"Invalid RABBITMQ_PUBLISHER_POOL_SIZE value. Defaulting to {DEFAULT_POOL_SIZE}.")
+                pool_size = DEFAULT_POOL_SIZE
+        self.pool_size = pool_size
+        self._connection_factory = connection_factory
+        self._connection = None
+        self._connection_lock = asyncio.Lock()
+        self._channels = aio_pika.pool.Pool(self._open_channel, max_size=pool_size)
+        self._declared = set()
+
+    async def _get_connection(self):
+        async with self._connection_lock:
+            if self._connection is None or self._connection.is_closed:
+                self._connection = await self._connection_factory()
+            return self._connection
+
+    async def _open_channel(self):
+        connection = await self._get_connection()
+        return await connection.channel(publisher_confirms=True)
+
+    async def _declare_queue(self, channel, queue_name):
+        if queue_name not in self._declared:
+            await channel.declare_queue(queue_name, durable=True)
+            self._declared.add(queue_name)
+
+    @staticmethod
+    def _message(order):
+        return aio_pika.Message(serializer.dumps(order), content_type="application/json",
+                                delivery_mode=aio_pika.DeliveryMode.PERSISTENT)
+
+    async def publish(self, order: dict, queue_name: str = "orders", timeout: float = DEFAULT_CONFIRM_TIMEOUT):
+        """
+        Publishes an order as a persistent message and waits for its confirm.
+        Raises if the broker nacks it or does not confirm it in time.
+        """
+        message = self._message(order)
+        async with self._channels.acquire() as channel:
+            await self._declare_queue(channel, queue_name)
+            await channel.default_exchange.publish(message, routing_key=queue_name, timeout=timeout)
+
+    async def publish_batch(self, orders, queue_name: str = "orders",
+                            window: int = DEFAULT_CONFIRM_WINDOW,
+                            timeout: float = DEFAULT_CONFIRM_TIMEOUT) -> list:
+        """
+        Publishes many orders on one channel with up to `window` confirms
+        outstanding. Returns one boolean per order, in input order: True once
+        the broker acked it, False if it was nacked, timed out or could not
+        be serialized.
+        """
+        orders = list(orders)
+        results = [False] * len(orders)
+        async with self._channels.acquire() as channel:
+            await self._declare_queue(channel, queue_name)
+            exchange = channel.default_exchange
+            for start in range(0, len(orders), window):
+                publishes, indexes = [], []
+                for index in range(start, min(start + window, len(orders))):
+                    try:
+                        message = self._message(orders[index])
+                    except (TypeError, ValueError) as e:
+                        logger.error(f"Cannot serialize order {orders[index]!r}: {e}")
+                        continue
+                    publishes.append(exchange.publish(message, routing_key=queue_name, timeout=timeout))
+                    indexes.append(index)
+                outcomes = await asyncio.gather(*publishes, return_exceptions=True)
+                for index, outcome in zip(indexes, outcomes):
+                    results[index] = not isinstance(outcome, BaseException)
+        return results
+
+    async def close(self):
+        await self._channels.close()
+        if self._connection is not None and not self._connection.is_closed:
+            await self._connection.close()
+        self._connection = None
+
+
+# One publisher per event loop: aio-pika objects cannot be shared across loops.
+_publishers = weakref.WeakKeyDictionary()
+
+def get_async_publisher() -> AsyncRabbitMQPublisher:
+    """
+    Returns the running event loop's publisher, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    publisher = _publishers.get(loop)
+    if publisher is None:
+        publisher = _publishers[loop] = AsyncRabbitMQPublisher()
+    return publisher
+
+async def publish_order(order: dict, queue_name: str = "orders") -> None:
+    """
+    Publishes an enriched order to the specified RabbitMQ queue and waits for the confirm.
+    """
+    try:
+        await get_async_publisher().publish(order, queue_name)
+        logger.info(f"Published order: {order.get('order_id')}")
+    except Exception as e:
+        logger.error(f"Failed to publish order: {e}")
+        raise
+
+async def publish_orders(orders, queue_name: str = "orders") -> list:
+    """
+    Publishes a batch of orders with publisher confirms and returns a list
+    with one boolean per order indicating whether the broker accepted it.
+    """
+    results = await get_async_publisher().publish_batch(orders, queue_name)
+    confirmed = sum(results)
+    if confirmed == len(results):
+        logger.info(f"Published {confirmed} orders to {queue_name}")
+    else:
+        logger.error(f"Published {confirmed} of {len(results)} orders to {queue_name}")
+    return results
+
+
+class AsyncOrderHandler:
+    """
+    Settles one delivery at a time for the asyncio consumer: decodes the
+    order, skips duplicates, runs process (a function or a coroutine
+    function) and acks, or rejects the message if processing failed.
+    """
+
+    def __init__(self, process, dedup=None):
+        self.process = process
+        self.dedup = dedup
+        self.stats = {"acked": 0, "rejected": 0, "duplicates": 0}
+
+    async def __call__(self, message):
+        try:
+            order = serializer.decode_order_dict(message.body)
+        except ValueError as e:
+            logger.error(f"Rejecting invalid order message: {e}")
+            await message.reject(requeue=False)
+            self.stats["rejected"] += 1
+            return
+        order_id = order_id_of(order)
+        if self.dedup is not None and not self.dedup.claim(order_id):
+            await message.ack()
+            self.stats["duplicates"] += 1
+            return
+        try:
+            result = self.process(order)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Error processing order {order_id}: {e}")
+            if self.dedup is not None:
+                self.dedup.release(order_id)
+            await message.reject(requeue=False)
+            self.stats["rejected"] += 1
+            return
+        if self.dedup is not None:
+            self.dedup.complete(order_id)
+        await message.ack()
+        self.stats["acked"] += 1
+
+
+async def start_order_consumer(queue_name: str = "orders", processed_orders=None, process=None, stop=None):
+    """
+    Consumes the queue on the running event loop until stop (an
+    asyncio.Event) is set. Up to CONSUMER_PREFETCH deliveries are handled
+    concurrently; process may be a coroutine function, so awaiting I/O
+    in it does not hold up other orders.
+    """
+    if process is None:
+        process = functools.partial(process_order, processed_orders=processed_orders)
+    try:
+        prefetch = int(os.environ.get("CONSUMER_PREFETCH", DEFAULT_PREFETCH_COUNT))
+    except ValueError:
+        logger.warning(f"Invalid CONSUMER_PREFETCH value. Defaulting to {DEFAULT_PREFETCH_COUNT}.")
+        prefetch = DEFAULT_PREFETCH_COUNT
+    handler = AsyncOrderHandler(process, dedup_from_env())
+    stop = stop or asyncio.Event()
+    connection = await get_async_connection()
+    async with connection:
+        channel = await connection.channel()
+        await channel.set_qos(prefetch_count=prefetch)
+        queue = await channel.declare_queue(queue_name, durable=True)
+        await queue.consume(handler)
+        logger.info(f"Starting async consumer (prefetch {prefetch}). Waiting for messages...")
+        await stop.wait()
+    logger.info(f"Async consumer stopped: {handler.stats}")
+    if handler.dedup is not None:
+        logger.info(f"Dedup stats: {handler.dedup.stats()}")
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(start_order_consumer())
+    except KeyboardInterrupt:
+        logger.info("Consumer interrupted by user. Shutting down...")
+
+__all__ = ["get_async_connection", "AsyncRabbitMQPublisher", "get_async_publisher", "publish_order",
+           "publish_orders", "AsyncOrderHandler", "start_order_consumer", "connection_url"]
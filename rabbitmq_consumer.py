@@ -1,14 +1,43 @@
-import json
 import os
+import concurrent.futures
+import functools
 import logging
 import pika
+import queue
+import threading
+import time
 import urllib.parse
 import ssl  # Make sure to import ssl if you're using it
 
+import serializer
+from order_dedup import OrderDeduplicator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Unacknowledged messages the broker may push to a consumer (basic_qos).
+DEFAULT_PREFETCH_COUNT = 200
+# Batch mode: messages handed to process_orders at once, and the longest a
+# partial batch waits for more messages (milliseconds).
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_TIMEOUT_MS = 50
+# Pause before a batch whose hook raised (e.g. the database is down) is retried.
+DEFAULT_RETRY_DELAY_MS = 1000
+# Parallel mode: order field whose value keeps orders in sequence, and how
+# processing is executed ("thread", or "process" for CPU-bound work).
+DEFAULT_ORDER_KEY = "symbol"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+EXECUTORS = (EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name} value. Defaulting to {default}.")
+        return default
+
 def get_rabbitmq_connection():
     """
     Establishes and returns a blocking connection to the RabbitMQ server.
@@ -49,6 +78,263 @@ def process_order(order: dict, processed_orders=None):
     if processed_orders is not None:
         processed_orders.append(order)
 
+def process_orders(orders, processed_orders=None):
+    """
+    Processes a batch of orders, in order. Returns how many orders from the
+    start of the batch were processed; the rest are returned to the queue.
+    Override this hook for work that is cheaper per batch (e.g. one insert).
+    """
+    for count, order in enumerate(orders):
+        try:
+            process_order(order, processed_orders=processed_orders)
+        except Exception as e:
+            logger.error(f"Error processing order {order.get('order_id')}: {e}")
+            return count
+    return len(orders)
+
+def order_id_of(order):
+    return order.get("order_id") if isinstance(order, dict) else None
+
+def dedup_from_env():
+    """
+    Returns the OrderDeduplicator consumers use to skip orders they have
+    already processed, or None when CONSUMER_DEDUP=false.
+    """
+    if os.environ.get("CONSUMER_DEDUP", "true").lower() != "true":
+        return None
+    return OrderDeduplicator.from_env()
+
+def consumer_settings():
+    """
+    Returns (prefetch_count, batch_size, batch_timeout_ms) from
+    CONSUMER_PREFETCH, CONSUMER_BATCH_SIZE and CONSUMER_BATCH_TIMEOUT_MS.
+    """
+    batch_size = _env_int("CONSUMER_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+    # The prefetch window has to hold a full batch, or batches only ever flush on the timer.
+    prefetch = max(_env_int("CONSUMER_PREFETCH", DEFAULT_PREFETCH_COUNT), batch_size)
+    batch_timeout_ms = _env_int("CONSUMER_BATCH_TIMEOUT_MS", DEFAULT_BATCH_TIMEOUT_MS)
+    return prefetch, batch_size, batch_timeout_ms
+
+
+class OrderBatcher:
+    """
+    Collects deliveries from one channel and hands them to process_orders
+    when batch_size have arrived or batch_timeout_ms after the first one.
+    The processed prefix of a batch is acked with a single multiple ack; the
+    order that failed is rejected (like a failure in single mode) and the
+    orders after it are requeued. If process raises instead, the whole
+    batch is requeued and batching pauses for retry_delay_ms. Runs entirely
+    on the connection's thread. With a dedup, orders already processed are
+    acked without processing.
+    """
+
+    def __init__(self, connection, channel, process=process_orders,
+                 batch_size=DEFAULT_BATCH_SIZE, batch_timeout_ms=DEFAULT_BATCH_TIMEOUT_MS, dedup=None,
+                 retry_delay_ms=DEFAULT_RETRY_DELAY_MS):
+        self.connection = connection
+        self.channel = channel
+        self.process = process
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout_ms / 1000
+        self.retry_delay = retry_delay_ms / 1000
+        self.dedup = dedup
+        self._pending = []  # (delivery_tag, order), in delivery order
+        self._timer = None
+        self._paused_until = 0.0
+        self.stats = {"batches": 0, "acked": 0, "rejected": 0, "requeued": 0, "duplicates": 0}
+
+    def on_message(self, ch, method, properties, body):
+        try:
+            order = serializer.decode_order_dict(body)
+        except ValueError as e:
+            logger.error(f"Rejecting invalid order message: {e}")
+            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            self.stats["rejected"] += 1
+            return
+        if self.dedup is not None and not self.dedup.claim(order_id_of(order)):
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            self.stats["duplicates"] += 1
+            return
+        self._pending.append((method.delivery_tag, order))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = self.connection.call_later(self.batch_timeout, self._on_timeout)
+
+    def _on_timeout(self):
+        self._timer = None
+        self.flush()
+
+    def flush(self):
+        """
+        Processes and settles everything collected so far.
+        """
+        if self._timer is not None:
+            self.connection.remove_timeout(self._timer)
+            self._timer = None
+        if not self._pending:
+            return
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            # Redelivered orders wait here; the prefetch limit stops the rest.
+            self._timer = self.connection.call_later(pause, self._on_timeout)
+            return
+        batch, self._pending = self._pending, []
+        tags = [tag for tag, _order in batch]
+        self.stats["batches"] += 1
+        try:
+            done = self.process([order for _tag, order in batch])
+        except Exception as e:
+            logger.error(f"Error processing a batch of {len(batch)} orders ({e}); "
+                         f"requeueing it and pausing for {self.retry_delay}s")
+            if self.dedup is not None:
+                for _tag, order in batch:
+                    self.dedup.release(order_id_of(order))
+            self.channel.basic_nack(delivery_tag=tags[-1], multiple=True, requeue=True)
+            self.stats["requeued"] += len(batch)
+            self._paused_until = time.monotonic() + self.retry_delay
+            return
+        done = len(batch) if done is None else max(0, min(done, len(batch)))
+        if self.dedup is not None:
+            for index, (_tag, order) in enumerate(batch):
+                if index < done:
+                    self.dedup.complete(order_id_of(order))
+                else:
+                    self.dedup.release(order_id_of(order))
+        if done:
+            self.channel.basic_ack(delivery_tag=tags[done - 1], multiple=True)
+            self.stats["acked"] += done
+        if done < len(batch):
+            logger.error(f"Order {batch[done][1].get('order_id')} failed; "
+                         f"rejecting it and requeueing {len(batch) - done - 1} orders after it")
+            self.channel.basic_nack(delivery_tag=tags[done], requeue=False)
+            self.stats["rejected"] += 1
+            if done + 1 < len(batch):
+                self.channel.basic_nack(delivery_tag=tags[-1], multiple=True, requeue=True)
+                self.stats["requeued"] += len(batch) - done - 1
+
+
+class KeyedWorkerPool:
+    """
+    Runs tasks on a fixed number of lanes, one worker thread each. Tasks
+    with the same key always land on the same lane, so they run in the order
+    they were submitted, while tasks for different keys run in parallel.
+    With an executor (e.g. a ProcessPoolExecutor), a lane hands its task's
+    function to the executor and waits for it, keeping per-key order.
+    """
+
+    _STOP = object()
+
+    def __init__(self, workers, executor=None):
+        self.executor = executor
+        self._lanes = [queue.Queue() for _ in range(max(1, workers))]
+        self._threads = [
+            threading.Thread(target=self._run, args=(lane,), name=f"order-lane-{i}", daemon=True)
+            for i, lane in enumerate(self._lanes)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key, fn, arg, on_done):
+        """
+        Queues fn(arg) behind earlier tasks for key; on_done(error) is called
+        on the lane thread with None on success or the exception raised.
+        """
+        self._lanes[hash(key) % len(self._lanes)].put((fn, arg, on_done))
+
+    def _run(self, lane):
+        while True:
+            task = lane.get()
+            if task is self._STOP:
+                return
+            fn, arg, on_done = task
+            try:
+                if self.executor is not None:
+                    self.executor.submit(fn, arg).result()
+                else:
+                    fn(arg)
+            except Exception as e:
+                on_done(e)
+            else:
+                on_done(None)
+
+    def close(self):
+        """
+        Finishes every queued task, then stops the lanes.
+        """
+        for lane in self._lanes:
+            lane.put(self._STOP)
+        for thread in self._threads:
+            thread.join()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+class OrderDispatcher:
+    """
+    Receives orders on the connection's thread and hands them to a
+    KeyedWorkerPool, keyed on one order field (default: symbol). Workers
+    never touch the channel: each result is marshalled back to the
+    connection thread with add_callback_threadsafe, where the message is
+    acked, or rejected if processing failed. With a dedup, orders already
+    processed or still in flight are acked without being dispatched.
+    """
+
+    def __init__(self, connection, channel, pool, process=process_order, key_field=DEFAULT_ORDER_KEY,
+                 dedup=None):
+        self.connection = connection
+        self.channel = channel
+        self.pool = pool
+        self.process = process
+        self.key_field = key_field
+        self.dedup = dedup
+        self.stats = {"dispatched": 0, "acked": 0, "rejected": 0, "duplicates": 0}
+
+    def on_message(self, ch, method, properties, body):
+        try:
+            order = serializer.decode_order_dict(body)
+        except ValueError as e:
+            logger.error(f"Rejecting invalid order message: {e}")
+            ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+            self.stats["rejected"] += 1
+            return
+        if self.dedup is not None and not self.dedup.claim(order_id_of(order)):
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            self.stats["duplicates"] += 1
+            return
+        key = order.get(self.key_field) if isinstance(order, dict) else None
+        self.stats["dispatched"] += 1
+        self.pool.submit(key, self.process, order,
+                         functools.partial(self._on_done, method.delivery_tag, order))
+
+    def _on_done(self, delivery_tag, order, error):
+        # Runs on a worker thread: only schedule the settlement.
+        if error is not None:
+            logger.error(f"Error processing order {order.get('order_id')}: {error}")
+        self.connection.add_callback_threadsafe(
+            functools.partial(self._settle, delivery_tag, order_id_of(order), error is None))
+
+    def _settle(self, delivery_tag, order_id, ok):
+        if self.dedup is not None:
+            if ok:
+                self.dedup.complete(order_id)
+            else:
+                self.dedup.release(order_id)
+        if ok:
+            self.channel.basic_ack(delivery_tag=delivery_tag)
+            self.stats["acked"] += 1
+        else:
+            self.channel.basic_nack(delivery_tag=delivery_tag, requeue=False)
+            self.stats["rejected"] += 1
+
+    def drain(self):
+        """
+        Waits for every dispatched order and delivers the outstanding acks.
+        """
+        self.pool.close()
+        self.connection.process_data_events(time_limit=0)
+
+
 def start_order_consumer(queue_name: str = "orders", processed_orders=None):
     """
     Connects to RabbitMQ, declares the queue (ensuring durability), and starts
@@ -59,33 +345,146 @@ def start_order_consumer(queue_name: str = "orders", processed_orders=None):
         connection = get_rabbitmq_connection()
         channel = connection.channel()
         channel.queue_declare(queue=queue_name, durable=True)
+        prefetch, _batch_size, _batch_timeout_ms = consumer_settings()
+        channel.basic_qos(prefetch_count=prefetch)
     except Exception as e:
         logger.error(f"Error connecting to RabbitMQ: {e}")
         return
 
+    dedup = dedup_from_env()
+
     def callback(ch, method, properties, body):
+        order_id = None
         try:
-            order = json.loads(body)
-            process_order(order, processed_orders=processed_orders)
+            order = serializer.decode_order_dict(body)
+            order_id = order_id_of(order)
+            if dedup is not None and not dedup.claim(order_id):
+                logger.info(f"Skipping duplicate order: {order_id}")
+            else:
+                process_order(order, processed_orders=processed_orders)
+                if dedup is not None:
+                    dedup.complete(order_id)
             ch.basic_ack(delivery_tag=method.delivery_tag)
         except Exception as e:
             logger.error(f"Error processing order: {e}")
+            if dedup is not None:
+                dedup.release(order_id)
             ch.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
 
     channel.basic_consume(queue=queue_name, on_message_callback=callback)
     logger.info("Starting consumer. Waiting for messages...")
+    run_consumer(connection, channel, dedup=dedup)
+
+def start_batch_consumer(queue_name: str = "orders", processed_orders=None, process=None):
+    """
+    Like start_order_consumer, but hands orders to process (by default
+    process_orders) in batches and acknowledges each batch with one frame.
+    Prefetch, batch size and batch timeout come from consumer_settings().
+    """
+    prefetch, batch_size, batch_timeout_ms = consumer_settings()
+    retry_delay_ms = _env_int("CONSUMER_RETRY_DELAY_MS", DEFAULT_RETRY_DELAY_MS)
+    if process is None:
+        process = lambda orders: process_orders(orders, processed_orders=processed_orders)
+    try:
+        connection = get_rabbitmq_connection()
+        channel = connection.channel()
+        channel.queue_declare(queue=queue_name, durable=True)
+        channel.basic_qos(prefetch_count=prefetch)
+    except Exception as e:
+        logger.error(f"Error connecting to RabbitMQ: {e}")
+        return
+
+    dedup = dedup_from_env()
+    batcher = OrderBatcher(connection, channel, process, batch_size, batch_timeout_ms, dedup, retry_delay_ms)
+    channel.basic_consume(queue=queue_name, on_message_callback=batcher.on_message)
+    logger.info(f"Starting batch consumer (prefetch {prefetch}, batches of {batch_size} "
+                f"or {batch_timeout_ms} ms). Waiting for messages...")
+    run_consumer(connection, channel, on_stop=batcher.flush, dedup=dedup)
+
+def start_parallel_consumer(queue_name: str = "orders", processed_orders=None, process=None):
+    """
+    Consumes on the connection's thread and processes orders on a pool of
+    CONSUMER_WORKERS lanes (default: one per core), in threads or, with
+    CONSUMER_EXECUTOR=process, in worker processes. Orders sharing the
+    CONSUMER_ORDER_KEY field are processed in arrival order.
+    """
+    prefetch, _batch_size, _batch_timeout_ms = consumer_settings()
+    workers = _env_int("CONSUMER_WORKERS", os.cpu_count() or 1)
+    executor_kind = os.environ.get("CONSUMER_EXECUTOR", EXECUTOR_THREAD).lower()
+    if executor_kind not in EXECUTORS:
+        raise ValueError(f"Unknown CONSUMER_EXECUTOR {executor_kind!r}; expected one of {EXECUTORS}")
+    key_field = os.environ.get("CONSUMER_ORDER_KEY", DEFAULT_ORDER_KEY)
+    executor = None
+    if executor_kind == EXECUTOR_PROCESS:
+        # Results cannot be appended to a list in another process.
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        process = process or process_order
+    elif process is None:
+        process = functools.partial(process_order, processed_orders=processed_orders)
+    try:
+        connection = get_rabbitmq_connection()
+        channel = connection.channel()
+        channel.queue_declare(queue=queue_name, durable=True)
+        channel.basic_qos(prefetch_count=prefetch)
+    except Exception as e:
+        logger.error(f"Error connecting to RabbitMQ: {e}")
+        if executor is not None:
+            executor.shutdown()
+        return
+
+    dedup = dedup_from_env()
+    dispatcher = OrderDispatcher(connection, channel, KeyedWorkerPool(workers, executor), process, key_field, dedup)
+    channel.basic_consume(queue=queue_name, on_message_callback=dispatcher.on_message)
+    logger.info(f"Starting parallel consumer ({workers} {executor_kind} lanes keyed on {key_field}, "
+                f"prefetch {prefetch}). Waiting for messages...")
+    run_consumer(connection, channel, on_stop=dispatcher.drain, dedup=dedup)
+
+def start_postgres_sink_consumer(queue_name: str = "orders"):
+    """
+    Runs the batch consumer as the persistence sink: each batch is written
+    to the orders table with COPY (see order_sink.py) and acked after commit.
+    """
+    # Imported here: the sink pulls in the API's model helpers and Postgres settings.
+    from order_sink import PostgresOrderSink
+    sink = PostgresOrderSink.from_env()
+    start_batch_consumer(queue_name, process=sink.write)
+    logger.info(f"Order sink stats: {sink.stats}")
+
+def run_consumer(connection, channel, on_stop=None, dedup=None):
+    """
+    Runs the channel's consumers until interrupted, then closes the connection.
+    on_stop runs first on a clean shutdown, to settle anything still pending.
+    The dedup's hit/miss counters are logged on the way out.
+    """
     try:
         channel.start_consuming()
     except KeyboardInterrupt:
         logger.info("Consumer interrupted by user. Shutting down...")
+        if on_stop is not None:
+            on_stop()
         channel.stop_consuming()
     except Exception as e:
         logger.error(f"Unexpected error in consumer: {e}")
     finally:
         connection.close()
         logger.info("RabbitMQ connection closed.")
+        if dedup is not None:
+            logger.info(f"Dedup stats: {dedup.stats()}")
+
+# Consumer entry points by CONSUMER_MODE.
+CONSUMER_MODES = {
+    "single": start_order_consumer,
+    "batch": start_batch_consumer,
+    "parallel": start_parallel_consumer,
+    "postgres": start_postgres_sink_consumer,
+}
 
 if __name__ == '__main__':
-    start_order_consumer()
+    mode = os.environ.get("CONSUMER_MODE", "single").lower()
+    if mode not in CONSUMER_MODES:
+        raise SystemExit(f"Unknown CONSUMER_MODE {mode!r}; expected one of {sorted(CONSUMER_MODES)}")
+    CONSUMER_MODES[mode]()
 
-__all__ = ["start_order_consumer", "get_rabbitmq_connection"]
\ No newline at end of file
+__all__ = ["start_order_consumer", "start_batch_consumer", "get_rabbitmq_connection",
+           "start_parallel_consumer", "process_orders", "OrderBatcher", "OrderDispatcher",
+           "KeyedWorkerPool", "consumer_settings", "dedup_from_env", "start_postgres_sink_consumer"]
\ No newline at end of file
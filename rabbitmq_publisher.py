@@ -1,15 +1,22 @@
 import os
-import json
 import logging
 import pika
 import urllib.parse
 import ssl
-import time
+import queue
+import threading
+import contextlib
+import atexit
+
+import serializer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Number of pooled connection/channel pairs kept open by the shared publisher.
+DEFAULT_POOL_SIZE = 4
+
 def get_rabbitmq_connection():
     """
     Establishes and returns a blocking connection to the RabbitMQ server.
@@ -43,30 +50,240 @@ def get_rabbitmq_connection():
     logger.info(f"Connecting using local RabbitMQ at {rabbitmq_host}:{rabbitmq_port}")
     return pika.BlockingConnection(connection_params)
 
+class PooledChannel:
+    """
+    A RabbitMQ connection and channel pair that is checked out by one thread
+    at a time. pika's BlockingConnection is not thread-safe, so each pooled
+    slot owns its own connection rather than sharing one between threads.
+    """
+
+    def __init__(self, connection_factory=get_rabbitmq_connection):
+        self._connection_factory = connection_factory
+        self.connection = None
+        self.channel = None
+        self.declared_queues = set()
+        self.declared_exchanges = set()
+        self.confirm_channel = None
+
+    def ensure_open(self):
+        """
+        Returns an open channel, reconnecting if the broker dropped the connection.
+        """
+        if self.connection is not None and self.connection.is_open and self.channel.is_open:
+            try:
+                # Service heartbeats and detect a connection the broker closed while idle.
+                self.connection.process_data_events(time_limit=0)
+            except pika.exceptions.AMQPError as e:
+                logger.warning(f"Pooled RabbitMQ connection lost: {e}")
+                self.close()
+        if self.connection is None or not self.connection.is_open or not self.channel.is_open:
+            self.close()
+            self.connection = self._connection_factory()
+            self.channel = self.connection.channel()
+        return self.channel
+
+    def declare_queue(self, queue_name):
+        """
+        Declares a durable queue the first time it is used on this connection.
+        """
+        if queue_name not in self.declared_queues:
+            self.channel.queue_declare(queue=queue_name, durable=True)
+            self.declared_queues.add(queue_name)
+
+    def declare_exchange(self, exchange, exchange_type="fanout"):
+        """
+        Declares an exchange the first time it is used on this connection.
+        """
+        if exchange not in self.declared_exchanges:
+            self.channel.exchange_declare(exchange=exchange, exchange_type=exchange_type)
+            self.declared_exchanges.add(exchange)
+
+    def ensure_confirm_channel(self):
+        """
+        Returns a second channel in confirm mode, opened with pika's public
+        BlockingChannel.confirm_delivery(). Each basic_publish on it returns
+        once the broker acked the message and raises NackError if it was
+        nacked, so the caller gets a result per message.
+        """
+        self.ensure_open()
+        if self.confirm_channel is None or not self.confirm_channel.is_open:
+            self.confirm_channel = self.connection.channel()
+            self.confirm_channel.confirm_delivery()
+        return self.confirm_channel
+
+    def close(self):
+        try:
+            if self.connection is not None and self.connection.is_open:
+                self.connection.close()
+        except pika.exceptions.AMQPError as e:
+            logger.warning(f"Error closing RabbitMQ connection: {e}")
+        self.connection = None
+        self.channel = None
+        self.declared_queues = set()
+        self.declared_exchanges = set()
+        self.confirm_channel = None
+
+
+class RabbitMQPublisher:
+    """
+    Long-lived publisher that keeps a small pool of open channels and reuses
+    them across calls instead of connecting once per order.
+    """
+
+    def __init__(self, pool_size=None, connection_factory=get_rabbitmq_connection):
+        if pool_size is None:
+            try:
+                pool_size = int(os.environ.get("RABBITMQ_PUBLISHER_POOL_SIZE", DEFAULT_POOL_SIZE))
+            except ValueError:
+                logger.warning(f"Invalid RABBITMQ_PUBLISHER_POOL_SIZE value. Defaulting to {DEFAULT_POOL_SIZE}.")
+                pool_size = DEFAULT_POOL_SIZE
+        self.pool_size = max(1, pool_size)
+        # LIFO so that the most recently used (and therefore warm) slot is reused first.
+        self._pool = queue.LifoQueue()
+        for _ in range(self.pool_size):
+            self._pool.put(PooledChannel(connection_factory))
+
+    @contextlib.contextmanager
+    def channel(self):
+        """
+        Checks out a pooled slot for exclusive use by the calling thread.
+        """
+        slot = self._pool.get()
+        try:
+            yield slot
+        finally:
+            self._pool.put(slot)
+
+    def publish(self, order: dict, queue_name: str = "orders") -> None:
+        """
+        Publishes an order as a persistent message, reconnecting and retrying
+        once if the pooled connection turns out to be dead.
+        """
+        message = serializer.dumps(order)
+        with self.channel() as slot:
+            for attempt in (1, 2):
+                try:
+                    channel = slot.ensure_open()
+                    slot.declare_queue(queue_name)
+                    channel.basic_publish(
+                        exchange="",
+                        routing_key=queue_name,
+                        body=message,
+                        properties=pika.BasicProperties(delivery_mode=2)  # Persistent delivery
+                    )
+                    return
+                except pika.exceptions.AMQPError as e:
+                    slot.close()
+                    if attempt == 2:
+                        raise
+                    logger.warning(f"Publish failed ({e!r}); reconnecting to RabbitMQ and retrying.")
+
+    def publish_batch(self, orders, queue_name: str = "orders") -> list:
+        """
+        Publishes many orders on a confirm-mode channel, reusing one pooled
+        slot for the whole batch. Returns one boolean per order, in input
+        order: True once the broker acked it, False if it was nacked, could
+        not be serialized or was never confirmed because the connection failed.
+        """
+        orders = iter(orders)
+        results = []
+        properties = pika.BasicProperties(delivery_mode=2)  # Persistent delivery
+        with self.channel() as slot:
+            try:
+                channel = slot.ensure_confirm_channel()
+                slot.declare_queue(queue_name)
+                for order in orders:
+                    try:
+                        message = serializer.dumps(order)
+                    except (TypeError, ValueError) as e:
+                        logger.error(f"Cannot serialize order {order!r}: {e}")
+                        results.append(False)
+                        continue
+                    # Counted as failed until the broker confirms it.
+                    results.append(False)
+                    try:
+                        channel.basic_publish(exchange="", routing_key=queue_name,
+                                              body=message, properties=properties)
+                    except (pika.exceptions.NackError, pika.exceptions.UnroutableError) as e:
+                        logger.error(f"Broker rejected an order for {queue_name}: {e!r}")
+                        continue
+                    results[-1] = True
+            except pika.exceptions.AMQPError as e:
+                logger.error(f"Batch publish to {queue_name} failed: {e!r}")
+                slot.close()
+                # Report the orders we never got to as failed too.
+                results.extend(False for _ in orders)
+        return results
+
+    def broadcast(self, messages, exchange: str) -> None:
+        """
+        Publishes transient messages to a fanout exchange, for live
+        notifications that are not worth persisting or confirming.
+        """
+        with self.channel() as slot:
+            try:
+                channel = slot.ensure_open()
+                slot.declare_exchange(exchange, "fanout")
+                for message in messages:
+                    channel.basic_publish(exchange=exchange, routing_key="", body=message)
+            except pika.exceptions.AMQPError:
+                slot.close()
+                raise
+
+    def close(self):
+        """
+        Closes every pooled connection. The publisher reconnects lazily if used again.
+        """
+        for _ in range(self.pool_size):
+            with self.channel() as slot:
+                slot.close()
+
+
+_publisher = None
+_publisher_lock = threading.Lock()
+
+def _reset_publisher_in_child():
+    # A forked worker must not share its parent's broker sockets.
+    global _publisher, _publisher_lock
+    _publisher = None
+    _publisher_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_publisher_in_child)
+
+def get_publisher() -> RabbitMQPublisher:
+    """
+    Returns the process-wide publisher, creating it on first use.
+    """
+    global _publisher
+    if _publisher is None:
+        with _publisher_lock:
+            if _publisher is None:
+                _publisher = RabbitMQPublisher()
+                atexit.register(_publisher.close)
+    return _publisher
+
 def publish_order(order: dict, queue_name: str = "orders") -> None:
     """
     Publishes an enriched order to the specified RabbitMQ queue.
     """
     try:
-        connection = get_rabbitmq_connection()
-        channel = connection.channel()
-        # Declare the queue with durability so that messages survive RabbitMQ restarts.
-        channel.queue_declare(queue=queue_name, durable=True)
-        message = json.dumps(order)
-        channel.basic_publish(
-            exchange="",
-            routing_key=queue_name,
-            body=message,
-            properties=pika.BasicProperties(delivery_mode=2)  # Persistent delivery
-        )
-        # Process any pending network events to flush the message.
-        connection.process_data_events()
-        # Sleep briefly to ensure the message is transmitted.
-        time.sleep(0.5)
+        get_publisher().publish(order, queue_name)
         logger.info(f"Published order: {order.get('order_id')}")
-        connection.close()
     except Exception as e:
         logger.error(f"Failed to publish order: {e}")
         raise
 
-__all__ = ["publish_order", "get_rabbitmq_connection"]
\ No newline at end of file
+def publish_orders(orders, queue_name: str = "orders") -> list:
+    """
+    Publishes a batch of orders with publisher confirms and returns a list
+    with one boolean per order indicating whether the broker accepted it.
+    """
+    results = get_publisher().publish_batch(orders, queue_name)
+    confirmed = sum(results)
+    if confirmed == len(results):
+        logger.info(f"Published {confirmed} orders to {queue_name}")
+    else:
+        logger.error(f"Published {confirmed} of {len(results)} orders to {queue_name}")
+    return results
+
+__all__ = ["publish_order", "publish_orders", "get_rabbitmq_connection", "get_publisher", "RabbitMQPublisher"]
\ No newline at end of file
@@ -0,0 +1,219 @@
+import dataclasses
+import datetime
+import decimal
+import json
+import logging
+import os
+import typing
+import uuid
+
+try:
+    import orjson  # Optional: fastest dumps/loads.
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Optional: fast dumps/loads and typed decoding into Order structs.
+except ImportError:
+    msgspec = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Backends in order of preference; ORDER_SERIALIZER picks one explicitly.
+PREFERENCE = ("orjson", "msgspec", "json")
+
+def _default(obj):
+    """
+    Encodes the non-JSON types that show up in orders (timestamps, Decimal
+    prices from Postgres, UUIDs) the same way for every backend.
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if msgspec is not None and isinstance(obj, msgspec.Struct):
+        return msgspec.structs.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_dumps(obj):
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+def _json_loads(data):
+    return json.loads(data)
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj, default=_default)
+
+def _msgspec_codecs():
+    encoder = msgspec.json.Encoder(enc_hook=_default, decimal_format="number")
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj):
+        try:
+            return encoder.encode(obj)
+        except msgspec.EncodeError as e:
+            raise TypeError(str(e)) from e
+
+    def loads(data):
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return dumps, loads
+
+# Backend name -> (dumps, loads) for every backend installed here. dumps
+# returns bytes; loads accepts bytes or str. Encoding failures raise
+# TypeError and malformed input raises ValueError, whatever the backend.
+CODECS = {"json": (_json_dumps, _json_loads)}
+if orjson is not None:
+    CODECS["orjson"] = (_orjson_dumps, orjson.loads)
+if msgspec is not None:
+    CODECS["msgspec"] = _msgspec_codecs()
+
+def select_backend(name=None):
+    """
+    Returns the backend to use: name (or ORDER_SERIALIZER) if it is
+    installed, otherwise the fastest one available.
+    """
+    name = (name or os.environ.get("ORDER_SERIALIZER", "")).lower()
+    if name in CODECS:
+        return name
+    if name:
+        logger.warning(f"Serializer {name!r} is not available; falling back")
+    return next(backend for backend in PREFERENCE if backend in CODECS)
+
+BACKEND = select_backend()
+dumps, loads = CODECS[BACKEND]
+
+def dumps_str(obj):
+    """
+    Returns obj as a JSON string, for text protocols (SSE frames, NDJSON lines).
+    """
+    return dumps(obj).decode()
+
+
+# Fields of the typed Order; typed decoding drops any other field.
+ORDER_FIELDS = (
+    "order_id", "symbol", "quantity", "price", "transact_time", "business_unit",
+    "trader_id", "risk_category", "processed_timestamp", "ingested_timestamp",
+)
+
+if msgspec is not None and BACKEND != "json":
+    class Order(msgspec.Struct, omit_defaults=True):
+        """
+        A typed order, decoded directly from JSON without an intermediate dict.
+        """
+        order_id: str
+        symbol: typing.Optional[str] = None
+        quantity: typing.Optional[int] = None
+        price: typing.Optional[float] = None
+        transact_time: typing.Optional[str] = None
+        business_unit: typing.Optional[str] = None
+        trader_id: typing.Optional[str] = None
+        risk_category: typing.Optional[str] = None
+        processed_timestamp: typing.Optional[str] = None
+        ingested_timestamp: typing.Optional[str] = None
+
+    _order_decoder = msgspec.json.Decoder(Order)
+    _orders_decoder = msgspec.json.Decoder(typing.List[Order])
+
+    def decode_order(data):
+        """
+        Decodes one JSON order into an Order, raising ValueError if it does not fit.
+        """
+        try:
+            return _order_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def decode_orders(data):
+        """
+        Decodes a JSON array of orders into a list of Order.
+        """
+        try:
+            return _orders_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def order_to_dict(order):
+        return {name: value for name, value in msgspec.structs.asdict(order).items() if value is not None}
+
+    def decode_order_dict(data):
+        """
+        Decodes one JSON order for a consumer: checked against Order (raising
+        ValueError if it does not fit) but returned as a dict that keeps the
+        fields Order does not declare, such as custom mapping fields.
+        """
+        order = loads(data)
+        try:
+            typed = msgspec.convert(order, Order)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from e
+        return {**order, **order_to_dict(typed)}
+else:
+    @dataclasses.dataclass
+    class Order:
+        """
+        A typed order. Without msgspec it is built from the decoded dict.
+        """
+        order_id: str
+        symbol: typing.Optional[str] = None
+        quantity: typing.Optional[int] = None
+        price: typing.Optional[float] = None
+        transact_time: typing.Optional[str] = None
+        business_unit: typing.Optional[str] = None
+        trader_id: typing.Optional[str] = None
+        risk_category: typing.Optional[str] = None
+        processed_timestamp: typing.Optional[str] = None
+        ingested_timestamp: typing.Optional[str] = None
+
+        @classmethod
+        def from_dict(cls, data):
+            if not isinstance(data, dict) or not isinstance(data.get("order_id"), str):
+                raise ValueError("An order must be an object with a string order_id")
+            for name, types in (("quantity", int), ("price", (int, float))):
+                value = data.get(name)
+                if value is not None and (isinstance(value, bool) or not isinstance(value, types)):
+                    raise ValueError(f"{name} has the wrong type")
+            order = cls(**{name: data[name] for name in ORDER_FIELDS if name in data})
+            if isinstance(order.price, int):
+                order.price = float(order.price)
+            return order
+
+    def decode_order(data):
+        """
+        Decodes one JSON order into an Order, raising ValueError if it does not fit.
+        """
+        return Order.from_dict(loads(data))
+
+    def decode_orders(data):
+        """
+        Decodes a JSON array of orders into a list of Order.
+        """
+        orders = loads(data)
+        if not isinstance(orders, list):
+            raise ValueError("Expected a JSON array of orders")
+        return [Order.from_dict(order) for order in orders]
+
+    def order_to_dict(order):
+        return {name: value for name, value in dataclasses.asdict(order).items() if value is not None}
+
+    def decode_order_dict(data):
+        """
+        Decodes one JSON order for a consumer: checked against Order (raising
+        ValueError if it does not fit) but returned as a dict that keeps the
+        fields Order does not declare, such as custom mapping fields.
+        """
+        order = loads(data)
+        typed = Order.from_dict(order)
+        return {**order, **order_to_dict(typed)}
+
+__all__ = ["dumps", "dumps_str", "loads", "decode_order", "decode_orders", "decode_order_dict", "order_to_dict",
+           "Order", "BACKEND", "CODECS", "select_backend"]
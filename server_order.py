@@ -5,42 +5,13 @@ import select
 import threading
 import logging
 
+from fix_core import build_execution_report
+from fix_parser import FixMessageView
+from fix_session import get_msg_seq_num
+
 # Set up basic logging configuration.
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 
-def build_execution_report(order_msg):
-    """
-    Build an Execution Report FIX message in response to an order message.
-    This function extracts key fields (e.g. ClOrdID, MsgSeqNum) from the order
-    and constructs a new FIX message that simulates an execution report.
-    """
-    cl_ord_id = None
-    msg_seq_num = None
-    for tag, value in order_msg:
-        if tag == 11:
-            cl_ord_id = value
-        if tag == 34:
-            try:
-                msg_seq_num = int(value)
-            except ValueError:
-                msg_seq_num = 0
-    exec_msg = simplefix.FixMessage()
-    exec_msg.append_pair(8, "FIX.4.2")           # BeginString
-    exec_msg.append_pair(35, "8")                # MsgType: Execution Report
-    exec_msg.append_pair(11, cl_ord_id if cl_ord_id else "UNKNOWN")
-    if msg_seq_num is not None:
-        exec_msg.append_pair(34, str(msg_seq_num))  # Echo the sequence number
-    exec_msg.append_pair(17, "EXEC456")          # ExecID
-    exec_msg.append_pair(39, "2")                # OrdStatus: Filled
-    exec_msg.append_pair(150, "F")               # ExecType: Fill
-    # Copy order details: Symbol (55), OrderQty (38), Price (44)
-    for tag in [55, 38, 44]:
-        for t, v in order_msg:
-            if t == tag:
-                exec_msg.append_pair(tag, v)
-                break
-    return exec_msg.encode()
-
 def send_heartbeat(conn):
     """
     Build and send a Heartbeat FIX message.
@@ -77,18 +48,13 @@ def handle_client(conn, addr):
                     order_msg = parser.get_message()
                     if order_msg is None:
                         break
+                    # Index the tags once; validation and the report read from this view.
+                    order_msg = FixMessageView(order_msg)
                     logging.info("Received Order FIX message:")
                     for tag, value in order_msg:
                         logging.info(f"  Tag {tag}: {value}")
                     # Validate sequence number.
-                    received_seq_num = None
-                    for tag, value in order_msg:
-                        if tag == 34:
-                            try:
-                                received_seq_num = int(value)
-                            except ValueError:
-                                received_seq_num = None
-                            break
+                    received_seq_num = get_msg_seq_num(order_msg)
                     if received_seq_num is not None:
                         if received_seq_num != expected_seq_num:
                             logging.warning(f"Expected sequence number {expected_seq_num} but received {received_seq_num}")
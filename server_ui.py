@@ -6,6 +6,9 @@ import threading
 import queue
 import tkinter as tk
 from tkinter import ttk
+from fix_core import build_execution_report
+from fix_parser import FixMessageView
+from fix_session import SessionSequenceStore, get_msg_seq_num, get_sender_comp_id
 
 # Thread-safe queue for log messages
 log_queue = queue.Queue()
@@ -13,43 +16,8 @@ log_queue = queue.Queue()
 # Global heartbeat interval (seconds)
 HEARTBEAT_INTERVAL = 5
 
-# Global dictionary to maintain expected sequence numbers per client (keyed by SenderCompID)
-session_seq_numbers = {}
-
-def build_execution_report(order_msg):
-    """
-    Build an Execution Report FIX message in response to an order message.
-    Extract key fields (e.g., ClOrdID, MsgSeqNum) and construct a FIX message.
-    """
-    cl_ord_id = None
-    msg_seq_num = None
-    sender = None
-    for tag, value in order_msg:
-        if tag == 11:
-            cl_ord_id = value
-        if tag == 34:
-            try:
-                msg_seq_num = int(value)
-            except ValueError:
-                msg_seq_num = 0
-        if tag == 49:
-            sender = value.decode() if isinstance(value, bytes) else value
-    exec_msg = simplefix.FixMessage()
-    exec_msg.append_pair(8, "FIX.4.2")           # BeginString
-    exec_msg.append_pair(35, "8")                # MsgType: Execution Report
-    exec_msg.append_pair(11, cl_ord_id if cl_ord_id else "UNKNOWN")
-    if msg_seq_num is not None:
-        exec_msg.append_pair(34, str(msg_seq_num))  # Echo the sequence number
-    exec_msg.append_pair(17, "EXEC456")          # ExecID
-    exec_msg.append_pair(39, "2")                # OrdStatus: Filled
-    exec_msg.append_pair(150, "F")               # ExecType: Fill
-    # Optionally, copy order details: Symbol (55), OrderQty (38), Price (44)
-    for tag in [55, 38, 44]:
-        for t, v in order_msg:
-            if t == tag:
-                exec_msg.append_pair(tag, v)
-                break
-    return exec_msg.encode()
+# Expected sequence numbers per client (keyed by SenderCompID), local to this process
+session_seq_numbers = SessionSequenceStore()
 
 def send_heartbeat(conn):
     """
@@ -88,31 +56,21 @@ def handle_client(conn, addr):
                     order_msg = parser.get_message()
                     if order_msg is None:
                         break
+                    # Index the tags once; every step below reads from this view.
+                    order_msg = FixMessageView(order_msg)
 
                     log_queue.put("Received Order FIX message:")
                     for tag, value in order_msg:
                         log_queue.put(f"  Tag {tag}: {value}")
 
                     # Extract SenderCompID (tag 49) to use as client ID
-                    for tag, value in order_msg:
-                        if tag == 49:
-                            client_id = value.decode() if isinstance(value, bytes) else value
-                            break
-                    if client_id is None:
-                        client_id = "UNKNOWN"
+                    client_id = get_sender_comp_id(order_msg, client_id) or "UNKNOWN"
 
-                    # Get the expected sequence number from our global session dictionary.
-                    expected_seq_num = session_seq_numbers.get(client_id, 1)
+                    # Get the expected sequence number from the session store.
+                    expected_seq_num = session_seq_numbers.expected(client_id)
 
                     # Validate sequence number
-                    received_seq_num = None
-                    for tag, value in order_msg:
-                        if tag == 34:
-                            try:
-                                received_seq_num = int(value)
-                            except ValueError:
-                                received_seq_num = None
-                            break
+                    received_seq_num = get_msg_seq_num(order_msg)
                     if received_seq_num is not None:
                         if received_seq_num != expected_seq_num:
                             log_queue.put(f"Warning for {client_id}: Expected sequence number {expected_seq_num} but received {received_seq_num}")
@@ -127,8 +85,7 @@ def handle_client(conn, addr):
                     log_queue.put("Sent Execution Report.")
 
                     # Update the expected sequence number and store it.
-                    expected_seq_num = (received_seq_num + 1) if received_seq_num is not None else expected_seq_num + 1
-                    session_seq_numbers[client_id] = expected_seq_num
+                    session_seq_numbers.advance(client_id, received_seq_num)
 
             else:
                 # Timeout reached; no data received—send heartbeat.
@@ -1,3 +1,3 @@
-/*! For license information please see main.deb7aa28.js.LICENSE.txt */
-(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),a=n(43),l=n(950);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}var u=Symbol.for("react.element"),s=Symbol.for("react.transitional.element"),c=Symbol.for("react.portal"),f=Symbol.for("react.fragment"),d=Symbol.for("react.strict_mode"),p=Symbol.for("react.profiler"),h=Symbol.for("react.provider"),m=Symbol.for("react.consumer"),g=Symbol.for("react.context"),y=Symbol.for("react.forward_ref"),v=Symbol.for("react.suspense"),b=Symbol.for("react.suspense_list"),w=Symbol.for("react.memo"),S=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var k=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var E=Symbol.for("react.memo_cache_sentinel"),x=Symbol.iterator;function C(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=x&&e[x]||e["@@iterator"])?e:null}var R=Symbol.for("react.client.reference");function _(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===R?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case f:return"Fragment";case c:return"Portal";case p:return"Profiler";case d:return"StrictMode";case v:return"Suspense";case b:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case g:return(e.displayName||"Context")+".Provider";case m:return(e._context.displayName||"Context")+".Consumer";case y:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case w:return null!==(t=e.displayName||null)?t:_(e.type)||"Memo";case S:t=e._payload,e=e._init;try{return _(e(t))}catch(n){}}return null}var P,T,O=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,N=Object.assign;function L(e){if(void 0===P)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);P=t&&t[1]||"",T=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+P+e+T}var z=!1;function A(e,t){if(!e||z)return"";z=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(l){r=l}e.call(n.prototype)}}else{try{throw Error()}catch(o){r=o}(n=e())&&"function"===typeof n.catch&&n.catch((function(){}))}}catch(i){if(i&&r&&"string"===typeof i.stack)return[i.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var a=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");a&&a.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var l=r.DetermineComponentFrameRoot(),o=l[0],i=l[1];if(o&&i){var u=o.split("\n"),s=i.split("\n");for(a=r=0;r<u.length&&!u[r].includes("DetermineComponentFrameRoot");)r++;for(;a<s.length&&!s[a].includes("DetermineComponentFrameRoot");)a++;if(r===u.length||a===s.length)for(r=u.length-1,a=s.length-1;1<=r&&0<=a&&u[r]!==s[a];)a--;for(;1<=r&&0<=a;r--,a--)if(u[r]!==s[a]){if(1!==r||1!==a)do{if(r--,0>--a||u[r]!==s[a]){var c="\n"+u[r].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=r&&0<=a);break}}}finally{z=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?L(n):""}function F(e){switch(e.tag){case 26:case 27:case 5:return L(e.type);case 16:return L("Lazy");case 13:return L("Suspense");case 19:return L("SuspenseList");case 0:case 15:return e=A(e.type,!1);case 11:return e=A(e.type.render,!1);case 1:return e=A(e.type,!0);default:return""}}function D(e){try{var t="";do{t+=F(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function j(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function M(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function U(e){if(j(e)!==e)throw Error(o(188))}function I(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=I(e)))return t;e=e.sibling}return null}var $=Array.isArray,B=l.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,H={pending:!1,data:null,method:null,action:null},q=[],W=-1;function V(e){return{current:e}}function Q(e){0>W||(e.current=q[W],q[W]=null,W--)}function K(e,t){W++,q[W]=e.current,e.current=t}var Y=V(null),X=V(null),G=V(null),J=V(null);function Z(e,t){switch(K(G,t),K(X,e),K(Y,null),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)&&(t=t.namespaceURI)?Xc(t):0;break;default:if(t=(e=8===e?t.parentNode:t).tagName,e=e.namespaceURI)t=Gc(e=Xc(e),t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}Q(Y),K(Y,t)}function ee(){Q(Y),Q(X),Q(G)}function te(e){null!==e.memoizedState&&K(J,e);var t=Y.current,n=Gc(t,e.type);t!==n&&(K(X,e),K(Y,n))}function ne(e){X.current===e&&(Q(Y),Q(X)),J.current===e&&(Q(J),jf._currentValue=H)}var re=Object.prototype.hasOwnProperty,ae=r.unstable_scheduleCallback,le=r.unstable_cancelCallback,oe=r.unstable_shouldYield,ie=r.unstable_requestPaint,ue=r.unstable_now,se=r.unstable_getCurrentPriorityLevel,ce=r.unstable_ImmediatePriority,fe=r.unstable_UserBlockingPriority,de=r.unstable_NormalPriority,pe=r.unstable_LowPriority,he=r.unstable_IdlePriority,me=r.log,ge=r.unstable_setDisableYieldValue,ye=null,ve=null;function be(e){if("function"===typeof me&&ge(e),ve&&"function"===typeof ve.setStrictMode)try{ve.setStrictMode(ye,e)}catch(t){}}var we=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(Se(e)/ke|0)|0},Se=Math.log,ke=Math.LN2;var Ee=128,xe=4194304;function Ce(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194176&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function Re(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,a=e.suspendedLanes,l=e.pingedLanes,o=e.warmLanes;e=0!==e.finishedLanes;var i=134217727&n;return 0!==i?0!==(n=i&~a)?r=Ce(n):0!==(l&=i)?r=Ce(l):e||0!==(o=i&~o)&&(r=Ce(o)):0!==(i=n&~a)?r=Ce(i):0!==l?r=Ce(l):e||0!==(o=n&~o)&&(r=Ce(o)),0===r?0:0!==t&&t!==r&&0===(t&a)&&((a=r&-r)>=(o=t&-t)||32===a&&0!==(4194176&o))?t:r}function _e(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function Pe(e,t){switch(e){case 1:case 2:case 4:case 8:return t+250;case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Te(){var e=Ee;return 0===(4194176&(Ee<<=1))&&(Ee=128),e}function Oe(){var e=xe;return 0===(62914560&(xe<<=1))&&(xe=4194304),e}function Ne(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Le(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function ze(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-we(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194218&n}function Ae(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-we(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}function Fe(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function De(){var e=B.p;return 0!==e?e:void 0===(e=window.event)?32:Jf(e.type)}var je=Math.random().toString(36).slice(2),Me="__reactFiber$"+je,Ue="__reactProps$"+je,Ie="__reactContainer$"+je,$e="__reactEvents$"+je,Be="__reactListeners$"+je,He="__reactHandles$"+je,qe="__reactResources$"+je,We="__reactMarker$"+je;function Ve(e){delete e[Me],delete e[Ue],delete e[$e],delete e[Be],delete e[He]}function Qe(e){var t=e[Me];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ie]||n[Me]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=sf(e);null!==e;){if(n=e[Me])return n;e=sf(e)}return t}n=(e=n).parentNode}return null}function Ke(e){if(e=e[Me]||e[Ie]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function Ye(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(o(33))}function Xe(e){var t=e[qe];return t||(t=e[qe]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Ge(e){e[We]=!0}var Je=new Set,Ze={};function et(e,t){tt(e,t),tt(e+"Capture",t)}function tt(e,t){for(Ze[e]=t,e=0;e<t.length;e++)Je.add(t[e])}var nt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),rt=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),at={},lt={};function ot(e,t,n){if(a=t,re.call(lt,a)||!re.call(at,a)&&(rt.test(a)?lt[a]=!0:(at[a]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var a}function it(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function ut(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function st(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ct(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function ft(e){e._valueTracker||(e._valueTracker=function(e){var t=ct(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var a=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,l.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function dt(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ct(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function pt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var ht=/[\n"\\]/g;function mt(e){return e.replace(ht,(function(e){return"\\"+e.charCodeAt(0).toString(16)+" "}))}function gt(e,t,n,r,a,l,o,i){e.name="",null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o?e.type=o:e.removeAttribute("type"),null!=t?"number"===o?(0===t&&""===e.value||e.value!=t)&&(e.value=""+st(t)):e.value!==""+st(t)&&(e.value=""+st(t)):"submit"!==o&&"reset"!==o||e.removeAttribute("value"),null!=t?vt(e,o,st(t)):null!=n?vt(e,o,st(n)):null!=r&&e.removeAttribute("value"),null==a&&null!=l&&(e.defaultChecked=!!l),null!=a&&(e.checked=a&&"function"!==typeof a&&"symbol"!==typeof a),null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.name=""+st(i):e.removeAttribute("name")}function yt(e,t,n,r,a,l,o,i){if(null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l&&(e.type=l),null!=t||null!=n){if(!("submit"!==l&&"reset"!==l||void 0!==t&&null!==t))return;n=null!=n?""+st(n):"",t=null!=t?""+st(t):n,i||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:a)&&"symbol"!==typeof r&&!!r,e.checked=i?e.checked:!!r,e.defaultChecked=!!r,null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.name=o)}function vt(e,t,n){"number"===t&&pt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function bt(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+st(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function wt(e,t,n){null==t||((t=""+st(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+st(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function St(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(o(92));if($(r)){if(1<r.length)throw Error(o(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=st(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function kt(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var Et=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function xt(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||Et.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function Ct(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(o(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var a in t)r=t[a],t.hasOwnProperty(a)&&n[a]!==r&&xt(e,a,r)}else for(var l in t)t.hasOwnProperty(l)&&xt(e,l,t[l])}function Rt(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var _t=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Pt=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Tt(e){return Pt.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Ot=null;function Nt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Lt=null,zt=null;function At(e){var t=Ke(e);if(t&&(e=t.stateNode)){var n=e[Ue]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+mt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=r[Ue]||null;if(!a)throw Error(o(90));gt(r,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&dt(r)}break e;case"textarea":wt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&bt(e,!!n.multiple,t,!1)}}}var Ft=!1;function Dt(e,t,n){if(Ft)return e(t,n);Ft=!0;try{return e(t)}finally{if(Ft=!1,(null!==Lt||null!==zt)&&(Ms(),Lt&&(t=Lt,e=zt,zt=Lt=null,At(t),e)))for(t=0;t<e.length;t++)At(e[t])}}function jt(e,t){var n=e.stateNode;if(null===n)return null;var r=n[Ue]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var Mt=!1;if(nt)try{var Ut={};Object.defineProperty(Ut,"passive",{get:function(){Mt=!0}}),window.addEventListener("test",Ut,Ut),window.removeEventListener("test",Ut,Ut)}catch(kd){Mt=!1}var It=null,$t=null,Bt=null;function Ht(){if(Bt)return Bt;var e,t,n=$t,r=n.length,a="value"in It?It.value:It.textContent,l=a.length;for(e=0;e<r&&n[e]===a[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===a[l-t];t++);return Bt=a.slice(e,1<t?1-t:void 0)}function qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function Wt(){return!0}function Vt(){return!1}function Qt(e){function t(t,n,r,a,l){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=l,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(a):a[o]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?Wt:Vt,this.isPropagationStopped=Vt,this}return N(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Wt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Wt)},persist:function(){},isPersistent:Wt}),t}var Kt,Yt,Xt,Gt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Jt=Qt(Gt),Zt=N({},Gt,{view:0,detail:0}),en=Qt(Zt),tn=N({},Zt,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Xt&&(Xt&&"mousemove"===e.type?(Kt=e.screenX-Xt.screenX,Yt=e.screenY-Xt.screenY):Yt=Kt=0,Xt=e),Kt)},movementY:function(e){return"movementY"in e?e.movementY:Yt}}),nn=Qt(tn),rn=Qt(N({},tn,{dataTransfer:0})),an=Qt(N({},Zt,{relatedTarget:0})),ln=Qt(N({},Gt,{animationName:0,elapsedTime:0,pseudoElement:0})),on=Qt(N({},Gt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),un=Qt(N({},Gt,{data:0})),sn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},cn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function dn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function pn(){return dn}var hn=Qt(N({},Zt,{key:function(e){if(e.key){var t=sn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?cn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pn,charCode:function(e){return"keypress"===e.type?qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),mn=Qt(N({},tn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),gn=Qt(N({},Zt,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pn})),yn=Qt(N({},Gt,{propertyName:0,elapsedTime:0,pseudoElement:0})),vn=Qt(N({},tn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),bn=Qt(N({},Gt,{newState:0,oldState:0})),wn=[9,13,27,32],Sn=nt&&"CompositionEvent"in window,kn=null;nt&&"documentMode"in document&&(kn=document.documentMode);var En=nt&&"TextEvent"in window&&!kn,xn=nt&&(!Sn||kn&&8<kn&&11>=kn),Cn=String.fromCharCode(32),Rn=!1;function _n(e,t){switch(e){case"keyup":return-1!==wn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Pn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Tn=!1;var On={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Nn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!On[e.type]:"textarea"===t}function Ln(e,t,n,r){Lt?zt?zt.push(r):zt=[r]:Lt=r,0<(t=Dc(t,"onChange")).length&&(n=new Jt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var zn=null,An=null;function Fn(e){Pc(e,0)}function Dn(e){if(dt(Ye(e)))return e}function jn(e,t){if("change"===e)return t}var Mn=!1;if(nt){var Un;if(nt){var In="oninput"in document;if(!In){var $n=document.createElement("div");$n.setAttribute("oninput","return;"),In="function"===typeof $n.oninput}Un=In}else Un=!1;Mn=Un&&(!document.documentMode||9<document.documentMode)}function Bn(){zn&&(zn.detachEvent("onpropertychange",Hn),An=zn=null)}function Hn(e){if("value"===e.propertyName&&Dn(An)){var t=[];Ln(t,An,e,Nt(e)),Dt(Fn,t)}}function qn(e,t,n){"focusin"===e?(Bn(),An=n,(zn=t).attachEvent("onpropertychange",Hn)):"focusout"===e&&Bn()}function Wn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Dn(An)}function Vn(e,t){if("click"===e)return Dn(t)}function Qn(e,t){if("input"===e||"change"===e)return Dn(t)}var Kn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Yn(e,t){if(Kn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!re.call(t,a)||!Kn(e[a],t[a]))return!1}return!0}function Xn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Gn(e,t){var n,r=Xn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Xn(r)}}function Jn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Jn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function Zn(e){for(var t=pt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=pt((e=t.contentWindow).document)}return t}function er(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function tr(e,t){var n=Zn(t);t=e.focusedElem;var r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&Jn(t.ownerDocument.documentElement,t)){if(null!==r&&er(t))if(e=r.start,void 0===(n=r.end)&&(n=e),"selectionStart"in t)t.selectionStart=e,t.selectionEnd=Math.min(n,t.value.length);else if((n=(e=t.ownerDocument||document)&&e.defaultView||window).getSelection){n=n.getSelection();var a=t.textContent.length,l=Math.min(r.start,a);r=void 0===r.end?l:Math.min(r.end,a),!n.extend&&l>r&&(a=r,r=l,l=a),a=Gn(t,l);var o=Gn(t,r);a&&o&&(1!==n.rangeCount||n.anchorNode!==a.node||n.anchorOffset!==a.offset||n.focusNode!==o.node||n.focusOffset!==o.offset)&&((e=e.createRange()).setStart(a.node,a.offset),n.removeAllRanges(),l>r?(n.addRange(e),n.extend(o.node,o.offset)):(e.setEnd(o.node,o.offset),n.addRange(e)))}for(e=[],n=t;n=n.parentNode;)1===n.nodeType&&e.push({element:n,left:n.scrollLeft,top:n.scrollTop});for("function"===typeof t.focus&&t.focus(),t=0;t<e.length;t++)(n=e[t]).element.scrollLeft=n.left,n.element.scrollTop=n.top}}var nr=nt&&"documentMode"in document&&11>=document.documentMode,rr=null,ar=null,lr=null,or=!1;function ir(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;or||null==rr||rr!==pt(r)||("selectionStart"in(r=rr)&&er(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Yn(lr,r)||(lr=r,0<(r=Dc(ar,"onSelect")).length&&(t=new Jt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function ur(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var sr={animationend:ur("Animation","AnimationEnd"),animationiteration:ur("Animation","AnimationIteration"),animationstart:ur("Animation","AnimationStart"),transitionrun:ur("Transition","TransitionRun"),transitionstart:ur("Transition","TransitionStart"),transitioncancel:ur("Transition","TransitionCancel"),transitionend:ur("Transition","TransitionEnd")},cr={},fr={};function dr(e){if(cr[e])return cr[e];if(!sr[e])return e;var t,n=sr[e];for(t in n)if(n.hasOwnProperty(t)&&t in fr)return cr[e]=n[t];return e}nt&&(fr=document.createElement("div").style,"AnimationEvent"in window||(delete sr.animationend.animation,delete sr.animationiteration.animation,delete sr.animationstart.animation),"TransitionEvent"in window||delete sr.transitionend.transition);var pr=dr("animationend"),hr=dr("animationiteration"),mr=dr("animationstart"),gr=dr("transitionrun"),yr=dr("transitionstart"),vr=dr("transitioncancel"),br=dr("transitionend"),wr=new Map,Sr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll scrollEnd toggle touchMove waiting wheel".split(" ");function kr(e,t){wr.set(e,t),et(t,[e])}var Er=[],xr=0,Cr=0;function Rr(){for(var e=xr,t=Cr=xr=0;t<e;){var n=Er[t];Er[t++]=null;var r=Er[t];Er[t++]=null;var a=Er[t];Er[t++]=null;var l=Er[t];if(Er[t++]=null,null!==r&&null!==a){var o=r.pending;null===o?a.next=a:(a.next=o.next,o.next=a),r.pending=a}0!==l&&Or(n,a,l)}}function _r(e,t,n,r){Er[xr++]=e,Er[xr++]=t,Er[xr++]=n,Er[xr++]=r,Cr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Pr(e,t,n,r){return _r(e,t,n,r),Nr(e)}function Tr(e,t){return _r(e,null,null,t),Nr(e)}function Or(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var a=!1,l=e.return;null!==l;)l.childLanes|=n,null!==(r=l.alternate)&&(r.childLanes|=n),22===l.tag&&(null===(e=l.stateNode)||1&e._visibility||(a=!0)),e=l,l=l.return;a&&null!==t&&3===e.tag&&(l=e.stateNode,a=31-we(n),null===(e=(l=l.hiddenUpdates)[a])?l[a]=[t]:e.push(t),t.lane=536870912|n)}function Nr(e){if(50<Ps)throw Ps=0,Ts=null,Error(o(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Lr={},zr=new WeakMap;function Ar(e,t){if("object"===typeof e&&null!==e){var n=zr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:D(t)},zr.set(e,t),t)}return{value:e,source:t,stack:D(t)}}var Fr=[],Dr=0,jr=null,Mr=0,Ur=[],Ir=0,$r=null,Br=1,Hr="";function qr(e,t){Fr[Dr++]=Mr,Fr[Dr++]=jr,jr=e,Mr=t}function Wr(e,t,n){Ur[Ir++]=Br,Ur[Ir++]=Hr,Ur[Ir++]=$r,$r=e;var r=Br;e=Hr;var a=32-we(r)-1;r&=~(1<<a),n+=1;var l=32-we(t)+a;if(30<l){var o=a-a%5;l=(r&(1<<o)-1).toString(32),r>>=o,a-=o,Br=1<<32-we(t)+a|n<<a|r,Hr=l+e}else Br=1<<l|n<<a|r,Hr=e}function Vr(e){null!==e.return&&(qr(e,1),Wr(e,1,0))}function Qr(e){for(;e===jr;)jr=Fr[--Dr],Fr[Dr]=null,Mr=Fr[--Dr],Fr[Dr]=null;for(;e===$r;)$r=Ur[--Ir],Ur[Ir]=null,Hr=Ur[--Ir],Ur[Ir]=null,Br=Ur[--Ir],Ur[Ir]=null}var Kr=null,Yr=null,Xr=!1,Gr=null,Jr=!1,Zr=Error(o(519));function ea(e){throw la(Ar(Error(o(418,"")),e)),Zr}function ta(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Me]=e,t[Ue]=r,n){case"dialog":Tc("cancel",t),Tc("close",t);break;case"iframe":case"object":case"embed":Tc("load",t);break;case"video":case"audio":for(n=0;n<Rc.length;n++)Tc(Rc[n],t);break;case"source":Tc("error",t);break;case"img":case"image":case"link":Tc("error",t),Tc("load",t);break;case"details":Tc("toggle",t);break;case"input":Tc("invalid",t),yt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),ft(t);break;case"select":Tc("invalid",t);break;case"textarea":Tc("invalid",t),St(t,r.value,r.defaultValue,r.children),ft(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Bc(t.textContent,n)?(null!=r.popover&&(Tc("beforetoggle",t),Tc("toggle",t)),null!=r.onScroll&&Tc("scroll",t),null!=r.onScrollEnd&&Tc("scrollend",t),null!=r.onClick&&(t.onclick=Hc),t=!0):t=!1,t||ea(e)}function na(e){for(Kr=e.return;Kr;)switch(Kr.tag){case 3:case 27:return void(Jr=!0);case 5:case 13:return void(Jr=!1);default:Kr=Kr.return}}function ra(e){if(e!==Kr)return!1;if(!Xr)return na(e),Xr=!0,!1;var t,n=!1;if((t=3!==e.tag&&27!==e.tag)&&((t=5===e.tag)&&(t=!("form"!==(t=e.type)&&"button"!==t)||Jc(e.type,e.memoizedProps)),t=!t),t&&(n=!0),n&&Yr&&ea(e),na(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){Yr=uf(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}Yr=null}}else Yr=Kr?uf(e.stateNode.nextSibling):null;return!0}function aa(){Yr=Kr=null,Xr=!1}function la(e){null===Gr?Gr=[e]:Gr.push(e)}var oa=Error(o(460)),ia=Error(o(474)),ua={then:function(){}};function sa(e){return"fulfilled"===(e=e.status)||"rejected"===e}function ca(){}function fa(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(ca,ca),t=n),t.status){case"fulfilled":return t.value;case"rejected":if((e=t.reason)===oa)throw Error(o(483));throw e;default:if("string"===typeof t.status)t.then(ca,ca);else{if(null!==(e=ts)&&100<e.shellSuspendCounter)throw Error(o(482));(e=t).status="pending",e.then((function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}}),(function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}}))}switch(t.status){case"fulfilled":return t.value;case"rejected":if((e=t.reason)===oa)throw Error(o(483));throw e}throw da=t,oa}}var da=null;function pa(){if(null===da)throw Error(o(459));var e=da;return da=null,e}var ha=null,ma=0;function ga(e){var t=ma;return ma+=1,null===ha&&(ha=[]),fa(ha,e,t)}function ya(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function va(e,t){if(t.$$typeof===u)throw Error(o(525));throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ba(e){return(0,e._init)(e._payload)}function wa(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function a(e,t){return(e=ju(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=33554434,n):r:(t.flags|=33554434,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=33554434),t}function u(e,t,n,r){return null===t||6!==t.tag?((t=Bu(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function d(e,t,n,r){var l=n.type;return l===f?h(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===l||"object"===typeof l&&null!==l&&l.$$typeof===S&&ba(l)===t.type)?(ya(t=a(t,n.props),n),t.return=e,t):(ya(t=Uu(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function p(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Hu(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function h(e,t,n,r,l){return null===t||7!==t.tag?((t=Iu(n,e.mode,r,l)).return=e,t):((t=a(t,n)).return=e,t)}function m(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Bu(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case s:return ya(n=Uu(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case c:return(t=Hu(t,e.mode,n)).return=e,t;case S:return m(e,t=(0,t._init)(t._payload),n)}if($(t)||C(t))return(t=Iu(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return m(e,ga(t),n);if(t.$$typeof===g)return m(e,Ri(e,t),n);va(e,t)}return null}function y(e,t,n,r){var a=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==a?null:u(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case s:return n.key===a?d(e,t,n,r):null;case c:return n.key===a?p(e,t,n,r):null;case S:return y(e,t,n=(a=n._init)(n._payload),r)}if($(n)||C(n))return null!==a?null:h(e,t,n,r,null);if("function"===typeof n.then)return y(e,t,ga(n),r);if(n.$$typeof===g)return y(e,t,Ri(e,n),r);va(e,n)}return null}function v(e,t,n,r,a){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return u(t,e=e.get(n)||null,""+r,a);if("object"===typeof r&&null!==r){switch(r.$$typeof){case s:return d(t,e=e.get(null===r.key?n:r.key)||null,r,a);case c:return p(t,e=e.get(null===r.key?n:r.key)||null,r,a);case S:return v(e,t,n,r=(0,r._init)(r._payload),a)}if($(r)||C(r))return h(t,e=e.get(n)||null,r,a,null);if("function"===typeof r.then)return v(e,t,n,ga(r),a);if(r.$$typeof===g)return v(e,t,n,Ri(t,r),a);va(t,r)}return null}function b(u,d,p,h){if("object"===typeof p&&null!==p&&p.type===f&&null===p.key&&(p=p.props.children),"object"===typeof p&&null!==p){switch(p.$$typeof){case s:e:{for(var w=p.key;null!==d;){if(d.key===w){if((w=p.type)===f){if(7===d.tag){n(u,d.sibling),(h=a(d,p.props.children)).return=u,u=h;break e}}else if(d.elementType===w||"object"===typeof w&&null!==w&&w.$$typeof===S&&ba(w)===d.type){n(u,d.sibling),ya(h=a(d,p.props),p),h.return=u,u=h;break e}n(u,d);break}t(u,d),d=d.sibling}p.type===f?((h=Iu(p.props.children,u.mode,h,p.key)).return=u,u=h):(ya(h=Uu(p.type,p.key,p.props,null,u.mode,h),p),h.return=u,u=h)}return i(u);case c:e:{for(w=p.key;null!==d;){if(d.key===w){if(4===d.tag&&d.stateNode.containerInfo===p.containerInfo&&d.stateNode.implementation===p.implementation){n(u,d.sibling),(h=a(d,p.children||[])).return=u,u=h;break e}n(u,d);break}t(u,d),d=d.sibling}(h=Hu(p,u.mode,h)).return=u,u=h}return i(u);case S:return b(u,d,p=(w=p._init)(p._payload),h)}if($(p))return function(a,o,i,u){for(var s=null,c=null,f=o,d=o=0,p=null;null!==f&&d<i.length;d++){f.index>d?(p=f,f=null):p=f.sibling;var h=y(a,f,i[d],u);if(null===h){null===f&&(f=p);break}e&&f&&null===h.alternate&&t(a,f),o=l(h,o,d),null===c?s=h:c.sibling=h,c=h,f=p}if(d===i.length)return n(a,f),Xr&&qr(a,d),s;if(null===f){for(;d<i.length;d++)null!==(f=m(a,i[d],u))&&(o=l(f,o,d),null===c?s=f:c.sibling=f,c=f);return Xr&&qr(a,d),s}for(f=r(f);d<i.length;d++)null!==(p=v(f,a,d,i[d],u))&&(e&&null!==p.alternate&&f.delete(null===p.key?d:p.key),o=l(p,o,d),null===c?s=p:c.sibling=p,c=p);return e&&f.forEach((function(e){return t(a,e)})),Xr&&qr(a,d),s}(u,d,p,h);if(C(p)){if("function"!==typeof(w=C(p)))throw Error(o(150));return function(a,i,u,s){if(null==u)throw Error(o(151));for(var c=null,f=null,d=i,p=i=0,h=null,g=u.next();null!==d&&!g.done;p++,g=u.next()){d.index>p?(h=d,d=null):h=d.sibling;var b=y(a,d,g.value,s);if(null===b){null===d&&(d=h);break}e&&d&&null===b.alternate&&t(a,d),i=l(b,i,p),null===f?c=b:f.sibling=b,f=b,d=h}if(g.done)return n(a,d),Xr&&qr(a,p),c;if(null===d){for(;!g.done;p++,g=u.next())null!==(g=m(a,g.value,s))&&(i=l(g,i,p),null===f?c=g:f.sibling=g,f=g);return Xr&&qr(a,p),c}for(d=r(d);!g.done;p++,g=u.next())null!==(g=v(d,a,p,g.value,s))&&(e&&null!==g.alternate&&d.delete(null===g.key?p:g.key),i=l(g,i,p),null===f?c=g:f.sibling=g,f=g);return e&&d.forEach((function(e){return t(a,e)})),Xr&&qr(a,p),c}(u,d,p=w.call(p),h)}if("function"===typeof p.then)return b(u,d,ga(p),h);if(p.$$typeof===g)return b(u,d,Ri(u,p),h);va(u,p)}return"string"===typeof p&&""!==p||"number"===typeof p||"bigint"===typeof p?(p=""+p,null!==d&&6===d.tag?(n(u,d.sibling),(h=a(d,p)).return=u,u=h):(n(u,d),(h=Bu(p,u.mode,h)).return=u,u=h),i(u)):n(u,d)}return function(e,t,n,r){try{ma=0;var a=b(e,t,n,r);return ha=null,a}catch(o){if(o===oa)throw o;var l=Fu(29,o,null,e.mode);return l.lanes=r,l.return=e,l}}}var Sa=wa(!0),ka=wa(!1),Ea=V(null),xa=V(0);function Ca(e,t){K(xa,e=ss),K(Ea,t),ss=e|t.baseLanes}function Ra(){K(xa,ss),K(Ea,Ea.current)}function _a(){ss=xa.current,Q(Ea),Q(xa)}var Pa=V(null),Ta=null;function Oa(e){var t=e.alternate;K(Aa,1&Aa.current),K(Pa,e),null===Ta&&(null===t||null!==Ea.current||null!==t.memoizedState)&&(Ta=e)}function Na(e){if(22===e.tag){if(K(Aa,Aa.current),K(Pa,e),null===Ta){var t=e.alternate;null!==t&&null!==t.memoizedState&&(Ta=e)}}else La()}function La(){K(Aa,Aa.current),K(Pa,Pa.current)}function za(e){Q(Pa),Ta===e&&(Ta=null),Q(Aa)}var Aa=V(0);function Fa(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Da="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach((function(e){return e()}))}},ja=r.unstable_scheduleCallback,Ma=r.unstable_NormalPriority,Ua={$$typeof:g,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Ia(){return{controller:new Da,data:new Map,refCount:0}}function $a(e){e.refCount--,0===e.refCount&&ja(Ma,(function(){e.controller.abort()}))}var Ba=null,Ha=0,qa=0,Wa=null;function Va(){if(0===--Ha&&null!==Ba){null!==Wa&&(Wa.status="fulfilled");var e=Ba;Ba=null,qa=0,Wa=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Qa=O.S;O.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Ba){var n=Ba=[];Ha=0,qa=Sc(),Wa={status:"pending",value:void 0,then:function(e){n.push(e)}}}Ha++,t.then(Va,Va)}(0,t),null!==Qa&&Qa(e,t)};var Ka=V(null);function Ya(){var e=Ka.current;return null!==e?e:ts.pooledCache}function Xa(e,t){K(Ka,null===t?Ka.current:t.pool)}function Ga(){var e=Ya();return null===e?null:{parent:Ua._currentValue,pool:e}}var Ja=0,Za=null,el=null,tl=null,nl=!1,rl=!1,al=!1,ll=0,ol=0,il=null,ul=0;function sl(){throw Error(o(321))}function cl(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Kn(e[n],t[n]))return!1;return!0}function fl(e,t,n,r,a,l){return Ja=l,Za=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,O.H=null===e||null===e.memoizedState?Ro:_o,al=!1,l=n(r,a),al=!1,rl&&(l=pl(t,n,r,a)),dl(e),l}function dl(e){O.H=Co;var t=null!==el&&null!==el.next;if(Ja=0,tl=el=Za=null,nl=!1,ol=0,il=null,t)throw Error(o(300));null===e||qo||null!==(e=e.dependencies)&&Ei(e)&&(qo=!0)}function pl(e,t,n,r){Za=e;var a=0;do{if(rl&&(il=null),ol=0,rl=!1,25<=a)throw Error(o(301));if(a+=1,tl=el=null,null!=e.updateQueue){var l=e.updateQueue;l.lastEffect=null,l.events=null,l.stores=null,null!=l.memoCache&&(l.memoCache.index=0)}O.H=Po,l=t(n,r)}while(rl);return l}function hl(){var e=O.H,t=e.useState()[0];return t="function"===typeof t.then?wl(t):t,e=e.useState()[0],(null!==el?el.memoizedState:null)!==e&&(Za.flags|=1024),t}function ml(){var e=0!==ll;return ll=0,e}function gl(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function yl(e){if(nl){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}nl=!1}Ja=0,tl=el=Za=null,rl=!1,ol=ll=0,il=null}function vl(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===tl?Za.memoizedState=tl=e:tl=tl.next=e,tl}function bl(){if(null===el){var e=Za.alternate;e=null!==e?e.memoizedState:null}else e=el.next;var t=null===tl?Za.memoizedState:tl.next;if(null!==t)tl=t,el=e;else{if(null===e){if(null===Za.alternate)throw Error(o(467));throw Error(o(310))}e={memoizedState:(el=e).memoizedState,baseState:el.baseState,baseQueue:el.baseQueue,queue:el.queue,next:null},null===tl?Za.memoizedState=tl=e:tl=tl.next=e}return tl}function wl(e){var t=ol;return ol+=1,null===il&&(il=[]),e=fa(il,e,t),t=Za,null===(null===tl?t.memoizedState:tl.next)&&(t=t.alternate,O.H=null===t||null===t.memoizedState?Ro:_o),e}function Sl(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return wl(e);if(e.$$typeof===g)return Ci(e)}throw Error(o(438,String(e)))}function kl(e){var t=null,n=Za.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=Za.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map((function(e){return e.slice()})),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},Za.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=E;return t.index++,n}function El(e,t){return"function"===typeof t?t(e):t}function xl(e){return Cl(bl(),el,e)}function Cl(e,t,n){var r=e.queue;if(null===r)throw Error(o(311));r.lastRenderedReducer=n;var a=e.baseQueue,l=r.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}t.baseQueue=a=l,r.pending=null}if(l=e.baseState,null===a)e.memoizedState=l;else{var u=i=null,s=null,c=t=a.next,f=!1;do{var d=-536870913&c.lane;if(d!==c.lane?(rs&d)===d:(Ja&d)===d){var p=c.revertLane;if(0===p)null!==s&&(s=s.next={lane:0,revertLane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),d===qa&&(f=!0);else{if((Ja&p)===p){c=c.next,p===qa&&(f=!0);continue}d={lane:0,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===s?(u=s=d,i=l):s=s.next=d,Za.lanes|=p,fs|=p}d=c.action,al&&n(l,d),l=c.hasEagerState?c.eagerState:n(l,d)}else p={lane:d,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===s?(u=s=p,i=l):s=s.next=p,Za.lanes|=d,fs|=d;c=c.next}while(null!==c&&c!==t);if(null===s?i=l:s.next=u,!Kn(l,e.memoizedState)&&(qo=!0,f&&null!==(n=Wa)))throw n;e.memoizedState=l,e.baseState=i,e.baseQueue=s,r.lastRenderedState=l}return null===a&&(r.lanes=0),[e.memoizedState,r.dispatch]}function Rl(e){var t=bl(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);Kn(l,t.memoizedState)||(qo=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function _l(e,t,n){var r=Za,a=bl(),l=Xr;if(l){if(void 0===n)throw Error(o(407));n=n()}else n=t();var i=!Kn((el||a).memoizedState,n);if(i&&(a.memoizedState=n,qo=!0),a=a.queue,Jl(Ol.bind(null,r,a,e),[e]),a.getSnapshot!==t||i||null!==tl&&1&tl.memoizedState.tag){if(r.flags|=2048,Ql(9,Tl.bind(null,r,a,n,t),{destroy:void 0},null),null===ts)throw Error(o(349));l||0!==(60&Ja)||Pl(r,t,n)}return n}function Pl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=Za.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},Za.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Tl(e,t,n,r){t.value=n,t.getSnapshot=r,Nl(t)&&Ll(e)}function Ol(e,t,n){return n((function(){Nl(t)&&Ll(e)}))}function Nl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Kn(e,n)}catch(r){return!0}}function Ll(e){var t=Tr(e,2);null!==t&&Ls(t,e,2)}function zl(e){var t=vl();if("function"===typeof e){var n=e;if(e=n(),al){be(!0);try{n()}finally{be(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:El,lastRenderedState:e},t}function Al(e,t,n,r){return e.baseState=n,Cl(e,el,"function"===typeof r?r:El)}function Fl(e,t,n,r,a){if(ko(e))throw Error(o(485));if(null!==(e=t.action)){var l={payload:a,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){l.listeners.push(e)}};null!==O.T?n(!0):l.isTransition=!1,r(l),null===(n=t.pending)?(l.next=t.pending=l,Dl(t,l)):(l.next=n.next,t.pending=n.next=l)}}function Dl(e,t){var n=t.action,r=t.payload,a=e.state;if(t.isTransition){var l=O.T,o={};O.T=o;try{var i=n(a,r),u=O.S;null!==u&&u(o,i),jl(e,t,i)}catch(s){Ul(e,t,s)}finally{O.T=l}}else try{jl(e,t,l=n(a,r))}catch(c){Ul(e,t,c)}}function jl(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then((function(n){Ml(e,t,n)}),(function(n){return Ul(e,t,n)})):Ml(e,t,n)}function Ml(e,t,n){t.status="fulfilled",t.value=n,Il(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,Dl(e,n)))}function Ul(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,Il(t),t=t.next}while(t!==r)}e.action=null}function Il(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function $l(e,t){return t}function Bl(e,t){if(Xr){var n=ts.formState;if(null!==n){e:{var r=Za;if(Xr){if(Yr){t:{for(var a=Yr,l=Jr;8!==a.nodeType;){if(!l){a=null;break t}if(null===(a=uf(a.nextSibling))){a=null;break t}}a="F!"===(l=a.data)||"F"===l?a:null}if(a){Yr=uf(a.nextSibling),r="F!"===a.data;break e}}ea(r)}r=!1}r&&(t=n[0])}}return(n=vl()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:$l,lastRenderedState:t},n.queue=r,n=bo.bind(null,Za,r),r.dispatch=n,r=zl(!1),l=So.bind(null,Za,!1,r.queue),a={state:t,dispatch:null,action:e,pending:null},(r=vl()).queue=a,n=Fl.bind(null,Za,a,l,n),a.dispatch=n,r.memoizedState=e,[t,n,!1]}function Hl(e){return ql(bl(),el,e)}function ql(e,t,n){t=Cl(e,t,$l)[0],e=xl(El)[0],t="object"===typeof t&&null!==t&&"function"===typeof t.then?wl(t):t;var r=bl(),a=r.queue,l=a.dispatch;return n!==r.memoizedState&&(Za.flags|=2048,Ql(9,Wl.bind(null,a,n),{destroy:void 0},null)),[t,l,e]}function Wl(e,t){e.action=t}function Vl(e){var t=bl(),n=el;if(null!==n)return ql(t,n,e);bl(),t=t.memoizedState;var r=(n=bl()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function Ql(e,t,n,r){return e={tag:e,create:t,inst:n,deps:r,next:null},null===(t=Za.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},Za.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Kl(){return bl().memoizedState}function Yl(e,t,n,r){var a=vl();Za.flags|=e,a.memoizedState=Ql(1|t,n,{destroy:void 0},void 0===r?null:r)}function Xl(e,t,n,r){var a=bl();r=void 0===r?null:r;var l=a.memoizedState.inst;null!==el&&null!==r&&cl(r,el.memoizedState.deps)?a.memoizedState=Ql(t,n,l,r):(Za.flags|=e,a.memoizedState=Ql(1|t,n,l,r))}function Gl(e,t){Yl(8390656,8,e,t)}function Jl(e,t){Xl(2048,8,e,t)}function Zl(e,t){return Xl(4,2,e,t)}function eo(e,t){return Xl(4,4,e,t)}function to(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function no(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,Xl(4,4,to.bind(null,t,e),n)}function ro(){}function ao(e,t){var n=bl();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&cl(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function lo(e,t){var n=bl();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&cl(t,r[1]))return r[0];if(r=e(),al){be(!0);try{e()}finally{be(!1)}}return n.memoizedState=[r,t],r}function oo(e,t,n){return void 0===n||0!==(1073741824&Ja)?e.memoizedState=t:(e.memoizedState=n,e=Ns(),Za.lanes|=e,fs|=e,n)}function io(e,t,n,r){return Kn(n,t)?n:null!==Ea.current?(e=oo(e,n,r),Kn(e,t)||(qo=!0),e):0===(42&Ja)?(qo=!0,e.memoizedState=n):(e=Ns(),Za.lanes|=e,fs|=e,t)}function uo(e,t,n,r,a){var l=B.p;B.p=0!==l&&8>l?l:8;var o=O.T,i={};O.T=i,So(e,!1,t,n);try{var u=a(),s=O.S;if(null!==s&&s(i,u),null!==u&&"object"===typeof u&&"function"===typeof u.then)wo(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then((function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)}),(function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)})),r}(u,r),Os());else wo(e,t,r,Os())}catch(c){wo(e,t,{then:function(){},status:"rejected",reason:c},Os())}finally{B.p=l,O.T=o}}function so(){}function co(e,t,n,r){if(5!==e.tag)throw Error(o(476));var a=fo(e).queue;uo(e,a,t,H,null===n?so:function(){return po(e),n(r)})}function fo(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:H,baseState:H,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:El,lastRenderedState:H},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:El,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function po(e){wo(e,fo(e).next.queue,{},Os())}function ho(){return Ci(jf)}function mo(){return bl().memoizedState}function go(){return bl().memoizedState}function yo(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Os(),r=Li(t,e=Ni(n),n);return null!==r&&(Ls(r,t,n),zi(r,t,n)),t={cache:Ia()},void(e.payload=t)}t=t.return}}function vo(e,t,n){var r=Os();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},ko(e)?Eo(t,n):null!==(n=Pr(e,t,n,r))&&(Ls(n,e,r),xo(n,t,r))}function bo(e,t,n){wo(e,t,n,Os())}function wo(e,t,n,r){var a={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(ko(e))Eo(t,a);else{var l=e.alternate;if(0===e.lanes&&(null===l||0===l.lanes)&&null!==(l=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=l(o,n);if(a.hasEagerState=!0,a.eagerState=i,Kn(i,o))return _r(e,t,a,0),null===ts&&Rr(),!1}catch(u){}if(null!==(n=Pr(e,t,a,r)))return Ls(n,e,r),xo(n,t,r),!0}return!1}function So(e,t,n,r){if(r={lane:2,revertLane:Sc(),action:r,hasEagerState:!1,eagerState:null,next:null},ko(e)){if(t)throw Error(o(479))}else null!==(t=Pr(e,n,r,2))&&Ls(t,e,2)}function ko(e){var t=e.alternate;return e===Za||null!==t&&t===Za}function Eo(e,t){rl=nl=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function xo(e,t,n){if(0!==(4194176&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ae(e,n)}}var Co={readContext:Ci,use:Sl,useCallback:sl,useContext:sl,useEffect:sl,useImperativeHandle:sl,useLayoutEffect:sl,useInsertionEffect:sl,useMemo:sl,useReducer:sl,useRef:sl,useState:sl,useDebugValue:sl,useDeferredValue:sl,useTransition:sl,useSyncExternalStore:sl,useId:sl};Co.useCacheRefresh=sl,Co.useMemoCache=sl,Co.useHostTransitionStatus=sl,Co.useFormState=sl,Co.useActionState=sl,Co.useOptimistic=sl;var Ro={readContext:Ci,use:Sl,useCallback:function(e,t){return vl().memoizedState=[e,void 0===t?null:t],e},useContext:Ci,useEffect:Gl,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,Yl(4194308,4,to.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Yl(4194308,4,e,t)},useInsertionEffect:function(e,t){Yl(4,2,e,t)},useMemo:function(e,t){var n=vl();t=void 0===t?null:t;var r=e();if(al){be(!0);try{e()}finally{be(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=vl();if(void 0!==n){var a=n(t);if(al){be(!0);try{n(t)}finally{be(!1)}}}else a=t;return r.memoizedState=r.baseState=a,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:a},r.queue=e,e=e.dispatch=vo.bind(null,Za,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},vl().memoizedState=e},useState:function(e){var t=(e=zl(e)).queue,n=bo.bind(null,Za,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:ro,useDeferredValue:function(e,t){return oo(vl(),e,t)},useTransition:function(){var e=zl(!1);return e=uo.bind(null,Za,e.queue,!0,!1),vl().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=Za,a=vl();if(Xr){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===ts)throw Error(o(349));0!==(60&rs)||Pl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,Gl(Ol.bind(null,r,l,e),[e]),r.flags|=2048,Ql(9,Tl.bind(null,r,l,n,t),{destroy:void 0},null),n},useId:function(){var e=vl(),t=ts.identifierPrefix;if(Xr){var n=Hr;t=":"+t+"R"+(n=(Br&~(1<<32-we(Br)-1)).toString(32)+n),0<(n=ll++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=ul++).toString(32)+":";return e.memoizedState=t},useCacheRefresh:function(){return vl().memoizedState=yo.bind(null,Za)}};Ro.useMemoCache=kl,Ro.useHostTransitionStatus=ho,Ro.useFormState=Bl,Ro.useActionState=Bl,Ro.useOptimistic=function(e){var t=vl();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=So.bind(null,Za,!0,n),n.dispatch=t,[e,t]};var _o={readContext:Ci,use:Sl,useCallback:ao,useContext:Ci,useEffect:Jl,useImperativeHandle:no,useInsertionEffect:Zl,useLayoutEffect:eo,useMemo:lo,useReducer:xl,useRef:Kl,useState:function(){return xl(El)},useDebugValue:ro,useDeferredValue:function(e,t){return io(bl(),el.memoizedState,e,t)},useTransition:function(){var e=xl(El)[0],t=bl().memoizedState;return["boolean"===typeof e?e:wl(e),t]},useSyncExternalStore:_l,useId:mo};_o.useCacheRefresh=go,_o.useMemoCache=kl,_o.useHostTransitionStatus=ho,_o.useFormState=Hl,_o.useActionState=Hl,_o.useOptimistic=function(e,t){return Al(bl(),0,e,t)};var Po={readContext:Ci,use:Sl,useCallback:ao,useContext:Ci,useEffect:Jl,useImperativeHandle:no,useInsertionEffect:Zl,useLayoutEffect:eo,useMemo:lo,useReducer:Rl,useRef:Kl,useState:function(){return Rl(El)},useDebugValue:ro,useDeferredValue:function(e,t){var n=bl();return null===el?oo(n,e,t):io(n,el.memoizedState,e,t)},useTransition:function(){var e=Rl(El)[0],t=bl().memoizedState;return["boolean"===typeof e?e:wl(e),t]},useSyncExternalStore:_l,useId:mo};function To(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:N({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}Po.useCacheRefresh=go,Po.useMemoCache=kl,Po.useHostTransitionStatus=ho,Po.useFormState=Vl,Po.useActionState=Vl,Po.useOptimistic=function(e,t){var n=bl();return null!==el?Al(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])};var Oo={isMounted:function(e){return!!(e=e._reactInternals)&&j(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Os(),a=Ni(r);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=Li(e,a,r))&&(Ls(t,e,r),zi(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Os(),a=Ni(r);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=Li(e,a,r))&&(Ls(t,e,r),zi(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Os(),r=Ni(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=Li(e,r,n))&&(Ls(t,e,n),zi(t,e,n))}};function No(e,t,n,r,a,l,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,l,o):!t.prototype||!t.prototype.isPureReactComponent||(!Yn(n,r)||!Yn(a,l))}function Lo(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Oo.enqueueReplaceState(t,t.state,null)}function zo(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var a in n===t&&(n=N({},n)),e)void 0===n[a]&&(n[a]=e[a]);return n}var Ao="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function Fo(e){Ao(e)}function Do(e){console.error(e)}function jo(e){Ao(e)}function Mo(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout((function(){throw n}))}}function Uo(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout((function(){throw r}))}}function Io(e,t,n){return(n=Ni(n)).tag=3,n.payload={element:null},n.callback=function(){Mo(e,t)},n}function $o(e){return(e=Ni(e)).tag=3,e}function Bo(e,t,n,r){var a=n.type.getDerivedStateFromError;if("function"===typeof a){var l=r.value;e.payload=function(){return a(l)},e.callback=function(){Uo(t,n,r)}}var o=n.stateNode;null!==o&&"function"===typeof o.componentDidCatch&&(e.callback=function(){Uo(t,n,r),"function"!==typeof a&&(null===ks?ks=new Set([this]):ks.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var Ho=Error(o(461)),qo=!1;function Wo(e,t,n,r){t.child=null===e?ka(t,null,n,r):Sa(t,e.child,n,r)}function Vo(e,t,n,r,a){n=n.render;var l=t.ref;if("ref"in r){var o={};for(var i in r)"ref"!==i&&(o[i]=r[i])}else o=r;return xi(t),r=fl(e,t,n,o,l,a),i=ml(),null===e||qo?(Xr&&i&&Vr(t),t.flags|=1,Wo(e,t,r,a),t.child):(gl(e,t,a),di(e,t,a))}function Qo(e,t,n,r,a){if(null===e){var l=n.type;return"function"!==typeof l||Du(l)||void 0!==l.defaultProps||null!==n.compare?((e=Uu(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=l,Ko(e,t,l,r,a))}if(l=e.child,!pi(e,a)){var o=l.memoizedProps;if((n=null!==(n=n.compare)?n:Yn)(o,r)&&e.ref===t.ref)return di(e,t,a)}return t.flags|=1,(e=ju(l,r)).ref=t.ref,e.return=t,t.child=e}function Ko(e,t,n,r,a){if(null!==e){var l=e.memoizedProps;if(Yn(l,r)&&e.ref===t.ref){if(qo=!1,t.pendingProps=r=l,!pi(e,a))return t.lanes=e.lanes,di(e,t,a);0!==(131072&e.flags)&&(qo=!0)}}return Jo(e,t,n,r,a)}function Yo(e,t,n){var r=t.pendingProps,a=r.children,l=0!==(2&t.stateNode._pendingVisibility),o=null!==e?e.memoizedState:null;if(Go(e,t),"hidden"===r.mode||l){if(0!==(128&t.flags)){if(r=null!==o?o.baseLanes|n:n,null!==e){for(a=t.child=e.child,l=0;null!==a;)l=l|a.lanes|a.childLanes,a=a.sibling;t.childLanes=l&~r}else t.childLanes=0,t.child=null;return Xo(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,Xo(e,t,null!==o?o.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Xa(0,null!==o?o.cachePool:null),null!==o?Ca(t,o):Ra(),Na(t)}else null!==o?(Xa(0,o.cachePool),Ca(t,o),La(),t.memoizedState=null):(null!==e&&Xa(0,null),Ra(),La());return Wo(e,t,a,n),t.child}function Xo(e,t,n,r){var a=Ya();return a=null===a?null:{parent:Ua._currentValue,pool:a},t.memoizedState={baseLanes:n,cachePool:a},null!==e&&Xa(0,null),Ra(),Na(t),null!==e&&ki(e,t,r,!0),null}function Go(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=2097664);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(o(284));null!==e&&e.ref===n||(t.flags|=2097664)}}function Jo(e,t,n,r,a){return xi(t),n=fl(e,t,n,r,void 0,a),r=ml(),null===e||qo?(Xr&&r&&Vr(t),t.flags|=1,Wo(e,t,n,a),t.child):(gl(e,t,a),di(e,t,a))}function Zo(e,t,n,r,a,l){return xi(t),t.updateQueue=null,n=pl(t,r,n,a),dl(e),r=ml(),null===e||qo?(Xr&&r&&Vr(t),t.flags|=1,Wo(e,t,n,l),t.child):(gl(e,t,l),di(e,t,l))}function ei(e,t,n,r,a){if(xi(t),null===t.stateNode){var l=Lr,o=n.contextType;"object"===typeof o&&null!==o&&(l=Ci(o)),l=new n(r,l),t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,l.updater=Oo,t.stateNode=l,l._reactInternals=t,(l=t.stateNode).props=r,l.state=t.memoizedState,l.refs={},Ti(t),o=n.contextType,l.context="object"===typeof o&&null!==o?Ci(o):Lr,l.state=t.memoizedState,"function"===typeof(o=n.getDerivedStateFromProps)&&(To(t,n,o,r),l.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(o=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),o!==l.state&&Oo.enqueueReplaceState(l,l.state,null),ji(t,r,l,a),Di(),l.state=t.memoizedState),"function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){l=t.stateNode;var i=t.memoizedProps,u=zo(n,i);l.props=u;var s=l.context,c=n.contextType;o=Lr,"object"===typeof c&&null!==c&&(o=Ci(c));var f=n.getDerivedStateFromProps;c="function"===typeof f||"function"===typeof l.getSnapshotBeforeUpdate,i=t.pendingProps!==i,c||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(i||s!==o)&&Lo(t,l,r,o),Pi=!1;var d=t.memoizedState;l.state=d,ji(t,r,l,a),Di(),s=t.memoizedState,i||d!==s||Pi?("function"===typeof f&&(To(t,n,f,r),s=t.memoizedState),(u=Pi||No(t,n,u,r,d,s,o))?(c||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||("function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"===typeof l.componentDidMount&&(t.flags|=4194308)):("function"===typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),l.props=r,l.state=s,l.context=o,r=u):("function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,Oi(e,t),c=zo(n,o=t.memoizedProps),l.props=c,f=t.pendingProps,d=l.context,s=n.contextType,u=Lr,"object"===typeof s&&null!==s&&(u=Ci(s)),(s="function"===typeof(i=n.getDerivedStateFromProps)||"function"===typeof l.getSnapshotBeforeUpdate)||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(o!==f||d!==u)&&Lo(t,l,r,u),Pi=!1,d=t.memoizedState,l.state=d,ji(t,r,l,a),Di();var p=t.memoizedState;o!==f||d!==p||Pi||null!==e&&null!==e.dependencies&&Ei(e.dependencies)?("function"===typeof i&&(To(t,n,i,r),p=t.memoizedState),(c=Pi||No(t,n,c,r,d,p,u)||null!==e&&null!==e.dependencies&&Ei(e.dependencies))?(s||"function"!==typeof l.UNSAFE_componentWillUpdate&&"function"!==typeof l.componentWillUpdate||("function"===typeof l.componentWillUpdate&&l.componentWillUpdate(r,p,u),"function"===typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,p,u)),"function"===typeof l.componentDidUpdate&&(t.flags|=4),"function"===typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),l.props=r,l.state=p,l.context=u,r=c):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return l=r,Go(e,t),r=0!==(128&t.flags),l||r?(l=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:l.render(),t.flags|=1,null!==e&&r?(t.child=Sa(t,e.child,null,a),t.child=Sa(t,null,n,a)):Wo(e,t,n,a),t.memoizedState=l.state,e=t.child):e=di(e,t,a),e}function ti(e,t,n,r){return aa(),t.flags|=256,Wo(e,t,n,r),t.child}var ni={dehydrated:null,treeContext:null,retryLane:0};function ri(e){return{baseLanes:e,cachePool:Ga()}}function ai(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=hs),e}function li(e,t,n){var r,a=t.pendingProps,l=!1,i=0!==(128&t.flags);if((r=i)||(r=(null===e||null!==e.memoizedState)&&0!==(2&Aa.current)),r&&(l=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(Xr){if(l?Oa(t):La(),Xr){var u,s=Yr;if(u=s){e:{for(u=s,s=Jr;8!==u.nodeType;){if(!s){s=null;break e}if(null===(u=uf(u.nextSibling))){s=null;break e}}s=u}null!==s?(t.memoizedState={dehydrated:s,treeContext:null!==$r?{id:Br,overflow:Hr}:null,retryLane:536870912},(u=Fu(18,null,null,0)).stateNode=s,u.return=t,t.child=u,Kr=t,Yr=null,u=!0):u=!1}u||ea(t)}if(null!==(s=t.memoizedState)&&null!==(s=s.dehydrated))return"$!"===s.data?t.lanes=16:t.lanes=536870912,null;za(t)}return s=a.children,a=a.fallback,l?(La(),s=ii({mode:"hidden",children:s},l=t.mode),a=Iu(a,l,n,null),s.return=t,a.return=t,s.sibling=a,t.child=s,(l=t.child).memoizedState=ri(n),l.childLanes=ai(e,r,n),t.memoizedState=ni,a):(Oa(t),oi(t,s))}if(null!==(u=e.memoizedState)&&null!==(s=u.dehydrated)){if(i)256&t.flags?(Oa(t),t.flags&=-257,t=ui(e,t,n)):null!==t.memoizedState?(La(),t.child=e.child,t.flags|=128,t=null):(La(),l=a.fallback,s=t.mode,a=ii({mode:"visible",children:a.children},s),(l=Iu(l,s,n,null)).flags|=2,a.return=t,l.return=t,a.sibling=l,t.child=a,Sa(t,e.child,null,n),(a=t.child).memoizedState=ri(n),a.childLanes=ai(e,r,n),t.memoizedState=ni,t=l);else if(Oa(t),"$!"===s.data){if(r=s.nextSibling&&s.nextSibling.dataset)var c=r.dgst;r=c,(a=Error(o(419))).stack="",a.digest=r,la({value:a,source:null,stack:null}),t=ui(e,t,n)}else if(qo||ki(e,t,n,!1),r=0!==(n&e.childLanes),qo||r){if(null!==(r=ts)){if(0!==(42&(a=n&-n)))a=1;else switch(a){case 2:a=1;break;case 8:a=4;break;case 32:a=16;break;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:a=64;break;case 268435456:a=134217728;break;default:a=0}if(0!==(a=0!==(a&(r.suspendedLanes|n))?0:a)&&a!==u.retryLane)throw u.retryLane=a,Tr(e,a),Ls(r,e,a),Ho}"$?"===s.data||qs(),t=ui(e,t,n)}else"$?"===s.data?(t.flags|=128,t.child=e.child,t=ic.bind(null,e),s._reactRetry=t,t=null):(e=u.treeContext,Yr=uf(s.nextSibling),Kr=t,Xr=!0,Gr=null,Jr=!1,null!==e&&(Ur[Ir++]=Br,Ur[Ir++]=Hr,Ur[Ir++]=$r,Br=e.id,Hr=e.overflow,$r=t),(t=oi(t,a.children)).flags|=4096);return t}return l?(La(),l=a.fallback,s=t.mode,c=(u=e.child).sibling,(a=ju(u,{mode:"hidden",children:a.children})).subtreeFlags=31457280&u.subtreeFlags,null!==c?l=ju(c,l):(l=Iu(l,s,n,null)).flags|=2,l.return=t,a.return=t,a.sibling=l,t.child=a,a=l,l=t.child,null===(s=e.child.memoizedState)?s=ri(n):(null!==(u=s.cachePool)?(c=Ua._currentValue,u=u.parent!==c?{parent:c,pool:c}:u):u=Ga(),s={baseLanes:s.baseLanes|n,cachePool:u}),l.memoizedState=s,l.childLanes=ai(e,r,n),t.memoizedState=ni,a):(Oa(t),e=(n=e.child).sibling,(n=ju(n,{mode:"visible",children:a.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function oi(e,t){return(t=ii({mode:"visible",children:t},e.mode)).return=e,e.child=t}function ii(e,t){return $u(e,t,0,null)}function ui(e,t,n){return Sa(t,e.child,null,n),(e=oi(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function si(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),wi(e.return,t,n)}function ci(e,t,n,r,a){var l=e.memoizedState;null===l?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=a)}function fi(e,t,n){var r=t.pendingProps,a=r.revealOrder,l=r.tail;if(Wo(e,t,r.children,n),0!==(2&(r=Aa.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&si(e,n,t);else if(19===e.tag)si(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(K(Aa,r),a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===Fa(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),ci(t,!1,a,n,l);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===Fa(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}ci(t,!0,n,null,l);break;case"together":ci(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function di(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),fs|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(ki(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=ju(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=ju(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function pi(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Ei(e))}function hi(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)qo=!0;else{if(!pi(e,n)&&0===(128&t.flags))return qo=!1,function(e,t,n){switch(t.tag){case 3:Z(t,t.stateNode.containerInfo),vi(t,Ua,e.memoizedState.cache),aa();break;case 27:case 5:te(t);break;case 4:Z(t,t.stateNode.containerInfo);break;case 10:vi(t,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(Oa(t),t.flags|=128,null):0!==(n&t.child.childLanes)?li(e,t,n):(Oa(t),null!==(e=di(e,t,n))?e.sibling:null);Oa(t);break;case 19:var a=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(ki(e,t,n,!1),r=0!==(n&t.childLanes)),a){if(r)return fi(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),K(Aa,Aa.current),r)break;return null;case 22:case 23:return t.lanes=0,Yo(e,t,n);case 24:vi(t,Ua,e.memoizedState.cache)}return di(e,t,n)}(e,t,n);qo=0!==(131072&e.flags)}else qo=!1,Xr&&0!==(1048576&t.flags)&&Wr(t,Mr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,a=r._init;if(r=a(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((a=r.$$typeof)===y){t.tag=11,t=Vo(null,t,r,e,n);break e}if(a===w){t.tag=14,t=Qo(null,t,r,e,n);break e}}throw t=_(r)||r,Error(o(306,t,""))}Du(r)?(e=zo(r,e),t.tag=1,t=ei(null,t,r,e,n)):(t.tag=0,t=Jo(null,t,r,e,n))}return t;case 0:return Jo(e,t,t.type,t.pendingProps,n);case 1:return ei(e,t,r=t.type,a=zo(r,t.pendingProps),n);case 3:e:{if(Z(t,t.stateNode.containerInfo),null===e)throw Error(o(387));var l=t.pendingProps;r=(a=t.memoizedState).element,Oi(e,t),ji(t,l,null,n);var i=t.memoizedState;if(l=i.cache,vi(t,Ua,l),l!==a.cache&&Si(t,[Ua],n,!0),Di(),l=i.element,a.isDehydrated){if(a={element:l,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=a,t.memoizedState=a,256&t.flags){t=ti(e,t,l,n);break e}if(l!==r){la(r=Ar(Error(o(424)),t)),t=ti(e,t,l,n);break e}for(Yr=uf(t.stateNode.containerInfo.firstChild),Kr=t,Xr=!0,Gr=null,Jr=!0,n=ka(t,null,l,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(aa(),l===r){t=di(e,t,n);break e}Wo(e,t,l,n)}t=t.child}return t;case 26:return Go(e,t),null===e?(n=yf(t.type,null,t.pendingProps,null))?t.memoizedState=n:Xr||(n=t.type,e=t.pendingProps,(r=Yc(G.current).createElement(n))[Me]=t,r[Ue]=e,Vc(r,n,e),Ge(r),t.stateNode=r):t.memoizedState=yf(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return te(t),null===e&&Xr&&(r=t.stateNode=cf(t.type,t.pendingProps,G.current),Kr=t,Jr=!0,Yr=uf(r.firstChild)),r=t.pendingProps.children,null!==e||Xr?Wo(e,t,r,n):t.child=Sa(t,null,r,n),Go(e,t),t.child;case 5:return null===e&&Xr&&((a=r=Yr)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var a=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[We])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(l=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(l!==a.rel||e.getAttribute("href")!==(null==a.href?null:a.href)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin)||e.getAttribute("title")!==(null==a.title?null:a.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((l=e.getAttribute("src"))!==(null==a.src?null:a.src)||e.getAttribute("type")!==(null==a.type?null:a.type)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin))&&l&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var l=null==a.name?null:""+a.name;if("hidden"===a.type&&e.getAttribute("name")===l)return e}if(null===(e=uf(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,Jr))?(t.stateNode=r,Kr=t,Yr=uf(r.firstChild),Jr=!1,a=!0):a=!1),a||ea(t)),te(t),a=t.type,l=t.pendingProps,i=null!==e?e.memoizedProps:null,r=l.children,Jc(a,l)?r=null:null!==i&&Jc(a,i)&&(t.flags|=32),null!==t.memoizedState&&(a=fl(e,t,hl,null,null,n),jf._currentValue=a),Go(e,t),Wo(e,t,r,n),t.child;case 6:return null===e&&Xr&&((e=n=Yr)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=uf(e.nextSibling)))return null}return e}(n,t.pendingProps,Jr))?(t.stateNode=n,Kr=t,Yr=null,e=!0):e=!1),e||ea(t)),null;case 13:return li(e,t,n);case 4:return Z(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Sa(t,null,r,n):Wo(e,t,r,n),t.child;case 11:return Vo(e,t,t.type,t.pendingProps,n);case 7:return Wo(e,t,t.pendingProps,n),t.child;case 8:case 12:return Wo(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,vi(t,t.type,r.value),Wo(e,t,r.children,n),t.child;case 9:return a=t.type._context,r=t.pendingProps.children,xi(t),r=r(a=Ci(a)),t.flags|=1,Wo(e,t,r,n),t.child;case 14:return Qo(e,t,t.type,t.pendingProps,n);case 15:return Ko(e,t,t.type,t.pendingProps,n);case 19:return fi(e,t,n);case 22:return Yo(e,t,n);case 24:return xi(t),r=Ci(Ua),null===e?(null===(a=Ya())&&(a=ts,l=Ia(),a.pooledCache=l,l.refCount++,null!==l&&(a.pooledCacheLanes|=n),a=l),t.memoizedState={parent:r,cache:a},Ti(t),vi(t,Ua,a)):(0!==(e.lanes&n)&&(Oi(e,t),ji(t,null,null,n),Di()),a=e.memoizedState,l=t.memoizedState,a.parent!==r?(a={parent:r,cache:r},t.memoizedState=a,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=a),vi(t,Ua,r)):(r=l.cache,vi(t,Ua,r),r!==a.cache&&Si(t,[Ua],n,!0))),Wo(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}var mi=V(null),gi=null,yi=null;function vi(e,t,n){K(mi,t._currentValue),t._currentValue=n}function bi(e){e._currentValue=mi.current,Q(mi)}function wi(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Si(e,t,n,r){var a=e.child;for(null!==a&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){var i=a.child;l=l.firstContext;e:for(;null!==l;){var u=l;l=a;for(var s=0;s<t.length;s++)if(u.context===t[s]){l.lanes|=n,null!==(u=l.alternate)&&(u.lanes|=n),wi(l.return,n,e),r||(i=null);break e}l=u.next}}else if(18===a.tag){if(null===(i=a.return))throw Error(o(341));i.lanes|=n,null!==(l=i.alternate)&&(l.lanes|=n),wi(i,n,e),i=null}else i=a.child;if(null!==i)i.return=a;else for(i=a;null!==i;){if(i===e){i=null;break}if(null!==(a=i.sibling)){a.return=i.return,i=a;break}i=i.return}a=i}}function ki(e,t,n,r){e=null;for(var a=t,l=!1;null!==a;){if(!l)if(0!==(524288&a.flags))l=!0;else if(0!==(262144&a.flags))break;if(10===a.tag){var i=a.alternate;if(null===i)throw Error(o(387));if(null!==(i=i.memoizedProps)){var u=a.type;Kn(a.pendingProps.value,i.value)||(null!==e?e.push(u):e=[u])}}else if(a===J.current){if(null===(i=a.alternate))throw Error(o(387));i.memoizedState.memoizedState!==a.memoizedState.memoizedState&&(null!==e?e.push(jf):e=[jf])}a=a.return}null!==e&&Si(t,e,n,r),t.flags|=262144}function Ei(e){for(e=e.firstContext;null!==e;){if(!Kn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function xi(e){gi=e,yi=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Ci(e){return _i(gi,e)}function Ri(e,t){return null===gi&&xi(e),_i(e,t)}function _i(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===yi){if(null===e)throw Error(o(308));yi=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else yi=yi.next=t;return n}var Pi=!1;function Ti(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Oi(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function Ni(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function Li(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&es)){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,t=Nr(e),Or(e,null,n),t}return _r(e,r,t,n),Nr(e)}function zi(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194176&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ae(e,n)}}function Ai(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,l=null;if(null!==(n=n.firstBaseUpdate)){do{var o={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===l?a=l=o:l=l.next=o,n=n.next}while(null!==n);null===l?a=l=t:l=l.next=t}else a=l=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:l,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var Fi=!1;function Di(){if(Fi){if(null!==Wa)throw Wa}}function ji(e,t,n,r){Fi=!1;var a=e.updateQueue;Pi=!1;var l=a.firstBaseUpdate,o=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var u=i,s=u.next;u.next=null,null===o?l=s:o.next=s,o=u;var c=e.alternate;null!==c&&((i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=s:i.next=s,c.lastBaseUpdate=u))}if(null!==l){var f=a.baseState;for(o=0,c=s=u=null,i=l;;){var d=-536870913&i.lane,p=d!==i.lane;if(p?(rs&d)===d:(r&d)===d){0!==d&&d===qa&&(Fi=!0),null!==c&&(c=c.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});e:{var h=e,m=i;d=t;var g=n;switch(m.tag){case 1:if("function"===typeof(h=m.payload)){f=h.call(g,f,d);break e}f=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null===(d="function"===typeof(h=m.payload)?h.call(g,f,d):h)||void 0===d)break e;f=N({},f,d);break e;case 2:Pi=!0}}null!==(d=i.callback)&&(e.flags|=64,p&&(e.flags|=8192),null===(p=a.callbacks)?a.callbacks=[d]:p.push(d))}else p={lane:d,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(s=c=p,u=f):c=c.next=p,o|=d;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(p=i).next,p.next=null,a.lastBaseUpdate=p,a.shared.pending=null}}null===c&&(u=f),a.baseState=u,a.firstBaseUpdate=s,a.lastBaseUpdate=c,null===l&&(a.shared.lanes=0),fs|=o,e.lanes=o,e.memoizedState=f}}function Mi(e,t){if("function"!==typeof e)throw Error(o(191,e));e.call(t)}function Ui(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)Mi(n[e],t)}function Ii(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var a=r.next;n=a;do{if((n.tag&e)===e){r=void 0;var l=n.create,o=n.inst;r=l(),o.destroy=r}n=n.next}while(n!==a)}}catch(i){rc(t,t.return,i)}}function $i(e,t,n){try{var r=t.updateQueue,a=null!==r?r.lastEffect:null;if(null!==a){var l=a.next;r=l;do{if((r.tag&e)===e){var o=r.inst,i=o.destroy;if(void 0!==i){o.destroy=void 0,a=t;var u=n;try{i()}catch(s){rc(a,u,s)}}}r=r.next}while(r!==l)}}catch(s){rc(t,t.return,s)}}function Bi(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{Ui(t,n)}catch(r){rc(e,e.return,r)}}}function Hi(e,t,n){n.props=zo(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){rc(e,t,r)}}function qi(e,t){try{var n=e.ref;if(null!==n){var r=e.stateNode;switch(e.tag){case 26:case 27:case 5:var a=r;break;default:a=r}"function"===typeof n?e.refCleanup=n(a):n.current=a}}catch(l){rc(e,t,l)}}function Wi(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(a){rc(e,t,a)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(l){rc(e,t,l)}else n.current=null}function Vi(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(a){rc(e,e.return,a)}}function Qi(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var a=null,l=null,i=null,u=null,s=null,c=null,f=null;for(h in n){var d=n[h];if(n.hasOwnProperty(h)&&null!=d)switch(h){case"checked":case"value":break;case"defaultValue":s=d;default:r.hasOwnProperty(h)||qc(e,t,h,null,r,d)}}for(var p in r){var h=r[p];if(d=n[p],r.hasOwnProperty(p)&&(null!=h||null!=d))switch(p){case"type":l=h;break;case"name":a=h;break;case"checked":c=h;break;case"defaultChecked":f=h;break;case"value":i=h;break;case"defaultValue":u=h;break;case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(o(137,t));break;default:h!==d&&qc(e,t,p,h,r,d)}}return void gt(e,i,u,s,c,f,l,a);case"select":for(l in h=i=u=p=null,n)if(s=n[l],n.hasOwnProperty(l)&&null!=s)switch(l){case"value":break;case"multiple":h=s;default:r.hasOwnProperty(l)||qc(e,t,l,null,r,s)}for(a in r)if(l=r[a],s=n[a],r.hasOwnProperty(a)&&(null!=l||null!=s))switch(a){case"value":p=l;break;case"defaultValue":u=l;break;case"multiple":i=l;default:l!==s&&qc(e,t,a,l,r,s)}return t=u,n=i,r=h,void(null!=p?bt(e,!!n,p,!1):!!r!==!!n&&(null!=t?bt(e,!!n,t,!0):bt(e,!!n,n?[]:"",!1)));case"textarea":for(u in h=p=null,n)if(a=n[u],n.hasOwnProperty(u)&&null!=a&&!r.hasOwnProperty(u))switch(u){case"value":case"children":break;default:qc(e,t,u,null,r,a)}for(i in r)if(a=r[i],l=n[i],r.hasOwnProperty(i)&&(null!=a||null!=l))switch(i){case"value":p=a;break;case"defaultValue":h=a;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=a)throw Error(o(91));break;default:a!==l&&qc(e,t,i,a,r,l)}return void wt(e,p,h);case"option":for(var m in n)if(p=n[m],n.hasOwnProperty(m)&&null!=p&&!r.hasOwnProperty(m))if("selected"===m)e.selected=!1;else qc(e,t,m,null,r,p);for(s in r)if(p=r[s],h=n[s],r.hasOwnProperty(s)&&p!==h&&(null!=p||null!=h))if("selected"===s)e.selected=p&&"function"!==typeof p&&"symbol"!==typeof p;else qc(e,t,s,p,r,h);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)p=n[g],n.hasOwnProperty(g)&&null!=p&&!r.hasOwnProperty(g)&&qc(e,t,g,null,r,p);for(c in r)if(p=r[c],h=n[c],r.hasOwnProperty(c)&&p!==h&&(null!=p||null!=h))switch(c){case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(o(137,t));break;default:qc(e,t,c,p,r,h)}return;default:if(Rt(t)){for(var y in n)p=n[y],n.hasOwnProperty(y)&&void 0!==p&&!r.hasOwnProperty(y)&&Wc(e,t,y,void 0,r,p);for(f in r)p=r[f],h=n[f],!r.hasOwnProperty(f)||p===h||void 0===p&&void 0===h||Wc(e,t,f,p,r,h);return}}for(var v in n)p=n[v],n.hasOwnProperty(v)&&null!=p&&!r.hasOwnProperty(v)&&qc(e,t,v,null,r,p);for(d in r)p=r[d],h=n[d],!r.hasOwnProperty(d)||p===h||null==p&&null==h||qc(e,t,d,p,r,h)}(r,e.type,n,t),r[Ue]=t}catch(a){rc(e,e.return,a)}}function Ki(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag||4===e.tag}function Yi(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||Ki(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&27!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function Xi(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Hc));else if(4!==r&&27!==r&&null!==(e=e.child))for(Xi(e,t,n),e=e.sibling;null!==e;)Xi(e,t,n),e=e.sibling}function Gi(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&27!==r&&null!==(e=e.child))for(Gi(e,t,n),e=e.sibling;null!==e;)Gi(e,t,n),e=e.sibling}var Ji=!1,Zi=!1,eu=!1,tu="function"===typeof WeakSet?WeakSet:Set,nu=null,ru=!1;function au(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:yu(e,n),4&r&&Ii(5,n);break;case 1:if(yu(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(i){rc(n,n.return,i)}else{var a=zo(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(a,t,e.__reactInternalSnapshotBeforeUpdate)}catch(u){rc(n,n.return,u)}}64&r&&Bi(n),512&r&&qi(n,n.return);break;case 3:if(yu(e,n),64&r&&null!==(r=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:e=n.child.stateNode}try{Ui(r,e)}catch(i){rc(n,n.return,i)}}break;case 26:yu(e,n),512&r&&qi(n,n.return);break;case 27:case 5:yu(e,n),null===t&&4&r&&Vi(n),512&r&&qi(n,n.return);break;case 12:default:yu(e,n);break;case 13:yu(e,n),4&r&&cu(e,n);break;case 22:if(!(a=null!==n.memoizedState||Ji)){t=null!==t&&null!==t.memoizedState||Zi;var l=Ji,o=Zi;Ji=a,(Zi=t)&&!o?bu(e,n,0!==(8772&n.subtreeFlags)):yu(e,n),Ji=l,Zi=o}512&r&&("manual"===n.memoizedProps.mode?qi(n,n.return):Wi(n,n.return))}}function lu(e){var t=e.alternate;null!==t&&(e.alternate=null,lu(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&Ve(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var ou=null,iu=!1;function uu(e,t,n){for(n=n.child;null!==n;)su(e,t,n),n=n.sibling}function su(e,t,n){if(ve&&"function"===typeof ve.onCommitFiberUnmount)try{ve.onCommitFiberUnmount(ye,n)}catch(o){}switch(n.tag){case 26:Zi||Wi(n,t),uu(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:Zi||Wi(n,t);var r=ou,a=iu;for(ou=n.stateNode,uu(e,t,n),t=(n=n.stateNode).attributes;t.length;)n.removeAttributeNode(t[0]);Ve(n),ou=r,iu=a;break;case 5:Zi||Wi(n,t);case 6:a=ou;var l=iu;if(ou=null,uu(e,t,n),iu=l,null!==(ou=a))if(iu)try{e=ou,r=n.stateNode,8===e.nodeType?e.parentNode.removeChild(r):e.removeChild(r)}catch(i){rc(n,t,i)}else try{ou.removeChild(n.stateNode)}catch(i){rc(n,t,i)}break;case 18:null!==ou&&(iu?(t=ou,n=n.stateNode,8===t.nodeType?lf(t.parentNode,n):1===t.nodeType&&lf(t,n),gd(t)):lf(ou,n.stateNode));break;case 4:r=ou,a=iu,ou=n.stateNode.containerInfo,iu=!0,uu(e,t,n),ou=r,iu=a;break;case 0:case 11:case 14:case 15:Zi||$i(2,n,t),Zi||$i(4,n,t),uu(e,t,n);break;case 1:Zi||(Wi(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&Hi(n,t,r)),uu(e,t,n);break;case 21:uu(e,t,n);break;case 22:Zi||Wi(n,t),Zi=(r=Zi)||null!==n.memoizedState,uu(e,t,n),Zi=r;break;default:uu(e,t,n)}}function cu(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{gd(e)}catch(n){rc(t,t.return,n)}}function fu(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new tu),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new tu),t;default:throw Error(o(435,e.tag))}}(e);t.forEach((function(t){var r=uc.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}function du(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r],l=e,i=t,u=i;e:for(;null!==u;){switch(u.tag){case 27:case 5:ou=u.stateNode,iu=!1;break e;case 3:case 4:ou=u.stateNode.containerInfo,iu=!0;break e}u=u.return}if(null===ou)throw Error(o(160));su(l,i,a),ou=null,iu=!1,null!==(l=a.alternate)&&(l.return=null),a.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)hu(t,e),t=t.sibling}var pu=null;function hu(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:du(t,e),mu(e),4&r&&($i(3,e,e.return),Ii(3,e),$i(5,e,e.return));break;case 1:du(t,e),mu(e),512&r&&(Zi||null===n||Wi(n,n.return)),64&r&&Ji&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var a=pu;if(du(t,e),mu(e),512&r&&(Zi||null===n||Wi(n,n.return)),4&r){var l=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,a=a.ownerDocument||a;t:switch(r){case"title":(!(l=a.getElementsByTagName("title")[0])||l[We]||l[Me]||"http://www.w3.org/2000/svg"===l.namespaceURI||l.hasAttribute("itemprop"))&&(l=a.createElement(r),a.head.insertBefore(l,a.querySelector("head > title"))),Vc(l,r,n),l[Me]=e,Ge(l),r=l;break e;case"link":var i=Pf("link","href",a).get(r+(n.href||""));if(i)for(var u=0;u<i.length;u++)if((l=i[u]).getAttribute("href")===(null==n.href?null:n.href)&&l.getAttribute("rel")===(null==n.rel?null:n.rel)&&l.getAttribute("title")===(null==n.title?null:n.title)&&l.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){i.splice(u,1);break t}Vc(l=a.createElement(r),r,n),a.head.appendChild(l);break;case"meta":if(i=Pf("meta","content",a).get(r+(n.content||"")))for(u=0;u<i.length;u++)if((l=i[u]).getAttribute("content")===(null==n.content?null:""+n.content)&&l.getAttribute("name")===(null==n.name?null:n.name)&&l.getAttribute("property")===(null==n.property?null:n.property)&&l.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&l.getAttribute("charset")===(null==n.charSet?null:n.charSet)){i.splice(u,1);break t}Vc(l=a.createElement(r),r,n),a.head.appendChild(l);break;default:throw Error(o(468,r))}l[Me]=e,Ge(l),r=l}e.stateNode=r}else Tf(a,e.type,e.stateNode);else e.stateNode=Ef(a,r,e.memoizedProps);else l!==r?(null===l?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):l.count--,null===r?Tf(a,e.type,e.stateNode):Ef(a,r,e.memoizedProps)):null===r&&null!==e.stateNode&&Qi(e,e.memoizedProps,n.memoizedProps)}break;case 27:if(4&r&&null===e.alternate){a=e.stateNode,l=e.memoizedProps;try{for(var s=a.firstChild;s;){var c=s.nextSibling,f=s.nodeName;s[We]||"HEAD"===f||"BODY"===f||"SCRIPT"===f||"STYLE"===f||"LINK"===f&&"stylesheet"===s.rel.toLowerCase()||a.removeChild(s),s=c}for(var d=e.type,p=a.attributes;p.length;)a.removeAttributeNode(p[0]);Vc(a,d,l),a[Me]=e,a[Ue]=l}catch(m){rc(e,e.return,m)}}case 5:if(du(t,e),mu(e),512&r&&(Zi||null===n||Wi(n,n.return)),32&e.flags){a=e.stateNode;try{kt(a,"")}catch(m){rc(e,e.return,m)}}4&r&&null!=e.stateNode&&Qi(e,a=e.memoizedProps,null!==n?n.memoizedProps:a),1024&r&&(eu=!0);break;case 6:if(du(t,e),mu(e),4&r){if(null===e.stateNode)throw Error(o(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(m){rc(e,e.return,m)}}break;case 3:if(_f=null,a=pu,pu=pf(t.containerInfo),du(t,e),pu=a,mu(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{gd(t.containerInfo)}catch(m){rc(e,e.return,m)}eu&&(eu=!1,gu(e));break;case 4:r=pu,pu=pf(e.stateNode.containerInfo),du(t,e),mu(e),pu=r;break;case 12:du(t,e),mu(e);break;case 13:du(t,e),mu(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(bs=ue()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,fu(e,r)));break;case 22:if(512&r&&(Zi||null===n||Wi(n,n.return)),s=null!==e.memoizedState,c=null!==n&&null!==n.memoizedState,Ji=(f=Ji)||s,Zi=(d=Zi)||c,du(t,e),Zi=d,Ji=f,mu(e),(t=e.stateNode)._current=e,t._visibility&=-3,t._visibility|=2&t._pendingVisibility,8192&r&&(t._visibility=s?-2&t._visibility:1|t._visibility,s&&(t=Ji||Zi,null===n||c||t||vu(e)),null===e.memoizedProps||"manual"!==e.memoizedProps.mode))e:for(n=null,t=e;;){if(5===t.tag||26===t.tag||27===t.tag){if(null===n){c=n=t;try{if(a=c.stateNode,s)"function"===typeof(l=a.style).setProperty?l.setProperty("display","none","important"):l.display="none";else{i=c.stateNode;var h=void 0!==(u=c.memoizedProps.style)&&null!==u&&u.hasOwnProperty("display")?u.display:null;i.style.display=null==h||"boolean"===typeof h?"":(""+h).trim()}}catch(m){rc(c,c.return,m)}}}else if(6===t.tag){if(null===n){c=t;try{c.stateNode.nodeValue=s?"":c.memoizedProps}catch(m){rc(c,c.return,m)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,fu(e,n))));break;case 19:du(t,e),mu(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,fu(e,r)));break;case 21:break;default:du(t,e),mu(e)}}function mu(e){var t=e.flags;if(2&t){try{if(27!==e.tag){e:{for(var n=e.return;null!==n;){if(Ki(n)){var r=n;break e}n=n.return}throw Error(o(160))}switch(r.tag){case 27:var a=r.stateNode;Gi(e,Yi(e),a);break;case 5:var l=r.stateNode;32&r.flags&&(kt(l,""),r.flags&=-33),Gi(e,Yi(e),l);break;case 3:case 4:var i=r.stateNode.containerInfo;Xi(e,Yi(e),i);break;default:throw Error(o(161))}}}catch(u){rc(e,e.return,u)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function gu(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;gu(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function yu(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)au(e,t.alternate,t),t=t.sibling}function vu(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:$i(4,t,t.return),vu(t);break;case 1:Wi(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&Hi(t,t.return,n),vu(t);break;case 26:case 27:case 5:Wi(t,t.return),vu(t);break;case 22:Wi(t,t.return),null===t.memoizedState&&vu(t);break;default:vu(t)}e=e.sibling}}function bu(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,a=e,l=t,o=l.flags;switch(l.tag){case 0:case 11:case 15:bu(a,l,n),Ii(4,l);break;case 1:if(bu(a,l,n),"function"===typeof(a=(r=l).stateNode).componentDidMount)try{a.componentDidMount()}catch(s){rc(r,r.return,s)}if(null!==(a=(r=l).updateQueue)){var i=r.stateNode;try{var u=a.shared.hiddenCallbacks;if(null!==u)for(a.shared.hiddenCallbacks=null,a=0;a<u.length;a++)Mi(u[a],i)}catch(s){rc(r,r.return,s)}}n&&64&o&&Bi(l),qi(l,l.return);break;case 26:case 27:case 5:bu(a,l,n),n&&null===r&&4&o&&Vi(l),qi(l,l.return);break;case 12:default:bu(a,l,n);break;case 13:bu(a,l,n),n&&4&o&&cu(a,l);break;case 22:null===l.memoizedState&&bu(a,l,n),qi(l,l.return)}t=t.sibling}}function wu(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&$a(n))}function Su(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&$a(e))}function ku(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Eu(e,t,n,r),t=t.sibling}function Eu(e,t,n,r){var a=t.flags;switch(t.tag){case 0:case 11:case 15:ku(e,t,n,r),2048&a&&Ii(9,t);break;case 3:ku(e,t,n,r),2048&a&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&$a(e)));break;case 12:if(2048&a){ku(e,t,n,r),e=t.stateNode;try{var l=t.memoizedProps,o=l.id,i=l.onPostCommit;"function"===typeof i&&i(o,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(u){rc(t,t.return,u)}}else ku(e,t,n,r);break;case 23:break;case 22:l=t.stateNode,null!==t.memoizedState?4&l._visibility?ku(e,t,n,r):Cu(e,t):4&l._visibility?ku(e,t,n,r):(l._visibility|=4,xu(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&a&&wu(t.alternate,t);break;case 24:ku(e,t,n,r),2048&a&&Su(t.alternate,t);break;default:ku(e,t,n,r)}}function xu(e,t,n,r,a){for(a=a&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var l=e,o=t,i=n,u=r,s=o.flags;switch(o.tag){case 0:case 11:case 15:xu(l,o,i,u,a),Ii(8,o);break;case 23:break;case 22:var c=o.stateNode;null!==o.memoizedState?4&c._visibility?xu(l,o,i,u,a):Cu(l,o):(c._visibility|=4,xu(l,o,i,u,a)),a&&2048&s&&wu(o.alternate,o);break;case 24:xu(l,o,i,u,a),a&&2048&s&&Su(o.alternate,o);break;default:xu(l,o,i,u,a)}t=t.sibling}}function Cu(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,a=r.flags;switch(r.tag){case 22:Cu(n,r),2048&a&&wu(r.alternate,r);break;case 24:Cu(n,r),2048&a&&Su(r.alternate,r);break;default:Cu(n,r)}t=t.sibling}}var Ru=8192;function _u(e){if(e.subtreeFlags&Ru)for(e=e.child;null!==e;)Pu(e),e=e.sibling}function Pu(e){switch(e.tag){case 26:_u(e),e.flags&Ru&&null!==e.memoizedState&&function(e,t,n){if(null===Nf)throw Error(o(475));var r=Nf;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var a=vf(n.href),l=e.querySelector(bf(a));if(l)return null!==(e=l._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=zf.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=l,void Ge(l);l=e.ownerDocument||e,n=wf(n),(a=ff.get(a))&&Cf(n,a),Ge(l=l.createElement("link"));var i=l;i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),Vc(l,"link",n),t.instance=l}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=zf.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(pu,e.memoizedState,e.memoizedProps);break;case 5:default:_u(e);break;case 3:case 4:var t=pu;pu=pf(e.stateNode.containerInfo),_u(e),pu=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=Ru,Ru=16777216,_u(e),Ru=t):_u(e))}}function Tu(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Ou(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];nu=r,zu(r,e)}Tu(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Nu(e),e=e.sibling}function Nu(e){switch(e.tag){case 0:case 11:case 15:Ou(e),2048&e.flags&&$i(9,e,e.return);break;case 3:case 12:default:Ou(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&4&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-5,Lu(e)):Ou(e)}}function Lu(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];nu=r,zu(r,e)}Tu(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:$i(8,t,t.return),Lu(t);break;case 22:4&(n=t.stateNode)._visibility&&(n._visibility&=-5,Lu(t));break;default:Lu(t)}e=e.sibling}}function zu(e,t){for(;null!==nu;){var n=nu;switch(n.tag){case 0:case 11:case 15:$i(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:$a(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,nu=r;else e:for(n=e;null!==nu;){var a=(r=nu).sibling,l=r.return;if(lu(r),r===n){nu=null;break e}if(null!==a){a.return=l,nu=a;break e}nu=l}}}function Au(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Fu(e,t,n,r){return new Au(e,t,n,r)}function Du(e){return!(!(e=e.prototype)||!e.isReactComponent)}function ju(e,t){var n=e.alternate;return null===n?((n=Fu(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=31457280&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Mu(e,t){e.flags&=31457282;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Uu(e,t,n,r,a,l){var i=0;if(r=e,"function"===typeof e)Du(e)&&(i=1);else if("string"===typeof e)i=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,Y.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case f:return Iu(n.children,a,l,t);case d:i=8,a|=24;break;case p:return(e=Fu(12,n,t,2|a)).elementType=p,e.lanes=l,e;case v:return(e=Fu(13,n,t,a)).elementType=v,e.lanes=l,e;case b:return(e=Fu(19,n,t,a)).elementType=b,e.lanes=l,e;case k:return $u(n,a,l,t);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case h:case g:i=10;break e;case m:i=9;break e;case y:i=11;break e;case w:i=14;break e;case S:i=16,r=null;break e}i=29,n=Error(o(130,null===e?"null":typeof e,"")),r=null}return(t=Fu(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function Iu(e,t,n,r){return(e=Fu(7,e,r,t)).lanes=n,e}function $u(e,t,n,r){(e=Fu(22,e,r,t)).elementType=k,e.lanes=n;var a={_visibility:1,_pendingVisibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null,_current:null,detach:function(){var e=a._current;if(null===e)throw Error(o(456));if(0===(2&a._pendingVisibility)){var t=Tr(e,2);null!==t&&(a._pendingVisibility|=2,Ls(t,e,2))}},attach:function(){var e=a._current;if(null===e)throw Error(o(456));if(0!==(2&a._pendingVisibility)){var t=Tr(e,2);null!==t&&(a._pendingVisibility&=-3,Ls(t,e,2))}}};return e.stateNode=a,e}function Bu(e,t,n){return(e=Fu(6,e,null,t)).lanes=n,e}function Hu(e,t,n){return(t=Fu(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function qu(e){e.flags|=4}function Wu(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Of(t)){if(null!==(t=Pa.current)&&((4194176&rs)===rs?null!==Ta:(62914560&rs)!==rs&&0===(536870912&rs)||t!==Ta))throw da=ua,ia;e.flags|=8192}}function Vu(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?Oe():536870912,e.lanes|=t,ms|=t)}function Qu(e,t){if(!Xr)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Ku(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=31457280&a.subtreeFlags,r|=31457280&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Yu(e,t,n){var r=t.pendingProps;switch(Qr(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return Ku(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),bi(Ua),ee(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(ra(t)?qu(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,null!==Gr&&(As(Gr),Gr=null))),Ku(t),null;case 26:return n=t.memoizedState,null===e?(qu(t),null!==n?(Ku(t),Wu(t,n)):(Ku(t),t.flags&=-16777217)):n?n!==e.memoizedState?(qu(t),Ku(t),Wu(t,n)):(Ku(t),t.flags&=-16777217):(e.memoizedProps!==r&&qu(t),Ku(t),t.flags&=-16777217),null;case 27:ne(t),n=G.current;var a=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&qu(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Ku(t),null}e=Y.current,ra(t)?ta(t):(e=cf(a,r,n),t.stateNode=e,qu(t))}return Ku(t),null;case 5:if(ne(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&qu(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Ku(t),null}if(e=Y.current,ra(t))ta(t);else{switch(a=Yc(G.current),e){case 1:e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=a.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?a.createElement(n,{is:r.is}):a.createElement(n)}}e[Me]=t,e[Ue]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)e.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=e;e:switch(Vc(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&qu(t)}}return Ku(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&qu(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(e=G.current,ra(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(a=Kr))switch(a.tag){case 27:case 5:r=a.memoizedProps}e[Me]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Bc(e.nodeValue,n)))||ea(t)}else(e=Yc(e).createTextNode(r))[Me]=t,t.stateNode=e}return Ku(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(a=ra(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[Me]=t}else aa(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Ku(t),a=!1}else null!==Gr&&(As(Gr),Gr=null),a=!0;if(!a)return 256&t.flags?(za(t),t):(za(t),null)}if(za(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){a=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(a=r.alternate.memoizedState.cachePool.pool);var l=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(l=r.memoizedState.cachePool.pool),l!==a&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),Vu(t,t.updateQueue),Ku(t),null;case 4:return ee(),null===e&&Lc(t.stateNode.containerInfo),Ku(t),null;case 10:return bi(t.type),Ku(t),null;case 19:if(Q(Aa),null===(a=t.memoizedState))return Ku(t),null;if(r=0!==(128&t.flags),null===(l=a.rendering))if(r)Qu(a,!1);else{if(0!==cs||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(l=Fa(e))){for(t.flags|=128,Qu(a,!1),e=l.updateQueue,t.updateQueue=e,Vu(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Mu(n,e),n=n.sibling;return K(Aa,1&Aa.current|2),t.child}e=e.sibling}null!==a.tail&&ue()>ws&&(t.flags|=128,r=!0,Qu(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=Fa(l))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,Vu(t,e),Qu(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!Xr)return Ku(t),null}else 2*ue()-a.renderingStartTime>ws&&536870912!==n&&(t.flags|=128,r=!0,Qu(a,!1),t.lanes=4194304);a.isBackwards?(l.sibling=t.child,t.child=l):(null!==(e=a.last)?e.sibling=l:t.child=l,a.last=l)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=ue(),t.sibling=null,e=Aa.current,K(Aa,r?1&e|2:1&e),t):(Ku(t),null);case 22:case 23:return za(t),_a(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(Ku(t),6&t.subtreeFlags&&(t.flags|=8192)):Ku(t),null!==(n=t.updateQueue)&&Vu(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&Q(Ka),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),bi(Ua),Ku(t),null;case 25:return null}throw Error(o(156,t.tag))}function Xu(e,t){switch(Qr(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return bi(Ua),ee(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return ne(t),null;case 13:if(za(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));aa()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Q(Aa),null;case 4:return ee(),null;case 10:return bi(t.type),null;case 22:case 23:return za(t),_a(),null!==e&&Q(Ka),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return bi(Ua),null;default:return null}}function Gu(e,t){switch(Qr(t),t.tag){case 3:bi(Ua),ee();break;case 26:case 27:case 5:ne(t);break;case 4:ee();break;case 13:za(t);break;case 19:Q(Aa);break;case 10:bi(t.type);break;case 22:case 23:za(t),_a(),null!==e&&Q(Ka);break;case 24:bi(Ua)}}var Ju={getCacheForType:function(e){var t=Ci(Ua),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},Zu="function"===typeof WeakMap?WeakMap:Map,es=0,ts=null,ns=null,rs=0,as=0,ls=null,os=!1,is=!1,us=!1,ss=0,cs=0,fs=0,ds=0,ps=0,hs=0,ms=0,gs=null,ys=null,vs=!1,bs=0,ws=1/0,Ss=null,ks=null,Es=!1,xs=null,Cs=0,Rs=0,_s=null,Ps=0,Ts=null;function Os(){if(0!==(2&es)&&0!==rs)return rs&-rs;if(null!==O.T){return 0!==qa?qa:Sc()}return De()}function Ns(){0===hs&&(hs=0===(536870912&rs)||Xr?Te():536870912);var e=Pa.current;return null!==e&&(e.flags|=32),hs}function Ls(e,t,n){(e===ts&&2===as||null!==e.cancelPendingCommit)&&(Is(e,0),js(e,rs,hs,!1)),Le(e,n),0!==(2&es)&&e===ts||(e===ts&&(0===(2&es)&&(ds|=n),4===cs&&js(e,rs,hs,!1)),mc(e))}function zs(e,t,n){if(0!==(6&es))throw Error(o(327));for(var r=!n&&0===(60&t)&&0===(t&e.expiredLanes)||_e(e,t),a=r?function(e,t){var n=es;es|=2;var r=Bs(),a=Hs();ts!==e||rs!==t?(Ss=null,ws=ue()+500,Is(e,t)):is=_e(e,t);e:for(;;)try{if(0!==as&&null!==ns){t=ns;var l=ls;t:switch(as){case 1:as=0,ls=null,Xs(e,t,l,1);break;case 2:if(sa(l)){as=0,ls=null,Ys(t);break}t=function(){2===as&&ts===e&&(as=7),mc(e)},l.then(t,t);break e;case 3:as=7;break e;case 4:as=5;break e;case 7:sa(l)?(as=0,ls=null,Ys(t)):(as=0,ls=null,Xs(e,t,l,7));break;case 5:var i=null;switch(ns.tag){case 26:i=ns.memoizedState;case 5:case 27:var u=ns;if(!i||Of(i)){as=0,ls=null;var s=u.sibling;if(null!==s)ns=s;else{var c=u.return;null!==c?(ns=c,Gs(c)):ns=null}break t}}as=0,ls=null,Xs(e,t,l,5);break;case 6:as=0,ls=null,Xs(e,t,l,6);break;case 8:Us(),cs=6;break e;default:throw Error(o(462))}}Qs();break}catch(f){$s(e,f)}return yi=gi=null,O.H=r,O.A=a,es=n,null!==ns?0:(ts=null,rs=0,Rr(),cs)}(e,t):Ws(e,t,!0),l=r;;){if(0===a){is&&!r&&js(e,t,0,!1);break}if(6===a)js(e,t,0,!os);else{if(n=e.current.alternate,l&&!Ds(n)){a=Ws(e,t,!1),l=!1;continue}if(2===a){if(l=t,e.errorRecoveryDisabledLanes&l)var i=0;else i=0!==(i=-536870913&e.pendingLanes)?i:536870912&i?536870912:0;if(0!==i){t=i;e:{var u=e;a=gs;var s=u.current.memoizedState.isDehydrated;if(s&&(Is(u,i).flags|=256),2!==(i=Ws(u,i,!1))){if(us&&!s){u.errorRecoveryDisabledLanes|=l,ds|=l,a=4;break e}l=ys,ys=a,null!==l&&As(l)}a=i}if(l=!1,2!==a)continue}}if(1===a){Is(e,0),js(e,t,0,!0);break}e:{switch(r=e,a){case 0:case 1:throw Error(o(345));case 4:if((4194176&t)===t){js(r,t,hs,!os);break e}break;case 2:ys=null;break;case 3:case 5:break;default:throw Error(o(329))}if(r.finishedWork=n,r.finishedLanes=t,(62914560&t)===t&&10<(l=bs+300-ue())){if(js(r,t,hs,!os),0!==Re(r,0))break e;r.timeoutHandle=ef(Fs.bind(null,r,n,ys,Ss,vs,t,hs,ds,ms,os,2,-0,0),l)}else Fs(r,n,ys,Ss,vs,t,hs,ds,ms,os,0,-0,0)}}break}mc(e)}function As(e){null===ys?ys=e:ys.push.apply(ys,e)}function Fs(e,t,n,r,a,l,i,u,s,c,f,d,p){var h=t.subtreeFlags;if((8192&h||16785408===(16785408&h))&&(Nf={stylesheets:null,count:0,unsuspend:Lf},Pu(t),null!==(t=function(){if(null===Nf)throw Error(o(475));var e=Nf;return e.stylesheets&&0===e.count&&Ff(e,e.stylesheets),0<e.count?function(t){var n=setTimeout((function(){if(e.stylesheets&&Ff(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}}),6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=t(Zs.bind(null,e,n,r,a,i,u,s,1,d,p)),void js(e,l,i,!c);Zs(e,n,r,a,i,u,s,f,d,p)}function Ds(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var a=n[r],l=a.getSnapshot;a=a.value;try{if(!Kn(l(),a))return!1}catch(o){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function js(e,t,n,r){t&=~ps,t&=~ds,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var a=t;0<a;){var l=31-we(a),o=1<<l;r[l]=-1,a&=~o}0!==n&&ze(e,n,t)}function Ms(){return 0!==(6&es)||(gc(0,!1),!1)}function Us(){if(null!==ns){if(0===as)var e=ns.return;else yi=gi=null,yl(e=ns),ha=null,ma=0,e=ns;for(;null!==e;)Gu(e.alternate,e),e=e.return;ns=null}}function Is(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,tf(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Us(),ts=e,ns=n=ju(e.current,null),rs=t,as=0,ls=null,os=!1,is=_e(e,t),us=!1,ms=hs=ps=ds=fs=cs=0,ys=gs=null,vs=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var a=31-we(r),l=1<<a;t|=e[a],r&=~l}return ss=t,Rr(),n}function $s(e,t){Za=null,O.H=Co,t===oa?(t=pa(),as=3):t===ia?(t=pa(),as=4):as=t===Ho?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,ls=t,null===ns&&(cs=1,Mo(e,Ar(t,e.current)))}function Bs(){var e=O.H;return O.H=Co,null===e?Co:e}function Hs(){var e=O.A;return O.A=Ju,e}function qs(){cs=4,os||(4194176&rs)!==rs&&null!==Pa.current||(is=!0),0===(134217727&fs)&&0===(134217727&ds)||null===ts||js(ts,rs,hs,!1)}function Ws(e,t,n){var r=es;es|=2;var a=Bs(),l=Hs();ts===e&&rs===t||(Ss=null,Is(e,t)),t=!1;var o=cs;e:for(;;)try{if(0!==as&&null!==ns){var i=ns,u=ls;switch(as){case 8:Us(),o=6;break e;case 3:case 2:case 6:null===Pa.current&&(t=!0);var s=as;if(as=0,ls=null,Xs(e,i,u,s),n&&is){o=0;break e}break;default:s=as,as=0,ls=null,Xs(e,i,u,s)}}Vs(),o=cs;break}catch(c){$s(e,c)}return t&&e.shellSuspendCounter++,yi=gi=null,es=r,O.H=a,O.A=l,null===ns&&(ts=null,rs=0,Rr()),o}function Vs(){for(;null!==ns;)Ks(ns)}function Qs(){for(;null!==ns&&!oe();)Ks(ns)}function Ks(e){var t=hi(e.alternate,e,ss);e.memoizedProps=e.pendingProps,null===t?Gs(e):ns=t}function Ys(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Zo(n,t,t.pendingProps,t.type,void 0,rs);break;case 11:t=Zo(n,t,t.pendingProps,t.type.render,t.ref,rs);break;case 5:yl(t);default:Gu(n,t),t=hi(n,t=ns=Mu(t,ss),ss)}e.memoizedProps=e.pendingProps,null===t?Gs(e):ns=t}function Xs(e,t,n,r){yi=gi=null,yl(t),ha=null,ma=0;var a=t.return;try{if(function(e,t,n,r,a){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&ki(t,n,a,!0),null!==(n=Pa.current)){switch(n.tag){case 13:return null===Ta?qs():null===n.alternate&&0===cs&&(cs=3),n.flags&=-257,n.flags|=65536,n.lanes=a,r===ua?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),ac(e,r,a)),!1;case 22:return n.flags|=65536,r===ua?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),ac(e,r,a)),!1}throw Error(o(435,n.tag))}return ac(e,r,a),qs(),!1}if(Xr)return null!==(t=Pa.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=a,r!==Zr&&la(Ar(e=Error(o(422),{cause:r}),n))):(r!==Zr&&la(Ar(t=Error(o(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,a&=-a,e.lanes|=a,r=Ar(r,n),Ai(e,a=Io(e.stateNode,r,a)),4!==cs&&(cs=2)),!1;var l=Error(o(520),{cause:r});if(l=Ar(l,n),null===gs?gs=[l]:gs.push(l),4!==cs&&(cs=2),null===t)return!0;r=Ar(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=a&-a,n.lanes|=e,Ai(n,e=Io(n.stateNode,r,e)),!1;case 1:if(t=n.type,l=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==l&&"function"===typeof l.componentDidCatch&&(null===ks||!ks.has(l))))return n.flags|=65536,a&=-a,n.lanes|=a,Bo(a=$o(a),e,n,r),Ai(n,a),!1}n=n.return}while(null!==n);return!1}(e,a,t,n,rs))return cs=1,Mo(e,Ar(n,e.current)),void(ns=null)}catch(l){if(null!==a)throw ns=a,l;return cs=1,Mo(e,Ar(n,e.current)),void(ns=null)}32768&t.flags?(Xr||1===r?e=!0:is||0!==(536870912&rs)?e=!1:(os=e=!0,(2===r||3===r||6===r)&&(null!==(r=Pa.current)&&13===r.tag&&(r.flags|=16384))),Js(t,e)):Gs(t)}function Gs(e){var t=e;do{if(0!==(32768&t.flags))return void Js(t,os);e=t.return;var n=Yu(t.alternate,t,ss);if(null!==n)return void(ns=n);if(null!==(t=t.sibling))return void(ns=t);ns=t=e}while(null!==t);0===cs&&(cs=5)}function Js(e,t){do{var n=Xu(e.alternate,e);if(null!==n)return n.flags&=32767,void(ns=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(ns=e);ns=e=n}while(null!==e);cs=6,ns=null}function Zs(e,t,n,r,a,l,i,u,s,c){var f=O.T,d=B.p;try{B.p=2,O.T=null,function(e,t,n,r,a,l,i,u){do{tc()}while(null!==xs);if(0!==(6&es))throw Error(o(327));var s=e.finishedWork;if(r=e.finishedLanes,null===s)return null;if(e.finishedWork=null,e.finishedLanes=0,s===e.current)throw Error(o(177));e.callbackNode=null,e.callbackPriority=0,e.cancelPendingCommit=null;var c=s.lanes|s.childLanes;if(function(e,t,n,r,a,l){var o=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var i=e.entanglements,u=e.expirationTimes,s=e.hiddenUpdates;for(n=o&~n;0<n;){var c=31-we(n),f=1<<c;i[c]=0,u[c]=-1;var d=s[c];if(null!==d)for(s[c]=null,c=0;c<d.length;c++){var p=d[c];null!==p&&(p.lane&=-536870913)}n&=~f}0!==r&&ze(e,r,0),0!==l&&0===a&&0!==e.tag&&(e.suspendedLanes|=l&~(o&~t))}(e,r,c|=Cr,l,i,u),e===ts&&(ns=ts=null,rs=0),0===(10256&s.subtreeFlags)&&0===(10256&s.flags)||Es||(Es=!0,Rs=c,_s=n,function(e,t){ae(e,t)}(de,(function(){return tc(),null}))),n=0!==(15990&s.flags),0!==(15990&s.subtreeFlags)||n?(n=O.T,O.T=null,l=B.p,B.p=2,i=es,es|=4,function(e,t){if(e=e.containerInfo,Qc=Wf,er(e=Zn(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(g){n=null;break e}var i=0,u=-1,s=-1,c=0,f=0,d=e,p=null;t:for(;;){for(var h;d!==n||0!==a&&3!==d.nodeType||(u=i+a),d!==l||0!==r&&3!==d.nodeType||(s=i+r),3===d.nodeType&&(i+=d.nodeValue.length),null!==(h=d.firstChild);)p=d,d=h;for(;;){if(d===e)break t;if(p===n&&++c===a&&(u=i),p===l&&++f===r&&(s=i),null!==(h=d.nextSibling))break;p=(d=p).parentNode}d=h}n=-1===u||-1===s?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Kc={focusedElem:e,selectionRange:n},Wf=!1,nu=t;null!==nu;)if(e=(t=nu).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,nu=e;else for(;null!==nu;){switch(l=(t=nu).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==l){e=void 0,n=t,a=l.memoizedProps,l=l.memoizedState,r=n.stateNode;try{var m=zo(n.type,a,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(m,l),r.__reactInternalSnapshotBeforeUpdate=e}catch(y){rc(n,n.return,y)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))of(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":of(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(o(163))}if(null!==(e=t.sibling)){e.return=t.return,nu=e;break}nu=t.return}m=ru,ru=!1}(e,s),hu(s,e),tr(Kc,e.containerInfo),Wf=!!Qc,Kc=Qc=null,e.current=s,au(e,s.alternate,s),ie(),es=i,B.p=l,O.T=n):e.current=s,Es?(Es=!1,xs=e,Cs=r):ec(e,c),c=e.pendingLanes,0===c&&(ks=null),function(e){if(ve&&"function"===typeof ve.onCommitFiberRoot)try{ve.onCommitFiberRoot(ye,e,void 0,128===(128&e.current.flags))}catch(t){}}(s.stateNode),mc(e),null!==t)for(a=e.onRecoverableError,s=0;s<t.length;s++)c=t[s],a(c.value,{componentStack:c.stack});0!==(3&Cs)&&tc(),c=e.pendingLanes,0!==(4194218&r)&&0!==(42&c)?e===Ts?Ps++:(Ps=0,Ts=e):Ps=0,gc(0,!1)}(e,t,n,r,d,a,l,i)}finally{O.T=f,B.p=d}}function ec(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,$a(t)))}function tc(){if(null!==xs){var e=xs,t=Rs;Rs=0;var n=Fe(Cs),r=O.T,a=B.p;try{if(B.p=32>n?32:n,O.T=null,null===xs)var l=!1;else{n=_s,_s=null;var i=xs,u=Cs;if(xs=null,Cs=0,0!==(6&es))throw Error(o(331));var s=es;if(es|=4,Nu(i.current),Eu(i,i.current,u,n),es=s,gc(0,!1),ve&&"function"===typeof ve.onPostCommitFiberRoot)try{ve.onPostCommitFiberRoot(ye,i)}catch(c){}l=!0}return l}finally{B.p=a,O.T=r,ec(e,t)}}return!1}function nc(e,t,n){t=Ar(n,t),null!==(e=Li(e,t=Io(e.stateNode,t,2),2))&&(Le(e,2),mc(e))}function rc(e,t,n){if(3===e.tag)nc(e,e,n);else for(;null!==t;){if(3===t.tag){nc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===ks||!ks.has(r))){e=Ar(n,e),null!==(r=Li(t,n=$o(2),2))&&(Bo(n,r,t,e),Le(r,2),mc(r));break}}t=t.return}}function ac(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new Zu;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(us=!0,a.add(n),e=lc.bind(null,e,t,n),t.then(e,e))}function lc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,ts===e&&(rs&n)===n&&(4===cs||3===cs&&(62914560&rs)===rs&&300>ue()-bs?0===(2&es)&&Is(e,0):ps|=n,ms===rs&&(ms=0)),mc(e)}function oc(e,t){0===t&&(t=Oe()),null!==(e=Tr(e,t))&&(Le(e,t),mc(e))}function ic(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),oc(e,n)}function uc(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(o(314))}null!==r&&r.delete(t),oc(e,n)}var sc=null,cc=null,fc=!1,dc=!1,pc=!1,hc=0;function mc(e){var t;e!==cc&&null===e.next&&(null===cc?sc=cc=e:cc=cc.next=e),dc=!0,fc||(fc=!0,t=yc,rf((function(){0!==(6&es)?ae(ce,t):t()})))}function gc(e,t){if(!pc&&dc){pc=!0;do{for(var n=!1,r=sc;null!==r;){if(!t)if(0!==e){var a=r.pendingLanes;if(0===a)var l=0;else{var o=r.suspendedLanes,i=r.pingedLanes;l=(1<<31-we(42|e)+1)-1,l=201326677&(l&=a&~(o&~i))?201326677&l|1:l?2|l:0}0!==l&&(n=!0,wc(r,l))}else l=rs,0===(3&(l=Re(r,r===ts?l:0)))||_e(r,l)||(n=!0,wc(r,l));r=r.next}}while(n);pc=!1}}function yc(){dc=fc=!1;var e=0;0!==hc&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==Zc&&(Zc=e,!0);return Zc=null,!1}()&&(e=hc),hc=0);for(var t=ue(),n=null,r=sc;null!==r;){var a=r.next,l=vc(r,t);0===l?(r.next=null,null===n?sc=a:n.next=a,null===a&&(cc=n)):(n=r,(0!==e||0!==(3&l))&&(dc=!0)),r=a}gc(e,!1)}function vc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,l=-62914561&e.pendingLanes;0<l;){var o=31-we(l),i=1<<o,u=a[o];-1===u?0!==(i&n)&&0===(i&r)||(a[o]=Pe(i,t)):u<=t&&(e.expiredLanes|=i),l&=~i}if(n=rs,n=Re(e,e===(t=ts)?n:0),r=e.callbackNode,0===n||e===t&&2===as||null!==e.cancelPendingCommit)return null!==r&&null!==r&&le(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||_e(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&le(r),Fe(n)){case 2:case 8:n=fe;break;case 32:default:n=de;break;case 268435456:n=he}return r=bc.bind(null,e),n=ae(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&le(r),e.callbackPriority=2,e.callbackNode=null,2}function bc(e,t){var n=e.callbackNode;if(tc()&&e.callbackNode!==n)return null;var r=rs;return 0===(r=Re(e,e===ts?r:0))?null:(zs(e,r,t),vc(e,ue()),null!=e.callbackNode&&e.callbackNode===n?bc.bind(null,e):null)}function wc(e,t){if(tc())return null;zs(e,t,!0)}function Sc(){return 0===hc&&(hc=Te()),hc}function kc(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Tt(""+e)}function Ec(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var xc=0;xc<Sr.length;xc++){var Cc=Sr[xc];kr(Cc.toLowerCase(),"on"+(Cc[0].toUpperCase()+Cc.slice(1)))}kr(pr,"onAnimationEnd"),kr(hr,"onAnimationIteration"),kr(mr,"onAnimationStart"),kr("dblclick","onDoubleClick"),kr("focusin","onFocus"),kr("focusout","onBlur"),kr(gr,"onTransitionRun"),kr(yr,"onTransitionStart"),kr(vr,"onTransitionCancel"),kr(br,"onTransitionEnd"),tt("onMouseEnter",["mouseout","mouseover"]),tt("onMouseLeave",["mouseout","mouseover"]),tt("onPointerEnter",["pointerout","pointerover"]),tt("onPointerLeave",["pointerout","pointerover"]),et("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),et("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),et("onBeforeInput",["compositionend","keypress","textInput","paste"]),et("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),et("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),et("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Rc="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),_c=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Rc));function Pc(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],u=i.instance,s=i.currentTarget;if(i=i.listener,u!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=s;try{l(a)}catch(c){Ao(c)}a.currentTarget=null,l=u}else for(o=0;o<r.length;o++){if(u=(i=r[o]).instance,s=i.currentTarget,i=i.listener,u!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=s;try{l(a)}catch(c){Ao(c)}a.currentTarget=null,l=u}}}}function Tc(e,t){var n=t[$e];void 0===n&&(n=t[$e]=new Set);var r=e+"__bubble";n.has(r)||(zc(t,e,2,!1),n.add(r))}function Oc(e,t,n){var r=0;t&&(r|=4),zc(n,e,r,t)}var Nc="_reactListening"+Math.random().toString(36).slice(2);function Lc(e){if(!e[Nc]){e[Nc]=!0,Je.forEach((function(t){"selectionchange"!==t&&(_c.has(t)||Oc(t,!1,e),Oc(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Nc]||(t[Nc]=!0,Oc("selectionchange",!1,t))}}function zc(e,t,n,r){switch(Jf(t)){case 2:var a=Vf;break;case 8:a=Qf;break;default:a=Kf}n=a.bind(null,t,n,e),a=void 0,!Mt||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function Ac(e,t,n,r,a){var l=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===a||8===i.nodeType&&i.parentNode===a)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&((u=o.stateNode.containerInfo)===a||8===u.nodeType&&u.parentNode===a))return;o=o.return}for(;null!==i;){if(null===(o=Qe(i)))return;if(5===(u=o.tag)||6===u||26===u||27===u){r=l=o;continue e}i=i.parentNode}}r=r.return}Dt((function(){var r=l,a=Nt(n),o=[];e:{var i=wr.get(e);if(void 0!==i){var u=Jt,s=e;switch(e){case"keypress":if(0===qt(n))break e;case"keydown":case"keyup":u=hn;break;case"focusin":s="focus",u=an;break;case"focusout":s="blur",u=an;break;case"beforeblur":case"afterblur":u=an;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=nn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=rn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=gn;break;case pr:case hr:case mr:u=ln;break;case br:u=yn;break;case"scroll":case"scrollend":u=en;break;case"wheel":u=vn;break;case"copy":case"cut":case"paste":u=on;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=mn;break;case"toggle":case"beforetoggle":u=bn}var c=0!==(4&t),f=!c&&("scroll"===e||"scrollend"===e),d=c?null!==i?i+"Capture":null:i;c=[];for(var p,h=r;null!==h;){var m=h;if(p=m.stateNode,5!==(m=m.tag)&&26!==m&&27!==m||null===p||null===d||null!=(m=jt(h,d))&&c.push(Fc(h,m,p)),f)break;h=h.return}0<c.length&&(i=new u(i,s,null,n,a),o.push({event:i,listeners:c}))}}if(0===(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===Ot||!(s=n.relatedTarget||n.fromElement)||!Qe(s)&&!s[Ie])&&(u||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(s=(s=n.relatedTarget||n.toElement)?Qe(s):null)&&(f=j(s),c=s.tag,s!==f||5!==c&&27!==c&&6!==c)&&(s=null)):(u=null,s=r),u!==s)){if(c=nn,m="onMouseLeave",d="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(c=mn,m="onPointerLeave",d="onPointerEnter",h="pointer"),f=null==u?i:Ye(u),p=null==s?i:Ye(s),(i=new c(m,h+"leave",u,n,a)).target=f,i.relatedTarget=p,m=null,Qe(a)===r&&((c=new c(d,h+"enter",s,n,a)).target=p,c.relatedTarget=f,m=c),f=m,u&&s)e:{for(d=s,h=0,p=c=u;p;p=jc(p))h++;for(p=0,m=d;m;m=jc(m))p++;for(;0<h-p;)c=jc(c),h--;for(;0<p-h;)d=jc(d),p--;for(;h--;){if(c===d||null!==d&&c===d.alternate)break e;c=jc(c),d=jc(d)}c=null}else c=null;null!==u&&Mc(o,i,u,c,!1),null!==s&&null!==f&&Mc(o,f,s,c,!0)}if("select"===(u=(i=r?Ye(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var g=jn;else if(Nn(i))if(Mn)g=Qn;else{g=Wn;var y=qn}else!(u=i.nodeName)||"input"!==u.toLowerCase()||"checkbox"!==i.type&&"radio"!==i.type?r&&Rt(r.elementType)&&(g=jn):g=Vn;switch(g&&(g=g(e,r))?Ln(o,g,n,a):(y&&y(e,i,r),"focusout"===e&&r&&"number"===i.type&&null!=r.memoizedProps.value&&vt(i,"number",i.value)),y=r?Ye(r):window,e){case"focusin":(Nn(y)||"true"===y.contentEditable)&&(rr=y,ar=r,lr=null);break;case"focusout":lr=ar=rr=null;break;case"mousedown":or=!0;break;case"contextmenu":case"mouseup":case"dragend":or=!1,ir(o,n,a);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ir(o,n,a)}var v;if(Sn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Tn?_n(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(xn&&"ko"!==n.locale&&(Tn||"onCompositionStart"!==b?"onCompositionEnd"===b&&Tn&&(v=Ht()):($t="value"in(It=a)?It.value:It.textContent,Tn=!0)),0<(y=Dc(r,b)).length&&(b=new un(b,e,null,n,a),o.push({event:b,listeners:y}),v?b.data=v:null!==(v=Pn(n))&&(b.data=v))),(v=En?function(e,t){switch(e){case"compositionend":return Pn(t);case"keypress":return 32!==t.which?null:(Rn=!0,Cn);case"textInput":return(e=t.data)===Cn&&Rn?null:e;default:return null}}(e,n):function(e,t){if(Tn)return"compositionend"===e||!Sn&&_n(e,t)?(e=Ht(),Bt=$t=It=null,Tn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return xn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(b=Dc(r,"onBeforeInput")).length&&(y=new un("onBeforeInput","beforeinput",null,n,a),o.push({event:y,listeners:b}),y.data=v)),function(e,t,n,r,a){if("submit"===t&&n&&n.stateNode===a){var l=kc((a[Ue]||null).action),o=r.submitter;o&&null!==(t=(t=o[Ue]||null)?kc(t.formAction):o.getAttribute("formAction"))&&(l=t,o=null);var i=new Jt("action","action",null,r,a);e.push({event:i,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==hc){var e=o?Ec(a,o):new FormData(a);co(n,{pending:!0,data:e,method:a.method,action:l},null,e)}}else"function"===typeof l&&(i.preventDefault(),e=o?Ec(a,o):new FormData(a),co(n,{pending:!0,data:e,method:a.method,action:l},l,e))},currentTarget:a}]})}}(o,e,r,n,a)}Pc(o,t)}))}function Fc(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Dc(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,l=a.stateNode;5!==(a=a.tag)&&26!==a&&27!==a||null===l||(null!=(a=jt(e,n))&&r.unshift(Fc(e,a,l)),null!=(a=jt(e,t))&&r.push(Fc(e,a,l))),e=e.return}return r}function jc(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function Mc(e,t,n,r,a){for(var l=t._reactName,o=[];null!==n&&n!==r;){var i=n,u=i.alternate,s=i.stateNode;if(i=i.tag,null!==u&&u===r)break;5!==i&&26!==i&&27!==i||null===s||(u=s,a?null!=(s=jt(n,l))&&o.unshift(Fc(n,s,u)):a||null!=(s=jt(n,l))&&o.push(Fc(n,s,u))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Uc=/\r\n?/g,Ic=/\u0000|\uFFFD/g;function $c(e){return("string"===typeof e?e:""+e).replace(Uc,"\n").replace(Ic,"")}function Bc(e,t){return t=$c(t),$c(e)===t}function Hc(){}function qc(e,t,n,r,a,l){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||kt(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&kt(e,""+r);break;case"className":it(e,"class",r);break;case"tabIndex":it(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":it(e,n,r);break;case"style":Ct(e,r,l);break;case"data":if("object"!==t){it(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof l&&("formAction"===n?("input"!==t&&qc(e,t,"name",a.name,a,null),qc(e,t,"formEncType",a.formEncType,a,null),qc(e,t,"formMethod",a.formMethod,a,null),qc(e,t,"formTarget",a.formTarget,a,null)):(qc(e,t,"encType",a.encType,a,null),qc(e,t,"method",a.method,a,null),qc(e,t,"target",a.target,a,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Hc);break;case"onScroll":null!=r&&Tc("scroll",e);break;case"onScrollEnd":null!=r&&Tc("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Tt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Tc("beforetoggle",e),Tc("toggle",e),ot(e,"popover",r);break;case"xlinkActuate":ut(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":ut(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":ut(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":ut(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":ut(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":ut(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":ut(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":ut(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":ut(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":ot(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&ot(e,n=_t.get(n)||n,r)}}function Wc(e,t,n,r,a,l){switch(n){case"style":Ct(e,r,l);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"children":"string"===typeof r?kt(e,r):("number"===typeof r||"bigint"===typeof r)&&kt(e,""+r);break;case"onScroll":null!=r&&Tc("scroll",e);break;case"onScrollEnd":null!=r&&Tc("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Hc);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Ze.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(a=n.endsWith("Capture"),t=n.slice(2,a?n.length-7:void 0),"function"===typeof(l=null!=(l=e[Ue]||null)?l[n]:null)&&e.removeEventListener(t,l,a),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):ot(e,n,r):("function"!==typeof l&&null!==l&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,a)))}}function Vc(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Tc("error",e),Tc("load",e);var r,a=!1,l=!1;for(r in n)if(n.hasOwnProperty(r)){var i=n[r];if(null!=i)switch(r){case"src":a=!0;break;case"srcSet":l=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:qc(e,t,r,i,n,null)}}return l&&qc(e,t,"srcSet",n.srcSet,n,null),void(a&&qc(e,t,"src",n.src,n,null));case"input":Tc("invalid",e);var u=r=i=l=null,s=null,c=null;for(a in n)if(n.hasOwnProperty(a)){var f=n[a];if(null!=f)switch(a){case"name":l=f;break;case"type":i=f;break;case"checked":s=f;break;case"defaultChecked":c=f;break;case"value":r=f;break;case"defaultValue":u=f;break;case"children":case"dangerouslySetInnerHTML":if(null!=f)throw Error(o(137,t));break;default:qc(e,t,a,f,n,null)}}return yt(e,r,u,s,c,i,l,!1),void ft(e);case"select":for(l in Tc("invalid",e),a=i=r=null,n)if(n.hasOwnProperty(l)&&null!=(u=n[l]))switch(l){case"value":r=u;break;case"defaultValue":i=u;break;case"multiple":a=u;default:qc(e,t,l,u,n,null)}return t=r,n=i,e.multiple=!!a,void(null!=t?bt(e,!!a,t,!1):null!=n&&bt(e,!!a,n,!0));case"textarea":for(i in Tc("invalid",e),r=l=a=null,n)if(n.hasOwnProperty(i)&&null!=(u=n[i]))switch(i){case"value":a=u;break;case"defaultValue":l=u;break;case"children":r=u;break;case"dangerouslySetInnerHTML":if(null!=u)throw Error(o(91));break;default:qc(e,t,i,u,n,null)}return St(e,a,l,r),void ft(e);case"option":for(s in n)if(n.hasOwnProperty(s)&&null!=(a=n[s]))if("selected"===s)e.selected=a&&"function"!==typeof a&&"symbol"!==typeof a;else qc(e,t,s,a,n,null);return;case"dialog":Tc("cancel",e),Tc("close",e);break;case"iframe":case"object":Tc("load",e);break;case"video":case"audio":for(a=0;a<Rc.length;a++)Tc(Rc[a],e);break;case"image":Tc("error",e),Tc("load",e);break;case"details":Tc("toggle",e);break;case"embed":case"source":case"link":Tc("error",e),Tc("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(c in n)if(n.hasOwnProperty(c)&&null!=(a=n[c]))switch(c){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:qc(e,t,c,a,n,null)}return;default:if(Rt(t)){for(f in n)n.hasOwnProperty(f)&&(void 0!==(a=n[f])&&Wc(e,t,f,a,n,void 0));return}}for(u in n)n.hasOwnProperty(u)&&(null!=(a=n[u])&&qc(e,t,u,a,n,null))}var Qc=null,Kc=null;function Yc(e){return 9===e.nodeType?e:e.ownerDocument}function Xc(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Gc(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function Jc(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var Zc=null;var ef="function"===typeof setTimeout?setTimeout:void 0,tf="function"===typeof clearTimeout?clearTimeout:void 0,nf="function"===typeof Promise?Promise:void 0,rf="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof nf?function(e){return nf.resolve(null).then(e).catch(af)}:ef;function af(e){setTimeout((function(){throw e}))}function lf(e,t){var n=t,r=0;do{var a=n.nextSibling;if(e.removeChild(n),a&&8===a.nodeType)if("/$"===(n=a.data)){if(0===r)return e.removeChild(a),void gd(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=a}while(n);gd(t)}function of(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":of(n),Ve(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function uf(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}function sf(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function cf(e,t,n){switch(t=Yc(n),e){case"html":if(!(e=t.documentElement))throw Error(o(452));return e;case"head":if(!(e=t.head))throw Error(o(453));return e;case"body":if(!(e=t.body))throw Error(o(454));return e;default:throw Error(o(451))}}var ff=new Map,df=new Set;function pf(e){return"function"===typeof e.getRootNode?e.getRootNode():e.ownerDocument}var hf=B.d;B.d={f:function(){var e=hf.f(),t=Ms();return e||t},r:function(e){var t=Ke(e);null!==t&&5===t.tag&&"form"===t.type?po(t):hf.r(e)},D:function(e){hf.D(e),gf("dns-prefetch",e,null)},C:function(e,t){hf.C(e,t),gf("preconnect",e,t)},L:function(e,t,n){hf.L(e,t,n);var r=mf;if(r&&e&&t){var a='link[rel="preload"][as="'+mt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(a+='[imagesrcset="'+mt(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(a+='[imagesizes="'+mt(n.imageSizes)+'"]')):a+='[href="'+mt(e)+'"]';var l=a;switch(t){case"style":l=vf(e);break;case"script":l=Sf(e)}ff.has(l)||(e=N({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),ff.set(l,e),null!==r.querySelector(a)||"style"===t&&r.querySelector(bf(l))||"script"===t&&r.querySelector(kf(l))||(Vc(t=r.createElement("link"),"link",e),Ge(t),r.head.appendChild(t)))}},m:function(e,t){hf.m(e,t);var n=mf;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",a='link[rel="modulepreload"][as="'+mt(r)+'"][href="'+mt(e)+'"]',l=a;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":l=Sf(e)}if(!ff.has(l)&&(e=N({rel:"modulepreload",href:e},t),ff.set(l,e),null===n.querySelector(a))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(kf(l)))return}Vc(r=n.createElement("link"),"link",e),Ge(r),n.head.appendChild(r)}}},X:function(e,t){hf.X(e,t);var n=mf;if(n&&e){var r=Xe(n).hoistableScripts,a=Sf(e),l=r.get(a);l||((l=n.querySelector(kf(a)))||(e=N({src:e,async:!0},t),(t=ff.get(a))&&Rf(e,t),Ge(l=n.createElement("script")),Vc(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}},S:function(e,t,n){hf.S(e,t,n);var r=mf;if(r&&e){var a=Xe(r).hoistableStyles,l=vf(e);t=t||"default";var o=a.get(l);if(!o){var i={loading:0,preload:null};if(o=r.querySelector(bf(l)))i.loading=5;else{e=N({rel:"stylesheet",href:e,"data-precedence":t},n),(n=ff.get(l))&&Cf(e,n);var u=o=r.createElement("link");Ge(u),Vc(u,"link",e),u._p=new Promise((function(e,t){u.onload=e,u.onerror=t})),u.addEventListener("load",(function(){i.loading|=1})),u.addEventListener("error",(function(){i.loading|=2})),i.loading|=4,xf(o,t,r)}o={type:"stylesheet",instance:o,count:1,state:i},a.set(l,o)}}},M:function(e,t){hf.M(e,t);var n=mf;if(n&&e){var r=Xe(n).hoistableScripts,a=Sf(e),l=r.get(a);l||((l=n.querySelector(kf(a)))||(e=N({src:e,async:!0,type:"module"},t),(t=ff.get(a))&&Rf(e,t),Ge(l=n.createElement("script")),Vc(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}}};var mf="undefined"===typeof document?null:document;function gf(e,t,n){var r=mf;if(r&&"string"===typeof t&&t){var a=mt(t);a='link[rel="'+e+'"][href="'+a+'"]',"string"===typeof n&&(a+='[crossorigin="'+n+'"]'),df.has(a)||(df.add(a),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(a)&&(Vc(t=r.createElement("link"),"link",e),Ge(t),r.head.appendChild(t)))}}function yf(e,t,n,r){var a,l,i,u,s=(s=G.current)?pf(s):null;if(!s)throw Error(o(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=vf(n.href),(r=(n=Xe(s).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=vf(n.href);var c=Xe(s).hoistableStyles,f=c.get(e);if(f||(s=s.ownerDocument||s,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},c.set(e,f),(c=s.querySelector(bf(e)))&&!c._p&&(f.instance=c,f.state.loading=5),ff.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},ff.set(e,n),c||(a=s,l=e,i=n,u=f.state,a.querySelector('link[rel="preload"][as="style"]['+l+"]")?u.loading=1:(l=a.createElement("link"),u.preload=l,l.addEventListener("load",(function(){return u.loading|=1})),l.addEventListener("error",(function(){return u.loading|=2})),Vc(l,"link",i),Ge(l),a.head.appendChild(l))))),t&&null===r)throw Error(o(528,""));return f}if(t&&null!==r)throw Error(o(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Sf(n),(r=(n=Xe(s).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,e))}}function vf(e){return'href="'+mt(e)+'"'}function bf(e){return'link[rel="stylesheet"]['+e+"]"}function wf(e){return N({},e,{"data-precedence":e.precedence,precedence:null})}function Sf(e){return'[src="'+mt(e)+'"]'}function kf(e){return"script[async]"+e}function Ef(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+mt(n.href)+'"]');if(r)return t.instance=r,Ge(r),r;var a=N({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return Ge(r=(e.ownerDocument||e).createElement("style")),Vc(r,"style",a),xf(r,n.precedence,e),t.instance=r;case"stylesheet":a=vf(n.href);var l=e.querySelector(bf(a));if(l)return t.state.loading|=4,t.instance=l,Ge(l),l;r=wf(n),(a=ff.get(a))&&Cf(r,a),Ge(l=(e.ownerDocument||e).createElement("link"));var i=l;return i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),Vc(l,"link",r),t.state.loading|=4,xf(l,n.precedence,e),t.instance=l;case"script":return l=Sf(n.src),(a=e.querySelector(kf(l)))?(t.instance=a,Ge(a),a):(r=n,(a=ff.get(l))&&Rf(r=N({},n),a),Ge(a=(e=e.ownerDocument||e).createElement("script")),Vc(a,"link",r),e.head.appendChild(a),t.instance=a);case"void":return null;default:throw Error(o(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,xf(r,n.precedence,e));return t.instance}function xf(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),a=r.length?r[r.length-1]:null,l=a,o=0;o<r.length;o++){var i=r[o];if(i.dataset.precedence===t)l=i;else if(l!==a)break}l?l.parentNode.insertBefore(e,l.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Cf(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function Rf(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var _f=null;function Pf(e,t,n){if(null===_f){var r=new Map,a=_f=new Map;a.set(n,r)}else(r=(a=_f).get(n))||(r=new Map,a.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),a=0;a<n.length;a++){var l=n[a];if(!(l[We]||l[Me]||"link"===e&&"stylesheet"===l.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==l.namespaceURI){var o=l.getAttribute(t)||"";o=e+o;var i=r.get(o);i?i.push(l):r.set(o,[l])}}return r}function Tf(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Of(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Nf=null;function Lf(){}function zf(){if(this.count--,0===this.count)if(this.stylesheets)Ff(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var Af=null;function Ff(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,Af=new Map,t.forEach(Df,e),Af=null,zf.call(e))}function Df(e,t){if(!(4&t.state.loading)){var n=Af.get(e);if(n)var r=n.get(null);else{n=new Map,Af.set(e,n);for(var a=e.querySelectorAll("link[data-precedence],style[data-precedence]"),l=0;l<a.length;l++){var o=a[l];"LINK"!==o.nodeName&&"not all"===o.getAttribute("media")||(n.set(o.dataset.precedence,o),r=o)}r&&n.set(null,r)}o=(a=t.instance).getAttribute("data-precedence"),(l=n.get(o)||r)===r&&n.set(null,a),n.set(o,a),this.count++,r=zf.bind(this),a.addEventListener("load",r),a.addEventListener("error",r),l?l.parentNode.insertBefore(a,l.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(a,e.firstChild),t.state.loading|=4}}var jf={$$typeof:g,Provider:null,Consumer:null,_currentValue:H,_currentValue2:H,_threadCount:0};function Mf(e,t,n,r,a,l,o,i){this.tag=1,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ne(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.finishedLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ne(0),this.hiddenUpdates=Ne(null),this.identifierPrefix=r,this.onUncaughtError=a,this.onCaughtError=l,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function Uf(e,t,n,r,a,l,o,i,u,s,c,f){return e=new Mf(e,t,n,o,i,u,s,f),t=1,!0===l&&(t|=24),l=Fu(3,null,null,t),e.current=l,l.stateNode=e,(t=Ia()).refCount++,e.pooledCache=t,t.refCount++,l.memoizedState={element:r,isDehydrated:n,cache:t},Ti(l),e}function If(e){return e?e=Lr:Lr}function $f(e,t,n,r,a,l){a=If(a),null===r.context?r.context=a:r.pendingContext=a,(r=Ni(t)).payload={element:n},null!==(l=void 0===l?null:l)&&(r.callback=l),null!==(n=Li(e,r,t))&&(Ls(n,0,t),zi(n,e,t))}function Bf(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Hf(e,t){Bf(e,t),(e=e.alternate)&&Bf(e,t)}function qf(e){if(13===e.tag){var t=Tr(e,67108864);null!==t&&Ls(t,0,67108864),Hf(e,67108864)}}var Wf=!0;function Vf(e,t,n,r){var a=O.T;O.T=null;var l=B.p;try{B.p=2,Kf(e,t,n,r)}finally{B.p=l,O.T=a}}function Qf(e,t,n,r){var a=O.T;O.T=null;var l=B.p;try{B.p=8,Kf(e,t,n,r)}finally{B.p=l,O.T=a}}function Kf(e,t,n,r){if(Wf){var a=Yf(r);if(null===a)Ac(e,t,r,Xf,n),id(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return ed=ud(ed,e,t,n,r,a),!0;case"dragenter":return td=ud(td,e,t,n,r,a),!0;case"mouseover":return nd=ud(nd,e,t,n,r,a),!0;case"pointerover":var l=a.pointerId;return rd.set(l,ud(rd.get(l)||null,e,t,n,r,a)),!0;case"gotpointercapture":return l=a.pointerId,ad.set(l,ud(ad.get(l)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(id(e,r),4&t&&-1<od.indexOf(e)){for(;null!==a;){var l=Ke(a);if(null!==l)switch(l.tag){case 3:if((l=l.stateNode).current.memoizedState.isDehydrated){var o=Ce(l.pendingLanes);if(0!==o){var i=l;for(i.pendingLanes|=2,i.entangledLanes|=2;o;){var u=1<<31-we(o);i.entanglements[1]|=u,o&=~u}mc(l),0===(6&es)&&(ws=ue()+500,gc(0,!1))}}break;case 13:null!==(i=Tr(l,2))&&Ls(i,0,2),Ms(),Hf(l,2)}if(null===(l=Yf(r))&&Ac(e,t,r,Xf,n),l===a)break;a=l}null!==a&&r.stopPropagation()}else Ac(e,t,r,null,n)}}function Yf(e){return Gf(e=Nt(e))}var Xf=null;function Gf(e){if(Xf=null,null!==(e=Qe(e))){var t=j(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=M(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return Xf=e,null}function Jf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(se()){case ce:return 2;case fe:return 8;case de:case pe:return 32;case he:return 268435456;default:return 32}default:return 32}}var Zf=!1,ed=null,td=null,nd=null,rd=new Map,ad=new Map,ld=[],od="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function id(e,t){switch(e){case"focusin":case"focusout":ed=null;break;case"dragenter":case"dragleave":td=null;break;case"mouseover":case"mouseout":nd=null;break;case"pointerover":case"pointerout":rd.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ad.delete(t.pointerId)}}function ud(e,t,n,r,a,l){return null===e||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[a]},null!==t&&(null!==(t=Ke(t))&&qf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function sd(e){var t=Qe(e.target);if(null!==t){var n=j(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=M(n)))return e.blockedOn=t,void function(e,t){var n=B.p;try{return B.p=e,t()}finally{B.p=n}}(e.priority,(function(){if(13===n.tag){var e=Os(),t=Tr(n,e);null!==t&&Ls(t,0,e),Hf(n,e)}}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function cd(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Yf(e.nativeEvent);if(null!==n)return null!==(t=Ke(n))&&qf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Ot=r,n.target.dispatchEvent(r),Ot=null,t.shift()}return!0}function fd(e,t,n){cd(e)&&n.delete(t)}function dd(){Zf=!1,null!==ed&&cd(ed)&&(ed=null),null!==td&&cd(td)&&(td=null),null!==nd&&cd(nd)&&(nd=null),rd.forEach(fd),ad.forEach(fd)}function pd(e,t){e.blockedOn===t&&(e.blockedOn=null,Zf||(Zf=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,dd)))}var hd=null;function md(e){hd!==e&&(hd=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,(function(){hd===e&&(hd=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],a=e[t+2];if("function"!==typeof r){if(null===Gf(r||n))continue;break}var l=Ke(n);null!==l&&(e.splice(t,3),t-=3,co(l,{pending:!0,data:a,method:n.method,action:r},r,a))}})))}function gd(e){function t(t){return pd(t,e)}null!==ed&&pd(ed,e),null!==td&&pd(td,e),null!==nd&&pd(nd,e),rd.forEach(t),ad.forEach(t);for(var n=0;n<ld.length;n++){var r=ld[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<ld.length&&null===(n=ld[0]).blockedOn;)sd(n),null===n.blockedOn&&ld.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var a=n[r],l=n[r+1],o=a[Ue]||null;if("function"===typeof l)o||md(n);else if(o){var i=null;if(l&&l.hasAttribute("formAction")){if(a=l,o=l[Ue]||null)i=o.formAction;else if(null!==Gf(a))continue}else i=o.action;"function"===typeof i?n[r+1]=i:(n.splice(r,3),r-=3),md(n)}}}function yd(e){this._internalRoot=e}function vd(e){this._internalRoot=e}vd.prototype.render=yd.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));$f(t.current,Os(),e,t,null,null)},vd.prototype.unmount=yd.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;0===e.tag&&tc(),$f(e.current,2,null,e,null,null),Ms(),t[Ie]=null}},vd.prototype.unstable_scheduleHydration=function(e){if(e){var t=De();e={blockedOn:null,target:e,priority:t};for(var n=0;n<ld.length&&0!==t&&t<ld[n].priority;n++);ld.splice(n,0,e),0===n&&sd(e)}};var bd=a.version;if("19.0.0"!==bd)throw Error(o(527,bd,"19.0.0"));B.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=j(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return U(a),e;if(l===r)return U(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,u=a.child;u;){if(u===n){i=!0,n=a,r=l;break}if(u===r){i=!0,r=a,n=l;break}u=u.sibling}if(!i){for(u=l.child;u;){if(u===n){i=!0,n=l,r=a;break}if(u===r){i=!0,r=l,n=a;break}u=u.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?I(e):null)?null:e.stateNode};var wd={bundleType:0,version:"19.0.0",rendererPackageName:"react-dom",currentDispatcherRef:O,findFiberByHostInstance:Qe,reconcilerVersion:"19.0.0"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var Sd=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Sd.isDisabled&&Sd.supportsFiber)try{ye=Sd.inject(wd),ve=Sd}catch(Ed){}}t.createRoot=function(e,t){if(!i(e))throw Error(o(299));var n=!1,r="",a=Fo,l=Do,u=jo;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(a=t.onUncaughtError),void 0!==t.onCaughtError&&(l=t.onCaughtError),void 0!==t.onRecoverableError&&(u=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Uf(e,1,!1,null,0,n,r,a,l,u,0,null),e[Ie]=t.current,Lc(8===e.nodeType?e.parentNode:e),new yd(t)},t.hydrateRoot=function(e,t,n){if(!i(e))throw Error(o(299));var r=!1,a="",l=Fo,u=Do,s=jo,c=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onUncaughtError&&(l=n.onUncaughtError),void 0!==n.onCaughtError&&(u=n.onCaughtError),void 0!==n.onRecoverableError&&(s=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(c=n.formState)),(t=Uf(e,1,!0,t,0,r,a,l,u,s,0,c)).context=If(null),n=t.current,(a=Ni(r=Os())).callback=null,Li(n,a,r),t.current.lanes=r,Le(t,r),mc(t),e[Ie]=t.current,Lc(e),new vd(t)},t.version="19.0.0"},43:(e,t,n)=>{e.exports=n(288)},175:(e,t)=>{const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,r=/^[\u0021-\u003A\u003C-\u007E]*$/,a=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,l=/^[\u0020-\u003A\u003D-\u007E]*$/,o=Object.prototype.toString,i=(()=>{const e=function(){};return e.prototype=Object.create(null),e})();function u(e,t,n){do{const n=e.charCodeAt(t);if(32!==n&&9!==n)return t}while(++t<n);return n}function s(e,t,n){for(;t>n;){const n=e.charCodeAt(--t);if(32!==n&&9!==n)return t+1}return n}function c(e){if(-1===e.indexOf("%"))return e;try{return decodeURIComponent(e)}catch(t){return e}}},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),l=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.consumer"),u=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),p=Symbol.iterator;var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}y.prototype.isReactComponent={},y.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},y.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=y.prototype;var w=b.prototype=new v;w.constructor=b,m(w,y.prototype),w.isPureReactComponent=!0;var S=Array.isArray,k={H:null,A:null,T:null,S:null},E=Object.prototype.hasOwnProperty;function x(e,t,r,a,l,o){return r=o.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:o}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var R=/\/+/g;function _(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function P(){}function T(e,t,a,l,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var u,s,c=!1;if(null===e)c=!0;else switch(i){case"bigint":case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0;break;case d:return T((c=e._init)(e._payload),t,a,l,o)}}if(c)return o=o(e),c=""===l?"."+_(e,0):l,S(o)?(a="",null!=c&&(a=c.replace(R,"$&/")+"/"),T(o,t,a,"",(function(e){return e}))):null!=o&&(C(o)&&(u=o,s=a+(null==o.key||e&&e.key===o.key?"":(""+o.key).replace(R,"$&/")+"/")+c,o=x(u.type,s,void 0,0,0,u.props)),t.push(o)),1;c=0;var f,h=""===l?".":l+":";if(S(e))for(var m=0;m<e.length;m++)c+=T(l=e[m],t,a,i=h+_(l,m),o);else if("function"===typeof(m=null===(f=e)||"object"!==typeof f?null:"function"===typeof(f=p&&f[p]||f["@@iterator"])?f:null))for(e=m.call(e),m=0;!(l=e.next()).done;)c+=T(l=l.value,t,a,i=h+_(l,m++),o);else if("object"===i){if("function"===typeof e.then)return T(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(P,P):(e.status="pending",e.then((function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)}),(function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)}))),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,a,l,o);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return c}function O(e,t,n){if(null==e)return e;var r=[],a=0;return T(e,r,"","",(function(e){return t.call(n,e,a++)})),r}function N(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var L="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function z(){}t.Children={map:O,forEach:function(e,t,n){O(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return O(e,(function(){t++})),t},toArray:function(e){return O(e,(function(e){return e}))||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=y,t.Fragment=a,t.Profiler=o,t.PureComponent=b,t.StrictMode=l,t.Suspense=c,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=k,t.act=function(){throw Error("act(...) is not supported in production builds of React.")},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=m({},e.props),a=e.key;if(null!=t)for(l in void 0!==t.ref&&void 0,void 0!==t.key&&(a=""+t.key),t)!E.call(t,l)||"key"===l||"__self"===l||"__source"===l||"ref"===l&&void 0===t.ref||(r[l]=t[l]);var l=arguments.length-2;if(1===l)r.children=n;else if(1<l){for(var o=Array(l),i=0;i<l;i++)o[i]=arguments[i+2];r.children=o}return x(e.type,a,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:i,_context:e},e},t.createElement=function(e,t,n){var r,a={},l=null;if(null!=t)for(r in void 0!==t.key&&(l=""+t.key),t)E.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(a[r]=t[r]);var o=arguments.length-2;if(1===o)a.children=n;else if(1<o){for(var i=Array(o),u=0;u<o;u++)i[u]=arguments[u+2];a.children=i}if(e&&e.defaultProps)for(r in o=e.defaultProps)void 0===a[r]&&(a[r]=o[r]);return x(e,l,void 0,0,0,a)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=C,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:N}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=k.T,n={};k.T=n;try{var r=e(),a=k.S;null!==a&&a(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(z,L)}catch(l){L(l)}finally{k.T=t}},t.unstable_useCacheRefresh=function(){return k.H.useCacheRefresh()},t.use=function(e){return k.H.use(e)},t.useActionState=function(e,t,n){return k.H.useActionState(e,t,n)},t.useCallback=function(e,t){return k.H.useCallback(e,t)},t.useContext=function(e){return k.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return k.H.useDeferredValue(e,t)},t.useEffect=function(e,t){return k.H.useEffect(e,t)},t.useId=function(){return k.H.useId()},t.useImperativeHandle=function(e,t,n){return k.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return k.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return k.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return k.H.useMemo(e,t)},t.useOptimistic=function(e,t){return k.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return k.H.useReducer(e,t,n)},t.useRef=function(e){return k.H.useRef(e)},t.useState=function(e){return k.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return k.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return k.H.useTransition()},t.version="19.0.0"},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function a(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(){}var o={d:{f:l,r:function(){throw Error(a(522))},D:l,C:l,L:l,m:l,X:l,S:l,M:l},p:0,findDOMNode:null},i=Symbol.for("react.portal");var u=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function s(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=o,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(a(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:i,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=u.T,n=o.p;try{if(u.T=null,o.p=2,e)return e()}finally{u.T=t,o.p=n,o.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,o.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&o.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=s(n,t.crossOrigin),a="string"===typeof t.integrity?t.integrity:void 0,l="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?o.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:a,fetchPriority:l}):"script"===n&&o.d.X(e,{crossOrigin:r,integrity:a,fetchPriority:l,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=s(t.as,t.crossOrigin);o.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&o.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=s(n,t.crossOrigin);o.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=s(t.as,t.crossOrigin);o.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else o.d.m(e)},t.requestFormReset=function(e){o.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return u.H.useFormState(e,t,n)},t.useFormStatus=function(){return u.H.useHostTransitionStatus()},t.version="19.0.0"},799:(e,t)=>{var n=Symbol.for("react.transitional.element");function r(e,t,r){var a=null;if(void 0!==r&&(a=""+r),void 0!==t.key&&(a=""+t.key),"key"in t)for(var l in r={},t)"key"!==l&&(r[l]=t[l]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:a,ref:void 0!==t?t:null,props:r}}Symbol.for("react.fragment"),t.jsx=r,t.jsxs=r},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<l(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,o=a>>>1;r<o;){var i=2*(r+1)-1,u=e[i],s=i+1,c=e[s];if(0>l(u,n))s<a&&0>l(c,u)?(e[r]=c,e[s]=n,r=s):(e[r]=u,e[i]=n,r=i);else{if(!(s<a&&0>l(c,n)))break e;e[r]=c,e[s]=n,r=s}}}return t}function l(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var o=performance;t.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();t.unstable_now=function(){return i.now()-u}}var s=[],c=[],f=1,d=null,p=3,h=!1,m=!1,g=!1,y="function"===typeof setTimeout?setTimeout:null,v="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(c);null!==t;){if(null===t.callback)a(c);else{if(!(t.startTime<=e))break;a(c),t.sortIndex=t.expirationTime,n(s,t)}t=r(c)}}function S(e){if(g=!1,w(e),!m)if(null!==r(s))m=!0,N();else{var t=r(c);null!==t&&L(S,t.startTime-e)}}var k,E=!1,x=-1,C=5,R=-1;function _(){return!(t.unstable_now()-R<C)}function P(){if(E){var e=t.unstable_now();R=e;var n=!0;try{e:{m=!1,g&&(g=!1,v(x),x=-1),h=!0;var l=p;try{t:{for(w(e),d=r(s);null!==d&&!(d.expirationTime>e&&_());){var o=d.callback;if("function"===typeof o){d.callback=null,p=d.priorityLevel;var i=o(d.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof i){d.callback=i,w(e),n=!0;break t}d===r(s)&&a(s),w(e)}else a(s);d=r(s)}if(null!==d)n=!0;else{var u=r(c);null!==u&&L(S,u.startTime-e),n=!1}}break e}finally{d=null,p=l,h=!1}n=void 0}}finally{n?k():E=!1}}}if("function"===typeof b)k=function(){b(P)};else if("undefined"!==typeof MessageChannel){var T=new MessageChannel,O=T.port2;T.port1.onmessage=P,k=function(){O.postMessage(null)}}else k=function(){y(P,0)};function N(){E||(E=!0,k())}function L(e,n){x=y((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){m||h||(m=!0,N())},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return p},t.unstable_getFirstCallbackNode=function(){return r(s)},t.unstable_next=function(e){switch(p){case 1:case 2:case 3:var t=3;break;default:t=p}var n=p;p=t;try{return e()}finally{p=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=p;p=e;try{return t()}finally{p=n}},t.unstable_scheduleCallback=function(e,a,l){var o=t.unstable_now();switch("object"===typeof l&&null!==l?l="number"===typeof(l=l.delay)&&0<l?o+l:o:l=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:f++,callback:a,priorityLevel:e,startTime:l,expirationTime:i=l+i,sortIndex:-1},l>o?(e.sortIndex=l,n(c,e),null===r(s)&&e===r(c)&&(g?(v(x),x=-1):g=!0,L(S,l-o))):(e.sortIndex=i,n(s,e),m||h||(m=!0,N())),e},t.unstable_shouldYield=_,t.unstable_wrapCallback=function(e){var t=p;return function(){var n=p;p=t;try{return e.apply(this,arguments)}finally{p=n}}}},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)}},t={};function n(r){var a=t[r];if(void 0!==a)return a.exports;var l=t[r]={exports:{}};return e[r](l,l.exports,n),l.exports}n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})};var r={};n.r(r),n.d(r,{hasBrowserEnv:()=>pn,hasStandardBrowserEnv:()=>mn,hasStandardBrowserWebWorkerEnv:()=>gn,navigator:()=>hn,origin:()=>yn});var a=n(43),l=n(391),o=(n(175),"popstate");function i(){return h((function(e,t){let{pathname:n,search:r,hash:a}=e.location;return f("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")}),(function(e,t){return"string"===typeof t?t:d(t)}),null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function u(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function s(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function c(e,t){return{usr:e.state,key:e.key,idx:t}}function f(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return{pathname:"string"===typeof e?e:e.pathname,search:"",hash:"",..."string"===typeof t?p(t):t,state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)}}function d(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function p(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function h(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:l=!1}=r,i=a.history,s="POP",p=null,h=m();function m(){return(i.state||{idx:null}).idx}function g(){s="POP";let e=m(),t=null==e?null:e-h;h=e,p&&p({action:s,location:v.location,delta:t})}function y(e){let t="null"!==a.location.origin?a.location.origin:a.location.href,n="string"===typeof e?e:d(e);return n=n.replace(/ $/,"%20"),u(t,`No window.location.(origin|href) available to create URL for href: ${n}`),new URL(n,t)}null==h&&(h=0,i.replaceState({...i.state,idx:h},""));let v={get action(){return s},get location(){return e(a,i)},listen(e){if(p)throw new Error("A history only accepts one active listener");return a.addEventListener(o,g),p=e,()=>{a.removeEventListener(o,g),p=null}},createHref:e=>t(a,e),createURL:y,encodeLocation(e){let t=y(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){s="PUSH";let r=f(v.location,e,t);n&&n(r,e),h=m()+1;let o=c(r,h),u=v.createHref(r);try{i.pushState(o,"",u)}catch(d){if(d instanceof DOMException&&"DataCloneError"===d.name)throw d;a.location.assign(u)}l&&p&&p({action:s,location:v.location,delta:1})},replace:function(e,t){s="REPLACE";let r=f(v.location,e,t);n&&n(r,e),h=m();let a=c(r,h),o=v.createHref(r);i.replaceState(a,"",o),l&&p&&p({action:s,location:v.location,delta:0})},go:e=>i.go(e)};return v}function m(e,t){return g(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function g(e,t,n,r){let a=O(("string"===typeof t?p(t):t).pathname||"/",n);if(null==a)return null;let l=y(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]));return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let o=null;for(let i=0;null==o&&i<l.length;++i){let e=T(a);o=_(l[i],e,r)}return o}function y(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",a=(e,a,l)=>{let o={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};o.relativePath.startsWith("/")&&(u(o.relativePath.startsWith(r),`Absolute route path "${o.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),o.relativePath=o.relativePath.slice(r.length));let i=F([r,o.relativePath]),s=n.concat(o);e.children&&e.children.length>0&&(u(!0!==e.index,`Index routes must not have child routes. Please remove all child routes from route path "${i}".`),y(e.children,t,s,i)),(null!=e.path||e.index)&&t.push({path:i,score:R(i,e.index),routesMeta:s})};return e.forEach(((e,t)=>{if(""!==e.path&&e.path?.includes("?"))for(let n of v(e.path))a(e,t,n);else a(e,t)})),t}function v(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),l=n.replace(/\?$/,"");if(0===r.length)return a?[l,""]:[l];let o=v(r.join("/")),i=[];return i.push(...o.map((e=>""===e?l:[l,e].join("/")))),a&&i.push(...o),i.map((t=>e.startsWith("/")&&""===t?"/":t))}var b=/^:[\w-]+$/,w=3,S=2,k=1,E=10,x=-2,C=e=>"*"===e;function R(e,t){let n=e.split("/"),r=n.length;return n.some(C)&&(r+=x),t&&(r+=S),n.filter((e=>!C(e))).reduce(((e,t)=>e+(b.test(t)?w:""===t?k:E)),r)}function _(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,a={},l="/",o=[];for(let i=0;i<r.length;++i){let e=r[i],u=i===r.length-1,s="/"===l?t:t.slice(l.length)||"/",c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:u},s),f=e.route;if(!c&&u&&n&&!r[r.length-1].route.index&&(c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},s)),!c)return null;Object.assign(a,c.params),o.push({params:a,pathname:F([l,c.pathname]),pathnameBase:D(F([l,c.pathnameBase])),route:f}),"/"!==c.pathnameBase&&(l=F([l,c.pathnameBase]))}return o}function P(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];s("*"===e||!e.endsWith("*")||e.endsWith("/*"),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,"/*")}".`);let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,((e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")));e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))");let l=new RegExp(a,t?void 0:"i");return[l,r]}(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let l=a[0],o=l.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce(((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";o=l.slice(0,l.length-e.length).replace(/(.)\/+$/,"$1")}const u=i[n];return e[r]=a&&!u?void 0:(u||"").replace(/%2F/g,"/"),e}),{}),pathname:l,pathnameBase:o,pattern:e}}function T(e){try{return e.split("/").map((e=>decodeURIComponent(e).replace(/\//g,"%2F"))).join("/")}catch(t){return s(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function O(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function N(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function L(e){return e.filter(((e,t)=>0===t||e.route.path&&e.route.path.length>0))}function z(e){let t=L(e);return t.map(((e,n)=>n===t.length-1?e.pathname:e.pathnameBase))}function A(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=p(e):(r={...e},u(!r.pathname||!r.pathname.includes("?"),N("?","pathname","search",r)),u(!r.pathname||!r.pathname.includes("#"),N("#","pathname","hash",r)),u(!r.search||!r.search.includes("#"),N("#","search","hash",r)));let l,o=""===e||""===r.pathname,i=o?"/":r.pathname;if(null==i)l=n;else{let e=t.length-1;if(!a&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}l=e>=0?t[e]:"/"}let s=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:a=""}="string"===typeof e?p(e):e,l=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:l,search:j(r),hash:M(a)}}(r,l),c=i&&"/"!==i&&i.endsWith("/"),f=(o||"."===i)&&n.endsWith("/");return s.pathname.endsWith("/")||!c&&!f||(s.pathname+="/"),s}var F=e=>e.join("/").replace(/\/\/+/g,"/"),D=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),j=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",M=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function U(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var I=["POST","PUT","PATCH","DELETE"],$=(new Set(I),["GET",...I]);new Set($),Symbol("ResetLoaderData");var B=a.createContext(null);B.displayName="DataRouter";var H=a.createContext(null);H.displayName="DataRouterState";var q=a.createContext({isTransitioning:!1});q.displayName="ViewTransition";var W=a.createContext(new Map);W.displayName="Fetchers";var V=a.createContext(null);V.displayName="Await";var Q=a.createContext(null);Q.displayName="Navigation";var K=a.createContext(null);K.displayName="Location";var Y=a.createContext({outlet:null,matches:[],isDataRoute:!1});Y.displayName="Route";var X=a.createContext(null);X.displayName="RouteError";function G(){return null!=a.useContext(K)}function J(){return u(G(),"useLocation() may be used only in the context of a <Router> component."),a.useContext(K).location}var Z="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function ee(e){a.useContext(Q).static||a.useLayoutEffect(e)}function te(){let{isDataRoute:e}=a.useContext(Y);return e?function(){let{router:e}=ce("useNavigate"),t=de("useNavigate"),n=a.useRef(!1);ee((()=>{n.current=!0}));let r=a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};s(n.current,Z),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,{fromRouteId:t,...a}))}),[e,t]);return r}():function(){u(G(),"useNavigate() may be used only in the context of a <Router> component.");let e=a.useContext(B),{basename:t,navigator:n}=a.useContext(Q),{matches:r}=a.useContext(Y),{pathname:l}=J(),o=JSON.stringify(z(r)),i=a.useRef(!1);ee((()=>{i.current=!0}));let c=a.useCallback((function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(s(i.current,Z),!i.current)return;if("number"===typeof r)return void n.go(r);let u=A(r,JSON.parse(o),l,"path"===a.relative);null==e&&"/"!==t&&(u.pathname="/"===u.pathname?t:F([t,u.pathname])),(a.replace?n.replace:n.push)(u,a.state,a)}),[t,n,o,l,e]);return c}()}a.createContext(null);function ne(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=a.useContext(Y),{pathname:r}=J(),l=JSON.stringify(z(n));return a.useMemo((()=>A(e,JSON.parse(l),r,"path"===t)),[e,l,r,t])}function re(e,t,n,r){u(G(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l,static:o}=a.useContext(Q),{matches:i}=a.useContext(Y),c=i[i.length-1],f=c?c.params:{},d=c?c.pathname:"/",h=c?c.pathnameBase:"/",g=c&&c.route;{let e=g&&g.path||"";me(d,!g||e.endsWith("*")||e.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${d}" (under <Route path="${e}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="${e}"> to <Route path="${"/"===e?"*":`${e}/*`}">.`)}let y,v=J();if(t){let e="string"===typeof t?p(t):t;u("/"===h||e.pathname?.startsWith(h),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${h}" but pathname "${e.pathname}" was given in the \`location\` prop.`),y=e}else y=v;let b=y.pathname||"/",w=b;if("/"!==h){let e=h.replace(/^\//,"").split("/");w="/"+b.replace(/^\//,"").split("/").slice(e.length).join("/")}let S=!o&&n&&n.matches&&n.matches.length>0?n.matches:m(e,{pathname:w});s(g||null!=S,`No routes matched location "${y.pathname}${y.search}${y.hash}" `),s(null==S||void 0!==S[S.length-1].route.element||void 0!==S[S.length-1].route.Component||void 0!==S[S.length-1].route.lazy,`Matched leaf route at location "${y.pathname}${y.search}${y.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let k=ue(S&&S.map((e=>Object.assign({},e,{params:Object.assign({},f,e.params),pathname:F([h,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?h:F([h,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])}))),i,n,r);return t&&k?a.createElement(K.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...y},navigationType:"POP"}},k):k}function ae(){let e=pe(),t=U(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:r},o={padding:"2px 4px",backgroundColor:r},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=a.createElement(a.Fragment,null,a.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),a.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",a.createElement("code",{style:o},"ErrorBoundary")," or"," ",a.createElement("code",{style:o},"errorElement")," prop on your route.")),a.createElement(a.Fragment,null,a.createElement("h2",null,"Unexpected Application Error!"),a.createElement("h3",{style:{fontStyle:"italic"}},t),n?a.createElement("pre",{style:l},n):null,i)}var le=a.createElement(ae,null),oe=class extends a.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?a.createElement(Y.Provider,{value:this.props.routeContext},a.createElement(X.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function ie(e){let{routeContext:t,match:n,children:r}=e,l=a.useContext(B);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),a.createElement(Y.Provider,{value:t},r)}function ue(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let r=e,l=n?.errors;if(null!=l){let e=r.findIndex((e=>e.route.id&&void 0!==l?.[e.route.id]));u(e>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(l).join(",")}`),r=r.slice(0,Math.min(r.length,e+1))}let o=!1,i=-1;if(n)for(let a=0;a<r.length;a++){let e=r[a];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(i=a),e.route.id){let{loaderData:t,errors:a}=n,l=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!a||void 0===a[e.route.id]);if(e.route.lazy||l){o=!0,r=i>=0?r.slice(0,i+1):[r[0]];break}}}return r.reduceRight(((e,u,s)=>{let c,f=!1,d=null,p=null;n&&(c=l&&u.route.id?l[u.route.id]:void 0,d=u.route.errorElement||le,o&&(i<0&&0===s?(me("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),f=!0,p=null):i===s&&(f=!0,p=u.route.hydrateFallbackElement||null)));let h=t.concat(r.slice(0,s+1)),m=()=>{let t;return t=c?d:f?p:u.route.Component?a.createElement(u.route.Component,null):u.route.element?u.route.element:e,a.createElement(ie,{match:u,routeContext:{outlet:e,matches:h,isDataRoute:null!=n},children:t})};return n&&(u.route.ErrorBoundary||u.route.errorElement||0===s)?a.createElement(oe,{location:n.location,revalidation:n.revalidation,component:d,error:c,children:m(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):m()}),null)}function se(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function ce(e){let t=a.useContext(B);return u(t,se(e)),t}function fe(e){let t=a.useContext(H);return u(t,se(e)),t}function de(e){let t=function(e){let t=a.useContext(Y);return u(t,se(e)),t}(e),n=t.matches[t.matches.length-1];return u(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function pe(){let e=a.useContext(X),t=fe("useRouteError"),n=de("useRouteError");return void 0!==e?e:t.errors?.[n]}var he={};function me(e,t,n){t||he[e]||(he[e]=!0,s(!1,n))}a.memo((function(e){let{routes:t,future:n,state:r}=e;return re(t,void 0,r,n)}));function ge(e){u(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function ye(e){let{basename:t="/",children:n=null,location:r,navigationType:l="POP",navigator:o,static:i=!1}=e;u(!G(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let c=t.replace(/^\/*/,"/"),f=a.useMemo((()=>({basename:c,navigator:o,static:i,future:{}})),[c,o,i]);"string"===typeof r&&(r=p(r));let{pathname:d="/",search:h="",hash:m="",state:g=null,key:y="default"}=r,v=a.useMemo((()=>{let e=O(d,c);return null==e?null:{location:{pathname:e,search:h,hash:m,state:g,key:y},navigationType:l}}),[c,d,h,m,g,y,l]);return s(null!=v,`<Router basename="${c}"> is not able to match the URL "${d}${h}${m}" because it does not start with the basename, so the <Router> won't render anything.`),null==v?null:a.createElement(Q.Provider,{value:f},a.createElement(K.Provider,{children:n,value:v}))}function ve(e){let{children:t,location:n}=e;return re(be(t),n)}a.Component;function be(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return a.Children.forEach(e,((e,r)=>{if(!a.isValidElement(e))return;let l=[...t,r];if(e.type===a.Fragment)return void n.push.apply(n,be(e.props.children,l));u(e.type===ge,`[${"string"===typeof e.type?e.type:e.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),u(!e.props.index||!e.props.children,"An index route cannot have child routes.");let o={id:e.props.id||l.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=be(e.props.children,l)),n.push(o)})),n}var we="get",Se="application/x-www-form-urlencoded";function ke(e){return null!=e&&"string"===typeof e.tagName}var Ee=null;var xe=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Ce(e){return null==e||xe.has(e)?e:(s(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${Se}"`),null)}function Re(e,t){let n,r,a,l,o;if(ke(i=e)&&"form"===i.tagName.toLowerCase()){let o=e.getAttribute("action");r=o?O(o,t):null,n=e.getAttribute("method")||we,a=Ce(e.getAttribute("enctype"))||Se,l=new FormData(e)}else if(function(e){return ke(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return ke(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let o=e.form;if(null==o)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let i=e.getAttribute("formaction")||o.getAttribute("action");if(r=i?O(i,t):null,n=e.getAttribute("formmethod")||o.getAttribute("method")||we,a=Ce(e.getAttribute("formenctype"))||Ce(o.getAttribute("enctype"))||Se,l=new FormData(o,e),!function(){if(null===Ee)try{new FormData(document.createElement("form"),0),Ee=!1}catch(e){Ee=!0}return Ee}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?`${t}.`:"";l.append(`${e}x`,"0"),l.append(`${e}y`,"0")}else t&&l.append(t,r)}}else{if(ke(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=we,r=null,a=Se,o=e}var i;return l&&"text/plain"===a&&(o=l,l=void 0),{action:r,method:n.toLowerCase(),encType:a,formData:l,body:o}}function _e(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}async function Pe(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise((()=>{}))}}function Te(e){return null!=e&&"string"===typeof e.page}function Oe(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function Ne(e,t,n,r,a,l){let o=(e,t)=>!n[t]||e.route.id!==n[t].route.id,i=(e,t)=>n[t].pathname!==e.pathname||n[t].route.path?.endsWith("*")&&n[t].params["*"]!==e.params["*"];return"assets"===l?t.filter(((e,t)=>o(e,t)||i(e,t))):"data"===l?t.filter(((t,l)=>{let u=r.routes[t.route.id];if(!u||!u.hasLoader)return!1;if(o(t,l)||i(t,l))return!0;if(t.route.shouldRevalidate){let r=t.route.shouldRevalidate({currentUrl:new URL(a.pathname+a.search+a.hash,window.origin),currentParams:n[0]?.params||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0})):[]}function Le(e){return[...new Set(e)]}function ze(e,t){let n=new Set,r=new Set(t);return e.reduce(((e,a)=>{if(t&&!Te(a)&&"script"===a.as&&a.href&&r.has(a.href))return e;let l=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(a));return n.has(l)||(n.add(l),e.push({key:l,link:a})),e}),[])}function Ae(e){return{__html:e}}Symbol("SingleFetchRedirect");function Fe(e){let t="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===t.pathname?t.pathname="_root.data":t.pathname=`${t.pathname.replace(/\/$/,"")}.data`,t}a.Component;function De(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let r,l=a.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://remix.run/guides/errors for more information."\n        );\n      '}});if(U(t))return a.createElement(je,{title:"Unhandled Thrown Response!"},a.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),l);if(t instanceof Error)r=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);r=new Error(e)}return a.createElement(je,{title:"Application Error!",isOutsideRemixApp:n},a.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),a.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},r.stack),l)}function je(e){let{title:t,renderScripts:n,isOutsideRemixApp:r,children:l}=e,{routeModules:o}=Be();return o.root?.Layout&&!r?l:a.createElement("html",{lang:"en"},a.createElement("head",null,a.createElement("meta",{charSet:"utf-8"}),a.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),a.createElement("title",null,t)),a.createElement("body",null,a.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},l,n?a.createElement(Ye,null):null)))}function Me(e){return!e}function Ue(){let e=a.useContext(B);return _e(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function Ie(){let e=a.useContext(H);return _e(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var $e=a.createContext(void 0);function Be(){let e=a.useContext($e);return _e(e,"You must render this element inside a <HydratedRouter> element"),e}function He(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function qe(e,t,n){if(n&&!Ke)return[e[0]];if(t){let n=e.findIndex((e=>void 0!==t[e.route.id]));return e.slice(0,n+1)}return e}function We(e){let{page:t,...n}=e,{router:r}=Ue(),l=a.useMemo((()=>m(r.routes,t,r.basename)),[r.routes,t,r.basename]);return l?a.createElement(Qe,{page:t,matches:l,...n}):null}function Ve(e){let{manifest:t,routeModules:n}=Be(),[r,l]=a.useState([]);return a.useEffect((()=>{let r=!1;return async function(e,t,n){return ze((await Promise.all(e.map((async e=>{let r=t.routes[e.route.id];if(r){let e=await Pe(r,n);return e.links?e.links():[]}return[]})))).flat(1).filter(Oe).filter((e=>"stylesheet"===e.rel||"preload"===e.rel)).map((e=>"stylesheet"===e.rel?{...e,rel:"prefetch",as:"style"}:{...e,rel:"prefetch"})))}(e,t,n).then((e=>{r||l(e)})),()=>{r=!0}}),[e,t,n]),r}function Qe(e){let{page:t,matches:n,...r}=e,l=J(),{manifest:o,routeModules:i}=Be(),{loaderData:u,matches:s}=Ie(),c=a.useMemo((()=>Ne(t,n,s,o,l,"data")),[t,n,s,o,l]),f=a.useMemo((()=>Ne(t,n,s,o,l,"assets")),[t,n,s,o,l]),d=a.useMemo((()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach((t=>{let n=o.routes[t.route.id];n&&n.hasLoader&&(!c.some((e=>e.route.id===t.route.id))&&t.route.id in u&&i[t.route.id]?.shouldRevalidate||n.hasClientLoader?r=!0:e.add(t.route.id))})),0===e.size)return[];let a=Fe(t);return r&&e.size>0&&a.searchParams.set("_routes",n.filter((t=>e.has(t.route.id))).map((e=>e.route.id)).join(",")),[a.pathname+a.search]}),[u,l,o,c,n,t,i]),p=a.useMemo((()=>function(e,t){return Le(e.map((e=>{let n=t.routes[e.route.id];if(!n)return[];let r=[n.module];return n.imports&&(r=r.concat(n.imports)),r})).flat(1))}(f,o)),[f,o]),h=Ve(f);return a.createElement(a.Fragment,null,d.map((e=>a.createElement("link",{key:e,rel:"prefetch",as:"fetch",href:e,...r}))),p.map((e=>a.createElement("link",{key:e,rel:"modulepreload",href:e,...r}))),h.map((e=>{let{key:t,link:n}=e;return a.createElement("link",{key:t,...n})})))}$e.displayName="FrameworkContext";var Ke=!1;function Ye(e){let{manifest:t,serverHandoffString:n,isSpaMode:r,renderMeta:l}=Be(),{router:o,static:i,staticContext:u}=Ue(),{matches:s}=Ie(),c=Me(r);l&&(l.didRenderScripts=!0);let f=qe(s,null,r);a.useEffect((()=>{Ke=!0}),[]);let d=a.useMemo((()=>{let r=u?`window.__reactRouterContext = ${n};window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());`:" ",l=i?`${t.hmr?.runtime?`import ${JSON.stringify(t.hmr.runtime)};`:""}${c?"":`import ${JSON.stringify(t.url)}`};\n${f.map(((e,n)=>`import * as route${n} from ${JSON.stringify(t.routes[e.route.id].module)};`)).join("\n")}\n  ${c?`window.__reactRouterManifest = ${JSON.stringify(function(e,t){let n=new Set(t.state.matches.map((e=>e.route.id))),r=t.state.location.pathname.split("/").filter(Boolean),a=["/"];for(r.pop();r.length>0;)a.push(`/${r.join("/")}`),r.pop();a.forEach((e=>{let r=m(t.routes,e,t.basename);r&&r.forEach((e=>n.add(e.route.id)))}));let l=[...n].reduce(((t,n)=>Object.assign(t,{[n]:e.routes[n]})),{});return{...e,routes:l}}(t,o),null,2)};`:""}\n  window.__reactRouterRouteModules = {${f.map(((e,t)=>`${JSON.stringify(e.route.id)}:route${t}`)).join(",")}};\n\nimport(${JSON.stringify(t.entry.module)});`:" ";return a.createElement(a.Fragment,null,a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:Ae(r),type:void 0}),a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:Ae(l),type:"module",async:!0}))}),[]),p=f.map((e=>{let n=t.routes[e.route.id];return n?(n.imports||[]).concat([n.module]):[]})).flat(1),h=Ke?[]:t.entry.imports.concat(p);return Ke?null:a.createElement(a.Fragment,null,c?null:a.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin}),a.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin}),(g=h,[...new Set(g)]).map((t=>a.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin}))),d);var g}function Xe(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach((t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)}))}}var Ge="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{Ge&&(window.__reactRouterVersion="7.1.5")}catch(Or){}function Je(e){let{basename:t,children:n,window:r}=e,l=a.useRef();null==l.current&&(l.current=i({window:r,v5Compat:!0}));let o=l.current,[u,s]=a.useState({action:o.action,location:o.location}),c=a.useCallback((e=>{a.startTransition((()=>s(e)))}),[s]);return a.useLayoutEffect((()=>o.listen(c)),[o,c]),a.createElement(ye,{basename:t,children:n,location:u.location,navigationType:u.action,navigator:o})}var Ze=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,et=a.forwardRef((function(e,t){let n,{onClick:r,discover:l="render",prefetch:o="none",relative:i,reloadDocument:c,replace:f,state:p,target:h,to:m,preventScrollReset:g,viewTransition:y,...v}=e,{basename:b}=a.useContext(Q),w="string"===typeof m&&Ze.test(m),S=!1;if("string"===typeof m&&w&&(n=m,Ge))try{let e=new URL(window.location.href),t=m.startsWith("//")?new URL(e.protocol+m):new URL(m),n=O(t.pathname,b);t.origin===e.origin&&null!=n?m=n+t.search+t.hash:S=!0}catch(Or){s(!1,`<Link to="${m}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let k=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};u(G(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=a.useContext(Q),{hash:l,pathname:o,search:i}=ne(e,{relative:t}),s=o;return"/"!==n&&(s="/"===o?n:F([n,o])),r.createHref({pathname:s,search:i,hash:l})}(m,{relative:i}),[E,x,C]=function(e,t){let n=a.useContext($e),[r,l]=a.useState(!1),[o,i]=a.useState(!1),{onFocus:u,onBlur:s,onMouseEnter:c,onMouseLeave:f,onTouchStart:d}=t,p=a.useRef(null);a.useEffect((()=>{if("render"===e&&i(!0),"viewport"===e){let e=new IntersectionObserver((e=>{e.forEach((e=>{i(e.isIntersecting)}))}),{threshold:.5});return p.current&&e.observe(p.current),()=>{e.disconnect()}}}),[e]),a.useEffect((()=>{if(r){let e=setTimeout((()=>{i(!0)}),100);return()=>{clearTimeout(e)}}}),[r]);let h=()=>{l(!0)},m=()=>{l(!1),i(!1)};return n?"intent"!==e?[o,p,{}]:[o,p,{onFocus:He(u,h),onBlur:He(s,m),onMouseEnter:He(c,h),onMouseLeave:He(f,m),onTouchStart:He(d,h)}]:[!1,p,{}]}(o,v),R=function(e){let{target:t,replace:n,state:r,preventScrollReset:l,relative:o,viewTransition:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},u=te(),s=J(),c=ne(e,{relative:o});return a.useCallback((a=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(a,t)){a.preventDefault();let t=void 0!==n?n:d(s)===d(c);u(e,{replace:t,state:r,preventScrollReset:l,relative:o,viewTransition:i})}}),[s,u,c,n,r,t,e,l,o,i])}(m,{replace:f,state:p,target:h,preventScrollReset:g,relative:i,viewTransition:y});let _=a.createElement("a",{...v,...C,href:n||k,onClick:S||c?r:function(e){r&&r(e),e.defaultPrevented||R(e)},ref:Xe(t,x),target:h,"data-discover":w||"render"!==l?void 0:"true"});return E&&!w?a.createElement(a.Fragment,null,_,a.createElement(We,{page:k})):_}));et.displayName="Link",a.forwardRef((function(e,t){let{"aria-current":n="page",caseSensitive:r=!1,className:l="",end:o=!1,style:i,to:s,viewTransition:c,children:f,...d}=e,p=ne(s,{relative:d.relative}),h=J(),m=a.useContext(H),{navigator:g,basename:y}=a.useContext(Q),v=null!=m&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=a.useContext(q);u(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=rt("useViewTransitionState"),l=ne(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=O(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=O(n.nextLocation.pathname,r)||n.nextLocation.pathname;return null!=P(l.pathname,i)||null!=P(l.pathname,o)}(p)&&!0===c,b=g.encodeLocation?g.encodeLocation(p).pathname:p.pathname,w=h.pathname,S=m&&m.navigation&&m.navigation.location?m.navigation.location.pathname:null;r||(w=w.toLowerCase(),S=S?S.toLowerCase():null,b=b.toLowerCase()),S&&y&&(S=O(S,y)||S);const k="/"!==b&&b.endsWith("/")?b.length-1:b.length;let E,x=w===b||!o&&w.startsWith(b)&&"/"===w.charAt(k),C=null!=S&&(S===b||!o&&S.startsWith(b)&&"/"===S.charAt(b.length)),R={isActive:x,isPending:C,isTransitioning:v},_=x?n:void 0;E="function"===typeof l?l(R):[l,x?"active":null,C?"pending":null,v?"transitioning":null].filter(Boolean).join(" ");let T="function"===typeof i?i(R):i;return a.createElement(et,{...d,"aria-current":_,className:E,ref:t,style:T,to:s,viewTransition:c},"function"===typeof f?f(R):f)})).displayName="NavLink";var tt=a.forwardRef(((e,t)=>{let{discover:n="render",fetcherKey:r,navigate:l,reloadDocument:o,replace:i,state:s,method:c=we,action:f,onSubmit:p,relative:h,preventScrollReset:m,viewTransition:g,...y}=e,v=ot(),b=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=a.useContext(Q),r=a.useContext(Y);u(r,"useFormAction must be used inside a RouteContext");let[l]=r.matches.slice(-1),o={...ne(e||".",{relative:t})},i=J();if(null==e){o.search=i.search;let e=new URLSearchParams(o.search),t=e.getAll("index");if(t.some((e=>""===e))){e.delete("index"),t.filter((e=>e)).forEach((t=>e.append("index",t)));let n=e.toString();o.search=n?`?${n}`:""}}e&&"."!==e||!l.route.index||(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(o.pathname="/"===o.pathname?n:F([n,o.pathname]));return d(o)}(f,{relative:h}),w="get"===c.toLowerCase()?"get":"post",S="string"===typeof f&&Ze.test(f);return a.createElement("form",{ref:t,method:w,action:b,onSubmit:o?p:e=>{if(p&&p(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=t?.getAttribute("formmethod")||c;v(t||e.currentTarget,{fetcherKey:r,method:n,navigate:l,replace:i,state:s,relative:h,preventScrollReset:m,viewTransition:g})},...y,"data-discover":S||"render"!==n?void 0:"true"})}));function nt(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function rt(e){let t=a.useContext(B);return u(t,nt(e)),t}tt.displayName="Form";var at=0,lt=()=>`__${String(++at)}__`;function ot(){let{router:e}=rt("useSubmit"),{basename:t}=a.useContext(Q),n=de("useRouteId");return a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:l,method:o,encType:i,formData:u,body:s}=Re(r,t);if(!1===a.navigate){let t=a.fetcherKey||lt();await e.fetch(t,n,a.action||l,{preventScrollReset:a.preventScrollReset,formData:u,body:s,formMethod:a.method||o,formEncType:a.encType||i,flushSync:a.flushSync})}else await e.navigate(a.action||l,{preventScrollReset:a.preventScrollReset,formData:u,body:s,formMethod:a.method||o,formEncType:a.encType||i,replace:a.replace,state:a.state,fromRouteId:n,flushSync:a.flushSync,viewTransition:a.viewTransition})}),[e,t,n])}new TextEncoder;function it(e,t){return function(){return e.apply(t,arguments)}}const{toString:ut}=Object.prototype,{getPrototypeOf:st}=Object,ct=(ft=Object.create(null),e=>{const t=ut.call(e);return ft[t]||(ft[t]=t.slice(8,-1).toLowerCase())});var ft;const dt=e=>(e=e.toLowerCase(),t=>ct(t)===e),pt=e=>t=>typeof t===e,{isArray:ht}=Array,mt=pt("undefined");const gt=dt("ArrayBuffer");const yt=pt("string"),vt=pt("function"),bt=pt("number"),wt=e=>null!==e&&"object"===typeof e,St=e=>{if("object"!==ct(e))return!1;const t=st(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)},kt=dt("Date"),Et=dt("File"),xt=dt("Blob"),Ct=dt("FileList"),Rt=dt("URLSearchParams"),[_t,Pt,Tt,Ot]=["ReadableStream","Request","Response","Headers"].map(dt);function Nt(e,t){let n,r,{allOwnKeys:a=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(null!==e&&"undefined"!==typeof e)if("object"!==typeof e&&(e=[e]),ht(e))for(n=0,r=e.length;n<r;n++)t.call(null,e[n],n,e);else{const r=a?Object.getOwnPropertyNames(e):Object.keys(e),l=r.length;let o;for(n=0;n<l;n++)o=r[n],t.call(null,e[o],o,e)}}function Lt(e,t){t=t.toLowerCase();const n=Object.keys(e);let r,a=n.length;for(;a-- >0;)if(r=n[a],t===r.toLowerCase())return r;return null}const zt="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:global,At=e=>!mt(e)&&e!==zt;const Ft=(Dt="undefined"!==typeof Uint8Array&&st(Uint8Array),e=>Dt&&e instanceof Dt);var Dt;const jt=dt("HTMLFormElement"),Mt=(e=>{let{hasOwnProperty:t}=e;return(e,n)=>t.call(e,n)})(Object.prototype),Ut=dt("RegExp"),It=(e,t)=>{const n=Object.getOwnPropertyDescriptors(e),r={};Nt(n,((n,a)=>{let l;!1!==(l=t(n,a,e))&&(r[a]=l||n)})),Object.defineProperties(e,r)},$t="abcdefghijklmnopqrstuvwxyz",Bt="0123456789",Ht={DIGIT:Bt,ALPHA:$t,ALPHA_DIGIT:$t+$t.toUpperCase()+Bt};const qt=dt("AsyncFunction"),Wt=((e,t)=>{return e?setImmediate:t?(n=`axios@${Math.random()}`,r=[],zt.addEventListener("message",(e=>{let{source:t,data:a}=e;t===zt&&a===n&&r.length&&r.shift()()}),!1),e=>{r.push(e),zt.postMessage(n,"*")}):e=>setTimeout(e);var n,r})("function"===typeof setImmediate,vt(zt.postMessage)),Vt="undefined"!==typeof queueMicrotask?queueMicrotask.bind(zt):"undefined"!==typeof process&&process.nextTick||Wt,Qt={isArray:ht,isArrayBuffer:gt,isBuffer:function(e){return null!==e&&!mt(e)&&null!==e.constructor&&!mt(e.constructor)&&vt(e.constructor.isBuffer)&&e.constructor.isBuffer(e)},isFormData:e=>{let t;return e&&("function"===typeof FormData&&e instanceof FormData||vt(e.append)&&("formdata"===(t=ct(e))||"object"===t&&vt(e.toString)&&"[object FormData]"===e.toString()))},isArrayBufferView:function(e){let t;return t="undefined"!==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView(e):e&&e.buffer&&gt(e.buffer),t},isString:yt,isNumber:bt,isBoolean:e=>!0===e||!1===e,isObject:wt,isPlainObject:St,isReadableStream:_t,isRequest:Pt,isResponse:Tt,isHeaders:Ot,isUndefined:mt,isDate:kt,isFile:Et,isBlob:xt,isRegExp:Ut,isFunction:vt,isStream:e=>wt(e)&&vt(e.pipe),isURLSearchParams:Rt,isTypedArray:Ft,isFileList:Ct,forEach:Nt,merge:function e(){const{caseless:t}=At(this)&&this||{},n={},r=(r,a)=>{const l=t&&Lt(n,a)||a;St(n[l])&&St(r)?n[l]=e(n[l],r):St(r)?n[l]=e({},r):ht(r)?n[l]=r.slice():n[l]=r};for(let a=0,l=arguments.length;a<l;a++)arguments[a]&&Nt(arguments[a],r);return n},extend:function(e,t,n){let{allOwnKeys:r}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return Nt(t,((t,r)=>{n&&vt(t)?e[r]=it(t,n):e[r]=t}),{allOwnKeys:r}),e},trim:e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,""),stripBOM:e=>(65279===e.charCodeAt(0)&&(e=e.slice(1)),e),inherits:(e,t,n,r)=>{e.prototype=Object.create(t.prototype,r),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),n&&Object.assign(e.prototype,n)},toFlatObject:(e,t,n,r)=>{let a,l,o;const i={};if(t=t||{},null==e)return t;do{for(a=Object.getOwnPropertyNames(e),l=a.length;l-- >0;)o=a[l],r&&!r(o,e,t)||i[o]||(t[o]=e[o],i[o]=!0);e=!1!==n&&st(e)}while(e&&(!n||n(e,t))&&e!==Object.prototype);return t},kindOf:ct,kindOfTest:dt,endsWith:(e,t,n)=>{e=String(e),(void 0===n||n>e.length)&&(n=e.length),n-=t.length;const r=e.indexOf(t,n);return-1!==r&&r===n},toArray:e=>{if(!e)return null;if(ht(e))return e;let t=e.length;if(!bt(t))return null;const n=new Array(t);for(;t-- >0;)n[t]=e[t];return n},forEachEntry:(e,t)=>{const n=(e&&e[Symbol.iterator]).call(e);let r;for(;(r=n.next())&&!r.done;){const n=r.value;t.call(e,n[0],n[1])}},matchAll:(e,t)=>{let n;const r=[];for(;null!==(n=e.exec(t));)r.push(n);return r},isHTMLForm:jt,hasOwnProperty:Mt,hasOwnProp:Mt,reduceDescriptors:It,freezeMethods:e=>{It(e,((t,n)=>{if(vt(e)&&-1!==["arguments","caller","callee"].indexOf(n))return!1;const r=e[n];vt(r)&&(t.enumerable=!1,"writable"in t?t.writable=!1:t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+n+"'")}))}))},toObjectSet:(e,t)=>{const n={},r=e=>{e.forEach((e=>{n[e]=!0}))};return ht(e)?r(e):r(String(e).split(t)),n},toCamelCase:e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,(function(e,t,n){return t.toUpperCase()+n})),noop:()=>{},toFiniteNumber:(e,t)=>null!=e&&Number.isFinite(e=+e)?e:t,findKey:Lt,global:zt,isContextDefined:At,ALPHABET:Ht,generateString:function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:16,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Ht.ALPHA_DIGIT,n="";const{length:r}=t;for(;e--;)n+=t[Math.random()*r|0];return n},isSpecCompliantForm:function(e){return!!(e&&vt(e.append)&&"FormData"===e[Symbol.toStringTag]&&e[Symbol.iterator])},toJSONObject:e=>{const t=new Array(10),n=(e,r)=>{if(wt(e)){if(t.indexOf(e)>=0)return;if(!("toJSON"in e)){t[r]=e;const a=ht(e)?[]:{};return Nt(e,((e,t)=>{const l=n(e,r+1);!mt(l)&&(a[t]=l)})),t[r]=void 0,a}}return e};return n(e,0)},isAsyncFn:qt,isThenable:e=>e&&(wt(e)||vt(e))&&vt(e.then)&&vt(e.catch),setImmediate:Wt,asap:Vt};function Kt(e,t,n,r,a){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack,this.message=e,this.name="AxiosError",t&&(this.code=t),n&&(this.config=n),r&&(this.request=r),a&&(this.response=a,this.status=a.status?a.status:null)}Qt.inherits(Kt,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:Qt.toJSONObject(this.config),code:this.code,status:this.status}}});const Yt=Kt.prototype,Xt={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach((e=>{Xt[e]={value:e}})),Object.defineProperties(Kt,Xt),Object.defineProperty(Yt,"isAxiosError",{value:!0}),Kt.from=(e,t,n,r,a,l)=>{const o=Object.create(Yt);return Qt.toFlatObject(e,o,(function(e){return e!==Error.prototype}),(e=>"isAxiosError"!==e)),Kt.call(o,e.message,t,n,r,a),o.cause=e,o.name=e.name,l&&Object.assign(o,l),o};const Gt=Kt;function Jt(e){return Qt.isPlainObject(e)||Qt.isArray(e)}function Zt(e){return Qt.endsWith(e,"[]")?e.slice(0,-2):e}function en(e,t,n){return e?e.concat(t).map((function(e,t){return e=Zt(e),!n&&t?"["+e+"]":e})).join(n?".":""):t}const tn=Qt.toFlatObject(Qt,{},null,(function(e){return/^is[A-Z]/.test(e)}));const nn=function(e,t,n){if(!Qt.isObject(e))throw new TypeError("target must be an object");t=t||new FormData;const r=(n=Qt.toFlatObject(n,{metaTokens:!0,dots:!1,indexes:!1},!1,(function(e,t){return!Qt.isUndefined(t[e])}))).metaTokens,a=n.visitor||s,l=n.dots,o=n.indexes,i=(n.Blob||"undefined"!==typeof Blob&&Blob)&&Qt.isSpecCompliantForm(t);if(!Qt.isFunction(a))throw new TypeError("visitor must be a function");function u(e){if(null===e)return"";if(Qt.isDate(e))return e.toISOString();if(!i&&Qt.isBlob(e))throw new Gt("Blob is not supported. Use a Buffer instead.");return Qt.isArrayBuffer(e)||Qt.isTypedArray(e)?i&&"function"===typeof Blob?new Blob([e]):Buffer.from(e):e}function s(e,n,a){let i=e;if(e&&!a&&"object"===typeof e)if(Qt.endsWith(n,"{}"))n=r?n:n.slice(0,-2),e=JSON.stringify(e);else if(Qt.isArray(e)&&function(e){return Qt.isArray(e)&&!e.some(Jt)}(e)||(Qt.isFileList(e)||Qt.endsWith(n,"[]"))&&(i=Qt.toArray(e)))return n=Zt(n),i.forEach((function(e,r){!Qt.isUndefined(e)&&null!==e&&t.append(!0===o?en([n],r,l):null===o?n:n+"[]",u(e))})),!1;return!!Jt(e)||(t.append(en(a,n,l),u(e)),!1)}const c=[],f=Object.assign(tn,{defaultVisitor:s,convertValue:u,isVisitable:Jt});if(!Qt.isObject(e))throw new TypeError("data must be an object");return function e(n,r){if(!Qt.isUndefined(n)){if(-1!==c.indexOf(n))throw Error("Circular reference detected in "+r.join("."));c.push(n),Qt.forEach(n,(function(n,l){!0===(!(Qt.isUndefined(n)||null===n)&&a.call(t,n,Qt.isString(l)?l.trim():l,r,f))&&e(n,r?r.concat(l):[l])})),c.pop()}}(e),t};function rn(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,(function(e){return t[e]}))}function an(e,t){this._pairs=[],e&&nn(e,this,t)}const ln=an.prototype;ln.append=function(e,t){this._pairs.push([e,t])},ln.toString=function(e){const t=e?function(t){return e.call(this,t,rn)}:rn;return this._pairs.map((function(e){return t(e[0])+"="+t(e[1])}),"").join("&")};const on=an;function un(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+").replace(/%5B/gi,"[").replace(/%5D/gi,"]")}function sn(e,t,n){if(!t)return e;const r=n&&n.encode||un;Qt.isFunction(n)&&(n={serialize:n});const a=n&&n.serialize;let l;if(l=a?a(t,n):Qt.isURLSearchParams(t)?t.toString():new on(t,n).toString(r),l){const t=e.indexOf("#");-1!==t&&(e=e.slice(0,t)),e+=(-1===e.indexOf("?")?"?":"&")+l}return e}const cn=class{constructor(){this.handlers=[]}use(e,t,n){return this.handlers.push({fulfilled:e,rejected:t,synchronous:!!n&&n.synchronous,runWhen:n?n.runWhen:null}),this.handlers.length-1}eject(e){this.handlers[e]&&(this.handlers[e]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(e){Qt.forEach(this.handlers,(function(t){null!==t&&e(t)}))}},fn={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},dn={isBrowser:!0,classes:{URLSearchParams:"undefined"!==typeof URLSearchParams?URLSearchParams:on,FormData:"undefined"!==typeof FormData?FormData:null,Blob:"undefined"!==typeof Blob?Blob:null},protocols:["http","https","file","blob","url","data"]},pn="undefined"!==typeof window&&"undefined"!==typeof document,hn="object"===typeof navigator&&navigator||void 0,mn=pn&&(!hn||["ReactNative","NativeScript","NS"].indexOf(hn.product)<0),gn="undefined"!==typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&"function"===typeof self.importScripts,yn=pn&&window.location.href||"http://localhost",vn={...r,...dn};const bn=function(e){function t(e,n,r,a){let l=e[a++];if("__proto__"===l)return!0;const o=Number.isFinite(+l),i=a>=e.length;if(l=!l&&Qt.isArray(r)?r.length:l,i)return Qt.hasOwnProp(r,l)?r[l]=[r[l],n]:r[l]=n,!o;r[l]&&Qt.isObject(r[l])||(r[l]=[]);return t(e,n,r[l],a)&&Qt.isArray(r[l])&&(r[l]=function(e){const t={},n=Object.keys(e);let r;const a=n.length;let l;for(r=0;r<a;r++)l=n[r],t[l]=e[l];return t}(r[l])),!o}if(Qt.isFormData(e)&&Qt.isFunction(e.entries)){const n={};return Qt.forEachEntry(e,((e,r)=>{t(function(e){return Qt.matchAll(/\w+|\[(\w*)]/g,e).map((e=>"[]"===e[0]?"":e[1]||e[0]))}(e),r,n,0)})),n}return null};const wn={transitional:fn,adapter:["xhr","http","fetch"],transformRequest:[function(e,t){const n=t.getContentType()||"",r=n.indexOf("application/json")>-1,a=Qt.isObject(e);a&&Qt.isHTMLForm(e)&&(e=new FormData(e));if(Qt.isFormData(e))return r?JSON.stringify(bn(e)):e;if(Qt.isArrayBuffer(e)||Qt.isBuffer(e)||Qt.isStream(e)||Qt.isFile(e)||Qt.isBlob(e)||Qt.isReadableStream(e))return e;if(Qt.isArrayBufferView(e))return e.buffer;if(Qt.isURLSearchParams(e))return t.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),e.toString();let l;if(a){if(n.indexOf("application/x-www-form-urlencoded")>-1)return function(e,t){return nn(e,new vn.classes.URLSearchParams,Object.assign({visitor:function(e,t,n,r){return vn.isNode&&Qt.isBuffer(e)?(this.append(t,e.toString("base64")),!1):r.defaultVisitor.apply(this,arguments)}},t))}(e,this.formSerializer).toString();if((l=Qt.isFileList(e))||n.indexOf("multipart/form-data")>-1){const t=this.env&&this.env.FormData;return nn(l?{"files[]":e}:e,t&&new t,this.formSerializer)}}return a||r?(t.setContentType("application/json",!1),function(e,t,n){if(Qt.isString(e))try{return(t||JSON.parse)(e),Qt.trim(e)}catch(Or){if("SyntaxError"!==Or.name)throw Or}return(n||JSON.stringify)(e)}(e)):e}],transformResponse:[function(e){const t=this.transitional||wn.transitional,n=t&&t.forcedJSONParsing,r="json"===this.responseType;if(Qt.isResponse(e)||Qt.isReadableStream(e))return e;if(e&&Qt.isString(e)&&(n&&!this.responseType||r)){const n=!(t&&t.silentJSONParsing)&&r;try{return JSON.parse(e)}catch(Or){if(n){if("SyntaxError"===Or.name)throw Gt.from(Or,Gt.ERR_BAD_RESPONSE,this,null,this.response);throw Or}}}return e}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:vn.classes.FormData,Blob:vn.classes.Blob},validateStatus:function(e){return e>=200&&e<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};Qt.forEach(["delete","get","head","post","put","patch"],(e=>{wn.headers[e]={}}));const Sn=wn,kn=Qt.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),En=Symbol("internals");function xn(e){return e&&String(e).trim().toLowerCase()}function Cn(e){return!1===e||null==e?e:Qt.isArray(e)?e.map(Cn):String(e)}function Rn(e,t,n,r,a){return Qt.isFunction(r)?r.call(this,t,n):(a&&(t=n),Qt.isString(t)?Qt.isString(r)?-1!==t.indexOf(r):Qt.isRegExp(r)?r.test(t):void 0:void 0)}class _n{constructor(e){e&&this.set(e)}set(e,t,n){const r=this;function a(e,t,n){const a=xn(t);if(!a)throw new Error("header name must be a non-empty string");const l=Qt.findKey(r,a);(!l||void 0===r[l]||!0===n||void 0===n&&!1!==r[l])&&(r[l||t]=Cn(e))}const l=(e,t)=>Qt.forEach(e,((e,n)=>a(e,n,t)));if(Qt.isPlainObject(e)||e instanceof this.constructor)l(e,t);else if(Qt.isString(e)&&(e=e.trim())&&!/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim()))l((e=>{const t={};let n,r,a;return e&&e.split("\n").forEach((function(e){a=e.indexOf(":"),n=e.substring(0,a).trim().toLowerCase(),r=e.substring(a+1).trim(),!n||t[n]&&kn[n]||("set-cookie"===n?t[n]?t[n].push(r):t[n]=[r]:t[n]=t[n]?t[n]+", "+r:r)})),t})(e),t);else if(Qt.isHeaders(e))for(const[o,i]of e.entries())a(i,o,n);else null!=e&&a(t,e,n);return this}get(e,t){if(e=xn(e)){const n=Qt.findKey(this,e);if(n){const e=this[n];if(!t)return e;if(!0===t)return function(e){const t=Object.create(null),n=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let r;for(;r=n.exec(e);)t[r[1]]=r[2];return t}(e);if(Qt.isFunction(t))return t.call(this,e,n);if(Qt.isRegExp(t))return t.exec(e);throw new TypeError("parser must be boolean|regexp|function")}}}has(e,t){if(e=xn(e)){const n=Qt.findKey(this,e);return!(!n||void 0===this[n]||t&&!Rn(0,this[n],n,t))}return!1}delete(e,t){const n=this;let r=!1;function a(e){if(e=xn(e)){const a=Qt.findKey(n,e);!a||t&&!Rn(0,n[a],a,t)||(delete n[a],r=!0)}}return Qt.isArray(e)?e.forEach(a):a(e),r}clear(e){const t=Object.keys(this);let n=t.length,r=!1;for(;n--;){const a=t[n];e&&!Rn(0,this[a],a,e,!0)||(delete this[a],r=!0)}return r}normalize(e){const t=this,n={};return Qt.forEach(this,((r,a)=>{const l=Qt.findKey(n,a);if(l)return t[l]=Cn(r),void delete t[a];const o=e?function(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,((e,t,n)=>t.toUpperCase()+n))}(a):String(a).trim();o!==a&&delete t[a],t[o]=Cn(r),n[o]=!0})),this}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.constructor.concat(this,...t)}toJSON(e){const t=Object.create(null);return Qt.forEach(this,((n,r)=>{null!=n&&!1!==n&&(t[r]=e&&Qt.isArray(n)?n.join(", "):n)})),t}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map((e=>{let[t,n]=e;return t+": "+n})).join("\n")}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(e){return e instanceof this?e:new this(e)}static concat(e){const t=new this(e);for(var n=arguments.length,r=new Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];return r.forEach((e=>t.set(e))),t}static accessor(e){const t=(this[En]=this[En]={accessors:{}}).accessors,n=this.prototype;function r(e){const r=xn(e);t[r]||(!function(e,t){const n=Qt.toCamelCase(" "+t);["get","set","has"].forEach((r=>{Object.defineProperty(e,r+n,{value:function(e,n,a){return this[r].call(this,t,e,n,a)},configurable:!0})}))}(n,e),t[r]=!0)}return Qt.isArray(e)?e.forEach(r):r(e),this}}_n.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]),Qt.reduceDescriptors(_n.prototype,((e,t)=>{let{value:n}=e,r=t[0].toUpperCase()+t.slice(1);return{get:()=>n,set(e){this[r]=e}}})),Qt.freezeMethods(_n);const Pn=_n;function Tn(e,t){const n=this||Sn,r=t||n,a=Pn.from(r.headers);let l=r.data;return Qt.forEach(e,(function(e){l=e.call(n,l,a.normalize(),t?t.status:void 0)})),a.normalize(),l}function On(e){return!(!e||!e.__CANCEL__)}function Nn(e,t,n){Gt.call(this,null==e?"canceled":e,Gt.ERR_CANCELED,t,n),this.name="CanceledError"}Qt.inherits(Nn,Gt,{__CANCEL__:!0});const Ln=Nn;function zn(e,t,n){const r=n.config.validateStatus;n.status&&r&&!r(n.status)?t(new Gt("Request failed with status code "+n.status,[Gt.ERR_BAD_REQUEST,Gt.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n)):e(n)}const An=function(e,t){e=e||10;const n=new Array(e),r=new Array(e);let a,l=0,o=0;return t=void 0!==t?t:1e3,function(i){const u=Date.now(),s=r[o];a||(a=u),n[l]=i,r[l]=u;let c=o,f=0;for(;c!==l;)f+=n[c++],c%=e;if(l=(l+1)%e,l===o&&(o=(o+1)%e),u-a<t)return;const d=s&&u-s;return d?Math.round(1e3*f/d):void 0}};const Fn=function(e,t){let n,r,a=0,l=1e3/t;const o=function(t){let l=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Date.now();a=l,n=null,r&&(clearTimeout(r),r=null),e.apply(null,t)};return[function(){const e=Date.now(),t=e-a;for(var i=arguments.length,u=new Array(i),s=0;s<i;s++)u[s]=arguments[s];t>=l?o(u,e):(n=u,r||(r=setTimeout((()=>{r=null,o(n)}),l-t)))},()=>n&&o(n)]},Dn=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:3,r=0;const a=An(50,250);return Fn((n=>{const l=n.loaded,o=n.lengthComputable?n.total:void 0,i=l-r,u=a(i);r=l;e({loaded:l,total:o,progress:o?l/o:void 0,bytes:i,rate:u||void 0,estimated:u&&o&&l<=o?(o-l)/u:void 0,event:n,lengthComputable:null!=o,[t?"download":"upload"]:!0})}),n)},jn=(e,t)=>{const n=null!=e;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},Mn=e=>function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return Qt.asap((()=>e(...n)))},Un=vn.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,vn.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(vn.origin),vn.navigator&&/(msie|trident)/i.test(vn.navigator.userAgent)):()=>!0,In=vn.hasStandardBrowserEnv?{write(e,t,n,r,a,l){const o=[e+"="+encodeURIComponent(t)];Qt.isNumber(n)&&o.push("expires="+new Date(n).toGMTString()),Qt.isString(r)&&o.push("path="+r),Qt.isString(a)&&o.push("domain="+a),!0===l&&o.push("secure"),document.cookie=o.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read:()=>null,remove(){}};function $n(e,t){return e&&!/^([a-z][a-z\d+\-.]*:)?\/\//i.test(t)?function(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}(e,t):t}const Bn=e=>e instanceof Pn?{...e}:e;function Hn(e,t){t=t||{};const n={};function r(e,t,n,r){return Qt.isPlainObject(e)&&Qt.isPlainObject(t)?Qt.merge.call({caseless:r},e,t):Qt.isPlainObject(t)?Qt.merge({},t):Qt.isArray(t)?t.slice():t}function a(e,t,n,a){return Qt.isUndefined(t)?Qt.isUndefined(e)?void 0:r(void 0,e,0,a):r(e,t,0,a)}function l(e,t){if(!Qt.isUndefined(t))return r(void 0,t)}function o(e,t){return Qt.isUndefined(t)?Qt.isUndefined(e)?void 0:r(void 0,e):r(void 0,t)}function i(n,a,l){return l in t?r(n,a):l in e?r(void 0,n):void 0}const u={url:l,method:l,data:l,baseURL:o,transformRequest:o,transformResponse:o,paramsSerializer:o,timeout:o,timeoutMessage:o,withCredentials:o,withXSRFToken:o,adapter:o,responseType:o,xsrfCookieName:o,xsrfHeaderName:o,onUploadProgress:o,onDownloadProgress:o,decompress:o,maxContentLength:o,maxBodyLength:o,beforeRedirect:o,transport:o,httpAgent:o,httpsAgent:o,cancelToken:o,socketPath:o,responseEncoding:o,validateStatus:i,headers:(e,t,n)=>a(Bn(e),Bn(t),0,!0)};return Qt.forEach(Object.keys(Object.assign({},e,t)),(function(r){const l=u[r]||a,o=l(e[r],t[r],r);Qt.isUndefined(o)&&l!==i||(n[r]=o)})),n}const qn=e=>{const t=Hn({},e);let n,{data:r,withXSRFToken:a,xsrfHeaderName:l,xsrfCookieName:o,headers:i,auth:u}=t;if(t.headers=i=Pn.from(i),t.url=sn($n(t.baseURL,t.url),e.params,e.paramsSerializer),u&&i.set("Authorization","Basic "+btoa((u.username||"")+":"+(u.password?unescape(encodeURIComponent(u.password)):""))),Qt.isFormData(r))if(vn.hasStandardBrowserEnv||vn.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if(!1!==(n=i.getContentType())){const[e,...t]=n?n.split(";").map((e=>e.trim())).filter(Boolean):[];i.setContentType([e||"multipart/form-data",...t].join("; "))}if(vn.hasStandardBrowserEnv&&(a&&Qt.isFunction(a)&&(a=a(t)),a||!1!==a&&Un(t.url))){const e=l&&o&&In.read(o);e&&i.set(l,e)}return t},Wn="undefined"!==typeof XMLHttpRequest&&function(e){return new Promise((function(t,n){const r=qn(e);let a=r.data;const l=Pn.from(r.headers).normalize();let o,i,u,s,c,{responseType:f,onUploadProgress:d,onDownloadProgress:p}=r;function h(){s&&s(),c&&c(),r.cancelToken&&r.cancelToken.unsubscribe(o),r.signal&&r.signal.removeEventListener("abort",o)}let m=new XMLHttpRequest;function g(){if(!m)return;const r=Pn.from("getAllResponseHeaders"in m&&m.getAllResponseHeaders());zn((function(e){t(e),h()}),(function(e){n(e),h()}),{data:f&&"text"!==f&&"json"!==f?m.response:m.responseText,status:m.status,statusText:m.statusText,headers:r,config:e,request:m}),m=null}m.open(r.method.toUpperCase(),r.url,!0),m.timeout=r.timeout,"onloadend"in m?m.onloadend=g:m.onreadystatechange=function(){m&&4===m.readyState&&(0!==m.status||m.responseURL&&0===m.responseURL.indexOf("file:"))&&setTimeout(g)},m.onabort=function(){m&&(n(new Gt("Request aborted",Gt.ECONNABORTED,e,m)),m=null)},m.onerror=function(){n(new Gt("Network Error",Gt.ERR_NETWORK,e,m)),m=null},m.ontimeout=function(){let t=r.timeout?"timeout of "+r.timeout+"ms exceeded":"timeout exceeded";const a=r.transitional||fn;r.timeoutErrorMessage&&(t=r.timeoutErrorMessage),n(new Gt(t,a.clarifyTimeoutError?Gt.ETIMEDOUT:Gt.ECONNABORTED,e,m)),m=null},void 0===a&&l.setContentType(null),"setRequestHeader"in m&&Qt.forEach(l.toJSON(),(function(e,t){m.setRequestHeader(t,e)})),Qt.isUndefined(r.withCredentials)||(m.withCredentials=!!r.withCredentials),f&&"json"!==f&&(m.responseType=r.responseType),p&&([u,c]=Dn(p,!0),m.addEventListener("progress",u)),d&&m.upload&&([i,s]=Dn(d),m.upload.addEventListener("progress",i),m.upload.addEventListener("loadend",s)),(r.cancelToken||r.signal)&&(o=t=>{m&&(n(!t||t.type?new Ln(null,e,m):t),m.abort(),m=null)},r.cancelToken&&r.cancelToken.subscribe(o),r.signal&&(r.signal.aborted?o():r.signal.addEventListener("abort",o)));const y=function(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}(r.url);y&&-1===vn.protocols.indexOf(y)?n(new Gt("Unsupported protocol "+y+":",Gt.ERR_BAD_REQUEST,e)):m.send(a||null)}))},Vn=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let n,r=new AbortController;const a=function(e){if(!n){n=!0,o();const t=e instanceof Error?e:this.reason;r.abort(t instanceof Gt?t:new Ln(t instanceof Error?t.message:t))}};let l=t&&setTimeout((()=>{l=null,a(new Gt(`timeout ${t} of ms exceeded`,Gt.ETIMEDOUT))}),t);const o=()=>{e&&(l&&clearTimeout(l),l=null,e.forEach((e=>{e.unsubscribe?e.unsubscribe(a):e.removeEventListener("abort",a)})),e=null)};e.forEach((e=>e.addEventListener("abort",a)));const{signal:i}=r;return i.unsubscribe=()=>Qt.asap(o),i}},Qn=function*(e,t){let n=e.byteLength;if(!t||n<t)return void(yield e);let r,a=0;for(;a<n;)r=a+t,yield e.slice(a,r),a=r},Kn=async function*(e){if(e[Symbol.asyncIterator])return void(yield*e);const t=e.getReader();try{for(;;){const{done:e,value:n}=await t.read();if(e)break;yield n}}finally{await t.cancel()}},Yn=(e,t,n,r)=>{const a=async function*(e,t){for await(const n of Kn(e))yield*Qn(n,t)}(e,t);let l,o=0,i=e=>{l||(l=!0,r&&r(e))};return new ReadableStream({async pull(e){try{const{done:t,value:r}=await a.next();if(t)return i(),void e.close();let l=r.byteLength;if(n){let e=o+=l;n(e)}e.enqueue(new Uint8Array(r))}catch(t){throw i(t),t}},cancel:e=>(i(e),a.return())},{highWaterMark:2})},Xn="function"===typeof fetch&&"function"===typeof Request&&"function"===typeof Response,Gn=Xn&&"function"===typeof ReadableStream,Jn=Xn&&("function"===typeof TextEncoder?(e=>t=>e.encode(t))(new TextEncoder):async e=>new Uint8Array(await new Response(e).arrayBuffer())),Zn=function(e){try{for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return!!e(...n)}catch(Or){return!1}},er=Gn&&Zn((()=>{let e=!1;const t=new Request(vn.origin,{body:new ReadableStream,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t})),tr=Gn&&Zn((()=>Qt.isReadableStream(new Response("").body))),nr={stream:tr&&(e=>e.body)};var rr;Xn&&(rr=new Response,["text","arrayBuffer","blob","formData","stream"].forEach((e=>{!nr[e]&&(nr[e]=Qt.isFunction(rr[e])?t=>t[e]():(t,n)=>{throw new Gt(`Response type '${e}' is not supported`,Gt.ERR_NOT_SUPPORT,n)})})));const ar=async(e,t)=>{const n=Qt.toFiniteNumber(e.getContentLength());return null==n?(async e=>{if(null==e)return 0;if(Qt.isBlob(e))return e.size;if(Qt.isSpecCompliantForm(e)){const t=new Request(vn.origin,{method:"POST",body:e});return(await t.arrayBuffer()).byteLength}return Qt.isArrayBufferView(e)||Qt.isArrayBuffer(e)?e.byteLength:(Qt.isURLSearchParams(e)&&(e+=""),Qt.isString(e)?(await Jn(e)).byteLength:void 0)})(t):n},lr=Xn&&(async e=>{let{url:t,method:n,data:r,signal:a,cancelToken:l,timeout:o,onDownloadProgress:i,onUploadProgress:u,responseType:s,headers:c,withCredentials:f="same-origin",fetchOptions:d}=qn(e);s=s?(s+"").toLowerCase():"text";let p,h=Vn([a,l&&l.toAbortSignal()],o);const m=h&&h.unsubscribe&&(()=>{h.unsubscribe()});let g;try{if(u&&er&&"get"!==n&&"head"!==n&&0!==(g=await ar(c,r))){let e,n=new Request(t,{method:"POST",body:r,duplex:"half"});if(Qt.isFormData(r)&&(e=n.headers.get("content-type"))&&c.setContentType(e),n.body){const[e,t]=jn(g,Dn(Mn(u)));r=Yn(n.body,65536,e,t)}}Qt.isString(f)||(f=f?"include":"omit");const a="credentials"in Request.prototype;p=new Request(t,{...d,signal:h,method:n.toUpperCase(),headers:c.normalize().toJSON(),body:r,duplex:"half",credentials:a?f:void 0});let l=await fetch(p);const o=tr&&("stream"===s||"response"===s);if(tr&&(i||o&&m)){const e={};["status","statusText","headers"].forEach((t=>{e[t]=l[t]}));const t=Qt.toFiniteNumber(l.headers.get("content-length")),[n,r]=i&&jn(t,Dn(Mn(i),!0))||[];l=new Response(Yn(l.body,65536,n,(()=>{r&&r(),m&&m()})),e)}s=s||"text";let y=await nr[Qt.findKey(nr,s)||"text"](l,e);return!o&&m&&m(),await new Promise(((t,n)=>{zn(t,n,{data:y,headers:Pn.from(l.headers),status:l.status,statusText:l.statusText,config:e,request:p})}))}catch(y){if(m&&m(),y&&"TypeError"===y.name&&/fetch/i.test(y.message))throw Object.assign(new Gt("Network Error",Gt.ERR_NETWORK,e,p),{cause:y.cause||y});throw Gt.from(y,y&&y.code,e,p)}}),or={http:null,xhr:Wn,fetch:lr};Qt.forEach(or,((e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch(Or){}Object.defineProperty(e,"adapterName",{value:t})}}));const ir=e=>`- ${e}`,ur=e=>Qt.isFunction(e)||null===e||!1===e,sr=e=>{e=Qt.isArray(e)?e:[e];const{length:t}=e;let n,r;const a={};for(let l=0;l<t;l++){let t;if(n=e[l],r=n,!ur(n)&&(r=or[(t=String(n)).toLowerCase()],void 0===r))throw new Gt(`Unknown adapter '${t}'`);if(r)break;a[t||"#"+l]=r}if(!r){const e=Object.entries(a).map((e=>{let[t,n]=e;return`adapter ${t} `+(!1===n?"is not supported by the environment":"is not available in the build")}));let n=t?e.length>1?"since :\n"+e.map(ir).join("\n"):" "+ir(e[0]):"as no adapter specified";throw new Gt("There is no suitable adapter to dispatch the request "+n,"ERR_NOT_SUPPORT")}return r};function cr(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Ln(null,e)}function fr(e){cr(e),e.headers=Pn.from(e.headers),e.data=Tn.call(e,e.transformRequest),-1!==["post","put","patch"].indexOf(e.method)&&e.headers.setContentType("application/x-www-form-urlencoded",!1);return sr(e.adapter||Sn.adapter)(e).then((function(t){return cr(e),t.data=Tn.call(e,e.transformResponse,t),t.headers=Pn.from(t.headers),t}),(function(t){return On(t)||(cr(e),t&&t.response&&(t.response.data=Tn.call(e,e.transformResponse,t.response),t.response.headers=Pn.from(t.response.headers))),Promise.reject(t)}))}const dr="1.7.9",pr={};["object","boolean","number","function","string","symbol"].forEach(((e,t)=>{pr[e]=function(n){return typeof n===e||"a"+(t<1?"n ":" ")+e}}));const hr={};pr.transitional=function(e,t,n){function r(e,t){return"[Axios v1.7.9] Transitional option '"+e+"'"+t+(n?". "+n:"")}return(n,a,l)=>{if(!1===e)throw new Gt(r(a," has been removed"+(t?" in "+t:"")),Gt.ERR_DEPRECATED);return t&&!hr[a]&&(hr[a]=!0,console.warn(r(a," has been deprecated since v"+t+" and will be removed in the near future"))),!e||e(n,a,l)}},pr.spelling=function(e){return(t,n)=>(console.warn(`${n} is likely a misspelling of ${e}`),!0)};const mr={assertOptions:function(e,t,n){if("object"!==typeof e)throw new Gt("options must be an object",Gt.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let a=r.length;for(;a-- >0;){const l=r[a],o=t[l];if(o){const t=e[l],n=void 0===t||o(t,l,e);if(!0!==n)throw new Gt("option "+l+" must be "+n,Gt.ERR_BAD_OPTION_VALUE)}else if(!0!==n)throw new Gt("Unknown option "+l,Gt.ERR_BAD_OPTION)}},validators:pr},gr=mr.validators;class yr{constructor(e){this.defaults=e,this.interceptors={request:new cn,response:new cn}}async request(e,t){try{return await this._request(e,t)}catch(n){if(n instanceof Error){let e={};Error.captureStackTrace?Error.captureStackTrace(e):e=new Error;const t=e.stack?e.stack.replace(/^.+\n/,""):"";try{n.stack?t&&!String(n.stack).endsWith(t.replace(/^.+\n.+\n/,""))&&(n.stack+="\n"+t):n.stack=t}catch(Or){}}throw n}}_request(e,t){"string"===typeof e?(t=t||{}).url=e:t=e||{},t=Hn(this.defaults,t);const{transitional:n,paramsSerializer:r,headers:a}=t;void 0!==n&&mr.assertOptions(n,{silentJSONParsing:gr.transitional(gr.boolean),forcedJSONParsing:gr.transitional(gr.boolean),clarifyTimeoutError:gr.transitional(gr.boolean)},!1),null!=r&&(Qt.isFunction(r)?t.paramsSerializer={serialize:r}:mr.assertOptions(r,{encode:gr.function,serialize:gr.function},!0)),mr.assertOptions(t,{baseUrl:gr.spelling("baseURL"),withXsrfToken:gr.spelling("withXSRFToken")},!0),t.method=(t.method||this.defaults.method||"get").toLowerCase();let l=a&&Qt.merge(a.common,a[t.method]);a&&Qt.forEach(["delete","get","head","post","put","patch","common"],(e=>{delete a[e]})),t.headers=Pn.concat(l,a);const o=[];let i=!0;this.interceptors.request.forEach((function(e){"function"===typeof e.runWhen&&!1===e.runWhen(t)||(i=i&&e.synchronous,o.unshift(e.fulfilled,e.rejected))}));const u=[];let s;this.interceptors.response.forEach((function(e){u.push(e.fulfilled,e.rejected)}));let c,f=0;if(!i){const e=[fr.bind(this),void 0];for(e.unshift.apply(e,o),e.push.apply(e,u),c=e.length,s=Promise.resolve(t);f<c;)s=s.then(e[f++],e[f++]);return s}c=o.length;let d=t;for(f=0;f<c;){const e=o[f++],t=o[f++];try{d=e(d)}catch(p){t.call(this,p);break}}try{s=fr.call(this,d)}catch(p){return Promise.reject(p)}for(f=0,c=u.length;f<c;)s=s.then(u[f++],u[f++]);return s}getUri(e){return sn($n((e=Hn(this.defaults,e)).baseURL,e.url),e.params,e.paramsSerializer)}}Qt.forEach(["delete","get","head","options"],(function(e){yr.prototype[e]=function(t,n){return this.request(Hn(n||{},{method:e,url:t,data:(n||{}).data}))}})),Qt.forEach(["post","put","patch"],(function(e){function t(t){return function(n,r,a){return this.request(Hn(a||{},{method:e,headers:t?{"Content-Type":"multipart/form-data"}:{},url:n,data:r}))}}yr.prototype[e]=t(),yr.prototype[e+"Form"]=t(!0)}));const vr=yr;class br{constructor(e){if("function"!==typeof e)throw new TypeError("executor must be a function.");let t;this.promise=new Promise((function(e){t=e}));const n=this;this.promise.then((e=>{if(!n._listeners)return;let t=n._listeners.length;for(;t-- >0;)n._listeners[t](e);n._listeners=null})),this.promise.then=e=>{let t;const r=new Promise((e=>{n.subscribe(e),t=e})).then(e);return r.cancel=function(){n.unsubscribe(t)},r},e((function(e,r,a){n.reason||(n.reason=new Ln(e,r,a),t(n.reason))}))}throwIfRequested(){if(this.reason)throw this.reason}subscribe(e){this.reason?e(this.reason):this._listeners?this._listeners.push(e):this._listeners=[e]}unsubscribe(e){if(!this._listeners)return;const t=this._listeners.indexOf(e);-1!==t&&this._listeners.splice(t,1)}toAbortSignal(){const e=new AbortController,t=t=>{e.abort(t)};return this.subscribe(t),e.signal.unsubscribe=()=>this.unsubscribe(t),e.signal}static source(){let e;return{token:new br((function(t){e=t})),cancel:e}}}const wr=br;const Sr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Sr).forEach((e=>{let[t,n]=e;Sr[n]=t}));const kr=Sr;const Er=function e(t){const n=new vr(t),r=it(vr.prototype.request,n);return Qt.extend(r,vr.prototype,n,{allOwnKeys:!0}),Qt.extend(r,n,null,{allOwnKeys:!0}),r.create=function(n){return e(Hn(t,n))},r}(Sn);Er.Axios=vr,Er.CanceledError=Ln,Er.CancelToken=wr,Er.isCancel=On,Er.VERSION=dr,Er.toFormData=nn,Er.AxiosError=Gt,Er.Cancel=Er.CanceledError,Er.all=function(e){return Promise.all(e)},Er.spread=function(e){return function(t){return e.apply(null,t)}},Er.isAxiosError=function(e){return Qt.isObject(e)&&!0===e.isAxiosError},Er.mergeConfig=Hn,Er.AxiosHeaders=Pn,Er.formToJSON=e=>bn(Qt.isHTMLForm(e)?new FormData(e):e),Er.getAdapter=sr,Er.HttpStatusCode=kr,Er.default=Er;const xr=Er;var Cr=n(579);const Rr=function(){const[e,t]=(0,a.useState)(""),[n,r]=(0,a.useState)(""),[l,o]=(0,a.useState)(""),[i,u]=(0,a.useState)(""),[s,c]=(0,a.useState)("");return(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("h2",{children:"Client Order UI"}),(0,Cr.jsxs)("form",{onSubmit:async t=>{t.preventDefault();const r={order_id:e,symbol:n,quantity:parseInt(l,10),price:parseFloat(i),business_unit:"BU-001",trader_id:"TRADER001",risk_category:"LOW",processed_timestamp:(new Date).toISOString()};try{const e=await xr.post("/orders",r);c(`Success: ${e.data.message}`)}catch(a){c(`Error: ${a.response?a.response.data.message:a.message}`)}},children:[(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Order ID:"}),(0,Cr.jsx)("input",{type:"text",value:e,onChange:e=>t(e.target.value),required:!0})]}),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Symbol:"}),(0,Cr.jsx)("input",{type:"text",value:n,onChange:e=>r(e.target.value),required:!0})]}),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Quantity:"}),(0,Cr.jsx)("input",{type:"number",value:l,onChange:e=>o(e.target.value),required:!0})]}),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Price:"}),(0,Cr.jsx)("input",{type:"number",step:"0.01",value:i,onChange:e=>u(e.target.value),required:!0})]}),(0,Cr.jsx)("button",{type:"submit",children:"Submit Order"})]}),s&&(0,Cr.jsx)("p",{children:s})]})};const _r=function(){const[e,t]=(0,a.useState)([]),n=async()=>{try{const e=await xr.get("/logs");t(e.data.logs)}catch(e){console.error("Error fetching logs:",e),t((e=>[...e,`Log entry at ${(new Date).toLocaleTimeString()}: No logs endpoint configured.`]))}};return(0,a.useEffect)((()=>{n();const e=setInterval(n,5e3);return()=>clearInterval(e)}),[]),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("h2",{children:"Server Dashboard"}),(0,Cr.jsx)("div",{style:{border:"1px solid #ccc",padding:"1rem",height:"300px",overflowY:"scroll"},children:e.length>0?e.map(((e,t)=>(0,Cr.jsx)("p",{children:e},t))):(0,Cr.jsx)("p",{children:"No logs available."})})]})};const Pr=function(){const[e,t]=(0,a.useState)([]),n=async()=>{try{const e=await xr.get("/orders");t(e.data.orders)}catch(e){console.error("Error fetching orders:",e)}};return(0,a.useEffect)((()=>{n();const e=setInterval(n,1e4);return()=>clearInterval(e)}),[]),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("h2",{children:"Internal System - Order Viewer"}),(0,Cr.jsxs)("table",{border:"1",cellPadding:"5",children:[(0,Cr.jsx)("thead",{children:(0,Cr.jsxs)("tr",{children:[(0,Cr.jsx)("th",{children:"Order ID"}),(0,Cr.jsx)("th",{children:"Symbol"}),(0,Cr.jsx)("th",{children:"Quantity"}),(0,Cr.jsx)("th",{children:"Price"}),(0,Cr.jsx)("th",{children:"Ingested Timestamp"})]})}),(0,Cr.jsx)("tbody",{children:e.length>0?e.map(((e,t)=>(0,Cr.jsxs)("tr",{children:[(0,Cr.jsx)("td",{children:e.order_id}),(0,Cr.jsx)("td",{children:e.symbol}),(0,Cr.jsx)("td",{children:e.quantity}),(0,Cr.jsx)("td",{children:e.price}),(0,Cr.jsx)("td",{children:e.ingested_timestamp})]},t))):(0,Cr.jsx)("tr",{children:(0,Cr.jsx)("td",{colSpan:"5",children:"No orders available."})})})]})]})};const Tr=function(){return(0,Cr.jsx)(Je,{children:(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("nav",{children:(0,Cr.jsxs)("ul",{children:[(0,Cr.jsx)("li",{children:(0,Cr.jsx)(et,{to:"/",children:"Client Order UI"})}),(0,Cr.jsx)("li",{children:(0,Cr.jsx)(et,{to:"/server",children:"Server Dashboard"})}),(0,Cr.jsx)("li",{children:(0,Cr.jsx)(et,{to:"/internal",children:"Internal System UI"})})]})}),(0,Cr.jsxs)(ve,{children:[(0,Cr.jsx)(ge,{path:"/",element:(0,Cr.jsx)(Rr,{})}),(0,Cr.jsx)(ge,{path:"/server",element:(0,Cr.jsx)(_r,{})}),(0,Cr.jsx)(ge,{path:"/internal",element:(0,Cr.jsx)(Pr,{})})]})]})})};l.createRoot(document.getElementById("root")).render((0,Cr.jsx)(a.StrictMode,{children:(0,Cr.jsx)(Tr,{})}))})();
-//# sourceMappingURL=main.deb7aa28.js.map
\ No newline at end of file
+/*! For license information please see main.fe4e3515.js.LICENSE.txt */
+(()=>{"use strict";var e={4:(e,t,n)=>{var r=n(853),a=n(43),l=n(950);function o(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}var u=Symbol.for("react.element"),s=Symbol.for("react.transitional.element"),c=Symbol.for("react.portal"),f=Symbol.for("react.fragment"),d=Symbol.for("react.strict_mode"),p=Symbol.for("react.profiler"),h=Symbol.for("react.provider"),m=Symbol.for("react.consumer"),g=Symbol.for("react.context"),y=Symbol.for("react.forward_ref"),v=Symbol.for("react.suspense"),b=Symbol.for("react.suspense_list"),w=Symbol.for("react.memo"),S=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var k=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var E=Symbol.for("react.memo_cache_sentinel"),x=Symbol.iterator;function C(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=x&&e[x]||e["@@iterator"])?e:null}var _=Symbol.for("react.client.reference");function R(e){if(null==e)return null;if("function"===typeof e)return e.$$typeof===_?null:e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case f:return"Fragment";case c:return"Portal";case p:return"Profiler";case d:return"StrictMode";case v:return"Suspense";case b:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case g:return(e.displayName||"Context")+".Provider";case m:return(e._context.displayName||"Context")+".Consumer";case y:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case w:return null!==(t=e.displayName||null)?t:R(e.type)||"Memo";case S:t=e._payload,e=e._init;try{return R(e(t))}catch(n){}}return null}var P,T,O=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,N=Object.assign;function L(e){if(void 0===P)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);P=t&&t[1]||"",T=-1<n.stack.indexOf("\n    at")?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+P+e+T}var z=!1;function A(e,t){if(!e||z)return"";z=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(a){var r=a}Reflect.construct(e,[],n)}else{try{n.call()}catch(l){r=l}e.call(n.prototype)}}else{try{throw Error()}catch(o){r=o}(n=e())&&"function"===typeof n.catch&&n.catch((function(){}))}}catch(i){if(i&&r&&"string"===typeof i.stack)return[i.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var a=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");a&&a.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var l=r.DetermineComponentFrameRoot(),o=l[0],i=l[1];if(o&&i){var u=o.split("\n"),s=i.split("\n");for(a=r=0;r<u.length&&!u[r].includes("DetermineComponentFrameRoot");)r++;for(;a<s.length&&!s[a].includes("DetermineComponentFrameRoot");)a++;if(r===u.length||a===s.length)for(r=u.length-1,a=s.length-1;1<=r&&0<=a&&u[r]!==s[a];)a--;for(;1<=r&&0<=a;r--,a--)if(u[r]!==s[a]){if(1!==r||1!==a)do{if(r--,0>--a||u[r]!==s[a]){var c="\n"+u[r].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=r&&0<=a);break}}}finally{z=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?L(n):""}function F(e){switch(e.tag){case 26:case 27:case 5:return L(e.type);case 16:return L("Lazy");case 13:return L("Suspense");case 19:return L("SuspenseList");case 0:case 15:return e=A(e.type,!1);case 11:return e=A(e.type.render,!1);case 1:return e=A(e.type,!0);default:return""}}function D(e){try{var t="";do{t+=F(e),e=e.return}while(e);return t}catch(n){return"\nError generating stack: "+n.message+"\n"+n.stack}}function j(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function M(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function U(e){if(j(e)!==e)throw Error(o(188))}function I(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=I(e)))return t;e=e.sibling}return null}var $=Array.isArray,B=l.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,H={pending:!1,data:null,method:null,action:null},q=[],W=-1;function V(e){return{current:e}}function Q(e){0>W||(e.current=q[W],q[W]=null,W--)}function K(e,t){W++,q[W]=e.current,e.current=t}var Y=V(null),J=V(null),X=V(null),G=V(null);function Z(e,t){switch(K(X,t),K(J,e),K(Y,null),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)&&(t=t.namespaceURI)?Jc(t):0;break;default:if(t=(e=8===e?t.parentNode:t).tagName,e=e.namespaceURI)t=Xc(e=Jc(e),t);else switch(t){case"svg":t=1;break;case"math":t=2;break;default:t=0}}Q(Y),K(Y,t)}function ee(){Q(Y),Q(J),Q(X)}function te(e){null!==e.memoizedState&&K(G,e);var t=Y.current,n=Xc(t,e.type);t!==n&&(K(J,e),K(Y,n))}function ne(e){J.current===e&&(Q(Y),Q(J)),G.current===e&&(Q(G),jf._currentValue=H)}var re=Object.prototype.hasOwnProperty,ae=r.unstable_scheduleCallback,le=r.unstable_cancelCallback,oe=r.unstable_shouldYield,ie=r.unstable_requestPaint,ue=r.unstable_now,se=r.unstable_getCurrentPriorityLevel,ce=r.unstable_ImmediatePriority,fe=r.unstable_UserBlockingPriority,de=r.unstable_NormalPriority,pe=r.unstable_LowPriority,he=r.unstable_IdlePriority,me=r.log,ge=r.unstable_setDisableYieldValue,ye=null,ve=null;function be(e){if("function"===typeof me&&ge(e),ve&&"function"===typeof ve.setStrictMode)try{ve.setStrictMode(ye,e)}catch(t){}}var we=Math.clz32?Math.clz32:function(e){return 0===(e>>>=0)?32:31-(Se(e)/ke|0)|0},Se=Math.log,ke=Math.LN2;var Ee=128,xe=4194304;function Ce(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194176&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function _e(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,a=e.suspendedLanes,l=e.pingedLanes,o=e.warmLanes;e=0!==e.finishedLanes;var i=134217727&n;return 0!==i?0!==(n=i&~a)?r=Ce(n):0!==(l&=i)?r=Ce(l):e||0!==(o=i&~o)&&(r=Ce(o)):0!==(i=n&~a)?r=Ce(i):0!==l?r=Ce(l):e||0!==(o=n&~o)&&(r=Ce(o)),0===r?0:0!==t&&t!==r&&0===(t&a)&&((a=r&-r)>=(o=t&-t)||32===a&&0!==(4194176&o))?t:r}function Re(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function Pe(e,t){switch(e){case 1:case 2:case 4:case 8:return t+250;case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Te(){var e=Ee;return 0===(4194176&(Ee<<=1))&&(Ee=128),e}function Oe(){var e=xe;return 0===(62914560&(xe<<=1))&&(xe=4194304),e}function Ne(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Le(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function ze(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-we(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|4194218&n}function Ae(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-we(n),a=1<<r;a&t|e[r]&t&&(e[r]|=t),n&=~a}}function Fe(e){return 2<(e&=-e)?8<e?0!==(134217727&e)?32:268435456:8:2}function De(){var e=B.p;return 0!==e?e:void 0===(e=window.event)?32:Gf(e.type)}var je=Math.random().toString(36).slice(2),Me="__reactFiber$"+je,Ue="__reactProps$"+je,Ie="__reactContainer$"+je,$e="__reactEvents$"+je,Be="__reactListeners$"+je,He="__reactHandles$"+je,qe="__reactResources$"+je,We="__reactMarker$"+je;function Ve(e){delete e[Me],delete e[Ue],delete e[$e],delete e[Be],delete e[He]}function Qe(e){var t=e[Me];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ie]||n[Me]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=sf(e);null!==e;){if(n=e[Me])return n;e=sf(e)}return t}n=(e=n).parentNode}return null}function Ke(e){if(e=e[Me]||e[Ie]){var t=e.tag;if(5===t||6===t||13===t||26===t||27===t||3===t)return e}return null}function Ye(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(o(33))}function Je(e){var t=e[qe];return t||(t=e[qe]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Xe(e){e[We]=!0}var Ge=new Set,Ze={};function et(e,t){tt(e,t),tt(e+"Capture",t)}function tt(e,t){for(Ze[e]=t,e=0;e<t.length;e++)Ge.add(t[e])}var nt=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),rt=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),at={},lt={};function ot(e,t,n){if(a=t,re.call(lt,a)||!re.call(at,a)&&(rt.test(a)?lt[a]=!0:(at[a]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var a}function it(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function ut(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function st(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ct(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function ft(e){e._valueTracker||(e._valueTracker=function(e){var t=ct(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var a=n.get,l=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return a.call(this)},set:function(e){r=""+e,l.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function dt(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ct(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function pt(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var ht=/[\n"\\]/g;function mt(e){return e.replace(ht,(function(e){return"\\"+e.charCodeAt(0).toString(16)+" "}))}function gt(e,t,n,r,a,l,o,i){e.name="",null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o?e.type=o:e.removeAttribute("type"),null!=t?"number"===o?(0===t&&""===e.value||e.value!=t)&&(e.value=""+st(t)):e.value!==""+st(t)&&(e.value=""+st(t)):"submit"!==o&&"reset"!==o||e.removeAttribute("value"),null!=t?vt(e,o,st(t)):null!=n?vt(e,o,st(n)):null!=r&&e.removeAttribute("value"),null==a&&null!=l&&(e.defaultChecked=!!l),null!=a&&(e.checked=a&&"function"!==typeof a&&"symbol"!==typeof a),null!=i&&"function"!==typeof i&&"symbol"!==typeof i&&"boolean"!==typeof i?e.name=""+st(i):e.removeAttribute("name")}function yt(e,t,n,r,a,l,o,i){if(null!=l&&"function"!==typeof l&&"symbol"!==typeof l&&"boolean"!==typeof l&&(e.type=l),null!=t||null!=n){if(!("submit"!==l&&"reset"!==l||void 0!==t&&null!==t))return;n=null!=n?""+st(n):"",t=null!=t?""+st(t):n,i||t===e.value||(e.value=t),e.defaultValue=t}r="function"!==typeof(r=null!=r?r:a)&&"symbol"!==typeof r&&!!r,e.checked=i?e.checked:!!r,e.defaultChecked=!!r,null!=o&&"function"!==typeof o&&"symbol"!==typeof o&&"boolean"!==typeof o&&(e.name=o)}function vt(e,t,n){"number"===t&&pt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function bt(e,t,n,r){if(e=e.options,t){t={};for(var a=0;a<n.length;a++)t["$"+n[a]]=!0;for(n=0;n<e.length;n++)a=t.hasOwnProperty("$"+e[n].value),e[n].selected!==a&&(e[n].selected=a),a&&r&&(e[n].defaultSelected=!0)}else{for(n=""+st(n),t=null,a=0;a<e.length;a++){if(e[a].value===n)return e[a].selected=!0,void(r&&(e[a].defaultSelected=!0));null!==t||e[a].disabled||(t=e[a])}null!==t&&(t.selected=!0)}}function wt(e,t,n){null==t||((t=""+st(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+st(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function St(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(o(92));if($(r)){if(1<r.length)throw Error(o(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=st(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r)}function kt(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var Et=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function xt(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"===typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!==typeof n||0===n||Et.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function Ct(e,t,n){if(null!=t&&"object"!==typeof t)throw Error(o(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var a in t)r=t[a],t.hasOwnProperty(a)&&n[a]!==r&&xt(e,a,r)}else for(var l in t)t.hasOwnProperty(l)&&xt(e,l,t[l])}function _t(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Rt=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Pt=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Tt(e){return Pt.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var Ot=null;function Nt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Lt=null,zt=null;function At(e){var t=Ke(e);if(t&&(e=t.stateNode)){var n=e[Ue]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+mt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var a=r[Ue]||null;if(!a)throw Error(o(90));gt(r,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&dt(r)}break e;case"textarea":wt(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&bt(e,!!n.multiple,t,!1)}}}var Ft=!1;function Dt(e,t,n){if(Ft)return e(t,n);Ft=!0;try{return e(t)}finally{if(Ft=!1,(null!==Lt||null!==zt)&&(Ms(),Lt&&(t=Lt,e=zt,zt=Lt=null,At(t),e)))for(t=0;t<e.length;t++)At(e[t])}}function jt(e,t){var n=e.stateNode;if(null===n)return null;var r=n[Ue]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var Mt=!1;if(nt)try{var Ut={};Object.defineProperty(Ut,"passive",{get:function(){Mt=!0}}),window.addEventListener("test",Ut,Ut),window.removeEventListener("test",Ut,Ut)}catch(kd){Mt=!1}var It=null,$t=null,Bt=null;function Ht(){if(Bt)return Bt;var e,t,n=$t,r=n.length,a="value"in It?It.value:It.textContent,l=a.length;for(e=0;e<r&&n[e]===a[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===a[l-t];t++);return Bt=a.slice(e,1<t?1-t:void 0)}function qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function Wt(){return!0}function Vt(){return!1}function Qt(e){function t(t,n,r,a,l){for(var o in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=a,this.target=l,this.currentTarget=null,e)e.hasOwnProperty(o)&&(t=e[o],this[o]=t?t(a):a[o]);return this.isDefaultPrevented=(null!=a.defaultPrevented?a.defaultPrevented:!1===a.returnValue)?Wt:Vt,this.isPropagationStopped=Vt,this}return N(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Wt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Wt)},persist:function(){},isPersistent:Wt}),t}var Kt,Yt,Jt,Xt={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Gt=Qt(Xt),Zt=N({},Xt,{view:0,detail:0}),en=Qt(Zt),tn=N({},Zt,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:pn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Jt&&(Jt&&"mousemove"===e.type?(Kt=e.screenX-Jt.screenX,Yt=e.screenY-Jt.screenY):Yt=Kt=0,Jt=e),Kt)},movementY:function(e){return"movementY"in e?e.movementY:Yt}}),nn=Qt(tn),rn=Qt(N({},tn,{dataTransfer:0})),an=Qt(N({},Zt,{relatedTarget:0})),ln=Qt(N({},Xt,{animationName:0,elapsedTime:0,pseudoElement:0})),on=Qt(N({},Xt,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),un=Qt(N({},Xt,{data:0})),sn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},cn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},fn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function dn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=fn[e])&&!!t[e]}function pn(){return dn}var hn=Qt(N({},Zt,{key:function(e){if(e.key){var t=sn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?cn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:pn,charCode:function(e){return"keypress"===e.type?qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),mn=Qt(N({},tn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),gn=Qt(N({},Zt,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:pn})),yn=Qt(N({},Xt,{propertyName:0,elapsedTime:0,pseudoElement:0})),vn=Qt(N({},tn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),bn=Qt(N({},Xt,{newState:0,oldState:0})),wn=[9,13,27,32],Sn=nt&&"CompositionEvent"in window,kn=null;nt&&"documentMode"in document&&(kn=document.documentMode);var En=nt&&"TextEvent"in window&&!kn,xn=nt&&(!Sn||kn&&8<kn&&11>=kn),Cn=String.fromCharCode(32),_n=!1;function Rn(e,t){switch(e){case"keyup":return-1!==wn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Pn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Tn=!1;var On={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Nn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!On[e.type]:"textarea"===t}function Ln(e,t,n,r){Lt?zt?zt.push(r):zt=[r]:Lt=r,0<(t=Dc(t,"onChange")).length&&(n=new Gt("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var zn=null,An=null;function Fn(e){Pc(e,0)}function Dn(e){if(dt(Ye(e)))return e}function jn(e,t){if("change"===e)return t}var Mn=!1;if(nt){var Un;if(nt){var In="oninput"in document;if(!In){var $n=document.createElement("div");$n.setAttribute("oninput","return;"),In="function"===typeof $n.oninput}Un=In}else Un=!1;Mn=Un&&(!document.documentMode||9<document.documentMode)}function Bn(){zn&&(zn.detachEvent("onpropertychange",Hn),An=zn=null)}function Hn(e){if("value"===e.propertyName&&Dn(An)){var t=[];Ln(t,An,e,Nt(e)),Dt(Fn,t)}}function qn(e,t,n){"focusin"===e?(Bn(),An=n,(zn=t).attachEvent("onpropertychange",Hn)):"focusout"===e&&Bn()}function Wn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Dn(An)}function Vn(e,t){if("click"===e)return Dn(t)}function Qn(e,t){if("input"===e||"change"===e)return Dn(t)}var Kn="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function Yn(e,t){if(Kn(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var a=n[r];if(!re.call(t,a)||!Kn(e[a],t[a]))return!1}return!0}function Jn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Xn(e,t){var n,r=Jn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=Jn(r)}}function Gn(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?Gn(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function Zn(e){for(var t=pt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=pt((e=t.contentWindow).document)}return t}function er(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function tr(e,t){var n=Zn(t);t=e.focusedElem;var r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&Gn(t.ownerDocument.documentElement,t)){if(null!==r&&er(t))if(e=r.start,void 0===(n=r.end)&&(n=e),"selectionStart"in t)t.selectionStart=e,t.selectionEnd=Math.min(n,t.value.length);else if((n=(e=t.ownerDocument||document)&&e.defaultView||window).getSelection){n=n.getSelection();var a=t.textContent.length,l=Math.min(r.start,a);r=void 0===r.end?l:Math.min(r.end,a),!n.extend&&l>r&&(a=r,r=l,l=a),a=Xn(t,l);var o=Xn(t,r);a&&o&&(1!==n.rangeCount||n.anchorNode!==a.node||n.anchorOffset!==a.offset||n.focusNode!==o.node||n.focusOffset!==o.offset)&&((e=e.createRange()).setStart(a.node,a.offset),n.removeAllRanges(),l>r?(n.addRange(e),n.extend(o.node,o.offset)):(e.setEnd(o.node,o.offset),n.addRange(e)))}for(e=[],n=t;n=n.parentNode;)1===n.nodeType&&e.push({element:n,left:n.scrollLeft,top:n.scrollTop});for("function"===typeof t.focus&&t.focus(),t=0;t<e.length;t++)(n=e[t]).element.scrollLeft=n.left,n.element.scrollTop=n.top}}var nr=nt&&"documentMode"in document&&11>=document.documentMode,rr=null,ar=null,lr=null,or=!1;function ir(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;or||null==rr||rr!==pt(r)||("selectionStart"in(r=rr)&&er(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Yn(lr,r)||(lr=r,0<(r=Dc(ar,"onSelect")).length&&(t=new Gt("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=rr)))}function ur(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var sr={animationend:ur("Animation","AnimationEnd"),animationiteration:ur("Animation","AnimationIteration"),animationstart:ur("Animation","AnimationStart"),transitionrun:ur("Transition","TransitionRun"),transitionstart:ur("Transition","TransitionStart"),transitioncancel:ur("Transition","TransitionCancel"),transitionend:ur("Transition","TransitionEnd")},cr={},fr={};function dr(e){if(cr[e])return cr[e];if(!sr[e])return e;var t,n=sr[e];for(t in n)if(n.hasOwnProperty(t)&&t in fr)return cr[e]=n[t];return e}nt&&(fr=document.createElement("div").style,"AnimationEvent"in window||(delete sr.animationend.animation,delete sr.animationiteration.animation,delete sr.animationstart.animation),"TransitionEvent"in window||delete sr.transitionend.transition);var pr=dr("animationend"),hr=dr("animationiteration"),mr=dr("animationstart"),gr=dr("transitionrun"),yr=dr("transitionstart"),vr=dr("transitioncancel"),br=dr("transitionend"),wr=new Map,Sr="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll scrollEnd toggle touchMove waiting wheel".split(" ");function kr(e,t){wr.set(e,t),et(t,[e])}var Er=[],xr=0,Cr=0;function _r(){for(var e=xr,t=Cr=xr=0;t<e;){var n=Er[t];Er[t++]=null;var r=Er[t];Er[t++]=null;var a=Er[t];Er[t++]=null;var l=Er[t];if(Er[t++]=null,null!==r&&null!==a){var o=r.pending;null===o?a.next=a:(a.next=o.next,o.next=a),r.pending=a}0!==l&&Or(n,a,l)}}function Rr(e,t,n,r){Er[xr++]=e,Er[xr++]=t,Er[xr++]=n,Er[xr++]=r,Cr|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Pr(e,t,n,r){return Rr(e,t,n,r),Nr(e)}function Tr(e,t){return Rr(e,null,null,t),Nr(e)}function Or(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var a=!1,l=e.return;null!==l;)l.childLanes|=n,null!==(r=l.alternate)&&(r.childLanes|=n),22===l.tag&&(null===(e=l.stateNode)||1&e._visibility||(a=!0)),e=l,l=l.return;a&&null!==t&&3===e.tag&&(l=e.stateNode,a=31-we(n),null===(e=(l=l.hiddenUpdates)[a])?l[a]=[t]:e.push(t),t.lane=536870912|n)}function Nr(e){if(50<Ps)throw Ps=0,Ts=null,Error(o(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Lr={},zr=new WeakMap;function Ar(e,t){if("object"===typeof e&&null!==e){var n=zr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:D(t)},zr.set(e,t),t)}return{value:e,source:t,stack:D(t)}}var Fr=[],Dr=0,jr=null,Mr=0,Ur=[],Ir=0,$r=null,Br=1,Hr="";function qr(e,t){Fr[Dr++]=Mr,Fr[Dr++]=jr,jr=e,Mr=t}function Wr(e,t,n){Ur[Ir++]=Br,Ur[Ir++]=Hr,Ur[Ir++]=$r,$r=e;var r=Br;e=Hr;var a=32-we(r)-1;r&=~(1<<a),n+=1;var l=32-we(t)+a;if(30<l){var o=a-a%5;l=(r&(1<<o)-1).toString(32),r>>=o,a-=o,Br=1<<32-we(t)+a|n<<a|r,Hr=l+e}else Br=1<<l|n<<a|r,Hr=e}function Vr(e){null!==e.return&&(qr(e,1),Wr(e,1,0))}function Qr(e){for(;e===jr;)jr=Fr[--Dr],Fr[Dr]=null,Mr=Fr[--Dr],Fr[Dr]=null;for(;e===$r;)$r=Ur[--Ir],Ur[Ir]=null,Hr=Ur[--Ir],Ur[Ir]=null,Br=Ur[--Ir],Ur[Ir]=null}var Kr=null,Yr=null,Jr=!1,Xr=null,Gr=!1,Zr=Error(o(519));function ea(e){throw la(Ar(Error(o(418,"")),e)),Zr}function ta(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[Me]=e,t[Ue]=r,n){case"dialog":Tc("cancel",t),Tc("close",t);break;case"iframe":case"object":case"embed":Tc("load",t);break;case"video":case"audio":for(n=0;n<_c.length;n++)Tc(_c[n],t);break;case"source":Tc("error",t);break;case"img":case"image":case"link":Tc("error",t),Tc("load",t);break;case"details":Tc("toggle",t);break;case"input":Tc("invalid",t),yt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0),ft(t);break;case"select":Tc("invalid",t);break;case"textarea":Tc("invalid",t),St(t,r.value,r.defaultValue,r.children),ft(t)}"string"!==typeof(n=r.children)&&"number"!==typeof n&&"bigint"!==typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||Bc(t.textContent,n)?(null!=r.popover&&(Tc("beforetoggle",t),Tc("toggle",t)),null!=r.onScroll&&Tc("scroll",t),null!=r.onScrollEnd&&Tc("scrollend",t),null!=r.onClick&&(t.onclick=Hc),t=!0):t=!1,t||ea(e)}function na(e){for(Kr=e.return;Kr;)switch(Kr.tag){case 3:case 27:return void(Gr=!0);case 5:case 13:return void(Gr=!1);default:Kr=Kr.return}}function ra(e){if(e!==Kr)return!1;if(!Jr)return na(e),Jr=!0,!1;var t,n=!1;if((t=3!==e.tag&&27!==e.tag)&&((t=5===e.tag)&&(t=!("form"!==(t=e.type)&&"button"!==t)||Gc(e.type,e.memoizedProps)),t=!t),t&&(n=!0),n&&Yr&&ea(e),na(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType)if("/$"===(t=e.data)){if(0===n){Yr=uf(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++;e=e.nextSibling}Yr=null}}else Yr=Kr?uf(e.stateNode.nextSibling):null;return!0}function aa(){Yr=Kr=null,Jr=!1}function la(e){null===Xr?Xr=[e]:Xr.push(e)}var oa=Error(o(460)),ia=Error(o(474)),ua={then:function(){}};function sa(e){return"fulfilled"===(e=e.status)||"rejected"===e}function ca(){}function fa(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(ca,ca),t=n),t.status){case"fulfilled":return t.value;case"rejected":if((e=t.reason)===oa)throw Error(o(483));throw e;default:if("string"===typeof t.status)t.then(ca,ca);else{if(null!==(e=ts)&&100<e.shellSuspendCounter)throw Error(o(482));(e=t).status="pending",e.then((function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}}),(function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}}))}switch(t.status){case"fulfilled":return t.value;case"rejected":if((e=t.reason)===oa)throw Error(o(483));throw e}throw da=t,oa}}var da=null;function pa(){if(null===da)throw Error(o(459));var e=da;return da=null,e}var ha=null,ma=0;function ga(e){var t=ma;return ma+=1,null===ha&&(ha=[]),fa(ha,e,t)}function ya(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function va(e,t){if(t.$$typeof===u)throw Error(o(525));throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ba(e){return(0,e._init)(e._payload)}function wa(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function a(e,t){return(e=ju(e,t)).index=0,e.sibling=null,e}function l(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=33554434,n):r:(t.flags|=33554434,n):(t.flags|=1048576,n)}function i(t){return e&&null===t.alternate&&(t.flags|=33554434),t}function u(e,t,n,r){return null===t||6!==t.tag?((t=Bu(n,e.mode,r)).return=e,t):((t=a(t,n)).return=e,t)}function d(e,t,n,r){var l=n.type;return l===f?h(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===l||"object"===typeof l&&null!==l&&l.$$typeof===S&&ba(l)===t.type)?(ya(t=a(t,n.props),n),t.return=e,t):(ya(t=Uu(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function p(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Hu(n,e.mode,r)).return=e,t):((t=a(t,n.children||[])).return=e,t)}function h(e,t,n,r,l){return null===t||7!==t.tag?((t=Iu(n,e.mode,r,l)).return=e,t):((t=a(t,n)).return=e,t)}function m(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t||"bigint"===typeof t)return(t=Bu(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case s:return ya(n=Uu(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case c:return(t=Hu(t,e.mode,n)).return=e,t;case S:return m(e,t=(0,t._init)(t._payload),n)}if($(t)||C(t))return(t=Iu(t,e.mode,n,null)).return=e,t;if("function"===typeof t.then)return m(e,ga(t),n);if(t.$$typeof===g)return m(e,_i(e,t),n);va(e,t)}return null}function y(e,t,n,r){var a=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n||"bigint"===typeof n)return null!==a?null:u(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case s:return n.key===a?d(e,t,n,r):null;case c:return n.key===a?p(e,t,n,r):null;case S:return y(e,t,n=(a=n._init)(n._payload),r)}if($(n)||C(n))return null!==a?null:h(e,t,n,r,null);if("function"===typeof n.then)return y(e,t,ga(n),r);if(n.$$typeof===g)return y(e,t,_i(e,n),r);va(e,n)}return null}function v(e,t,n,r,a){if("string"===typeof r&&""!==r||"number"===typeof r||"bigint"===typeof r)return u(t,e=e.get(n)||null,""+r,a);if("object"===typeof r&&null!==r){switch(r.$$typeof){case s:return d(t,e=e.get(null===r.key?n:r.key)||null,r,a);case c:return p(t,e=e.get(null===r.key?n:r.key)||null,r,a);case S:return v(e,t,n,r=(0,r._init)(r._payload),a)}if($(r)||C(r))return h(t,e=e.get(n)||null,r,a,null);if("function"===typeof r.then)return v(e,t,n,ga(r),a);if(r.$$typeof===g)return v(e,t,n,_i(t,r),a);va(t,r)}return null}function b(u,d,p,h){if("object"===typeof p&&null!==p&&p.type===f&&null===p.key&&(p=p.props.children),"object"===typeof p&&null!==p){switch(p.$$typeof){case s:e:{for(var w=p.key;null!==d;){if(d.key===w){if((w=p.type)===f){if(7===d.tag){n(u,d.sibling),(h=a(d,p.props.children)).return=u,u=h;break e}}else if(d.elementType===w||"object"===typeof w&&null!==w&&w.$$typeof===S&&ba(w)===d.type){n(u,d.sibling),ya(h=a(d,p.props),p),h.return=u,u=h;break e}n(u,d);break}t(u,d),d=d.sibling}p.type===f?((h=Iu(p.props.children,u.mode,h,p.key)).return=u,u=h):(ya(h=Uu(p.type,p.key,p.props,null,u.mode,h),p),h.return=u,u=h)}return i(u);case c:e:{for(w=p.key;null!==d;){if(d.key===w){if(4===d.tag&&d.stateNode.containerInfo===p.containerInfo&&d.stateNode.implementation===p.implementation){n(u,d.sibling),(h=a(d,p.children||[])).return=u,u=h;break e}n(u,d);break}t(u,d),d=d.sibling}(h=Hu(p,u.mode,h)).return=u,u=h}return i(u);case S:return b(u,d,p=(w=p._init)(p._payload),h)}if($(p))return function(a,o,i,u){for(var s=null,c=null,f=o,d=o=0,p=null;null!==f&&d<i.length;d++){f.index>d?(p=f,f=null):p=f.sibling;var h=y(a,f,i[d],u);if(null===h){null===f&&(f=p);break}e&&f&&null===h.alternate&&t(a,f),o=l(h,o,d),null===c?s=h:c.sibling=h,c=h,f=p}if(d===i.length)return n(a,f),Jr&&qr(a,d),s;if(null===f){for(;d<i.length;d++)null!==(f=m(a,i[d],u))&&(o=l(f,o,d),null===c?s=f:c.sibling=f,c=f);return Jr&&qr(a,d),s}for(f=r(f);d<i.length;d++)null!==(p=v(f,a,d,i[d],u))&&(e&&null!==p.alternate&&f.delete(null===p.key?d:p.key),o=l(p,o,d),null===c?s=p:c.sibling=p,c=p);return e&&f.forEach((function(e){return t(a,e)})),Jr&&qr(a,d),s}(u,d,p,h);if(C(p)){if("function"!==typeof(w=C(p)))throw Error(o(150));return function(a,i,u,s){if(null==u)throw Error(o(151));for(var c=null,f=null,d=i,p=i=0,h=null,g=u.next();null!==d&&!g.done;p++,g=u.next()){d.index>p?(h=d,d=null):h=d.sibling;var b=y(a,d,g.value,s);if(null===b){null===d&&(d=h);break}e&&d&&null===b.alternate&&t(a,d),i=l(b,i,p),null===f?c=b:f.sibling=b,f=b,d=h}if(g.done)return n(a,d),Jr&&qr(a,p),c;if(null===d){for(;!g.done;p++,g=u.next())null!==(g=m(a,g.value,s))&&(i=l(g,i,p),null===f?c=g:f.sibling=g,f=g);return Jr&&qr(a,p),c}for(d=r(d);!g.done;p++,g=u.next())null!==(g=v(d,a,p,g.value,s))&&(e&&null!==g.alternate&&d.delete(null===g.key?p:g.key),i=l(g,i,p),null===f?c=g:f.sibling=g,f=g);return e&&d.forEach((function(e){return t(a,e)})),Jr&&qr(a,p),c}(u,d,p=w.call(p),h)}if("function"===typeof p.then)return b(u,d,ga(p),h);if(p.$$typeof===g)return b(u,d,_i(u,p),h);va(u,p)}return"string"===typeof p&&""!==p||"number"===typeof p||"bigint"===typeof p?(p=""+p,null!==d&&6===d.tag?(n(u,d.sibling),(h=a(d,p)).return=u,u=h):(n(u,d),(h=Bu(p,u.mode,h)).return=u,u=h),i(u)):n(u,d)}return function(e,t,n,r){try{ma=0;var a=b(e,t,n,r);return ha=null,a}catch(o){if(o===oa)throw o;var l=Fu(29,o,null,e.mode);return l.lanes=r,l.return=e,l}}}var Sa=wa(!0),ka=wa(!1),Ea=V(null),xa=V(0);function Ca(e,t){K(xa,e=ss),K(Ea,t),ss=e|t.baseLanes}function _a(){K(xa,ss),K(Ea,Ea.current)}function Ra(){ss=xa.current,Q(Ea),Q(xa)}var Pa=V(null),Ta=null;function Oa(e){var t=e.alternate;K(Aa,1&Aa.current),K(Pa,e),null===Ta&&(null===t||null!==Ea.current||null!==t.memoizedState)&&(Ta=e)}function Na(e){if(22===e.tag){if(K(Aa,Aa.current),K(Pa,e),null===Ta){var t=e.alternate;null!==t&&null!==t.memoizedState&&(Ta=e)}}else La()}function La(){K(Aa,Aa.current),K(Pa,Pa.current)}function za(e){Q(Pa),Ta===e&&(Ta=null),Q(Aa)}var Aa=V(0);function Fa(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Da="undefined"!==typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach((function(e){return e()}))}},ja=r.unstable_scheduleCallback,Ma=r.unstable_NormalPriority,Ua={$$typeof:g,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Ia(){return{controller:new Da,data:new Map,refCount:0}}function $a(e){e.refCount--,0===e.refCount&&ja(Ma,(function(){e.controller.abort()}))}var Ba=null,Ha=0,qa=0,Wa=null;function Va(){if(0===--Ha&&null!==Ba){null!==Wa&&(Wa.status="fulfilled");var e=Ba;Ba=null,qa=0,Wa=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Qa=O.S;O.S=function(e,t){"object"===typeof t&&null!==t&&"function"===typeof t.then&&function(e,t){if(null===Ba){var n=Ba=[];Ha=0,qa=Sc(),Wa={status:"pending",value:void 0,then:function(e){n.push(e)}}}Ha++,t.then(Va,Va)}(0,t),null!==Qa&&Qa(e,t)};var Ka=V(null);function Ya(){var e=Ka.current;return null!==e?e:ts.pooledCache}function Ja(e,t){K(Ka,null===t?Ka.current:t.pool)}function Xa(){var e=Ya();return null===e?null:{parent:Ua._currentValue,pool:e}}var Ga=0,Za=null,el=null,tl=null,nl=!1,rl=!1,al=!1,ll=0,ol=0,il=null,ul=0;function sl(){throw Error(o(321))}function cl(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Kn(e[n],t[n]))return!1;return!0}function fl(e,t,n,r,a,l){return Ga=l,Za=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,O.H=null===e||null===e.memoizedState?_o:Ro,al=!1,l=n(r,a),al=!1,rl&&(l=pl(t,n,r,a)),dl(e),l}function dl(e){O.H=Co;var t=null!==el&&null!==el.next;if(Ga=0,tl=el=Za=null,nl=!1,ol=0,il=null,t)throw Error(o(300));null===e||qo||null!==(e=e.dependencies)&&Ei(e)&&(qo=!0)}function pl(e,t,n,r){Za=e;var a=0;do{if(rl&&(il=null),ol=0,rl=!1,25<=a)throw Error(o(301));if(a+=1,tl=el=null,null!=e.updateQueue){var l=e.updateQueue;l.lastEffect=null,l.events=null,l.stores=null,null!=l.memoCache&&(l.memoCache.index=0)}O.H=Po,l=t(n,r)}while(rl);return l}function hl(){var e=O.H,t=e.useState()[0];return t="function"===typeof t.then?wl(t):t,e=e.useState()[0],(null!==el?el.memoizedState:null)!==e&&(Za.flags|=1024),t}function ml(){var e=0!==ll;return ll=0,e}function gl(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function yl(e){if(nl){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}nl=!1}Ga=0,tl=el=Za=null,rl=!1,ol=ll=0,il=null}function vl(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===tl?Za.memoizedState=tl=e:tl=tl.next=e,tl}function bl(){if(null===el){var e=Za.alternate;e=null!==e?e.memoizedState:null}else e=el.next;var t=null===tl?Za.memoizedState:tl.next;if(null!==t)tl=t,el=e;else{if(null===e){if(null===Za.alternate)throw Error(o(467));throw Error(o(310))}e={memoizedState:(el=e).memoizedState,baseState:el.baseState,baseQueue:el.baseQueue,queue:el.queue,next:null},null===tl?Za.memoizedState=tl=e:tl=tl.next=e}return tl}function wl(e){var t=ol;return ol+=1,null===il&&(il=[]),e=fa(il,e,t),t=Za,null===(null===tl?t.memoizedState:tl.next)&&(t=t.alternate,O.H=null===t||null===t.memoizedState?_o:Ro),e}function Sl(e){if(null!==e&&"object"===typeof e){if("function"===typeof e.then)return wl(e);if(e.$$typeof===g)return Ci(e)}throw Error(o(438,String(e)))}function kl(e){var t=null,n=Za.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=Za.alternate;null!==r&&(null!==(r=r.updateQueue)&&(null!=(r=r.memoCache)&&(t={data:r.data.map((function(e){return e.slice()})),index:0})))}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},Za.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=E;return t.index++,n}function El(e,t){return"function"===typeof t?t(e):t}function xl(e){return Cl(bl(),el,e)}function Cl(e,t,n){var r=e.queue;if(null===r)throw Error(o(311));r.lastRenderedReducer=n;var a=e.baseQueue,l=r.pending;if(null!==l){if(null!==a){var i=a.next;a.next=l.next,l.next=i}t.baseQueue=a=l,r.pending=null}if(l=e.baseState,null===a)e.memoizedState=l;else{var u=i=null,s=null,c=t=a.next,f=!1;do{var d=-536870913&c.lane;if(d!==c.lane?(rs&d)===d:(Ga&d)===d){var p=c.revertLane;if(0===p)null!==s&&(s=s.next={lane:0,revertLane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),d===qa&&(f=!0);else{if((Ga&p)===p){c=c.next,p===qa&&(f=!0);continue}d={lane:0,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===s?(u=s=d,i=l):s=s.next=d,Za.lanes|=p,fs|=p}d=c.action,al&&n(l,d),l=c.hasEagerState?c.eagerState:n(l,d)}else p={lane:d,revertLane:c.revertLane,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===s?(u=s=p,i=l):s=s.next=p,Za.lanes|=d,fs|=d;c=c.next}while(null!==c&&c!==t);if(null===s?i=l:s.next=u,!Kn(l,e.memoizedState)&&(qo=!0,f&&null!==(n=Wa)))throw n;e.memoizedState=l,e.baseState=i,e.baseQueue=s,r.lastRenderedState=l}return null===a&&(r.lanes=0),[e.memoizedState,r.dispatch]}function _l(e){var t=bl(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,a=n.pending,l=t.memoizedState;if(null!==a){n.pending=null;var i=a=a.next;do{l=e(l,i.action),i=i.next}while(i!==a);Kn(l,t.memoizedState)||(qo=!0),t.memoizedState=l,null===t.baseQueue&&(t.baseState=l),n.lastRenderedState=l}return[l,r]}function Rl(e,t,n){var r=Za,a=bl(),l=Jr;if(l){if(void 0===n)throw Error(o(407));n=n()}else n=t();var i=!Kn((el||a).memoizedState,n);if(i&&(a.memoizedState=n,qo=!0),a=a.queue,Gl(Ol.bind(null,r,a,e),[e]),a.getSnapshot!==t||i||null!==tl&&1&tl.memoizedState.tag){if(r.flags|=2048,Ql(9,Tl.bind(null,r,a,n,t),{destroy:void 0},null),null===ts)throw Error(o(349));l||0!==(60&Ga)||Pl(r,t,n)}return n}function Pl(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=Za.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},Za.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Tl(e,t,n,r){t.value=n,t.getSnapshot=r,Nl(t)&&Ll(e)}function Ol(e,t,n){return n((function(){Nl(t)&&Ll(e)}))}function Nl(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Kn(e,n)}catch(r){return!0}}function Ll(e){var t=Tr(e,2);null!==t&&Ls(t,e,2)}function zl(e){var t=vl();if("function"===typeof e){var n=e;if(e=n(),al){be(!0);try{n()}finally{be(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:El,lastRenderedState:e},t}function Al(e,t,n,r){return e.baseState=n,Cl(e,el,"function"===typeof r?r:El)}function Fl(e,t,n,r,a){if(ko(e))throw Error(o(485));if(null!==(e=t.action)){var l={payload:a,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){l.listeners.push(e)}};null!==O.T?n(!0):l.isTransition=!1,r(l),null===(n=t.pending)?(l.next=t.pending=l,Dl(t,l)):(l.next=n.next,t.pending=n.next=l)}}function Dl(e,t){var n=t.action,r=t.payload,a=e.state;if(t.isTransition){var l=O.T,o={};O.T=o;try{var i=n(a,r),u=O.S;null!==u&&u(o,i),jl(e,t,i)}catch(s){Ul(e,t,s)}finally{O.T=l}}else try{jl(e,t,l=n(a,r))}catch(c){Ul(e,t,c)}}function jl(e,t,n){null!==n&&"object"===typeof n&&"function"===typeof n.then?n.then((function(n){Ml(e,t,n)}),(function(n){return Ul(e,t,n)})):Ml(e,t,n)}function Ml(e,t,n){t.status="fulfilled",t.value=n,Il(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,Dl(e,n)))}function Ul(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,Il(t),t=t.next}while(t!==r)}e.action=null}function Il(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function $l(e,t){return t}function Bl(e,t){if(Jr){var n=ts.formState;if(null!==n){e:{var r=Za;if(Jr){if(Yr){t:{for(var a=Yr,l=Gr;8!==a.nodeType;){if(!l){a=null;break t}if(null===(a=uf(a.nextSibling))){a=null;break t}}a="F!"===(l=a.data)||"F"===l?a:null}if(a){Yr=uf(a.nextSibling),r="F!"===a.data;break e}}ea(r)}r=!1}r&&(t=n[0])}}return(n=vl()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:$l,lastRenderedState:t},n.queue=r,n=bo.bind(null,Za,r),r.dispatch=n,r=zl(!1),l=So.bind(null,Za,!1,r.queue),a={state:t,dispatch:null,action:e,pending:null},(r=vl()).queue=a,n=Fl.bind(null,Za,a,l,n),a.dispatch=n,r.memoizedState=e,[t,n,!1]}function Hl(e){return ql(bl(),el,e)}function ql(e,t,n){t=Cl(e,t,$l)[0],e=xl(El)[0],t="object"===typeof t&&null!==t&&"function"===typeof t.then?wl(t):t;var r=bl(),a=r.queue,l=a.dispatch;return n!==r.memoizedState&&(Za.flags|=2048,Ql(9,Wl.bind(null,a,n),{destroy:void 0},null)),[t,l,e]}function Wl(e,t){e.action=t}function Vl(e){var t=bl(),n=el;if(null!==n)return ql(t,n,e);bl(),t=t.memoizedState;var r=(n=bl()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function Ql(e,t,n,r){return e={tag:e,create:t,inst:n,deps:r,next:null},null===(t=Za.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},Za.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Kl(){return bl().memoizedState}function Yl(e,t,n,r){var a=vl();Za.flags|=e,a.memoizedState=Ql(1|t,n,{destroy:void 0},void 0===r?null:r)}function Jl(e,t,n,r){var a=bl();r=void 0===r?null:r;var l=a.memoizedState.inst;null!==el&&null!==r&&cl(r,el.memoizedState.deps)?a.memoizedState=Ql(t,n,l,r):(Za.flags|=e,a.memoizedState=Ql(1|t,n,l,r))}function Xl(e,t){Yl(8390656,8,e,t)}function Gl(e,t){Jl(2048,8,e,t)}function Zl(e,t){return Jl(4,2,e,t)}function eo(e,t){return Jl(4,4,e,t)}function to(e,t){if("function"===typeof t){e=e();var n=t(e);return function(){"function"===typeof n?n():t(null)}}if(null!==t&&void 0!==t)return e=e(),t.current=e,function(){t.current=null}}function no(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,Jl(4,4,to.bind(null,t,e),n)}function ro(){}function ao(e,t){var n=bl();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&cl(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function lo(e,t){var n=bl();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&cl(t,r[1]))return r[0];if(r=e(),al){be(!0);try{e()}finally{be(!1)}}return n.memoizedState=[r,t],r}function oo(e,t,n){return void 0===n||0!==(1073741824&Ga)?e.memoizedState=t:(e.memoizedState=n,e=Ns(),Za.lanes|=e,fs|=e,n)}function io(e,t,n,r){return Kn(n,t)?n:null!==Ea.current?(e=oo(e,n,r),Kn(e,t)||(qo=!0),e):0===(42&Ga)?(qo=!0,e.memoizedState=n):(e=Ns(),Za.lanes|=e,fs|=e,t)}function uo(e,t,n,r,a){var l=B.p;B.p=0!==l&&8>l?l:8;var o=O.T,i={};O.T=i,So(e,!1,t,n);try{var u=a(),s=O.S;if(null!==s&&s(i,u),null!==u&&"object"===typeof u&&"function"===typeof u.then)wo(e,t,function(e,t){var n=[],r={status:"pending",value:null,reason:null,then:function(e){n.push(e)}};return e.then((function(){r.status="fulfilled",r.value=t;for(var e=0;e<n.length;e++)(0,n[e])(t)}),(function(e){for(r.status="rejected",r.reason=e,e=0;e<n.length;e++)(0,n[e])(void 0)})),r}(u,r),Os());else wo(e,t,r,Os())}catch(c){wo(e,t,{then:function(){},status:"rejected",reason:c},Os())}finally{B.p=l,O.T=o}}function so(){}function co(e,t,n,r){if(5!==e.tag)throw Error(o(476));var a=fo(e).queue;uo(e,a,t,H,null===n?so:function(){return po(e),n(r)})}function fo(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:H,baseState:H,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:El,lastRenderedState:H},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:El,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function po(e){wo(e,fo(e).next.queue,{},Os())}function ho(){return Ci(jf)}function mo(){return bl().memoizedState}function go(){return bl().memoizedState}function yo(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Os(),r=Li(t,e=Ni(n),n);return null!==r&&(Ls(r,t,n),zi(r,t,n)),t={cache:Ia()},void(e.payload=t)}t=t.return}}function vo(e,t,n){var r=Os();n={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},ko(e)?Eo(t,n):null!==(n=Pr(e,t,n,r))&&(Ls(n,e,r),xo(n,t,r))}function bo(e,t,n){wo(e,t,n,Os())}function wo(e,t,n,r){var a={lane:r,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(ko(e))Eo(t,a);else{var l=e.alternate;if(0===e.lanes&&(null===l||0===l.lanes)&&null!==(l=t.lastRenderedReducer))try{var o=t.lastRenderedState,i=l(o,n);if(a.hasEagerState=!0,a.eagerState=i,Kn(i,o))return Rr(e,t,a,0),null===ts&&_r(),!1}catch(u){}if(null!==(n=Pr(e,t,a,r)))return Ls(n,e,r),xo(n,t,r),!0}return!1}function So(e,t,n,r){if(r={lane:2,revertLane:Sc(),action:r,hasEagerState:!1,eagerState:null,next:null},ko(e)){if(t)throw Error(o(479))}else null!==(t=Pr(e,n,r,2))&&Ls(t,e,2)}function ko(e){var t=e.alternate;return e===Za||null!==t&&t===Za}function Eo(e,t){rl=nl=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function xo(e,t,n){if(0!==(4194176&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ae(e,n)}}var Co={readContext:Ci,use:Sl,useCallback:sl,useContext:sl,useEffect:sl,useImperativeHandle:sl,useLayoutEffect:sl,useInsertionEffect:sl,useMemo:sl,useReducer:sl,useRef:sl,useState:sl,useDebugValue:sl,useDeferredValue:sl,useTransition:sl,useSyncExternalStore:sl,useId:sl};Co.useCacheRefresh=sl,Co.useMemoCache=sl,Co.useHostTransitionStatus=sl,Co.useFormState=sl,Co.useActionState=sl,Co.useOptimistic=sl;var _o={readContext:Ci,use:Sl,useCallback:function(e,t){return vl().memoizedState=[e,void 0===t?null:t],e},useContext:Ci,useEffect:Xl,useImperativeHandle:function(e,t,n){n=null!==n&&void 0!==n?n.concat([e]):null,Yl(4194308,4,to.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Yl(4194308,4,e,t)},useInsertionEffect:function(e,t){Yl(4,2,e,t)},useMemo:function(e,t){var n=vl();t=void 0===t?null:t;var r=e();if(al){be(!0);try{e()}finally{be(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=vl();if(void 0!==n){var a=n(t);if(al){be(!0);try{n(t)}finally{be(!1)}}}else a=t;return r.memoizedState=r.baseState=a,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:a},r.queue=e,e=e.dispatch=vo.bind(null,Za,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},vl().memoizedState=e},useState:function(e){var t=(e=zl(e)).queue,n=bo.bind(null,Za,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:ro,useDeferredValue:function(e,t){return oo(vl(),e,t)},useTransition:function(){var e=zl(!1);return e=uo.bind(null,Za,e.queue,!0,!1),vl().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=Za,a=vl();if(Jr){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===ts)throw Error(o(349));0!==(60&rs)||Pl(r,t,n)}a.memoizedState=n;var l={value:n,getSnapshot:t};return a.queue=l,Xl(Ol.bind(null,r,l,e),[e]),r.flags|=2048,Ql(9,Tl.bind(null,r,l,n,t),{destroy:void 0},null),n},useId:function(){var e=vl(),t=ts.identifierPrefix;if(Jr){var n=Hr;t=":"+t+"R"+(n=(Br&~(1<<32-we(Br)-1)).toString(32)+n),0<(n=ll++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=ul++).toString(32)+":";return e.memoizedState=t},useCacheRefresh:function(){return vl().memoizedState=yo.bind(null,Za)}};_o.useMemoCache=kl,_o.useHostTransitionStatus=ho,_o.useFormState=Bl,_o.useActionState=Bl,_o.useOptimistic=function(e){var t=vl();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=So.bind(null,Za,!0,n),n.dispatch=t,[e,t]};var Ro={readContext:Ci,use:Sl,useCallback:ao,useContext:Ci,useEffect:Gl,useImperativeHandle:no,useInsertionEffect:Zl,useLayoutEffect:eo,useMemo:lo,useReducer:xl,useRef:Kl,useState:function(){return xl(El)},useDebugValue:ro,useDeferredValue:function(e,t){return io(bl(),el.memoizedState,e,t)},useTransition:function(){var e=xl(El)[0],t=bl().memoizedState;return["boolean"===typeof e?e:wl(e),t]},useSyncExternalStore:Rl,useId:mo};Ro.useCacheRefresh=go,Ro.useMemoCache=kl,Ro.useHostTransitionStatus=ho,Ro.useFormState=Hl,Ro.useActionState=Hl,Ro.useOptimistic=function(e,t){return Al(bl(),0,e,t)};var Po={readContext:Ci,use:Sl,useCallback:ao,useContext:Ci,useEffect:Gl,useImperativeHandle:no,useInsertionEffect:Zl,useLayoutEffect:eo,useMemo:lo,useReducer:_l,useRef:Kl,useState:function(){return _l(El)},useDebugValue:ro,useDeferredValue:function(e,t){var n=bl();return null===el?oo(n,e,t):io(n,el.memoizedState,e,t)},useTransition:function(){var e=_l(El)[0],t=bl().memoizedState;return["boolean"===typeof e?e:wl(e),t]},useSyncExternalStore:Rl,useId:mo};function To(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:N({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}Po.useCacheRefresh=go,Po.useMemoCache=kl,Po.useHostTransitionStatus=ho,Po.useFormState=Vl,Po.useActionState=Vl,Po.useOptimistic=function(e,t){var n=bl();return null!==el?Al(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])};var Oo={isMounted:function(e){return!!(e=e._reactInternals)&&j(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Os(),a=Ni(r);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=Li(e,a,r))&&(Ls(t,e,r),zi(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Os(),a=Ni(r);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=Li(e,a,r))&&(Ls(t,e,r),zi(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Os(),r=Ni(n);r.tag=2,void 0!==t&&null!==t&&(r.callback=t),null!==(t=Li(e,r,n))&&(Ls(t,e,n),zi(t,e,n))}};function No(e,t,n,r,a,l,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,l,o):!t.prototype||!t.prototype.isPureReactComponent||(!Yn(n,r)||!Yn(a,l))}function Lo(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Oo.enqueueReplaceState(t,t.state,null)}function zo(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var a in n===t&&(n=N({},n)),e)void 0===n[a]&&(n[a]=e[a]);return n}var Ao="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function Fo(e){Ao(e)}function Do(e){console.error(e)}function jo(e){Ao(e)}function Mo(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(n){setTimeout((function(){throw n}))}}function Uo(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(r){setTimeout((function(){throw r}))}}function Io(e,t,n){return(n=Ni(n)).tag=3,n.payload={element:null},n.callback=function(){Mo(e,t)},n}function $o(e){return(e=Ni(e)).tag=3,e}function Bo(e,t,n,r){var a=n.type.getDerivedStateFromError;if("function"===typeof a){var l=r.value;e.payload=function(){return a(l)},e.callback=function(){Uo(t,n,r)}}var o=n.stateNode;null!==o&&"function"===typeof o.componentDidCatch&&(e.callback=function(){Uo(t,n,r),"function"!==typeof a&&(null===ks?ks=new Set([this]):ks.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var Ho=Error(o(461)),qo=!1;function Wo(e,t,n,r){t.child=null===e?ka(t,null,n,r):Sa(t,e.child,n,r)}function Vo(e,t,n,r,a){n=n.render;var l=t.ref;if("ref"in r){var o={};for(var i in r)"ref"!==i&&(o[i]=r[i])}else o=r;return xi(t),r=fl(e,t,n,o,l,a),i=ml(),null===e||qo?(Jr&&i&&Vr(t),t.flags|=1,Wo(e,t,r,a),t.child):(gl(e,t,a),di(e,t,a))}function Qo(e,t,n,r,a){if(null===e){var l=n.type;return"function"!==typeof l||Du(l)||void 0!==l.defaultProps||null!==n.compare?((e=Uu(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=l,Ko(e,t,l,r,a))}if(l=e.child,!pi(e,a)){var o=l.memoizedProps;if((n=null!==(n=n.compare)?n:Yn)(o,r)&&e.ref===t.ref)return di(e,t,a)}return t.flags|=1,(e=ju(l,r)).ref=t.ref,e.return=t,t.child=e}function Ko(e,t,n,r,a){if(null!==e){var l=e.memoizedProps;if(Yn(l,r)&&e.ref===t.ref){if(qo=!1,t.pendingProps=r=l,!pi(e,a))return t.lanes=e.lanes,di(e,t,a);0!==(131072&e.flags)&&(qo=!0)}}return Go(e,t,n,r,a)}function Yo(e,t,n){var r=t.pendingProps,a=r.children,l=0!==(2&t.stateNode._pendingVisibility),o=null!==e?e.memoizedState:null;if(Xo(e,t),"hidden"===r.mode||l){if(0!==(128&t.flags)){if(r=null!==o?o.baseLanes|n:n,null!==e){for(a=t.child=e.child,l=0;null!==a;)l=l|a.lanes|a.childLanes,a=a.sibling;t.childLanes=l&~r}else t.childLanes=0,t.child=null;return Jo(e,t,r,n)}if(0===(536870912&n))return t.lanes=t.childLanes=536870912,Jo(e,t,null!==o?o.baseLanes|n:n,n);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Ja(0,null!==o?o.cachePool:null),null!==o?Ca(t,o):_a(),Na(t)}else null!==o?(Ja(0,o.cachePool),Ca(t,o),La(),t.memoizedState=null):(null!==e&&Ja(0,null),_a(),La());return Wo(e,t,a,n),t.child}function Jo(e,t,n,r){var a=Ya();return a=null===a?null:{parent:Ua._currentValue,pool:a},t.memoizedState={baseLanes:n,cachePool:a},null!==e&&Ja(0,null),_a(),Na(t),null!==e&&ki(e,t,r,!0),null}function Xo(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=2097664);else{if("function"!==typeof n&&"object"!==typeof n)throw Error(o(284));null!==e&&e.ref===n||(t.flags|=2097664)}}function Go(e,t,n,r,a){return xi(t),n=fl(e,t,n,r,void 0,a),r=ml(),null===e||qo?(Jr&&r&&Vr(t),t.flags|=1,Wo(e,t,n,a),t.child):(gl(e,t,a),di(e,t,a))}function Zo(e,t,n,r,a,l){return xi(t),t.updateQueue=null,n=pl(t,r,n,a),dl(e),r=ml(),null===e||qo?(Jr&&r&&Vr(t),t.flags|=1,Wo(e,t,n,l),t.child):(gl(e,t,l),di(e,t,l))}function ei(e,t,n,r,a){if(xi(t),null===t.stateNode){var l=Lr,o=n.contextType;"object"===typeof o&&null!==o&&(l=Ci(o)),l=new n(r,l),t.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,l.updater=Oo,t.stateNode=l,l._reactInternals=t,(l=t.stateNode).props=r,l.state=t.memoizedState,l.refs={},Ti(t),o=n.contextType,l.context="object"===typeof o&&null!==o?Ci(o):Lr,l.state=t.memoizedState,"function"===typeof(o=n.getDerivedStateFromProps)&&(To(t,n,o,r),l.state=t.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(o=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),o!==l.state&&Oo.enqueueReplaceState(l,l.state,null),ji(t,r,l,a),Di(),l.state=t.memoizedState),"function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){l=t.stateNode;var i=t.memoizedProps,u=zo(n,i);l.props=u;var s=l.context,c=n.contextType;o=Lr,"object"===typeof c&&null!==c&&(o=Ci(c));var f=n.getDerivedStateFromProps;c="function"===typeof f||"function"===typeof l.getSnapshotBeforeUpdate,i=t.pendingProps!==i,c||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(i||s!==o)&&Lo(t,l,r,o),Pi=!1;var d=t.memoizedState;l.state=d,ji(t,r,l,a),Di(),s=t.memoizedState,i||d!==s||Pi?("function"===typeof f&&(To(t,n,f,r),s=t.memoizedState),(u=Pi||No(t,n,u,r,d,s,o))?(c||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||("function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount()),"function"===typeof l.componentDidMount&&(t.flags|=4194308)):("function"===typeof l.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),l.props=r,l.state=s,l.context=o,r=u):("function"===typeof l.componentDidMount&&(t.flags|=4194308),r=!1)}else{l=t.stateNode,Oi(e,t),c=zo(n,o=t.memoizedProps),l.props=c,f=t.pendingProps,d=l.context,s=n.contextType,u=Lr,"object"===typeof s&&null!==s&&(u=Ci(s)),(s="function"===typeof(i=n.getDerivedStateFromProps)||"function"===typeof l.getSnapshotBeforeUpdate)||"function"!==typeof l.UNSAFE_componentWillReceiveProps&&"function"!==typeof l.componentWillReceiveProps||(o!==f||d!==u)&&Lo(t,l,r,u),Pi=!1,d=t.memoizedState,l.state=d,ji(t,r,l,a),Di();var p=t.memoizedState;o!==f||d!==p||Pi||null!==e&&null!==e.dependencies&&Ei(e.dependencies)?("function"===typeof i&&(To(t,n,i,r),p=t.memoizedState),(c=Pi||No(t,n,c,r,d,p,u)||null!==e&&null!==e.dependencies&&Ei(e.dependencies))?(s||"function"!==typeof l.UNSAFE_componentWillUpdate&&"function"!==typeof l.componentWillUpdate||("function"===typeof l.componentWillUpdate&&l.componentWillUpdate(r,p,u),"function"===typeof l.UNSAFE_componentWillUpdate&&l.UNSAFE_componentWillUpdate(r,p,u)),"function"===typeof l.componentDidUpdate&&(t.flags|=4),"function"===typeof l.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),l.props=r,l.state=p,l.context=u,r=c):("function"!==typeof l.componentDidUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof l.getSnapshotBeforeUpdate||o===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return l=r,Xo(e,t),r=0!==(128&t.flags),l||r?(l=t.stateNode,n=r&&"function"!==typeof n.getDerivedStateFromError?null:l.render(),t.flags|=1,null!==e&&r?(t.child=Sa(t,e.child,null,a),t.child=Sa(t,null,n,a)):Wo(e,t,n,a),t.memoizedState=l.state,e=t.child):e=di(e,t,a),e}function ti(e,t,n,r){return aa(),t.flags|=256,Wo(e,t,n,r),t.child}var ni={dehydrated:null,treeContext:null,retryLane:0};function ri(e){return{baseLanes:e,cachePool:Xa()}}function ai(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=hs),e}function li(e,t,n){var r,a=t.pendingProps,l=!1,i=0!==(128&t.flags);if((r=i)||(r=(null===e||null!==e.memoizedState)&&0!==(2&Aa.current)),r&&(l=!0,t.flags&=-129),r=0!==(32&t.flags),t.flags&=-33,null===e){if(Jr){if(l?Oa(t):La(),Jr){var u,s=Yr;if(u=s){e:{for(u=s,s=Gr;8!==u.nodeType;){if(!s){s=null;break e}if(null===(u=uf(u.nextSibling))){s=null;break e}}s=u}null!==s?(t.memoizedState={dehydrated:s,treeContext:null!==$r?{id:Br,overflow:Hr}:null,retryLane:536870912},(u=Fu(18,null,null,0)).stateNode=s,u.return=t,t.child=u,Kr=t,Yr=null,u=!0):u=!1}u||ea(t)}if(null!==(s=t.memoizedState)&&null!==(s=s.dehydrated))return"$!"===s.data?t.lanes=16:t.lanes=536870912,null;za(t)}return s=a.children,a=a.fallback,l?(La(),s=ii({mode:"hidden",children:s},l=t.mode),a=Iu(a,l,n,null),s.return=t,a.return=t,s.sibling=a,t.child=s,(l=t.child).memoizedState=ri(n),l.childLanes=ai(e,r,n),t.memoizedState=ni,a):(Oa(t),oi(t,s))}if(null!==(u=e.memoizedState)&&null!==(s=u.dehydrated)){if(i)256&t.flags?(Oa(t),t.flags&=-257,t=ui(e,t,n)):null!==t.memoizedState?(La(),t.child=e.child,t.flags|=128,t=null):(La(),l=a.fallback,s=t.mode,a=ii({mode:"visible",children:a.children},s),(l=Iu(l,s,n,null)).flags|=2,a.return=t,l.return=t,a.sibling=l,t.child=a,Sa(t,e.child,null,n),(a=t.child).memoizedState=ri(n),a.childLanes=ai(e,r,n),t.memoizedState=ni,t=l);else if(Oa(t),"$!"===s.data){if(r=s.nextSibling&&s.nextSibling.dataset)var c=r.dgst;r=c,(a=Error(o(419))).stack="",a.digest=r,la({value:a,source:null,stack:null}),t=ui(e,t,n)}else if(qo||ki(e,t,n,!1),r=0!==(n&e.childLanes),qo||r){if(null!==(r=ts)){if(0!==(42&(a=n&-n)))a=1;else switch(a){case 2:a=1;break;case 8:a=4;break;case 32:a=16;break;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:a=64;break;case 268435456:a=134217728;break;default:a=0}if(0!==(a=0!==(a&(r.suspendedLanes|n))?0:a)&&a!==u.retryLane)throw u.retryLane=a,Tr(e,a),Ls(r,e,a),Ho}"$?"===s.data||qs(),t=ui(e,t,n)}else"$?"===s.data?(t.flags|=128,t.child=e.child,t=ic.bind(null,e),s._reactRetry=t,t=null):(e=u.treeContext,Yr=uf(s.nextSibling),Kr=t,Jr=!0,Xr=null,Gr=!1,null!==e&&(Ur[Ir++]=Br,Ur[Ir++]=Hr,Ur[Ir++]=$r,Br=e.id,Hr=e.overflow,$r=t),(t=oi(t,a.children)).flags|=4096);return t}return l?(La(),l=a.fallback,s=t.mode,c=(u=e.child).sibling,(a=ju(u,{mode:"hidden",children:a.children})).subtreeFlags=31457280&u.subtreeFlags,null!==c?l=ju(c,l):(l=Iu(l,s,n,null)).flags|=2,l.return=t,a.return=t,a.sibling=l,t.child=a,a=l,l=t.child,null===(s=e.child.memoizedState)?s=ri(n):(null!==(u=s.cachePool)?(c=Ua._currentValue,u=u.parent!==c?{parent:c,pool:c}:u):u=Xa(),s={baseLanes:s.baseLanes|n,cachePool:u}),l.memoizedState=s,l.childLanes=ai(e,r,n),t.memoizedState=ni,a):(Oa(t),e=(n=e.child).sibling,(n=ju(n,{mode:"visible",children:a.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function oi(e,t){return(t=ii({mode:"visible",children:t},e.mode)).return=e,e.child=t}function ii(e,t){return $u(e,t,0,null)}function ui(e,t,n){return Sa(t,e.child,null,n),(e=oi(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function si(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),wi(e.return,t,n)}function ci(e,t,n,r,a){var l=e.memoizedState;null===l?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:a}:(l.isBackwards=t,l.rendering=null,l.renderingStartTime=0,l.last=r,l.tail=n,l.tailMode=a)}function fi(e,t,n){var r=t.pendingProps,a=r.revealOrder,l=r.tail;if(Wo(e,t,r.children,n),0!==(2&(r=Aa.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&si(e,n,t);else if(19===e.tag)si(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}switch(K(Aa,r),a){case"forwards":for(n=t.child,a=null;null!==n;)null!==(e=n.alternate)&&null===Fa(e)&&(a=n),n=n.sibling;null===(n=a)?(a=t.child,t.child=null):(a=n.sibling,n.sibling=null),ci(t,!1,a,n,l);break;case"backwards":for(n=null,a=t.child,t.child=null;null!==a;){if(null!==(e=a.alternate)&&null===Fa(e)){t.child=a;break}e=a.sibling,a.sibling=n,n=a,a=e}ci(t,!0,n,null,l);break;case"together":ci(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function di(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),fs|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(ki(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=ju(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=ju(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function pi(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Ei(e))}function hi(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)qo=!0;else{if(!pi(e,n)&&0===(128&t.flags))return qo=!1,function(e,t,n){switch(t.tag){case 3:Z(t,t.stateNode.containerInfo),vi(t,Ua,e.memoizedState.cache),aa();break;case 27:case 5:te(t);break;case 4:Z(t,t.stateNode.containerInfo);break;case 10:vi(t,t.type,t.memoizedProps.value);break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(Oa(t),t.flags|=128,null):0!==(n&t.child.childLanes)?li(e,t,n):(Oa(t),null!==(e=di(e,t,n))?e.sibling:null);Oa(t);break;case 19:var a=0!==(128&e.flags);if((r=0!==(n&t.childLanes))||(ki(e,t,n,!1),r=0!==(n&t.childLanes)),a){if(r)return fi(e,t,n);t.flags|=128}if(null!==(a=t.memoizedState)&&(a.rendering=null,a.tail=null,a.lastEffect=null),K(Aa,Aa.current),r)break;return null;case 22:case 23:return t.lanes=0,Yo(e,t,n);case 24:vi(t,Ua,e.memoizedState.cache)}return di(e,t,n)}(e,t,n);qo=0!==(131072&e.flags)}else qo=!1,Jr&&0!==(1048576&t.flags)&&Wr(t,Mr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var r=t.elementType,a=r._init;if(r=a(r._payload),t.type=r,"function"!==typeof r){if(void 0!==r&&null!==r){if((a=r.$$typeof)===y){t.tag=11,t=Vo(null,t,r,e,n);break e}if(a===w){t.tag=14,t=Qo(null,t,r,e,n);break e}}throw t=R(r)||r,Error(o(306,t,""))}Du(r)?(e=zo(r,e),t.tag=1,t=ei(null,t,r,e,n)):(t.tag=0,t=Go(null,t,r,e,n))}return t;case 0:return Go(e,t,t.type,t.pendingProps,n);case 1:return ei(e,t,r=t.type,a=zo(r,t.pendingProps),n);case 3:e:{if(Z(t,t.stateNode.containerInfo),null===e)throw Error(o(387));var l=t.pendingProps;r=(a=t.memoizedState).element,Oi(e,t),ji(t,l,null,n);var i=t.memoizedState;if(l=i.cache,vi(t,Ua,l),l!==a.cache&&Si(t,[Ua],n,!0),Di(),l=i.element,a.isDehydrated){if(a={element:l,isDehydrated:!1,cache:i.cache},t.updateQueue.baseState=a,t.memoizedState=a,256&t.flags){t=ti(e,t,l,n);break e}if(l!==r){la(r=Ar(Error(o(424)),t)),t=ti(e,t,l,n);break e}for(Yr=uf(t.stateNode.containerInfo.firstChild),Kr=t,Jr=!0,Xr=null,Gr=!0,n=ka(t,null,l,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(aa(),l===r){t=di(e,t,n);break e}Wo(e,t,l,n)}t=t.child}return t;case 26:return Xo(e,t),null===e?(n=yf(t.type,null,t.pendingProps,null))?t.memoizedState=n:Jr||(n=t.type,e=t.pendingProps,(r=Yc(X.current).createElement(n))[Me]=t,r[Ue]=e,Vc(r,n,e),Xe(r),t.stateNode=r):t.memoizedState=yf(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return te(t),null===e&&Jr&&(r=t.stateNode=cf(t.type,t.pendingProps,X.current),Kr=t,Gr=!0,Yr=uf(r.firstChild)),r=t.pendingProps.children,null!==e||Jr?Wo(e,t,r,n):t.child=Sa(t,null,r,n),Xo(e,t),t.child;case 5:return null===e&&Jr&&((a=r=Yr)&&(null!==(r=function(e,t,n,r){for(;1===e.nodeType;){var a=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[We])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(l=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(l!==a.rel||e.getAttribute("href")!==(null==a.href?null:a.href)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin)||e.getAttribute("title")!==(null==a.title?null:a.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((l=e.getAttribute("src"))!==(null==a.src?null:a.src)||e.getAttribute("type")!==(null==a.type?null:a.type)||e.getAttribute("crossorigin")!==(null==a.crossOrigin?null:a.crossOrigin))&&l&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var l=null==a.name?null:""+a.name;if("hidden"===a.type&&e.getAttribute("name")===l)return e}if(null===(e=uf(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,Gr))?(t.stateNode=r,Kr=t,Yr=uf(r.firstChild),Gr=!1,a=!0):a=!1),a||ea(t)),te(t),a=t.type,l=t.pendingProps,i=null!==e?e.memoizedProps:null,r=l.children,Gc(a,l)?r=null:null!==i&&Gc(a,i)&&(t.flags|=32),null!==t.memoizedState&&(a=fl(e,t,hl,null,null,n),jf._currentValue=a),Xo(e,t),Wo(e,t,r,n),t.child;case 6:return null===e&&Jr&&((e=n=Yr)&&(null!==(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=uf(e.nextSibling)))return null}return e}(n,t.pendingProps,Gr))?(t.stateNode=n,Kr=t,Yr=null,e=!0):e=!1),e||ea(t)),null;case 13:return li(e,t,n);case 4:return Z(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Sa(t,null,r,n):Wo(e,t,r,n),t.child;case 11:return Vo(e,t,t.type,t.pendingProps,n);case 7:return Wo(e,t,t.pendingProps,n),t.child;case 8:case 12:return Wo(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,vi(t,t.type,r.value),Wo(e,t,r.children,n),t.child;case 9:return a=t.type._context,r=t.pendingProps.children,xi(t),r=r(a=Ci(a)),t.flags|=1,Wo(e,t,r,n),t.child;case 14:return Qo(e,t,t.type,t.pendingProps,n);case 15:return Ko(e,t,t.type,t.pendingProps,n);case 19:return fi(e,t,n);case 22:return Yo(e,t,n);case 24:return xi(t),r=Ci(Ua),null===e?(null===(a=Ya())&&(a=ts,l=Ia(),a.pooledCache=l,l.refCount++,null!==l&&(a.pooledCacheLanes|=n),a=l),t.memoizedState={parent:r,cache:a},Ti(t),vi(t,Ua,a)):(0!==(e.lanes&n)&&(Oi(e,t),ji(t,null,null,n),Di()),a=e.memoizedState,l=t.memoizedState,a.parent!==r?(a={parent:r,cache:r},t.memoizedState=a,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=a),vi(t,Ua,r)):(r=l.cache,vi(t,Ua,r),r!==a.cache&&Si(t,[Ua],n,!0))),Wo(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(o(156,t.tag))}var mi=V(null),gi=null,yi=null;function vi(e,t,n){K(mi,t._currentValue),t._currentValue=n}function bi(e){e._currentValue=mi.current,Q(mi)}function wi(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Si(e,t,n,r){var a=e.child;for(null!==a&&(a.return=e);null!==a;){var l=a.dependencies;if(null!==l){var i=a.child;l=l.firstContext;e:for(;null!==l;){var u=l;l=a;for(var s=0;s<t.length;s++)if(u.context===t[s]){l.lanes|=n,null!==(u=l.alternate)&&(u.lanes|=n),wi(l.return,n,e),r||(i=null);break e}l=u.next}}else if(18===a.tag){if(null===(i=a.return))throw Error(o(341));i.lanes|=n,null!==(l=i.alternate)&&(l.lanes|=n),wi(i,n,e),i=null}else i=a.child;if(null!==i)i.return=a;else for(i=a;null!==i;){if(i===e){i=null;break}if(null!==(a=i.sibling)){a.return=i.return,i=a;break}i=i.return}a=i}}function ki(e,t,n,r){e=null;for(var a=t,l=!1;null!==a;){if(!l)if(0!==(524288&a.flags))l=!0;else if(0!==(262144&a.flags))break;if(10===a.tag){var i=a.alternate;if(null===i)throw Error(o(387));if(null!==(i=i.memoizedProps)){var u=a.type;Kn(a.pendingProps.value,i.value)||(null!==e?e.push(u):e=[u])}}else if(a===G.current){if(null===(i=a.alternate))throw Error(o(387));i.memoizedState.memoizedState!==a.memoizedState.memoizedState&&(null!==e?e.push(jf):e=[jf])}a=a.return}null!==e&&Si(t,e,n,r),t.flags|=262144}function Ei(e){for(e=e.firstContext;null!==e;){if(!Kn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function xi(e){gi=e,yi=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Ci(e){return Ri(gi,e)}function _i(e,t){return null===gi&&xi(e),Ri(e,t)}function Ri(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===yi){if(null===e)throw Error(o(308));yi=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else yi=yi.next=t;return n}var Pi=!1;function Ti(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Oi(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function Ni(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function Li(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&es)){var a=r.pending;return null===a?t.next=t:(t.next=a.next,a.next=t),r.pending=t,t=Nr(e),Or(e,null,n),t}return Rr(e,r,t,n),Nr(e)}function zi(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194176&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Ae(e,n)}}function Ai(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var a=null,l=null;if(null!==(n=n.firstBaseUpdate)){do{var o={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===l?a=l=o:l=l.next=o,n=n.next}while(null!==n);null===l?a=l=t:l=l.next=t}else a=l=t;return n={baseState:r.baseState,firstBaseUpdate:a,lastBaseUpdate:l,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var Fi=!1;function Di(){if(Fi){if(null!==Wa)throw Wa}}function ji(e,t,n,r){Fi=!1;var a=e.updateQueue;Pi=!1;var l=a.firstBaseUpdate,o=a.lastBaseUpdate,i=a.shared.pending;if(null!==i){a.shared.pending=null;var u=i,s=u.next;u.next=null,null===o?l=s:o.next=s,o=u;var c=e.alternate;null!==c&&((i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=s:i.next=s,c.lastBaseUpdate=u))}if(null!==l){var f=a.baseState;for(o=0,c=s=u=null,i=l;;){var d=-536870913&i.lane,p=d!==i.lane;if(p?(rs&d)===d:(r&d)===d){0!==d&&d===qa&&(Fi=!0),null!==c&&(c=c.next={lane:0,tag:i.tag,payload:i.payload,callback:null,next:null});e:{var h=e,m=i;d=t;var g=n;switch(m.tag){case 1:if("function"===typeof(h=m.payload)){f=h.call(g,f,d);break e}f=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null===(d="function"===typeof(h=m.payload)?h.call(g,f,d):h)||void 0===d)break e;f=N({},f,d);break e;case 2:Pi=!0}}null!==(d=i.callback)&&(e.flags|=64,p&&(e.flags|=8192),null===(p=a.callbacks)?a.callbacks=[d]:p.push(d))}else p={lane:d,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(s=c=p,u=f):c=c.next=p,o|=d;if(null===(i=i.next)){if(null===(i=a.shared.pending))break;i=(p=i).next,p.next=null,a.lastBaseUpdate=p,a.shared.pending=null}}null===c&&(u=f),a.baseState=u,a.firstBaseUpdate=s,a.lastBaseUpdate=c,null===l&&(a.shared.lanes=0),fs|=o,e.lanes=o,e.memoizedState=f}}function Mi(e,t){if("function"!==typeof e)throw Error(o(191,e));e.call(t)}function Ui(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)Mi(n[e],t)}function Ii(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var a=r.next;n=a;do{if((n.tag&e)===e){r=void 0;var l=n.create,o=n.inst;r=l(),o.destroy=r}n=n.next}while(n!==a)}}catch(i){rc(t,t.return,i)}}function $i(e,t,n){try{var r=t.updateQueue,a=null!==r?r.lastEffect:null;if(null!==a){var l=a.next;r=l;do{if((r.tag&e)===e){var o=r.inst,i=o.destroy;if(void 0!==i){o.destroy=void 0,a=t;var u=n;try{i()}catch(s){rc(a,u,s)}}}r=r.next}while(r!==l)}}catch(s){rc(t,t.return,s)}}function Bi(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{Ui(t,n)}catch(r){rc(e,e.return,r)}}}function Hi(e,t,n){n.props=zo(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(r){rc(e,t,r)}}function qi(e,t){try{var n=e.ref;if(null!==n){var r=e.stateNode;switch(e.tag){case 26:case 27:case 5:var a=r;break;default:a=r}"function"===typeof n?e.refCleanup=n(a):n.current=a}}catch(l){rc(e,t,l)}}function Wi(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"===typeof r)try{r()}catch(a){rc(e,t,a)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"===typeof n)try{n(null)}catch(l){rc(e,t,l)}else n.current=null}function Vi(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(a){rc(e,e.return,a)}}function Qi(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var a=null,l=null,i=null,u=null,s=null,c=null,f=null;for(h in n){var d=n[h];if(n.hasOwnProperty(h)&&null!=d)switch(h){case"checked":case"value":break;case"defaultValue":s=d;default:r.hasOwnProperty(h)||qc(e,t,h,null,r,d)}}for(var p in r){var h=r[p];if(d=n[p],r.hasOwnProperty(p)&&(null!=h||null!=d))switch(p){case"type":l=h;break;case"name":a=h;break;case"checked":c=h;break;case"defaultChecked":f=h;break;case"value":i=h;break;case"defaultValue":u=h;break;case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(o(137,t));break;default:h!==d&&qc(e,t,p,h,r,d)}}return void gt(e,i,u,s,c,f,l,a);case"select":for(l in h=i=u=p=null,n)if(s=n[l],n.hasOwnProperty(l)&&null!=s)switch(l){case"value":break;case"multiple":h=s;default:r.hasOwnProperty(l)||qc(e,t,l,null,r,s)}for(a in r)if(l=r[a],s=n[a],r.hasOwnProperty(a)&&(null!=l||null!=s))switch(a){case"value":p=l;break;case"defaultValue":u=l;break;case"multiple":i=l;default:l!==s&&qc(e,t,a,l,r,s)}return t=u,n=i,r=h,void(null!=p?bt(e,!!n,p,!1):!!r!==!!n&&(null!=t?bt(e,!!n,t,!0):bt(e,!!n,n?[]:"",!1)));case"textarea":for(u in h=p=null,n)if(a=n[u],n.hasOwnProperty(u)&&null!=a&&!r.hasOwnProperty(u))switch(u){case"value":case"children":break;default:qc(e,t,u,null,r,a)}for(i in r)if(a=r[i],l=n[i],r.hasOwnProperty(i)&&(null!=a||null!=l))switch(i){case"value":p=a;break;case"defaultValue":h=a;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=a)throw Error(o(91));break;default:a!==l&&qc(e,t,i,a,r,l)}return void wt(e,p,h);case"option":for(var m in n)if(p=n[m],n.hasOwnProperty(m)&&null!=p&&!r.hasOwnProperty(m))if("selected"===m)e.selected=!1;else qc(e,t,m,null,r,p);for(s in r)if(p=r[s],h=n[s],r.hasOwnProperty(s)&&p!==h&&(null!=p||null!=h))if("selected"===s)e.selected=p&&"function"!==typeof p&&"symbol"!==typeof p;else qc(e,t,s,p,r,h);return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var g in n)p=n[g],n.hasOwnProperty(g)&&null!=p&&!r.hasOwnProperty(g)&&qc(e,t,g,null,r,p);for(c in r)if(p=r[c],h=n[c],r.hasOwnProperty(c)&&p!==h&&(null!=p||null!=h))switch(c){case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(o(137,t));break;default:qc(e,t,c,p,r,h)}return;default:if(_t(t)){for(var y in n)p=n[y],n.hasOwnProperty(y)&&void 0!==p&&!r.hasOwnProperty(y)&&Wc(e,t,y,void 0,r,p);for(f in r)p=r[f],h=n[f],!r.hasOwnProperty(f)||p===h||void 0===p&&void 0===h||Wc(e,t,f,p,r,h);return}}for(var v in n)p=n[v],n.hasOwnProperty(v)&&null!=p&&!r.hasOwnProperty(v)&&qc(e,t,v,null,r,p);for(d in r)p=r[d],h=n[d],!r.hasOwnProperty(d)||p===h||null==p&&null==h||qc(e,t,d,p,r,h)}(r,e.type,n,t),r[Ue]=t}catch(a){rc(e,e.return,a)}}function Ki(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag||4===e.tag}function Yi(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||Ki(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&27!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function Ji(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Hc));else if(4!==r&&27!==r&&null!==(e=e.child))for(Ji(e,t,n),e=e.sibling;null!==e;)Ji(e,t,n),e=e.sibling}function Xi(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&27!==r&&null!==(e=e.child))for(Xi(e,t,n),e=e.sibling;null!==e;)Xi(e,t,n),e=e.sibling}var Gi=!1,Zi=!1,eu=!1,tu="function"===typeof WeakSet?WeakSet:Set,nu=null,ru=!1;function au(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:yu(e,n),4&r&&Ii(5,n);break;case 1:if(yu(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(i){rc(n,n.return,i)}else{var a=zo(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(a,t,e.__reactInternalSnapshotBeforeUpdate)}catch(u){rc(n,n.return,u)}}64&r&&Bi(n),512&r&&qi(n,n.return);break;case 3:if(yu(e,n),64&r&&null!==(r=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:e=n.child.stateNode}try{Ui(r,e)}catch(i){rc(n,n.return,i)}}break;case 26:yu(e,n),512&r&&qi(n,n.return);break;case 27:case 5:yu(e,n),null===t&&4&r&&Vi(n),512&r&&qi(n,n.return);break;case 12:default:yu(e,n);break;case 13:yu(e,n),4&r&&cu(e,n);break;case 22:if(!(a=null!==n.memoizedState||Gi)){t=null!==t&&null!==t.memoizedState||Zi;var l=Gi,o=Zi;Gi=a,(Zi=t)&&!o?bu(e,n,0!==(8772&n.subtreeFlags)):yu(e,n),Gi=l,Zi=o}512&r&&("manual"===n.memoizedProps.mode?qi(n,n.return):Wi(n,n.return))}}function lu(e){var t=e.alternate;null!==t&&(e.alternate=null,lu(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&Ve(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var ou=null,iu=!1;function uu(e,t,n){for(n=n.child;null!==n;)su(e,t,n),n=n.sibling}function su(e,t,n){if(ve&&"function"===typeof ve.onCommitFiberUnmount)try{ve.onCommitFiberUnmount(ye,n)}catch(o){}switch(n.tag){case 26:Zi||Wi(n,t),uu(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:Zi||Wi(n,t);var r=ou,a=iu;for(ou=n.stateNode,uu(e,t,n),t=(n=n.stateNode).attributes;t.length;)n.removeAttributeNode(t[0]);Ve(n),ou=r,iu=a;break;case 5:Zi||Wi(n,t);case 6:a=ou;var l=iu;if(ou=null,uu(e,t,n),iu=l,null!==(ou=a))if(iu)try{e=ou,r=n.stateNode,8===e.nodeType?e.parentNode.removeChild(r):e.removeChild(r)}catch(i){rc(n,t,i)}else try{ou.removeChild(n.stateNode)}catch(i){rc(n,t,i)}break;case 18:null!==ou&&(iu?(t=ou,n=n.stateNode,8===t.nodeType?lf(t.parentNode,n):1===t.nodeType&&lf(t,n),gd(t)):lf(ou,n.stateNode));break;case 4:r=ou,a=iu,ou=n.stateNode.containerInfo,iu=!0,uu(e,t,n),ou=r,iu=a;break;case 0:case 11:case 14:case 15:Zi||$i(2,n,t),Zi||$i(4,n,t),uu(e,t,n);break;case 1:Zi||(Wi(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount&&Hi(n,t,r)),uu(e,t,n);break;case 21:uu(e,t,n);break;case 22:Zi||Wi(n,t),Zi=(r=Zi)||null!==n.memoizedState,uu(e,t,n),Zi=r;break;default:uu(e,t,n)}}function cu(e,t){if(null===t.memoizedState&&(null!==(e=t.alternate)&&(null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))))try{gd(e)}catch(n){rc(t,t.return,n)}}function fu(e,t){var n=function(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new tu),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new tu),t;default:throw Error(o(435,e.tag))}}(e);t.forEach((function(t){var r=uc.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}function du(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var a=n[r],l=e,i=t,u=i;e:for(;null!==u;){switch(u.tag){case 27:case 5:ou=u.stateNode,iu=!1;break e;case 3:case 4:ou=u.stateNode.containerInfo,iu=!0;break e}u=u.return}if(null===ou)throw Error(o(160));su(l,i,a),ou=null,iu=!1,null!==(l=a.alternate)&&(l.return=null),a.return=null}if(13878&t.subtreeFlags)for(t=t.child;null!==t;)hu(t,e),t=t.sibling}var pu=null;function hu(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:du(t,e),mu(e),4&r&&($i(3,e,e.return),Ii(3,e),$i(5,e,e.return));break;case 1:du(t,e),mu(e),512&r&&(Zi||null===n||Wi(n,n.return)),64&r&&Gi&&(null!==(e=e.updateQueue)&&(null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r))));break;case 26:var a=pu;if(du(t,e),mu(e),512&r&&(Zi||null===n||Wi(n,n.return)),4&r){var l=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,a=a.ownerDocument||a;t:switch(r){case"title":(!(l=a.getElementsByTagName("title")[0])||l[We]||l[Me]||"http://www.w3.org/2000/svg"===l.namespaceURI||l.hasAttribute("itemprop"))&&(l=a.createElement(r),a.head.insertBefore(l,a.querySelector("head > title"))),Vc(l,r,n),l[Me]=e,Xe(l),r=l;break e;case"link":var i=Pf("link","href",a).get(r+(n.href||""));if(i)for(var u=0;u<i.length;u++)if((l=i[u]).getAttribute("href")===(null==n.href?null:n.href)&&l.getAttribute("rel")===(null==n.rel?null:n.rel)&&l.getAttribute("title")===(null==n.title?null:n.title)&&l.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){i.splice(u,1);break t}Vc(l=a.createElement(r),r,n),a.head.appendChild(l);break;case"meta":if(i=Pf("meta","content",a).get(r+(n.content||"")))for(u=0;u<i.length;u++)if((l=i[u]).getAttribute("content")===(null==n.content?null:""+n.content)&&l.getAttribute("name")===(null==n.name?null:n.name)&&l.getAttribute("property")===(null==n.property?null:n.property)&&l.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&l.getAttribute("charset")===(null==n.charSet?null:n.charSet)){i.splice(u,1);break t}Vc(l=a.createElement(r),r,n),a.head.appendChild(l);break;default:throw Error(o(468,r))}l[Me]=e,Xe(l),r=l}e.stateNode=r}else Tf(a,e.type,e.stateNode);else e.stateNode=Ef(a,r,e.memoizedProps);else l!==r?(null===l?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):l.count--,null===r?Tf(a,e.type,e.stateNode):Ef(a,r,e.memoizedProps)):null===r&&null!==e.stateNode&&Qi(e,e.memoizedProps,n.memoizedProps)}break;case 27:if(4&r&&null===e.alternate){a=e.stateNode,l=e.memoizedProps;try{for(var s=a.firstChild;s;){var c=s.nextSibling,f=s.nodeName;s[We]||"HEAD"===f||"BODY"===f||"SCRIPT"===f||"STYLE"===f||"LINK"===f&&"stylesheet"===s.rel.toLowerCase()||a.removeChild(s),s=c}for(var d=e.type,p=a.attributes;p.length;)a.removeAttributeNode(p[0]);Vc(a,d,l),a[Me]=e,a[Ue]=l}catch(m){rc(e,e.return,m)}}case 5:if(du(t,e),mu(e),512&r&&(Zi||null===n||Wi(n,n.return)),32&e.flags){a=e.stateNode;try{kt(a,"")}catch(m){rc(e,e.return,m)}}4&r&&null!=e.stateNode&&Qi(e,a=e.memoizedProps,null!==n?n.memoizedProps:a),1024&r&&(eu=!0);break;case 6:if(du(t,e),mu(e),4&r){if(null===e.stateNode)throw Error(o(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(m){rc(e,e.return,m)}}break;case 3:if(Rf=null,a=pu,pu=pf(t.containerInfo),du(t,e),pu=a,mu(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{gd(t.containerInfo)}catch(m){rc(e,e.return,m)}eu&&(eu=!1,gu(e));break;case 4:r=pu,pu=pf(e.stateNode.containerInfo),du(t,e),mu(e),pu=r;break;case 12:du(t,e),mu(e);break;case 13:du(t,e),mu(e),8192&e.child.flags&&null!==e.memoizedState!==(null!==n&&null!==n.memoizedState)&&(bs=ue()),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,fu(e,r)));break;case 22:if(512&r&&(Zi||null===n||Wi(n,n.return)),s=null!==e.memoizedState,c=null!==n&&null!==n.memoizedState,Gi=(f=Gi)||s,Zi=(d=Zi)||c,du(t,e),Zi=d,Gi=f,mu(e),(t=e.stateNode)._current=e,t._visibility&=-3,t._visibility|=2&t._pendingVisibility,8192&r&&(t._visibility=s?-2&t._visibility:1|t._visibility,s&&(t=Gi||Zi,null===n||c||t||vu(e)),null===e.memoizedProps||"manual"!==e.memoizedProps.mode))e:for(n=null,t=e;;){if(5===t.tag||26===t.tag||27===t.tag){if(null===n){c=n=t;try{if(a=c.stateNode,s)"function"===typeof(l=a.style).setProperty?l.setProperty("display","none","important"):l.display="none";else{i=c.stateNode;var h=void 0!==(u=c.memoizedProps.style)&&null!==u&&u.hasOwnProperty("display")?u.display:null;i.style.display=null==h||"boolean"===typeof h?"":(""+h).trim()}}catch(m){rc(c,c.return,m)}}}else if(6===t.tag){if(null===n){c=t;try{c.stateNode.nodeValue=s?"":c.memoizedProps}catch(m){rc(c,c.return,m)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&(null!==(r=e.updateQueue)&&(null!==(n=r.retryQueue)&&(r.retryQueue=null,fu(e,n))));break;case 19:du(t,e),mu(e),4&r&&(null!==(r=e.updateQueue)&&(e.updateQueue=null,fu(e,r)));break;case 21:break;default:du(t,e),mu(e)}}function mu(e){var t=e.flags;if(2&t){try{if(27!==e.tag){e:{for(var n=e.return;null!==n;){if(Ki(n)){var r=n;break e}n=n.return}throw Error(o(160))}switch(r.tag){case 27:var a=r.stateNode;Xi(e,Yi(e),a);break;case 5:var l=r.stateNode;32&r.flags&&(kt(l,""),r.flags&=-33),Xi(e,Yi(e),l);break;case 3:case 4:var i=r.stateNode.containerInfo;Ji(e,Yi(e),i);break;default:throw Error(o(161))}}}catch(u){rc(e,e.return,u)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function gu(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;gu(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function yu(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)au(e,t.alternate,t),t=t.sibling}function vu(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:$i(4,t,t.return),vu(t);break;case 1:Wi(t,t.return);var n=t.stateNode;"function"===typeof n.componentWillUnmount&&Hi(t,t.return,n),vu(t);break;case 26:case 27:case 5:Wi(t,t.return),vu(t);break;case 22:Wi(t,t.return),null===t.memoizedState&&vu(t);break;default:vu(t)}e=e.sibling}}function bu(e,t,n){for(n=n&&0!==(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,a=e,l=t,o=l.flags;switch(l.tag){case 0:case 11:case 15:bu(a,l,n),Ii(4,l);break;case 1:if(bu(a,l,n),"function"===typeof(a=(r=l).stateNode).componentDidMount)try{a.componentDidMount()}catch(s){rc(r,r.return,s)}if(null!==(a=(r=l).updateQueue)){var i=r.stateNode;try{var u=a.shared.hiddenCallbacks;if(null!==u)for(a.shared.hiddenCallbacks=null,a=0;a<u.length;a++)Mi(u[a],i)}catch(s){rc(r,r.return,s)}}n&&64&o&&Bi(l),qi(l,l.return);break;case 26:case 27:case 5:bu(a,l,n),n&&null===r&&4&o&&Vi(l),qi(l,l.return);break;case 12:default:bu(a,l,n);break;case 13:bu(a,l,n),n&&4&o&&cu(a,l);break;case 22:null===l.memoizedState&&bu(a,l,n),qi(l,l.return)}t=t.sibling}}function wu(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&$a(n))}function Su(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&$a(e))}function ku(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)Eu(e,t,n,r),t=t.sibling}function Eu(e,t,n,r){var a=t.flags;switch(t.tag){case 0:case 11:case 15:ku(e,t,n,r),2048&a&&Ii(9,t);break;case 3:ku(e,t,n,r),2048&a&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&$a(e)));break;case 12:if(2048&a){ku(e,t,n,r),e=t.stateNode;try{var l=t.memoizedProps,o=l.id,i=l.onPostCommit;"function"===typeof i&&i(o,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(u){rc(t,t.return,u)}}else ku(e,t,n,r);break;case 23:break;case 22:l=t.stateNode,null!==t.memoizedState?4&l._visibility?ku(e,t,n,r):Cu(e,t):4&l._visibility?ku(e,t,n,r):(l._visibility|=4,xu(e,t,n,r,0!==(10256&t.subtreeFlags))),2048&a&&wu(t.alternate,t);break;case 24:ku(e,t,n,r),2048&a&&Su(t.alternate,t);break;default:ku(e,t,n,r)}}function xu(e,t,n,r,a){for(a=a&&0!==(10256&t.subtreeFlags),t=t.child;null!==t;){var l=e,o=t,i=n,u=r,s=o.flags;switch(o.tag){case 0:case 11:case 15:xu(l,o,i,u,a),Ii(8,o);break;case 23:break;case 22:var c=o.stateNode;null!==o.memoizedState?4&c._visibility?xu(l,o,i,u,a):Cu(l,o):(c._visibility|=4,xu(l,o,i,u,a)),a&&2048&s&&wu(o.alternate,o);break;case 24:xu(l,o,i,u,a),a&&2048&s&&Su(o.alternate,o);break;default:xu(l,o,i,u,a)}t=t.sibling}}function Cu(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,a=r.flags;switch(r.tag){case 22:Cu(n,r),2048&a&&wu(r.alternate,r);break;case 24:Cu(n,r),2048&a&&Su(r.alternate,r);break;default:Cu(n,r)}t=t.sibling}}var _u=8192;function Ru(e){if(e.subtreeFlags&_u)for(e=e.child;null!==e;)Pu(e),e=e.sibling}function Pu(e){switch(e.tag){case 26:Ru(e),e.flags&_u&&null!==e.memoizedState&&function(e,t,n){if(null===Nf)throw Error(o(475));var r=Nf;if("stylesheet"===t.type&&("string"!==typeof n.media||!1!==matchMedia(n.media).matches)&&0===(4&t.state.loading)){if(null===t.instance){var a=vf(n.href),l=e.querySelector(bf(a));if(l)return null!==(e=l._p)&&"object"===typeof e&&"function"===typeof e.then&&(r.count++,r=zf.bind(r),e.then(r,r)),t.state.loading|=4,t.instance=l,void Xe(l);l=e.ownerDocument||e,n=wf(n),(a=ff.get(a))&&Cf(n,a),Xe(l=l.createElement("link"));var i=l;i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),Vc(l,"link",n),t.instance=l}null===r.stylesheets&&(r.stylesheets=new Map),r.stylesheets.set(t,e),(e=t.state.preload)&&0===(3&t.state.loading)&&(r.count++,t=zf.bind(r),e.addEventListener("load",t),e.addEventListener("error",t))}}(pu,e.memoizedState,e.memoizedProps);break;case 5:default:Ru(e);break;case 3:case 4:var t=pu;pu=pf(e.stateNode.containerInfo),Ru(e),pu=t;break;case 22:null===e.memoizedState&&(null!==(t=e.alternate)&&null!==t.memoizedState?(t=_u,_u=16777216,Ru(e),_u=t):Ru(e))}}function Tu(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function Ou(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];nu=r,zu(r,e)}Tu(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)Nu(e),e=e.sibling}function Nu(e){switch(e.tag){case 0:case 11:case 15:Ou(e),2048&e.flags&&$i(9,e,e.return);break;case 3:case 12:default:Ou(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&4&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-5,Lu(e)):Ou(e)}}function Lu(e){var t=e.deletions;if(0!==(16&e.flags)){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];nu=r,zu(r,e)}Tu(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:$i(8,t,t.return),Lu(t);break;case 22:4&(n=t.stateNode)._visibility&&(n._visibility&=-5,Lu(t));break;default:Lu(t)}e=e.sibling}}function zu(e,t){for(;null!==nu;){var n=nu;switch(n.tag){case 0:case 11:case 15:$i(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:$a(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,nu=r;else e:for(n=e;null!==nu;){var a=(r=nu).sibling,l=r.return;if(lu(r),r===n){nu=null;break e}if(null!==a){a.return=l,nu=a;break e}nu=l}}}function Au(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Fu(e,t,n,r){return new Au(e,t,n,r)}function Du(e){return!(!(e=e.prototype)||!e.isReactComponent)}function ju(e,t){var n=e.alternate;return null===n?((n=Fu(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=31457280&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function Mu(e,t){e.flags&=31457282;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Uu(e,t,n,r,a,l){var i=0;if(r=e,"function"===typeof e)Du(e)&&(i=1);else if("string"===typeof e)i=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!==typeof t.precedence||"string"!==typeof t.href||""===t.href)break;return!0;case"link":if("string"!==typeof t.rel||"string"!==typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"===typeof t.precedence&&null==e);case"script":if(t.async&&"function"!==typeof t.async&&"symbol"!==typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"===typeof t.src)return!0}return!1}(e,n,Y.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case f:return Iu(n.children,a,l,t);case d:i=8,a|=24;break;case p:return(e=Fu(12,n,t,2|a)).elementType=p,e.lanes=l,e;case v:return(e=Fu(13,n,t,a)).elementType=v,e.lanes=l,e;case b:return(e=Fu(19,n,t,a)).elementType=b,e.lanes=l,e;case k:return $u(n,a,l,t);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case h:case g:i=10;break e;case m:i=9;break e;case y:i=11;break e;case w:i=14;break e;case S:i=16,r=null;break e}i=29,n=Error(o(130,null===e?"null":typeof e,"")),r=null}return(t=Fu(i,n,t,a)).elementType=e,t.type=r,t.lanes=l,t}function Iu(e,t,n,r){return(e=Fu(7,e,r,t)).lanes=n,e}function $u(e,t,n,r){(e=Fu(22,e,r,t)).elementType=k,e.lanes=n;var a={_visibility:1,_pendingVisibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null,_current:null,detach:function(){var e=a._current;if(null===e)throw Error(o(456));if(0===(2&a._pendingVisibility)){var t=Tr(e,2);null!==t&&(a._pendingVisibility|=2,Ls(t,e,2))}},attach:function(){var e=a._current;if(null===e)throw Error(o(456));if(0!==(2&a._pendingVisibility)){var t=Tr(e,2);null!==t&&(a._pendingVisibility&=-3,Ls(t,e,2))}}};return e.stateNode=a,e}function Bu(e,t,n){return(e=Fu(6,e,null,t)).lanes=n,e}function Hu(e,t,n){return(t=Fu(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function qu(e){e.flags|=4}function Wu(e,t){if("stylesheet"!==t.type||0!==(4&t.state.loading))e.flags&=-16777217;else if(e.flags|=16777216,!Of(t)){if(null!==(t=Pa.current)&&((4194176&rs)===rs?null!==Ta:(62914560&rs)!==rs&&0===(536870912&rs)||t!==Ta))throw da=ua,ia;e.flags|=8192}}function Vu(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?Oe():536870912,e.lanes|=t,ms|=t)}function Qu(e,t){if(!Jr)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Ku(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=31457280&a.subtreeFlags,r|=31457280&a.flags,a.return=e,a=a.sibling;else for(a=e.child;null!==a;)n|=a.lanes|a.childLanes,r|=a.subtreeFlags,r|=a.flags,a.return=e,a=a.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Yu(e,t,n){var r=t.pendingProps;switch(Qr(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return Ku(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),bi(Ua),ee(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(ra(t)?qu(t):null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,null!==Xr&&(As(Xr),Xr=null))),Ku(t),null;case 26:return n=t.memoizedState,null===e?(qu(t),null!==n?(Ku(t),Wu(t,n)):(Ku(t),t.flags&=-16777217)):n?n!==e.memoizedState?(qu(t),Ku(t),Wu(t,n)):(Ku(t),t.flags&=-16777217):(e.memoizedProps!==r&&qu(t),Ku(t),t.flags&=-16777217),null;case 27:ne(t),n=X.current;var a=t.type;if(null!==e&&null!=t.stateNode)e.memoizedProps!==r&&qu(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Ku(t),null}e=Y.current,ra(t)?ta(t):(e=cf(a,r,n),t.stateNode=e,qu(t))}return Ku(t),null;case 5:if(ne(t),n=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&qu(t);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Ku(t),null}if(e=Y.current,ra(t))ta(t);else{switch(a=Yc(X.current),e){case 1:e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=a.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=a.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":(e=a.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e="string"===typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?e.multiple=!0:r.size&&(e.size=r.size);break;default:e="string"===typeof r.is?a.createElement(n,{is:r.is}):a.createElement(n)}}e[Me]=t,e[Ue]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)e.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=e;e:switch(Vc(e,n,r),n){case"button":case"input":case"select":case"textarea":e=!!r.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&qu(t)}}return Ku(t),t.flags&=-16777217,null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&qu(t);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(e=X.current,ra(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(a=Kr))switch(a.tag){case 27:case 5:r=a.memoizedProps}e[Me]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||Bc(e.nodeValue,n)))||ea(t)}else(e=Yc(e).createTextNode(r))[Me]=t,t.stateNode=e}return Ku(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(a=ra(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[Me]=t}else aa(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Ku(t),a=!1}else null!==Xr&&(As(Xr),Xr=null),a=!0;if(!a)return 256&t.flags?(za(t),t):(za(t),null)}if(za(t),0!==(128&t.flags))return t.lanes=n,t;if(n=null!==r,e=null!==e&&null!==e.memoizedState,n){a=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(a=r.alternate.memoizedState.cachePool.pool);var l=null;null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(l=r.memoizedState.cachePool.pool),l!==a&&(r.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),Vu(t,t.updateQueue),Ku(t),null;case 4:return ee(),null===e&&Lc(t.stateNode.containerInfo),Ku(t),null;case 10:return bi(t.type),Ku(t),null;case 19:if(Q(Aa),null===(a=t.memoizedState))return Ku(t),null;if(r=0!==(128&t.flags),null===(l=a.rendering))if(r)Qu(a,!1);else{if(0!==cs||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(l=Fa(e))){for(t.flags|=128,Qu(a,!1),e=l.updateQueue,t.updateQueue=e,Vu(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)Mu(n,e),n=n.sibling;return K(Aa,1&Aa.current|2),t.child}e=e.sibling}null!==a.tail&&ue()>ws&&(t.flags|=128,r=!0,Qu(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=Fa(l))){if(t.flags|=128,r=!0,e=e.updateQueue,t.updateQueue=e,Vu(t,e),Qu(a,!0),null===a.tail&&"hidden"===a.tailMode&&!l.alternate&&!Jr)return Ku(t),null}else 2*ue()-a.renderingStartTime>ws&&536870912!==n&&(t.flags|=128,r=!0,Qu(a,!1),t.lanes=4194304);a.isBackwards?(l.sibling=t.child,t.child=l):(null!==(e=a.last)?e.sibling=l:t.child=l,a.last=l)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=ue(),t.sibling=null,e=Aa.current,K(Aa,r?1&e|2:1&e),t):(Ku(t),null);case 22:case 23:return za(t),Ra(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?0!==(536870912&n)&&0===(128&t.flags)&&(Ku(t),6&t.subtreeFlags&&(t.flags|=8192)):Ku(t),null!==(n=t.updateQueue)&&Vu(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&Q(Ka),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),bi(Ua),Ku(t),null;case 25:return null}throw Error(o(156,t.tag))}function Ju(e,t){switch(Qr(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return bi(Ua),ee(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return ne(t),null;case 13:if(za(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));aa()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Q(Aa),null;case 4:return ee(),null;case 10:return bi(t.type),null;case 22:case 23:return za(t),Ra(),null!==e&&Q(Ka),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return bi(Ua),null;default:return null}}function Xu(e,t){switch(Qr(t),t.tag){case 3:bi(Ua),ee();break;case 26:case 27:case 5:ne(t);break;case 4:ee();break;case 13:za(t);break;case 19:Q(Aa);break;case 10:bi(t.type);break;case 22:case 23:za(t),Ra(),null!==e&&Q(Ka);break;case 24:bi(Ua)}}var Gu={getCacheForType:function(e){var t=Ci(Ua),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n}},Zu="function"===typeof WeakMap?WeakMap:Map,es=0,ts=null,ns=null,rs=0,as=0,ls=null,os=!1,is=!1,us=!1,ss=0,cs=0,fs=0,ds=0,ps=0,hs=0,ms=0,gs=null,ys=null,vs=!1,bs=0,ws=1/0,Ss=null,ks=null,Es=!1,xs=null,Cs=0,_s=0,Rs=null,Ps=0,Ts=null;function Os(){if(0!==(2&es)&&0!==rs)return rs&-rs;if(null!==O.T){return 0!==qa?qa:Sc()}return De()}function Ns(){0===hs&&(hs=0===(536870912&rs)||Jr?Te():536870912);var e=Pa.current;return null!==e&&(e.flags|=32),hs}function Ls(e,t,n){(e===ts&&2===as||null!==e.cancelPendingCommit)&&(Is(e,0),js(e,rs,hs,!1)),Le(e,n),0!==(2&es)&&e===ts||(e===ts&&(0===(2&es)&&(ds|=n),4===cs&&js(e,rs,hs,!1)),mc(e))}function zs(e,t,n){if(0!==(6&es))throw Error(o(327));for(var r=!n&&0===(60&t)&&0===(t&e.expiredLanes)||Re(e,t),a=r?function(e,t){var n=es;es|=2;var r=Bs(),a=Hs();ts!==e||rs!==t?(Ss=null,ws=ue()+500,Is(e,t)):is=Re(e,t);e:for(;;)try{if(0!==as&&null!==ns){t=ns;var l=ls;t:switch(as){case 1:as=0,ls=null,Js(e,t,l,1);break;case 2:if(sa(l)){as=0,ls=null,Ys(t);break}t=function(){2===as&&ts===e&&(as=7),mc(e)},l.then(t,t);break e;case 3:as=7;break e;case 4:as=5;break e;case 7:sa(l)?(as=0,ls=null,Ys(t)):(as=0,ls=null,Js(e,t,l,7));break;case 5:var i=null;switch(ns.tag){case 26:i=ns.memoizedState;case 5:case 27:var u=ns;if(!i||Of(i)){as=0,ls=null;var s=u.sibling;if(null!==s)ns=s;else{var c=u.return;null!==c?(ns=c,Xs(c)):ns=null}break t}}as=0,ls=null,Js(e,t,l,5);break;case 6:as=0,ls=null,Js(e,t,l,6);break;case 8:Us(),cs=6;break e;default:throw Error(o(462))}}Qs();break}catch(f){$s(e,f)}return yi=gi=null,O.H=r,O.A=a,es=n,null!==ns?0:(ts=null,rs=0,_r(),cs)}(e,t):Ws(e,t,!0),l=r;;){if(0===a){is&&!r&&js(e,t,0,!1);break}if(6===a)js(e,t,0,!os);else{if(n=e.current.alternate,l&&!Ds(n)){a=Ws(e,t,!1),l=!1;continue}if(2===a){if(l=t,e.errorRecoveryDisabledLanes&l)var i=0;else i=0!==(i=-536870913&e.pendingLanes)?i:536870912&i?536870912:0;if(0!==i){t=i;e:{var u=e;a=gs;var s=u.current.memoizedState.isDehydrated;if(s&&(Is(u,i).flags|=256),2!==(i=Ws(u,i,!1))){if(us&&!s){u.errorRecoveryDisabledLanes|=l,ds|=l,a=4;break e}l=ys,ys=a,null!==l&&As(l)}a=i}if(l=!1,2!==a)continue}}if(1===a){Is(e,0),js(e,t,0,!0);break}e:{switch(r=e,a){case 0:case 1:throw Error(o(345));case 4:if((4194176&t)===t){js(r,t,hs,!os);break e}break;case 2:ys=null;break;case 3:case 5:break;default:throw Error(o(329))}if(r.finishedWork=n,r.finishedLanes=t,(62914560&t)===t&&10<(l=bs+300-ue())){if(js(r,t,hs,!os),0!==_e(r,0))break e;r.timeoutHandle=ef(Fs.bind(null,r,n,ys,Ss,vs,t,hs,ds,ms,os,2,-0,0),l)}else Fs(r,n,ys,Ss,vs,t,hs,ds,ms,os,0,-0,0)}}break}mc(e)}function As(e){null===ys?ys=e:ys.push.apply(ys,e)}function Fs(e,t,n,r,a,l,i,u,s,c,f,d,p){var h=t.subtreeFlags;if((8192&h||16785408===(16785408&h))&&(Nf={stylesheets:null,count:0,unsuspend:Lf},Pu(t),null!==(t=function(){if(null===Nf)throw Error(o(475));var e=Nf;return e.stylesheets&&0===e.count&&Ff(e,e.stylesheets),0<e.count?function(t){var n=setTimeout((function(){if(e.stylesheets&&Ff(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}}),6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}())))return e.cancelPendingCommit=t(Zs.bind(null,e,n,r,a,i,u,s,1,d,p)),void js(e,l,i,!c);Zs(e,n,r,a,i,u,s,f,d,p)}function Ds(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&(null!==(n=t.updateQueue)&&null!==(n=n.stores)))for(var r=0;r<n.length;r++){var a=n[r],l=a.getSnapshot;a=a.value;try{if(!Kn(l(),a))return!1}catch(o){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function js(e,t,n,r){t&=~ps,t&=~ds,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var a=t;0<a;){var l=31-we(a),o=1<<l;r[l]=-1,a&=~o}0!==n&&ze(e,n,t)}function Ms(){return 0!==(6&es)||(gc(0,!1),!1)}function Us(){if(null!==ns){if(0===as)var e=ns.return;else yi=gi=null,yl(e=ns),ha=null,ma=0,e=ns;for(;null!==e;)Xu(e.alternate,e),e=e.return;ns=null}}function Is(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,tf(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Us(),ts=e,ns=n=ju(e.current,null),rs=t,as=0,ls=null,os=!1,is=Re(e,t),us=!1,ms=hs=ps=ds=fs=cs=0,ys=gs=null,vs=!1,0!==(8&t)&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var a=31-we(r),l=1<<a;t|=e[a],r&=~l}return ss=t,_r(),n}function $s(e,t){Za=null,O.H=Co,t===oa?(t=pa(),as=3):t===ia?(t=pa(),as=4):as=t===Ho?8:null!==t&&"object"===typeof t&&"function"===typeof t.then?6:1,ls=t,null===ns&&(cs=1,Mo(e,Ar(t,e.current)))}function Bs(){var e=O.H;return O.H=Co,null===e?Co:e}function Hs(){var e=O.A;return O.A=Gu,e}function qs(){cs=4,os||(4194176&rs)!==rs&&null!==Pa.current||(is=!0),0===(134217727&fs)&&0===(134217727&ds)||null===ts||js(ts,rs,hs,!1)}function Ws(e,t,n){var r=es;es|=2;var a=Bs(),l=Hs();ts===e&&rs===t||(Ss=null,Is(e,t)),t=!1;var o=cs;e:for(;;)try{if(0!==as&&null!==ns){var i=ns,u=ls;switch(as){case 8:Us(),o=6;break e;case 3:case 2:case 6:null===Pa.current&&(t=!0);var s=as;if(as=0,ls=null,Js(e,i,u,s),n&&is){o=0;break e}break;default:s=as,as=0,ls=null,Js(e,i,u,s)}}Vs(),o=cs;break}catch(c){$s(e,c)}return t&&e.shellSuspendCounter++,yi=gi=null,es=r,O.H=a,O.A=l,null===ns&&(ts=null,rs=0,_r()),o}function Vs(){for(;null!==ns;)Ks(ns)}function Qs(){for(;null!==ns&&!oe();)Ks(ns)}function Ks(e){var t=hi(e.alternate,e,ss);e.memoizedProps=e.pendingProps,null===t?Xs(e):ns=t}function Ys(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Zo(n,t,t.pendingProps,t.type,void 0,rs);break;case 11:t=Zo(n,t,t.pendingProps,t.type.render,t.ref,rs);break;case 5:yl(t);default:Xu(n,t),t=hi(n,t=ns=Mu(t,ss),ss)}e.memoizedProps=e.pendingProps,null===t?Xs(e):ns=t}function Js(e,t,n,r){yi=gi=null,yl(t),ha=null,ma=0;var a=t.return;try{if(function(e,t,n,r,a){if(n.flags|=32768,null!==r&&"object"===typeof r&&"function"===typeof r.then){if(null!==(t=n.alternate)&&ki(t,n,a,!0),null!==(n=Pa.current)){switch(n.tag){case 13:return null===Ta?qs():null===n.alternate&&0===cs&&(cs=3),n.flags&=-257,n.flags|=65536,n.lanes=a,r===ua?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),ac(e,r,a)),!1;case 22:return n.flags|=65536,r===ua?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),ac(e,r,a)),!1}throw Error(o(435,n.tag))}return ac(e,r,a),qs(),!1}if(Jr)return null!==(t=Pa.current)?(0===(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=a,r!==Zr&&la(Ar(e=Error(o(422),{cause:r}),n))):(r!==Zr&&la(Ar(t=Error(o(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,a&=-a,e.lanes|=a,r=Ar(r,n),Ai(e,a=Io(e.stateNode,r,a)),4!==cs&&(cs=2)),!1;var l=Error(o(520),{cause:r});if(l=Ar(l,n),null===gs?gs=[l]:gs.push(l),4!==cs&&(cs=2),null===t)return!0;r=Ar(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=a&-a,n.lanes|=e,Ai(n,e=Io(n.stateNode,r,e)),!1;case 1:if(t=n.type,l=n.stateNode,0===(128&n.flags)&&("function"===typeof t.getDerivedStateFromError||null!==l&&"function"===typeof l.componentDidCatch&&(null===ks||!ks.has(l))))return n.flags|=65536,a&=-a,n.lanes|=a,Bo(a=$o(a),e,n,r),Ai(n,a),!1}n=n.return}while(null!==n);return!1}(e,a,t,n,rs))return cs=1,Mo(e,Ar(n,e.current)),void(ns=null)}catch(l){if(null!==a)throw ns=a,l;return cs=1,Mo(e,Ar(n,e.current)),void(ns=null)}32768&t.flags?(Jr||1===r?e=!0:is||0!==(536870912&rs)?e=!1:(os=e=!0,(2===r||3===r||6===r)&&(null!==(r=Pa.current)&&13===r.tag&&(r.flags|=16384))),Gs(t,e)):Xs(t)}function Xs(e){var t=e;do{if(0!==(32768&t.flags))return void Gs(t,os);e=t.return;var n=Yu(t.alternate,t,ss);if(null!==n)return void(ns=n);if(null!==(t=t.sibling))return void(ns=t);ns=t=e}while(null!==t);0===cs&&(cs=5)}function Gs(e,t){do{var n=Ju(e.alternate,e);if(null!==n)return n.flags&=32767,void(ns=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(ns=e);ns=e=n}while(null!==e);cs=6,ns=null}function Zs(e,t,n,r,a,l,i,u,s,c){var f=O.T,d=B.p;try{B.p=2,O.T=null,function(e,t,n,r,a,l,i,u){do{tc()}while(null!==xs);if(0!==(6&es))throw Error(o(327));var s=e.finishedWork;if(r=e.finishedLanes,null===s)return null;if(e.finishedWork=null,e.finishedLanes=0,s===e.current)throw Error(o(177));e.callbackNode=null,e.callbackPriority=0,e.cancelPendingCommit=null;var c=s.lanes|s.childLanes;if(function(e,t,n,r,a,l){var o=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var i=e.entanglements,u=e.expirationTimes,s=e.hiddenUpdates;for(n=o&~n;0<n;){var c=31-we(n),f=1<<c;i[c]=0,u[c]=-1;var d=s[c];if(null!==d)for(s[c]=null,c=0;c<d.length;c++){var p=d[c];null!==p&&(p.lane&=-536870913)}n&=~f}0!==r&&ze(e,r,0),0!==l&&0===a&&0!==e.tag&&(e.suspendedLanes|=l&~(o&~t))}(e,r,c|=Cr,l,i,u),e===ts&&(ns=ts=null,rs=0),0===(10256&s.subtreeFlags)&&0===(10256&s.flags)||Es||(Es=!0,_s=c,Rs=n,function(e,t){ae(e,t)}(de,(function(){return tc(),null}))),n=0!==(15990&s.flags),0!==(15990&s.subtreeFlags)||n?(n=O.T,O.T=null,l=B.p,B.p=2,i=es,es|=4,function(e,t){if(e=e.containerInfo,Qc=Wf,er(e=Zn(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var a=r.anchorOffset,l=r.focusNode;r=r.focusOffset;try{n.nodeType,l.nodeType}catch(g){n=null;break e}var i=0,u=-1,s=-1,c=0,f=0,d=e,p=null;t:for(;;){for(var h;d!==n||0!==a&&3!==d.nodeType||(u=i+a),d!==l||0!==r&&3!==d.nodeType||(s=i+r),3===d.nodeType&&(i+=d.nodeValue.length),null!==(h=d.firstChild);)p=d,d=h;for(;;){if(d===e)break t;if(p===n&&++c===a&&(u=i),p===l&&++f===r&&(s=i),null!==(h=d.nextSibling))break;p=(d=p).parentNode}d=h}n=-1===u||-1===s?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Kc={focusedElem:e,selectionRange:n},Wf=!1,nu=t;null!==nu;)if(e=(t=nu).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,nu=e;else for(;null!==nu;){switch(l=(t=nu).alternate,e=t.flags,t.tag){case 0:case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(0!==(1024&e)&&null!==l){e=void 0,n=t,a=l.memoizedProps,l=l.memoizedState,r=n.stateNode;try{var m=zo(n.type,a,(n.elementType,n.type));e=r.getSnapshotBeforeUpdate(m,l),r.__reactInternalSnapshotBeforeUpdate=e}catch(y){rc(n,n.return,y)}}break;case 3:if(0!==(1024&e))if(9===(n=(e=t.stateNode.containerInfo).nodeType))of(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":of(e);break;default:e.textContent=""}break;default:if(0!==(1024&e))throw Error(o(163))}if(null!==(e=t.sibling)){e.return=t.return,nu=e;break}nu=t.return}m=ru,ru=!1}(e,s),hu(s,e),tr(Kc,e.containerInfo),Wf=!!Qc,Kc=Qc=null,e.current=s,au(e,s.alternate,s),ie(),es=i,B.p=l,O.T=n):e.current=s,Es?(Es=!1,xs=e,Cs=r):ec(e,c),c=e.pendingLanes,0===c&&(ks=null),function(e){if(ve&&"function"===typeof ve.onCommitFiberRoot)try{ve.onCommitFiberRoot(ye,e,void 0,128===(128&e.current.flags))}catch(t){}}(s.stateNode),mc(e),null!==t)for(a=e.onRecoverableError,s=0;s<t.length;s++)c=t[s],a(c.value,{componentStack:c.stack});0!==(3&Cs)&&tc(),c=e.pendingLanes,0!==(4194218&r)&&0!==(42&c)?e===Ts?Ps++:(Ps=0,Ts=e):Ps=0,gc(0,!1)}(e,t,n,r,d,a,l,i)}finally{O.T=f,B.p=d}}function ec(e,t){0===(e.pooledCacheLanes&=t)&&(null!=(t=e.pooledCache)&&(e.pooledCache=null,$a(t)))}function tc(){if(null!==xs){var e=xs,t=_s;_s=0;var n=Fe(Cs),r=O.T,a=B.p;try{if(B.p=32>n?32:n,O.T=null,null===xs)var l=!1;else{n=Rs,Rs=null;var i=xs,u=Cs;if(xs=null,Cs=0,0!==(6&es))throw Error(o(331));var s=es;if(es|=4,Nu(i.current),Eu(i,i.current,u,n),es=s,gc(0,!1),ve&&"function"===typeof ve.onPostCommitFiberRoot)try{ve.onPostCommitFiberRoot(ye,i)}catch(c){}l=!0}return l}finally{B.p=a,O.T=r,ec(e,t)}}return!1}function nc(e,t,n){t=Ar(n,t),null!==(e=Li(e,t=Io(e.stateNode,t,2),2))&&(Le(e,2),mc(e))}function rc(e,t,n){if(3===e.tag)nc(e,e,n);else for(;null!==t;){if(3===t.tag){nc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===ks||!ks.has(r))){e=Ar(n,e),null!==(r=Li(t,n=$o(2),2))&&(Bo(n,r,t,e),Le(r,2),mc(r));break}}t=t.return}}function ac(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new Zu;var a=new Set;r.set(t,a)}else void 0===(a=r.get(t))&&(a=new Set,r.set(t,a));a.has(n)||(us=!0,a.add(n),e=lc.bind(null,e,t,n),t.then(e,e))}function lc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,ts===e&&(rs&n)===n&&(4===cs||3===cs&&(62914560&rs)===rs&&300>ue()-bs?0===(2&es)&&Is(e,0):ps|=n,ms===rs&&(ms=0)),mc(e)}function oc(e,t){0===t&&(t=Oe()),null!==(e=Tr(e,t))&&(Le(e,t),mc(e))}function ic(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),oc(e,n)}function uc(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,a=e.memoizedState;null!==a&&(n=a.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(o(314))}null!==r&&r.delete(t),oc(e,n)}var sc=null,cc=null,fc=!1,dc=!1,pc=!1,hc=0;function mc(e){var t;e!==cc&&null===e.next&&(null===cc?sc=cc=e:cc=cc.next=e),dc=!0,fc||(fc=!0,t=yc,rf((function(){0!==(6&es)?ae(ce,t):t()})))}function gc(e,t){if(!pc&&dc){pc=!0;do{for(var n=!1,r=sc;null!==r;){if(!t)if(0!==e){var a=r.pendingLanes;if(0===a)var l=0;else{var o=r.suspendedLanes,i=r.pingedLanes;l=(1<<31-we(42|e)+1)-1,l=201326677&(l&=a&~(o&~i))?201326677&l|1:l?2|l:0}0!==l&&(n=!0,wc(r,l))}else l=rs,0===(3&(l=_e(r,r===ts?l:0)))||Re(r,l)||(n=!0,wc(r,l));r=r.next}}while(n);pc=!1}}function yc(){dc=fc=!1;var e=0;0!==hc&&(function(){var e=window.event;if(e&&"popstate"===e.type)return e!==Zc&&(Zc=e,!0);return Zc=null,!1}()&&(e=hc),hc=0);for(var t=ue(),n=null,r=sc;null!==r;){var a=r.next,l=vc(r,t);0===l?(r.next=null,null===n?sc=a:n.next=a,null===a&&(cc=n)):(n=r,(0!==e||0!==(3&l))&&(dc=!0)),r=a}gc(e,!1)}function vc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,a=e.expirationTimes,l=-62914561&e.pendingLanes;0<l;){var o=31-we(l),i=1<<o,u=a[o];-1===u?0!==(i&n)&&0===(i&r)||(a[o]=Pe(i,t)):u<=t&&(e.expiredLanes|=i),l&=~i}if(n=rs,n=_e(e,e===(t=ts)?n:0),r=e.callbackNode,0===n||e===t&&2===as||null!==e.cancelPendingCommit)return null!==r&&null!==r&&le(r),e.callbackNode=null,e.callbackPriority=0;if(0===(3&n)||Re(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&le(r),Fe(n)){case 2:case 8:n=fe;break;case 32:default:n=de;break;case 268435456:n=he}return r=bc.bind(null,e),n=ae(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&le(r),e.callbackPriority=2,e.callbackNode=null,2}function bc(e,t){var n=e.callbackNode;if(tc()&&e.callbackNode!==n)return null;var r=rs;return 0===(r=_e(e,e===ts?r:0))?null:(zs(e,r,t),vc(e,ue()),null!=e.callbackNode&&e.callbackNode===n?bc.bind(null,e):null)}function wc(e,t){if(tc())return null;zs(e,t,!0)}function Sc(){return 0===hc&&(hc=Te()),hc}function kc(e){return null==e||"symbol"===typeof e||"boolean"===typeof e?null:"function"===typeof e?e:Tt(""+e)}function Ec(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var xc=0;xc<Sr.length;xc++){var Cc=Sr[xc];kr(Cc.toLowerCase(),"on"+(Cc[0].toUpperCase()+Cc.slice(1)))}kr(pr,"onAnimationEnd"),kr(hr,"onAnimationIteration"),kr(mr,"onAnimationStart"),kr("dblclick","onDoubleClick"),kr("focusin","onFocus"),kr("focusout","onBlur"),kr(gr,"onTransitionRun"),kr(yr,"onTransitionStart"),kr(vr,"onTransitionCancel"),kr(br,"onTransitionEnd"),tt("onMouseEnter",["mouseout","mouseover"]),tt("onMouseLeave",["mouseout","mouseover"]),tt("onPointerEnter",["pointerout","pointerover"]),tt("onPointerLeave",["pointerout","pointerover"]),et("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),et("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),et("onBeforeInput",["compositionend","keypress","textInput","paste"]),et("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),et("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),et("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var _c="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Rc=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(_c));function Pc(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],a=r.event;r=r.listeners;e:{var l=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],u=i.instance,s=i.currentTarget;if(i=i.listener,u!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=s;try{l(a)}catch(c){Ao(c)}a.currentTarget=null,l=u}else for(o=0;o<r.length;o++){if(u=(i=r[o]).instance,s=i.currentTarget,i=i.listener,u!==l&&a.isPropagationStopped())break e;l=i,a.currentTarget=s;try{l(a)}catch(c){Ao(c)}a.currentTarget=null,l=u}}}}function Tc(e,t){var n=t[$e];void 0===n&&(n=t[$e]=new Set);var r=e+"__bubble";n.has(r)||(zc(t,e,2,!1),n.add(r))}function Oc(e,t,n){var r=0;t&&(r|=4),zc(n,e,r,t)}var Nc="_reactListening"+Math.random().toString(36).slice(2);function Lc(e){if(!e[Nc]){e[Nc]=!0,Ge.forEach((function(t){"selectionchange"!==t&&(Rc.has(t)||Oc(t,!1,e),Oc(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Nc]||(t[Nc]=!0,Oc("selectionchange",!1,t))}}function zc(e,t,n,r){switch(Gf(t)){case 2:var a=Vf;break;case 8:a=Qf;break;default:a=Kf}n=a.bind(null,t,n,e),a=void 0,!Mt||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(a=!0),r?void 0!==a?e.addEventListener(t,n,{capture:!0,passive:a}):e.addEventListener(t,n,!0):void 0!==a?e.addEventListener(t,n,{passive:a}):e.addEventListener(t,n,!1)}function Ac(e,t,n,r,a){var l=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===a||8===i.nodeType&&i.parentNode===a)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&((u=o.stateNode.containerInfo)===a||8===u.nodeType&&u.parentNode===a))return;o=o.return}for(;null!==i;){if(null===(o=Qe(i)))return;if(5===(u=o.tag)||6===u||26===u||27===u){r=l=o;continue e}i=i.parentNode}}r=r.return}Dt((function(){var r=l,a=Nt(n),o=[];e:{var i=wr.get(e);if(void 0!==i){var u=Gt,s=e;switch(e){case"keypress":if(0===qt(n))break e;case"keydown":case"keyup":u=hn;break;case"focusin":s="focus",u=an;break;case"focusout":s="blur",u=an;break;case"beforeblur":case"afterblur":u=an;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=nn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=rn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=gn;break;case pr:case hr:case mr:u=ln;break;case br:u=yn;break;case"scroll":case"scrollend":u=en;break;case"wheel":u=vn;break;case"copy":case"cut":case"paste":u=on;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=mn;break;case"toggle":case"beforetoggle":u=bn}var c=0!==(4&t),f=!c&&("scroll"===e||"scrollend"===e),d=c?null!==i?i+"Capture":null:i;c=[];for(var p,h=r;null!==h;){var m=h;if(p=m.stateNode,5!==(m=m.tag)&&26!==m&&27!==m||null===p||null===d||null!=(m=jt(h,d))&&c.push(Fc(h,m,p)),f)break;h=h.return}0<c.length&&(i=new u(i,s,null,n,a),o.push({event:i,listeners:c}))}}if(0===(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||n===Ot||!(s=n.relatedTarget||n.fromElement)||!Qe(s)&&!s[Ie])&&(u||i)&&(i=a.window===a?a:(i=a.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(s=(s=n.relatedTarget||n.toElement)?Qe(s):null)&&(f=j(s),c=s.tag,s!==f||5!==c&&27!==c&&6!==c)&&(s=null)):(u=null,s=r),u!==s)){if(c=nn,m="onMouseLeave",d="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(c=mn,m="onPointerLeave",d="onPointerEnter",h="pointer"),f=null==u?i:Ye(u),p=null==s?i:Ye(s),(i=new c(m,h+"leave",u,n,a)).target=f,i.relatedTarget=p,m=null,Qe(a)===r&&((c=new c(d,h+"enter",s,n,a)).target=p,c.relatedTarget=f,m=c),f=m,u&&s)e:{for(d=s,h=0,p=c=u;p;p=jc(p))h++;for(p=0,m=d;m;m=jc(m))p++;for(;0<h-p;)c=jc(c),h--;for(;0<p-h;)d=jc(d),p--;for(;h--;){if(c===d||null!==d&&c===d.alternate)break e;c=jc(c),d=jc(d)}c=null}else c=null;null!==u&&Mc(o,i,u,c,!1),null!==s&&null!==f&&Mc(o,f,s,c,!0)}if("select"===(u=(i=r?Ye(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var g=jn;else if(Nn(i))if(Mn)g=Qn;else{g=Wn;var y=qn}else!(u=i.nodeName)||"input"!==u.toLowerCase()||"checkbox"!==i.type&&"radio"!==i.type?r&&_t(r.elementType)&&(g=jn):g=Vn;switch(g&&(g=g(e,r))?Ln(o,g,n,a):(y&&y(e,i,r),"focusout"===e&&r&&"number"===i.type&&null!=r.memoizedProps.value&&vt(i,"number",i.value)),y=r?Ye(r):window,e){case"focusin":(Nn(y)||"true"===y.contentEditable)&&(rr=y,ar=r,lr=null);break;case"focusout":lr=ar=rr=null;break;case"mousedown":or=!0;break;case"contextmenu":case"mouseup":case"dragend":or=!1,ir(o,n,a);break;case"selectionchange":if(nr)break;case"keydown":case"keyup":ir(o,n,a)}var v;if(Sn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Tn?Rn(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(xn&&"ko"!==n.locale&&(Tn||"onCompositionStart"!==b?"onCompositionEnd"===b&&Tn&&(v=Ht()):($t="value"in(It=a)?It.value:It.textContent,Tn=!0)),0<(y=Dc(r,b)).length&&(b=new un(b,e,null,n,a),o.push({event:b,listeners:y}),v?b.data=v:null!==(v=Pn(n))&&(b.data=v))),(v=En?function(e,t){switch(e){case"compositionend":return Pn(t);case"keypress":return 32!==t.which?null:(_n=!0,Cn);case"textInput":return(e=t.data)===Cn&&_n?null:e;default:return null}}(e,n):function(e,t){if(Tn)return"compositionend"===e||!Sn&&Rn(e,t)?(e=Ht(),Bt=$t=It=null,Tn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return xn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(b=Dc(r,"onBeforeInput")).length&&(y=new un("onBeforeInput","beforeinput",null,n,a),o.push({event:y,listeners:b}),y.data=v)),function(e,t,n,r,a){if("submit"===t&&n&&n.stateNode===a){var l=kc((a[Ue]||null).action),o=r.submitter;o&&null!==(t=(t=o[Ue]||null)?kc(t.formAction):o.getAttribute("formAction"))&&(l=t,o=null);var i=new Gt("action","action",null,r,a);e.push({event:i,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==hc){var e=o?Ec(a,o):new FormData(a);co(n,{pending:!0,data:e,method:a.method,action:l},null,e)}}else"function"===typeof l&&(i.preventDefault(),e=o?Ec(a,o):new FormData(a),co(n,{pending:!0,data:e,method:a.method,action:l},l,e))},currentTarget:a}]})}}(o,e,r,n,a)}Pc(o,t)}))}function Fc(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Dc(e,t){for(var n=t+"Capture",r=[];null!==e;){var a=e,l=a.stateNode;5!==(a=a.tag)&&26!==a&&27!==a||null===l||(null!=(a=jt(e,n))&&r.unshift(Fc(e,a,l)),null!=(a=jt(e,t))&&r.push(Fc(e,a,l))),e=e.return}return r}function jc(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function Mc(e,t,n,r,a){for(var l=t._reactName,o=[];null!==n&&n!==r;){var i=n,u=i.alternate,s=i.stateNode;if(i=i.tag,null!==u&&u===r)break;5!==i&&26!==i&&27!==i||null===s||(u=s,a?null!=(s=jt(n,l))&&o.unshift(Fc(n,s,u)):a||null!=(s=jt(n,l))&&o.push(Fc(n,s,u))),n=n.return}0!==o.length&&e.push({event:t,listeners:o})}var Uc=/\r\n?/g,Ic=/\u0000|\uFFFD/g;function $c(e){return("string"===typeof e?e:""+e).replace(Uc,"\n").replace(Ic,"")}function Bc(e,t){return t=$c(t),$c(e)===t}function Hc(){}function qc(e,t,n,r,a,l){switch(n){case"children":"string"===typeof r?"body"===t||"textarea"===t&&""===r||kt(e,r):("number"===typeof r||"bigint"===typeof r)&&"body"!==t&&kt(e,""+r);break;case"className":it(e,"class",r);break;case"tabIndex":it(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":it(e,n,r);break;case"style":Ct(e,r,l);break;case"data":if("object"!==t){it(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"===typeof r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"===typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"===typeof l&&("formAction"===n?("input"!==t&&qc(e,t,"name",a.name,a,null),qc(e,t,"formEncType",a.formEncType,a,null),qc(e,t,"formMethod",a.formMethod,a,null),qc(e,t,"formTarget",a.formTarget,a,null)):(qc(e,t,"encType",a.encType,a,null),qc(e,t,"method",a.method,a,null),qc(e,t,"target",a.target,a,null))),null==r||"symbol"===typeof r||"boolean"===typeof r){e.removeAttribute(n);break}r=Tt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Hc);break;case"onScroll":null!=r&&Tc("scroll",e);break;case"onScrollEnd":null!=r&&Tc("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"muted":e.muted=r&&"function"!==typeof r&&"symbol"!==typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"===typeof r||"boolean"===typeof r||"symbol"===typeof r){e.removeAttribute("xlink:href");break}n=Tt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!==typeof r&&"symbol"!==typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!==typeof r&&"symbol"!==typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"===typeof r||"symbol"===typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Tc("beforetoggle",e),Tc("toggle",e),ot(e,"popover",r);break;case"xlinkActuate":ut(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":ut(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":ut(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":ut(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":ut(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":ut(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":ut(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":ut(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":ut(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":ot(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&ot(e,n=Rt.get(n)||n,r)}}function Wc(e,t,n,r,a,l){switch(n){case"style":Ct(e,r,l);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!==typeof r||!("__html"in r))throw Error(o(61));if(null!=(n=r.__html)){if(null!=a.children)throw Error(o(60));e.innerHTML=n}}break;case"children":"string"===typeof r?kt(e,r):("number"===typeof r||"bigint"===typeof r)&&kt(e,""+r);break;case"onScroll":null!=r&&Tc("scroll",e);break;case"onScrollEnd":null!=r&&Tc("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Hc);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:Ze.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(a=n.endsWith("Capture"),t=n.slice(2,a?n.length-7:void 0),"function"===typeof(l=null!=(l=e[Ue]||null)?l[n]:null)&&e.removeEventListener(t,l,a),"function"!==typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):ot(e,n,r):("function"!==typeof l&&null!==l&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,a)))}}function Vc(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Tc("error",e),Tc("load",e);var r,a=!1,l=!1;for(r in n)if(n.hasOwnProperty(r)){var i=n[r];if(null!=i)switch(r){case"src":a=!0;break;case"srcSet":l=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:qc(e,t,r,i,n,null)}}return l&&qc(e,t,"srcSet",n.srcSet,n,null),void(a&&qc(e,t,"src",n.src,n,null));case"input":Tc("invalid",e);var u=r=i=l=null,s=null,c=null;for(a in n)if(n.hasOwnProperty(a)){var f=n[a];if(null!=f)switch(a){case"name":l=f;break;case"type":i=f;break;case"checked":s=f;break;case"defaultChecked":c=f;break;case"value":r=f;break;case"defaultValue":u=f;break;case"children":case"dangerouslySetInnerHTML":if(null!=f)throw Error(o(137,t));break;default:qc(e,t,a,f,n,null)}}return yt(e,r,u,s,c,i,l,!1),void ft(e);case"select":for(l in Tc("invalid",e),a=i=r=null,n)if(n.hasOwnProperty(l)&&null!=(u=n[l]))switch(l){case"value":r=u;break;case"defaultValue":i=u;break;case"multiple":a=u;default:qc(e,t,l,u,n,null)}return t=r,n=i,e.multiple=!!a,void(null!=t?bt(e,!!a,t,!1):null!=n&&bt(e,!!a,n,!0));case"textarea":for(i in Tc("invalid",e),r=l=a=null,n)if(n.hasOwnProperty(i)&&null!=(u=n[i]))switch(i){case"value":a=u;break;case"defaultValue":l=u;break;case"children":r=u;break;case"dangerouslySetInnerHTML":if(null!=u)throw Error(o(91));break;default:qc(e,t,i,u,n,null)}return St(e,a,l,r),void ft(e);case"option":for(s in n)if(n.hasOwnProperty(s)&&null!=(a=n[s]))if("selected"===s)e.selected=a&&"function"!==typeof a&&"symbol"!==typeof a;else qc(e,t,s,a,n,null);return;case"dialog":Tc("cancel",e),Tc("close",e);break;case"iframe":case"object":Tc("load",e);break;case"video":case"audio":for(a=0;a<_c.length;a++)Tc(_c[a],e);break;case"image":Tc("error",e),Tc("load",e);break;case"details":Tc("toggle",e);break;case"embed":case"source":case"link":Tc("error",e),Tc("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(c in n)if(n.hasOwnProperty(c)&&null!=(a=n[c]))switch(c){case"children":case"dangerouslySetInnerHTML":throw Error(o(137,t));default:qc(e,t,c,a,n,null)}return;default:if(_t(t)){for(f in n)n.hasOwnProperty(f)&&(void 0!==(a=n[f])&&Wc(e,t,f,a,n,void 0));return}}for(u in n)n.hasOwnProperty(u)&&(null!=(a=n[u])&&qc(e,t,u,a,n,null))}var Qc=null,Kc=null;function Yc(e){return 9===e.nodeType?e:e.ownerDocument}function Jc(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function Xc(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function Gc(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"bigint"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var Zc=null;var ef="function"===typeof setTimeout?setTimeout:void 0,tf="function"===typeof clearTimeout?clearTimeout:void 0,nf="function"===typeof Promise?Promise:void 0,rf="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof nf?function(e){return nf.resolve(null).then(e).catch(af)}:ef;function af(e){setTimeout((function(){throw e}))}function lf(e,t){var n=t,r=0;do{var a=n.nextSibling;if(e.removeChild(n),a&&8===a.nodeType)if("/$"===(n=a.data)){if(0===r)return e.removeChild(a),void gd(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=a}while(n);gd(t)}function of(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":of(n),Ve(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function uf(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"F!"===t||"F"===t)break;if("/$"===t)return null}}return e}function sf(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}function cf(e,t,n){switch(t=Yc(n),e){case"html":if(!(e=t.documentElement))throw Error(o(452));return e;case"head":if(!(e=t.head))throw Error(o(453));return e;case"body":if(!(e=t.body))throw Error(o(454));return e;default:throw Error(o(451))}}var ff=new Map,df=new Set;function pf(e){return"function"===typeof e.getRootNode?e.getRootNode():e.ownerDocument}var hf=B.d;B.d={f:function(){var e=hf.f(),t=Ms();return e||t},r:function(e){var t=Ke(e);null!==t&&5===t.tag&&"form"===t.type?po(t):hf.r(e)},D:function(e){hf.D(e),gf("dns-prefetch",e,null)},C:function(e,t){hf.C(e,t),gf("preconnect",e,t)},L:function(e,t,n){hf.L(e,t,n);var r=mf;if(r&&e&&t){var a='link[rel="preload"][as="'+mt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(a+='[imagesrcset="'+mt(n.imageSrcSet)+'"]',"string"===typeof n.imageSizes&&(a+='[imagesizes="'+mt(n.imageSizes)+'"]')):a+='[href="'+mt(e)+'"]';var l=a;switch(t){case"style":l=vf(e);break;case"script":l=Sf(e)}ff.has(l)||(e=N({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),ff.set(l,e),null!==r.querySelector(a)||"style"===t&&r.querySelector(bf(l))||"script"===t&&r.querySelector(kf(l))||(Vc(t=r.createElement("link"),"link",e),Xe(t),r.head.appendChild(t)))}},m:function(e,t){hf.m(e,t);var n=mf;if(n&&e){var r=t&&"string"===typeof t.as?t.as:"script",a='link[rel="modulepreload"][as="'+mt(r)+'"][href="'+mt(e)+'"]',l=a;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":l=Sf(e)}if(!ff.has(l)&&(e=N({rel:"modulepreload",href:e},t),ff.set(l,e),null===n.querySelector(a))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(kf(l)))return}Vc(r=n.createElement("link"),"link",e),Xe(r),n.head.appendChild(r)}}},X:function(e,t){hf.X(e,t);var n=mf;if(n&&e){var r=Je(n).hoistableScripts,a=Sf(e),l=r.get(a);l||((l=n.querySelector(kf(a)))||(e=N({src:e,async:!0},t),(t=ff.get(a))&&_f(e,t),Xe(l=n.createElement("script")),Vc(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}},S:function(e,t,n){hf.S(e,t,n);var r=mf;if(r&&e){var a=Je(r).hoistableStyles,l=vf(e);t=t||"default";var o=a.get(l);if(!o){var i={loading:0,preload:null};if(o=r.querySelector(bf(l)))i.loading=5;else{e=N({rel:"stylesheet",href:e,"data-precedence":t},n),(n=ff.get(l))&&Cf(e,n);var u=o=r.createElement("link");Xe(u),Vc(u,"link",e),u._p=new Promise((function(e,t){u.onload=e,u.onerror=t})),u.addEventListener("load",(function(){i.loading|=1})),u.addEventListener("error",(function(){i.loading|=2})),i.loading|=4,xf(o,t,r)}o={type:"stylesheet",instance:o,count:1,state:i},a.set(l,o)}}},M:function(e,t){hf.M(e,t);var n=mf;if(n&&e){var r=Je(n).hoistableScripts,a=Sf(e),l=r.get(a);l||((l=n.querySelector(kf(a)))||(e=N({src:e,async:!0,type:"module"},t),(t=ff.get(a))&&_f(e,t),Xe(l=n.createElement("script")),Vc(l,"link",e),n.head.appendChild(l)),l={type:"script",instance:l,count:1,state:null},r.set(a,l))}}};var mf="undefined"===typeof document?null:document;function gf(e,t,n){var r=mf;if(r&&"string"===typeof t&&t){var a=mt(t);a='link[rel="'+e+'"][href="'+a+'"]',"string"===typeof n&&(a+='[crossorigin="'+n+'"]'),df.has(a)||(df.add(a),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(a)&&(Vc(t=r.createElement("link"),"link",e),Xe(t),r.head.appendChild(t)))}}function yf(e,t,n,r){var a,l,i,u,s=(s=X.current)?pf(s):null;if(!s)throw Error(o(446));switch(e){case"meta":case"title":return null;case"style":return"string"===typeof n.precedence&&"string"===typeof n.href?(t=vf(n.href),(r=(n=Je(s).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"===typeof n.href&&"string"===typeof n.precedence){e=vf(n.href);var c=Je(s).hoistableStyles,f=c.get(e);if(f||(s=s.ownerDocument||s,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},c.set(e,f),(c=s.querySelector(bf(e)))&&!c._p&&(f.instance=c,f.state.loading=5),ff.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},ff.set(e,n),c||(a=s,l=e,i=n,u=f.state,a.querySelector('link[rel="preload"][as="style"]['+l+"]")?u.loading=1:(l=a.createElement("link"),u.preload=l,l.addEventListener("load",(function(){return u.loading|=1})),l.addEventListener("error",(function(){return u.loading|=2})),Vc(l,"link",i),Xe(l),a.head.appendChild(l))))),t&&null===r)throw Error(o(528,""));return f}if(t&&null!==r)throw Error(o(529,""));return null;case"script":return t=n.async,"string"===typeof(n=n.src)&&t&&"function"!==typeof t&&"symbol"!==typeof t?(t=Sf(n),(r=(n=Je(s).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(o(444,e))}}function vf(e){return'href="'+mt(e)+'"'}function bf(e){return'link[rel="stylesheet"]['+e+"]"}function wf(e){return N({},e,{"data-precedence":e.precedence,precedence:null})}function Sf(e){return'[src="'+mt(e)+'"]'}function kf(e){return"script[async]"+e}function Ef(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+mt(n.href)+'"]');if(r)return t.instance=r,Xe(r),r;var a=N({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return Xe(r=(e.ownerDocument||e).createElement("style")),Vc(r,"style",a),xf(r,n.precedence,e),t.instance=r;case"stylesheet":a=vf(n.href);var l=e.querySelector(bf(a));if(l)return t.state.loading|=4,t.instance=l,Xe(l),l;r=wf(n),(a=ff.get(a))&&Cf(r,a),Xe(l=(e.ownerDocument||e).createElement("link"));var i=l;return i._p=new Promise((function(e,t){i.onload=e,i.onerror=t})),Vc(l,"link",r),t.state.loading|=4,xf(l,n.precedence,e),t.instance=l;case"script":return l=Sf(n.src),(a=e.querySelector(kf(l)))?(t.instance=a,Xe(a),a):(r=n,(a=ff.get(l))&&_f(r=N({},n),a),Xe(a=(e=e.ownerDocument||e).createElement("script")),Vc(a,"link",r),e.head.appendChild(a),t.instance=a);case"void":return null;default:throw Error(o(443,t.type))}else"stylesheet"===t.type&&0===(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,xf(r,n.precedence,e));return t.instance}function xf(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),a=r.length?r[r.length-1]:null,l=a,o=0;o<r.length;o++){var i=r[o];if(i.dataset.precedence===t)l=i;else if(l!==a)break}l?l.parentNode.insertBefore(e,l.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Cf(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function _f(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var Rf=null;function Pf(e,t,n){if(null===Rf){var r=new Map,a=Rf=new Map;a.set(n,r)}else(r=(a=Rf).get(n))||(r=new Map,a.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),a=0;a<n.length;a++){var l=n[a];if(!(l[We]||l[Me]||"link"===e&&"stylesheet"===l.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==l.namespaceURI){var o=l.getAttribute(t)||"";o=e+o;var i=r.get(o);i?i.push(l):r.set(o,[l])}}return r}function Tf(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function Of(e){return"stylesheet"!==e.type||0!==(3&e.state.loading)}var Nf=null;function Lf(){}function zf(){if(this.count--,0===this.count)if(this.stylesheets)Ff(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var Af=null;function Ff(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,Af=new Map,t.forEach(Df,e),Af=null,zf.call(e))}function Df(e,t){if(!(4&t.state.loading)){var n=Af.get(e);if(n)var r=n.get(null);else{n=new Map,Af.set(e,n);for(var a=e.querySelectorAll("link[data-precedence],style[data-precedence]"),l=0;l<a.length;l++){var o=a[l];"LINK"!==o.nodeName&&"not all"===o.getAttribute("media")||(n.set(o.dataset.precedence,o),r=o)}r&&n.set(null,r)}o=(a=t.instance).getAttribute("data-precedence"),(l=n.get(o)||r)===r&&n.set(null,a),n.set(o,a),this.count++,r=zf.bind(this),a.addEventListener("load",r),a.addEventListener("error",r),l?l.parentNode.insertBefore(a,l.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(a,e.firstChild),t.state.loading|=4}}var jf={$$typeof:g,Provider:null,Consumer:null,_currentValue:H,_currentValue2:H,_threadCount:0};function Mf(e,t,n,r,a,l,o,i){this.tag=1,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ne(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.finishedLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ne(0),this.hiddenUpdates=Ne(null),this.identifierPrefix=r,this.onUncaughtError=a,this.onCaughtError=l,this.onRecoverableError=o,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function Uf(e,t,n,r,a,l,o,i,u,s,c,f){return e=new Mf(e,t,n,o,i,u,s,f),t=1,!0===l&&(t|=24),l=Fu(3,null,null,t),e.current=l,l.stateNode=e,(t=Ia()).refCount++,e.pooledCache=t,t.refCount++,l.memoizedState={element:r,isDehydrated:n,cache:t},Ti(l),e}function If(e){return e?e=Lr:Lr}function $f(e,t,n,r,a,l){a=If(a),null===r.context?r.context=a:r.pendingContext=a,(r=Ni(t)).payload={element:n},null!==(l=void 0===l?null:l)&&(r.callback=l),null!==(n=Li(e,r,t))&&(Ls(n,0,t),zi(n,e,t))}function Bf(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Hf(e,t){Bf(e,t),(e=e.alternate)&&Bf(e,t)}function qf(e){if(13===e.tag){var t=Tr(e,67108864);null!==t&&Ls(t,0,67108864),Hf(e,67108864)}}var Wf=!0;function Vf(e,t,n,r){var a=O.T;O.T=null;var l=B.p;try{B.p=2,Kf(e,t,n,r)}finally{B.p=l,O.T=a}}function Qf(e,t,n,r){var a=O.T;O.T=null;var l=B.p;try{B.p=8,Kf(e,t,n,r)}finally{B.p=l,O.T=a}}function Kf(e,t,n,r){if(Wf){var a=Yf(r);if(null===a)Ac(e,t,r,Jf,n),id(e,r);else if(function(e,t,n,r,a){switch(t){case"focusin":return ed=ud(ed,e,t,n,r,a),!0;case"dragenter":return td=ud(td,e,t,n,r,a),!0;case"mouseover":return nd=ud(nd,e,t,n,r,a),!0;case"pointerover":var l=a.pointerId;return rd.set(l,ud(rd.get(l)||null,e,t,n,r,a)),!0;case"gotpointercapture":return l=a.pointerId,ad.set(l,ud(ad.get(l)||null,e,t,n,r,a)),!0}return!1}(a,e,t,n,r))r.stopPropagation();else if(id(e,r),4&t&&-1<od.indexOf(e)){for(;null!==a;){var l=Ke(a);if(null!==l)switch(l.tag){case 3:if((l=l.stateNode).current.memoizedState.isDehydrated){var o=Ce(l.pendingLanes);if(0!==o){var i=l;for(i.pendingLanes|=2,i.entangledLanes|=2;o;){var u=1<<31-we(o);i.entanglements[1]|=u,o&=~u}mc(l),0===(6&es)&&(ws=ue()+500,gc(0,!1))}}break;case 13:null!==(i=Tr(l,2))&&Ls(i,0,2),Ms(),Hf(l,2)}if(null===(l=Yf(r))&&Ac(e,t,r,Jf,n),l===a)break;a=l}null!==a&&r.stopPropagation()}else Ac(e,t,r,null,n)}}function Yf(e){return Xf(e=Nt(e))}var Jf=null;function Xf(e){if(Jf=null,null!==(e=Qe(e))){var t=j(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=M(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return Jf=e,null}function Gf(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(se()){case ce:return 2;case fe:return 8;case de:case pe:return 32;case he:return 268435456;default:return 32}default:return 32}}var Zf=!1,ed=null,td=null,nd=null,rd=new Map,ad=new Map,ld=[],od="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function id(e,t){switch(e){case"focusin":case"focusout":ed=null;break;case"dragenter":case"dragleave":td=null;break;case"mouseover":case"mouseout":nd=null;break;case"pointerover":case"pointerout":rd.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ad.delete(t.pointerId)}}function ud(e,t,n,r,a,l){return null===e||e.nativeEvent!==l?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:l,targetContainers:[a]},null!==t&&(null!==(t=Ke(t))&&qf(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==a&&-1===t.indexOf(a)&&t.push(a),e)}function sd(e){var t=Qe(e.target);if(null!==t){var n=j(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=M(n)))return e.blockedOn=t,void function(e,t){var n=B.p;try{return B.p=e,t()}finally{B.p=n}}(e.priority,(function(){if(13===n.tag){var e=Os(),t=Tr(n,e);null!==t&&Ls(t,0,e),Hf(n,e)}}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function cd(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Yf(e.nativeEvent);if(null!==n)return null!==(t=Ke(n))&&qf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Ot=r,n.target.dispatchEvent(r),Ot=null,t.shift()}return!0}function fd(e,t,n){cd(e)&&n.delete(t)}function dd(){Zf=!1,null!==ed&&cd(ed)&&(ed=null),null!==td&&cd(td)&&(td=null),null!==nd&&cd(nd)&&(nd=null),rd.forEach(fd),ad.forEach(fd)}function pd(e,t){e.blockedOn===t&&(e.blockedOn=null,Zf||(Zf=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,dd)))}var hd=null;function md(e){hd!==e&&(hd=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,(function(){hd===e&&(hd=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],a=e[t+2];if("function"!==typeof r){if(null===Xf(r||n))continue;break}var l=Ke(n);null!==l&&(e.splice(t,3),t-=3,co(l,{pending:!0,data:a,method:n.method,action:r},r,a))}})))}function gd(e){function t(t){return pd(t,e)}null!==ed&&pd(ed,e),null!==td&&pd(td,e),null!==nd&&pd(nd,e),rd.forEach(t),ad.forEach(t);for(var n=0;n<ld.length;n++){var r=ld[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<ld.length&&null===(n=ld[0]).blockedOn;)sd(n),null===n.blockedOn&&ld.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var a=n[r],l=n[r+1],o=a[Ue]||null;if("function"===typeof l)o||md(n);else if(o){var i=null;if(l&&l.hasAttribute("formAction")){if(a=l,o=l[Ue]||null)i=o.formAction;else if(null!==Xf(a))continue}else i=o.action;"function"===typeof i?n[r+1]=i:(n.splice(r,3),r-=3),md(n)}}}function yd(e){this._internalRoot=e}function vd(e){this._internalRoot=e}vd.prototype.render=yd.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));$f(t.current,Os(),e,t,null,null)},vd.prototype.unmount=yd.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;0===e.tag&&tc(),$f(e.current,2,null,e,null,null),Ms(),t[Ie]=null}},vd.prototype.unstable_scheduleHydration=function(e){if(e){var t=De();e={blockedOn:null,target:e,priority:t};for(var n=0;n<ld.length&&0!==t&&t<ld[n].priority;n++);ld.splice(n,0,e),0===n&&sd(e)}};var bd=a.version;if("19.0.0"!==bd)throw Error(o(527,bd,"19.0.0"));B.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=j(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var a=n.return;if(null===a)break;var l=a.alternate;if(null===l){if(null!==(r=a.return)){n=r;continue}break}if(a.child===l.child){for(l=a.child;l;){if(l===n)return U(a),e;if(l===r)return U(a),t;l=l.sibling}throw Error(o(188))}if(n.return!==r.return)n=a,r=l;else{for(var i=!1,u=a.child;u;){if(u===n){i=!0,n=a,r=l;break}if(u===r){i=!0,r=a,n=l;break}u=u.sibling}if(!i){for(u=l.child;u;){if(u===n){i=!0,n=l,r=a;break}if(u===r){i=!0,r=l,n=a;break}u=u.sibling}if(!i)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(t),e=null===(e=null!==e?I(e):null)?null:e.stateNode};var wd={bundleType:0,version:"19.0.0",rendererPackageName:"react-dom",currentDispatcherRef:O,findFiberByHostInstance:Qe,reconcilerVersion:"19.0.0"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var Sd=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Sd.isDisabled&&Sd.supportsFiber)try{ye=Sd.inject(wd),ve=Sd}catch(Ed){}}t.createRoot=function(e,t){if(!i(e))throw Error(o(299));var n=!1,r="",a=Fo,l=Do,u=jo;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(a=t.onUncaughtError),void 0!==t.onCaughtError&&(l=t.onCaughtError),void 0!==t.onRecoverableError&&(u=t.onRecoverableError),void 0!==t.unstable_transitionCallbacks&&t.unstable_transitionCallbacks),t=Uf(e,1,!1,null,0,n,r,a,l,u,0,null),e[Ie]=t.current,Lc(8===e.nodeType?e.parentNode:e),new yd(t)},t.hydrateRoot=function(e,t,n){if(!i(e))throw Error(o(299));var r=!1,a="",l=Fo,u=Do,s=jo,c=null;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onUncaughtError&&(l=n.onUncaughtError),void 0!==n.onCaughtError&&(u=n.onCaughtError),void 0!==n.onRecoverableError&&(s=n.onRecoverableError),void 0!==n.unstable_transitionCallbacks&&n.unstable_transitionCallbacks,void 0!==n.formState&&(c=n.formState)),(t=Uf(e,1,!0,t,0,r,a,l,u,s,0,c)).context=If(null),n=t.current,(a=Ni(r=Os())).callback=null,Li(n,a,r),t.current.lanes=r,Le(t,r),mc(t),e[Ie]=t.current,Lc(e),new vd(t)},t.version="19.0.0"},43:(e,t,n)=>{e.exports=n(288)},175:(e,t)=>{const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,r=/^[\u0021-\u003A\u003C-\u007E]*$/,a=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,l=/^[\u0020-\u003A\u003D-\u007E]*$/,o=Object.prototype.toString,i=(()=>{const e=function(){};return e.prototype=Object.create(null),e})();function u(e,t,n){do{const n=e.charCodeAt(t);if(32!==n&&9!==n)return t}while(++t<n);return n}function s(e,t,n){for(;t>n;){const n=e.charCodeAt(--t);if(32!==n&&9!==n)return t+1}return n}function c(e){if(-1===e.indexOf("%"))return e;try{return decodeURIComponent(e)}catch(t){return e}}},288:(e,t)=>{var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),a=Symbol.for("react.fragment"),l=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.consumer"),u=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),p=Symbol.iterator;var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function y(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||h}y.prototype.isReactComponent={},y.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},y.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=y.prototype;var w=b.prototype=new v;w.constructor=b,m(w,y.prototype),w.isPureReactComponent=!0;var S=Array.isArray,k={H:null,A:null,T:null,S:null},E=Object.prototype.hasOwnProperty;function x(e,t,r,a,l,o){return r=o.ref,{$$typeof:n,type:e,key:t,ref:void 0!==r?r:null,props:o}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var _=/\/+/g;function R(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function P(){}function T(e,t,a,l,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var u,s,c=!1;if(null===e)c=!0;else switch(i){case"bigint":case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0;break;case d:return T((c=e._init)(e._payload),t,a,l,o)}}if(c)return o=o(e),c=""===l?"."+R(e,0):l,S(o)?(a="",null!=c&&(a=c.replace(_,"$&/")+"/"),T(o,t,a,"",(function(e){return e}))):null!=o&&(C(o)&&(u=o,s=a+(null==o.key||e&&e.key===o.key?"":(""+o.key).replace(_,"$&/")+"/")+c,o=x(u.type,s,void 0,0,0,u.props)),t.push(o)),1;c=0;var f,h=""===l?".":l+":";if(S(e))for(var m=0;m<e.length;m++)c+=T(l=e[m],t,a,i=h+R(l,m),o);else if("function"===typeof(m=null===(f=e)||"object"!==typeof f?null:"function"===typeof(f=p&&f[p]||f["@@iterator"])?f:null))for(e=m.call(e),m=0;!(l=e.next()).done;)c+=T(l=l.value,t,a,i=h+R(l,m++),o);else if("object"===i){if("function"===typeof e.then)return T(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"===typeof e.status?e.then(P,P):(e.status="pending",e.then((function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)}),(function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)}))),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,a,l,o);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return c}function O(e,t,n){if(null==e)return e;var r=[],a=0;return T(e,r,"","",(function(e){return t.call(n,e,a++)})),r}function N(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var L="function"===typeof reportError?reportError:function(e){if("object"===typeof window&&"function"===typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"===typeof e&&null!==e&&"string"===typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"===typeof process&&"function"===typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)};function z(){}t.Children={map:O,forEach:function(e,t,n){O(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return O(e,(function(){t++})),t},toArray:function(e){return O(e,(function(e){return e}))||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=y,t.Fragment=a,t.Profiler=o,t.PureComponent=b,t.StrictMode=l,t.Suspense=c,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=k,t.act=function(){throw Error("act(...) is not supported in production builds of React.")},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error("The argument must be a React element, but you passed "+e+".");var r=m({},e.props),a=e.key;if(null!=t)for(l in void 0!==t.ref&&void 0,void 0!==t.key&&(a=""+t.key),t)!E.call(t,l)||"key"===l||"__self"===l||"__source"===l||"ref"===l&&void 0===t.ref||(r[l]=t[l]);var l=arguments.length-2;if(1===l)r.children=n;else if(1<l){for(var o=Array(l),i=0;i<l;i++)o[i]=arguments[i+2];r.children=o}return x(e.type,a,void 0,0,0,r)},t.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:i,_context:e},e},t.createElement=function(e,t,n){var r,a={},l=null;if(null!=t)for(r in void 0!==t.key&&(l=""+t.key),t)E.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(a[r]=t[r]);var o=arguments.length-2;if(1===o)a.children=n;else if(1<o){for(var i=Array(o),u=0;u<o;u++)i[u]=arguments[u+2];a.children=i}if(e&&e.defaultProps)for(r in o=e.defaultProps)void 0===a[r]&&(a[r]=o[r]);return x(e,l,void 0,0,0,a)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=C,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:N}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=k.T,n={};k.T=n;try{var r=e(),a=k.S;null!==a&&a(n,r),"object"===typeof r&&null!==r&&"function"===typeof r.then&&r.then(z,L)}catch(l){L(l)}finally{k.T=t}},t.unstable_useCacheRefresh=function(){return k.H.useCacheRefresh()},t.use=function(e){return k.H.use(e)},t.useActionState=function(e,t,n){return k.H.useActionState(e,t,n)},t.useCallback=function(e,t){return k.H.useCallback(e,t)},t.useContext=function(e){return k.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return k.H.useDeferredValue(e,t)},t.useEffect=function(e,t){return k.H.useEffect(e,t)},t.useId=function(){return k.H.useId()},t.useImperativeHandle=function(e,t,n){return k.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return k.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return k.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return k.H.useMemo(e,t)},t.useOptimistic=function(e,t){return k.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return k.H.useReducer(e,t,n)},t.useRef=function(e){return k.H.useRef(e)},t.useState=function(e){return k.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return k.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return k.H.useTransition()},t.version="19.0.0"},391:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(4)},579:(e,t,n)=>{e.exports=n(799)},672:(e,t,n)=>{var r=n(43);function a(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function l(){}var o={d:{f:l,r:function(){throw Error(a(522))},D:l,C:l,L:l,m:l,X:l,S:l,M:l},p:0,findDOMNode:null},i=Symbol.for("react.portal");var u=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function s(e,t){return"font"===e?"":"string"===typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=o,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(a(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:i,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=u.T,n=o.p;try{if(u.T=null,o.p=2,e)return e()}finally{u.T=t,o.p=n,o.d.f()}},t.preconnect=function(e,t){"string"===typeof e&&(t?t="string"===typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:t=null,o.d.C(e,t))},t.prefetchDNS=function(e){"string"===typeof e&&o.d.D(e)},t.preinit=function(e,t){if("string"===typeof e&&t&&"string"===typeof t.as){var n=t.as,r=s(n,t.crossOrigin),a="string"===typeof t.integrity?t.integrity:void 0,l="string"===typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?o.d.S(e,"string"===typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:a,fetchPriority:l}):"script"===n&&o.d.X(e,{crossOrigin:r,integrity:a,fetchPriority:l,nonce:"string"===typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"===typeof e)if("object"===typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=s(t.as,t.crossOrigin);o.d.M(e,{crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0})}}else null==t&&o.d.M(e)},t.preload=function(e,t){if("string"===typeof e&&"object"===typeof t&&null!==t&&"string"===typeof t.as){var n=t.as,r=s(n,t.crossOrigin);o.d.L(e,n,{crossOrigin:r,integrity:"string"===typeof t.integrity?t.integrity:void 0,nonce:"string"===typeof t.nonce?t.nonce:void 0,type:"string"===typeof t.type?t.type:void 0,fetchPriority:"string"===typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"===typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"===typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"===typeof t.imageSizes?t.imageSizes:void 0,media:"string"===typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"===typeof e)if(t){var n=s(t.as,t.crossOrigin);o.d.m(e,{as:"string"===typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"===typeof t.integrity?t.integrity:void 0})}else o.d.m(e)},t.requestFormReset=function(e){o.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return u.H.useFormState(e,t,n)},t.useFormStatus=function(){return u.H.useHostTransitionStatus()},t.version="19.0.0"},799:(e,t)=>{var n=Symbol.for("react.transitional.element");function r(e,t,r){var a=null;if(void 0!==r&&(a=""+r),void 0!==t.key&&(a=""+t.key),"key"in t)for(var l in r={},t)"key"!==l&&(r[l]=t[l]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:a,ref:void 0!==t?t:null,props:r}}Symbol.for("react.fragment"),t.jsx=r,t.jsxs=r},853:(e,t,n)=>{e.exports=n(896)},896:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,a=e[r];if(!(0<l(a,t)))break e;e[r]=t,e[n]=a,n=r}}function r(e){return 0===e.length?null:e[0]}function a(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,a=e.length,o=a>>>1;r<o;){var i=2*(r+1)-1,u=e[i],s=i+1,c=e[s];if(0>l(u,n))s<a&&0>l(c,u)?(e[r]=c,e[s]=n,r=s):(e[r]=u,e[i]=n,r=i);else{if(!(s<a&&0>l(c,n)))break e;e[r]=c,e[s]=n,r=s}}}return t}function l(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"===typeof performance&&"function"===typeof performance.now){var o=performance;t.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();t.unstable_now=function(){return i.now()-u}}var s=[],c=[],f=1,d=null,p=3,h=!1,m=!1,g=!1,y="function"===typeof setTimeout?setTimeout:null,v="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(c);null!==t;){if(null===t.callback)a(c);else{if(!(t.startTime<=e))break;a(c),t.sortIndex=t.expirationTime,n(s,t)}t=r(c)}}function S(e){if(g=!1,w(e),!m)if(null!==r(s))m=!0,N();else{var t=r(c);null!==t&&L(S,t.startTime-e)}}var k,E=!1,x=-1,C=5,_=-1;function R(){return!(t.unstable_now()-_<C)}function P(){if(E){var e=t.unstable_now();_=e;var n=!0;try{e:{m=!1,g&&(g=!1,v(x),x=-1),h=!0;var l=p;try{t:{for(w(e),d=r(s);null!==d&&!(d.expirationTime>e&&R());){var o=d.callback;if("function"===typeof o){d.callback=null,p=d.priorityLevel;var i=o(d.expirationTime<=e);if(e=t.unstable_now(),"function"===typeof i){d.callback=i,w(e),n=!0;break t}d===r(s)&&a(s),w(e)}else a(s);d=r(s)}if(null!==d)n=!0;else{var u=r(c);null!==u&&L(S,u.startTime-e),n=!1}}break e}finally{d=null,p=l,h=!1}n=void 0}}finally{n?k():E=!1}}}if("function"===typeof b)k=function(){b(P)};else if("undefined"!==typeof MessageChannel){var T=new MessageChannel,O=T.port2;T.port1.onmessage=P,k=function(){O.postMessage(null)}}else k=function(){y(P,0)};function N(){E||(E=!0,k())}function L(e,n){x=y((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){m||h||(m=!0,N())},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return p},t.unstable_getFirstCallbackNode=function(){return r(s)},t.unstable_next=function(e){switch(p){case 1:case 2:case 3:var t=3;break;default:t=p}var n=p;p=t;try{return e()}finally{p=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=p;p=e;try{return t()}finally{p=n}},t.unstable_scheduleCallback=function(e,a,l){var o=t.unstable_now();switch("object"===typeof l&&null!==l?l="number"===typeof(l=l.delay)&&0<l?o+l:o:l=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:f++,callback:a,priorityLevel:e,startTime:l,expirationTime:i=l+i,sortIndex:-1},l>o?(e.sortIndex=l,n(c,e),null===r(s)&&e===r(c)&&(g?(v(x),x=-1):g=!0,L(S,l-o))):(e.sortIndex=i,n(s,e),m||h||(m=!0,N())),e},t.unstable_shouldYield=R,t.unstable_wrapCallback=function(e){var t=p;return function(){var n=p;p=t;try{return e.apply(this,arguments)}finally{p=n}}}},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(672)}},t={};function n(r){var a=t[r];if(void 0!==a)return a.exports;var l=t[r]={exports:{}};return e[r](l,l.exports,n),l.exports}n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})};var r={};n.r(r),n.d(r,{hasBrowserEnv:()=>pn,hasStandardBrowserEnv:()=>mn,hasStandardBrowserWebWorkerEnv:()=>gn,navigator:()=>hn,origin:()=>yn});var a=n(43),l=n(391),o=(n(175),"popstate");function i(){return h((function(e,t){let{pathname:n,search:r,hash:a}=e.location;return f("",{pathname:n,search:r,hash:a},t.state&&t.state.usr||null,t.state&&t.state.key||"default")}),(function(e,t){return"string"===typeof t?t:d(t)}),null,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{})}function u(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}function s(e,t){if(!e){"undefined"!==typeof console&&console.warn(t);try{throw new Error(t)}catch(n){}}}function c(e,t){return{usr:e.state,key:e.key,idx:t}}function f(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,r=arguments.length>3?arguments[3]:void 0;return{pathname:"string"===typeof e?e:e.pathname,search:"",hash:"",..."string"===typeof t?p(t):t,state:n,key:t&&t.key||r||Math.random().toString(36).substring(2,10)}}function d(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&"?"!==n&&(t+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(t+="#"===r.charAt(0)?r:"#"+r),t}function p(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function h(e,t,n){let r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},{window:a=document.defaultView,v5Compat:l=!1}=r,i=a.history,s="POP",p=null,h=m();function m(){return(i.state||{idx:null}).idx}function g(){s="POP";let e=m(),t=null==e?null:e-h;h=e,p&&p({action:s,location:v.location,delta:t})}function y(e){let t="null"!==a.location.origin?a.location.origin:a.location.href,n="string"===typeof e?e:d(e);return n=n.replace(/ $/,"%20"),u(t,`No window.location.(origin|href) available to create URL for href: ${n}`),new URL(n,t)}null==h&&(h=0,i.replaceState({...i.state,idx:h},""));let v={get action(){return s},get location(){return e(a,i)},listen(e){if(p)throw new Error("A history only accepts one active listener");return a.addEventListener(o,g),p=e,()=>{a.removeEventListener(o,g),p=null}},createHref:e=>t(a,e),createURL:y,encodeLocation(e){let t=y(e);return{pathname:t.pathname,search:t.search,hash:t.hash}},push:function(e,t){s="PUSH";let r=f(v.location,e,t);n&&n(r,e),h=m()+1;let o=c(r,h),u=v.createHref(r);try{i.pushState(o,"",u)}catch(d){if(d instanceof DOMException&&"DataCloneError"===d.name)throw d;a.location.assign(u)}l&&p&&p({action:s,location:v.location,delta:1})},replace:function(e,t){s="REPLACE";let r=f(v.location,e,t);n&&n(r,e),h=m();let a=c(r,h),o=v.createHref(r);i.replaceState(a,"",o),l&&p&&p({action:s,location:v.location,delta:0})},go:e=>i.go(e)};return v}function m(e,t){return g(e,t,arguments.length>2&&void 0!==arguments[2]?arguments[2]:"/",!1)}function g(e,t,n,r){let a=O(("string"===typeof t?p(t):t).pathname||"/",n);if(null==a)return null;let l=y(e);!function(e){e.sort(((e,t)=>e.score!==t.score?t.score-e.score:function(e,t){let n=e.length===t.length&&e.slice(0,-1).every(((e,n)=>e===t[n]));return n?e[e.length-1]-t[t.length-1]:0}(e.routesMeta.map((e=>e.childrenIndex)),t.routesMeta.map((e=>e.childrenIndex)))))}(l);let o=null;for(let i=0;null==o&&i<l.length;++i){let e=T(a);o=R(l[i],e,r)}return o}function y(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"",a=(e,a,l)=>{let o={relativePath:void 0===l?e.path||"":l,caseSensitive:!0===e.caseSensitive,childrenIndex:a,route:e};o.relativePath.startsWith("/")&&(u(o.relativePath.startsWith(r),`Absolute route path "${o.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),o.relativePath=o.relativePath.slice(r.length));let i=F([r,o.relativePath]),s=n.concat(o);e.children&&e.children.length>0&&(u(!0!==e.index,`Index routes must not have child routes. Please remove all child routes from route path "${i}".`),y(e.children,t,s,i)),(null!=e.path||e.index)&&t.push({path:i,score:_(i,e.index),routesMeta:s})};return e.forEach(((e,t)=>{if(""!==e.path&&e.path?.includes("?"))for(let n of v(e.path))a(e,t,n);else a(e,t)})),t}function v(e){let t=e.split("/");if(0===t.length)return[];let[n,...r]=t,a=n.endsWith("?"),l=n.replace(/\?$/,"");if(0===r.length)return a?[l,""]:[l];let o=v(r.join("/")),i=[];return i.push(...o.map((e=>""===e?l:[l,e].join("/")))),a&&i.push(...o),i.map((t=>e.startsWith("/")&&""===t?"/":t))}var b=/^:[\w-]+$/,w=3,S=2,k=1,E=10,x=-2,C=e=>"*"===e;function _(e,t){let n=e.split("/"),r=n.length;return n.some(C)&&(r+=x),t&&(r+=S),n.filter((e=>!C(e))).reduce(((e,t)=>e+(b.test(t)?w:""===t?k:E)),r)}function R(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],{routesMeta:r}=e,a={},l="/",o=[];for(let i=0;i<r.length;++i){let e=r[i],u=i===r.length-1,s="/"===l?t:t.slice(l.length)||"/",c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:u},s),f=e.route;if(!c&&u&&n&&!r[r.length-1].route.index&&(c=P({path:e.relativePath,caseSensitive:e.caseSensitive,end:!1},s)),!c)return null;Object.assign(a,c.params),o.push({params:a,pathname:F([l,c.pathname]),pathnameBase:D(F([l,c.pathnameBase])),route:f}),"/"!==c.pathnameBase&&(l=F([l,c.pathnameBase]))}return o}function P(e,t){"string"===typeof e&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];s("*"===e||!e.endsWith("*")||e.endsWith("/*"),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,"/*")}".`);let r=[],a="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,((e,t,n)=>(r.push({paramName:t,isOptional:null!=n}),n?"/?([^\\/]+)?":"/([^\\/]+)")));e.endsWith("*")?(r.push({paramName:"*"}),a+="*"===e||"/*"===e?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?a+="\\/*$":""!==e&&"/"!==e&&(a+="(?:(?=\\/|$))");let l=new RegExp(a,t?void 0:"i");return[l,r]}(e.path,e.caseSensitive,e.end),a=t.match(n);if(!a)return null;let l=a[0],o=l.replace(/(.)\/+$/,"$1"),i=a.slice(1);return{params:r.reduce(((e,t,n)=>{let{paramName:r,isOptional:a}=t;if("*"===r){let e=i[n]||"";o=l.slice(0,l.length-e.length).replace(/(.)\/+$/,"$1")}const u=i[n];return e[r]=a&&!u?void 0:(u||"").replace(/%2F/g,"/"),e}),{}),pathname:l,pathnameBase:o,pattern:e}}function T(e){try{return e.split("/").map((e=>decodeURIComponent(e).replace(/\//g,"%2F"))).join("/")}catch(t){return s(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function O(e,t){if("/"===t)return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&"/"!==r?null:e.slice(n)||"/"}function N(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function L(e){return e.filter(((e,t)=>0===t||e.route.path&&e.route.path.length>0))}function z(e){let t=L(e);return t.map(((e,n)=>n===t.length-1?e.pathname:e.pathnameBase))}function A(e,t,n){let r,a=arguments.length>3&&void 0!==arguments[3]&&arguments[3];"string"===typeof e?r=p(e):(r={...e},u(!r.pathname||!r.pathname.includes("?"),N("?","pathname","search",r)),u(!r.pathname||!r.pathname.includes("#"),N("#","pathname","hash",r)),u(!r.search||!r.search.includes("#"),N("#","search","hash",r)));let l,o=""===e||""===r.pathname,i=o?"/":r.pathname;if(null==i)l=n;else{let e=t.length-1;if(!a&&i.startsWith("..")){let t=i.split("/");for(;".."===t[0];)t.shift(),e-=1;r.pathname=t.join("/")}l=e>=0?t[e]:"/"}let s=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"/",{pathname:n,search:r="",hash:a=""}="string"===typeof e?p(e):e,l=n?n.startsWith("/")?n:function(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach((e=>{".."===e?n.length>1&&n.pop():"."!==e&&n.push(e)})),n.length>1?n.join("/"):"/"}(n,t):t;return{pathname:l,search:j(r),hash:M(a)}}(r,l),c=i&&"/"!==i&&i.endsWith("/"),f=(o||"."===i)&&n.endsWith("/");return s.pathname.endsWith("/")||!c&&!f||(s.pathname+="/"),s}var F=e=>e.join("/").replace(/\/\/+/g,"/"),D=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),j=e=>e&&"?"!==e?e.startsWith("?")?e:"?"+e:"",M=e=>e&&"#"!==e?e.startsWith("#")?e:"#"+e:"";function U(e){return null!=e&&"number"===typeof e.status&&"string"===typeof e.statusText&&"boolean"===typeof e.internal&&"data"in e}var I=["POST","PUT","PATCH","DELETE"],$=(new Set(I),["GET",...I]);new Set($),Symbol("ResetLoaderData");var B=a.createContext(null);B.displayName="DataRouter";var H=a.createContext(null);H.displayName="DataRouterState";var q=a.createContext({isTransitioning:!1});q.displayName="ViewTransition";var W=a.createContext(new Map);W.displayName="Fetchers";var V=a.createContext(null);V.displayName="Await";var Q=a.createContext(null);Q.displayName="Navigation";var K=a.createContext(null);K.displayName="Location";var Y=a.createContext({outlet:null,matches:[],isDataRoute:!1});Y.displayName="Route";var J=a.createContext(null);J.displayName="RouteError";function X(){return null!=a.useContext(K)}function G(){return u(X(),"useLocation() may be used only in the context of a <Router> component."),a.useContext(K).location}var Z="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function ee(e){a.useContext(Q).static||a.useLayoutEffect(e)}function te(){let{isDataRoute:e}=a.useContext(Y);return e?function(){let{router:e}=ce("useNavigate"),t=de("useNavigate"),n=a.useRef(!1);ee((()=>{n.current=!0}));let r=a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};s(n.current,Z),n.current&&("number"===typeof r?e.navigate(r):await e.navigate(r,{fromRouteId:t,...a}))}),[e,t]);return r}():function(){u(X(),"useNavigate() may be used only in the context of a <Router> component.");let e=a.useContext(B),{basename:t,navigator:n}=a.useContext(Q),{matches:r}=a.useContext(Y),{pathname:l}=G(),o=JSON.stringify(z(r)),i=a.useRef(!1);ee((()=>{i.current=!0}));let c=a.useCallback((function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(s(i.current,Z),!i.current)return;if("number"===typeof r)return void n.go(r);let u=A(r,JSON.parse(o),l,"path"===a.relative);null==e&&"/"!==t&&(u.pathname="/"===u.pathname?t:F([t,u.pathname])),(a.replace?n.replace:n.push)(u,a.state,a)}),[t,n,o,l,e]);return c}()}a.createContext(null);function ne(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{matches:n}=a.useContext(Y),{pathname:r}=G(),l=JSON.stringify(z(n));return a.useMemo((()=>A(e,JSON.parse(l),r,"path"===t)),[e,l,r,t])}function re(e,t,n,r){u(X(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:l,static:o}=a.useContext(Q),{matches:i}=a.useContext(Y),c=i[i.length-1],f=c?c.params:{},d=c?c.pathname:"/",h=c?c.pathnameBase:"/",g=c&&c.route;{let e=g&&g.path||"";me(d,!g||e.endsWith("*")||e.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${d}" (under <Route path="${e}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.\n\nPlease change the parent <Route path="${e}"> to <Route path="${"/"===e?"*":`${e}/*`}">.`)}let y,v=G();if(t){let e="string"===typeof t?p(t):t;u("/"===h||e.pathname?.startsWith(h),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${h}" but pathname "${e.pathname}" was given in the \`location\` prop.`),y=e}else y=v;let b=y.pathname||"/",w=b;if("/"!==h){let e=h.replace(/^\//,"").split("/");w="/"+b.replace(/^\//,"").split("/").slice(e.length).join("/")}let S=!o&&n&&n.matches&&n.matches.length>0?n.matches:m(e,{pathname:w});s(g||null!=S,`No routes matched location "${y.pathname}${y.search}${y.hash}" `),s(null==S||void 0!==S[S.length-1].route.element||void 0!==S[S.length-1].route.Component||void 0!==S[S.length-1].route.lazy,`Matched leaf route at location "${y.pathname}${y.search}${y.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let k=ue(S&&S.map((e=>Object.assign({},e,{params:Object.assign({},f,e.params),pathname:F([h,l.encodeLocation?l.encodeLocation(e.pathname).pathname:e.pathname]),pathnameBase:"/"===e.pathnameBase?h:F([h,l.encodeLocation?l.encodeLocation(e.pathnameBase).pathname:e.pathnameBase])}))),i,n,r);return t&&k?a.createElement(K.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...y},navigationType:"POP"}},k):k}function ae(){let e=pe(),t=U(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",l={padding:"0.5rem",backgroundColor:r},o={padding:"2px 4px",backgroundColor:r},i=null;return console.error("Error handled by React Router default ErrorBoundary:",e),i=a.createElement(a.Fragment,null,a.createElement("p",null,"\ud83d\udcbf Hey developer \ud83d\udc4b"),a.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",a.createElement("code",{style:o},"ErrorBoundary")," or"," ",a.createElement("code",{style:o},"errorElement")," prop on your route.")),a.createElement(a.Fragment,null,a.createElement("h2",null,"Unexpected Application Error!"),a.createElement("h3",{style:{fontStyle:"italic"}},t),n?a.createElement("pre",{style:l},n):null,i)}var le=a.createElement(ae,null),oe=class extends a.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||"idle"!==t.revalidation&&"idle"===e.revalidation?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:void 0!==e.error?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return void 0!==this.state.error?a.createElement(Y.Provider,{value:this.props.routeContext},a.createElement(J.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function ie(e){let{routeContext:t,match:n,children:r}=e,l=a.useContext(B);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),a.createElement(Y.Provider,{value:t},r)}function ue(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null;if(null==e){if(!n)return null;if(n.errors)e=n.matches;else{if(0!==t.length||n.initialized||!(n.matches.length>0))return null;e=n.matches}}let r=e,l=n?.errors;if(null!=l){let e=r.findIndex((e=>e.route.id&&void 0!==l?.[e.route.id]));u(e>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(l).join(",")}`),r=r.slice(0,Math.min(r.length,e+1))}let o=!1,i=-1;if(n)for(let a=0;a<r.length;a++){let e=r[a];if((e.route.HydrateFallback||e.route.hydrateFallbackElement)&&(i=a),e.route.id){let{loaderData:t,errors:a}=n,l=e.route.loader&&!t.hasOwnProperty(e.route.id)&&(!a||void 0===a[e.route.id]);if(e.route.lazy||l){o=!0,r=i>=0?r.slice(0,i+1):[r[0]];break}}}return r.reduceRight(((e,u,s)=>{let c,f=!1,d=null,p=null;n&&(c=l&&u.route.id?l[u.route.id]:void 0,d=u.route.errorElement||le,o&&(i<0&&0===s?(me("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),f=!0,p=null):i===s&&(f=!0,p=u.route.hydrateFallbackElement||null)));let h=t.concat(r.slice(0,s+1)),m=()=>{let t;return t=c?d:f?p:u.route.Component?a.createElement(u.route.Component,null):u.route.element?u.route.element:e,a.createElement(ie,{match:u,routeContext:{outlet:e,matches:h,isDataRoute:null!=n},children:t})};return n&&(u.route.ErrorBoundary||u.route.errorElement||0===s)?a.createElement(oe,{location:n.location,revalidation:n.revalidation,component:d,error:c,children:m(),routeContext:{outlet:null,matches:h,isDataRoute:!0}}):m()}),null)}function se(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function ce(e){let t=a.useContext(B);return u(t,se(e)),t}function fe(e){let t=a.useContext(H);return u(t,se(e)),t}function de(e){let t=function(e){let t=a.useContext(Y);return u(t,se(e)),t}(e),n=t.matches[t.matches.length-1];return u(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function pe(){let e=a.useContext(J),t=fe("useRouteError"),n=de("useRouteError");return void 0!==e?e:t.errors?.[n]}var he={};function me(e,t,n){t||he[e]||(he[e]=!0,s(!1,n))}a.memo((function(e){let{routes:t,future:n,state:r}=e;return re(t,void 0,r,n)}));function ge(e){u(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function ye(e){let{basename:t="/",children:n=null,location:r,navigationType:l="POP",navigator:o,static:i=!1}=e;u(!X(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let c=t.replace(/^\/*/,"/"),f=a.useMemo((()=>({basename:c,navigator:o,static:i,future:{}})),[c,o,i]);"string"===typeof r&&(r=p(r));let{pathname:d="/",search:h="",hash:m="",state:g=null,key:y="default"}=r,v=a.useMemo((()=>{let e=O(d,c);return null==e?null:{location:{pathname:e,search:h,hash:m,state:g,key:y},navigationType:l}}),[c,d,h,m,g,y,l]);return s(null!=v,`<Router basename="${c}"> is not able to match the URL "${d}${h}${m}" because it does not start with the basename, so the <Router> won't render anything.`),null==v?null:a.createElement(Q.Provider,{value:f},a.createElement(K.Provider,{children:n,value:v}))}function ve(e){let{children:t,location:n}=e;return re(be(t),n)}a.Component;function be(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=[];return a.Children.forEach(e,((e,r)=>{if(!a.isValidElement(e))return;let l=[...t,r];if(e.type===a.Fragment)return void n.push.apply(n,be(e.props.children,l));u(e.type===ge,`[${"string"===typeof e.type?e.type:e.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),u(!e.props.index||!e.props.children,"An index route cannot have child routes.");let o={id:e.props.id||l.join("-"),caseSensitive:e.props.caseSensitive,element:e.props.element,Component:e.props.Component,index:e.props.index,path:e.props.path,loader:e.props.loader,action:e.props.action,hydrateFallbackElement:e.props.hydrateFallbackElement,HydrateFallback:e.props.HydrateFallback,errorElement:e.props.errorElement,ErrorBoundary:e.props.ErrorBoundary,hasErrorBoundary:!0===e.props.hasErrorBoundary||null!=e.props.ErrorBoundary||null!=e.props.errorElement,shouldRevalidate:e.props.shouldRevalidate,handle:e.props.handle,lazy:e.props.lazy};e.props.children&&(o.children=be(e.props.children,l)),n.push(o)})),n}var we="get",Se="application/x-www-form-urlencoded";function ke(e){return null!=e&&"string"===typeof e.tagName}var Ee=null;var xe=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Ce(e){return null==e||xe.has(e)?e:(s(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${Se}"`),null)}function _e(e,t){let n,r,a,l,o;if(ke(i=e)&&"form"===i.tagName.toLowerCase()){let o=e.getAttribute("action");r=o?O(o,t):null,n=e.getAttribute("method")||we,a=Ce(e.getAttribute("enctype"))||Se,l=new FormData(e)}else if(function(e){return ke(e)&&"button"===e.tagName.toLowerCase()}(e)||function(e){return ke(e)&&"input"===e.tagName.toLowerCase()}(e)&&("submit"===e.type||"image"===e.type)){let o=e.form;if(null==o)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let i=e.getAttribute("formaction")||o.getAttribute("action");if(r=i?O(i,t):null,n=e.getAttribute("formmethod")||o.getAttribute("method")||we,a=Ce(e.getAttribute("formenctype"))||Ce(o.getAttribute("enctype"))||Se,l=new FormData(o,e),!function(){if(null===Ee)try{new FormData(document.createElement("form"),0),Ee=!1}catch(e){Ee=!0}return Ee}()){let{name:t,type:n,value:r}=e;if("image"===n){let e=t?`${t}.`:"";l.append(`${e}x`,"0"),l.append(`${e}y`,"0")}else t&&l.append(t,r)}}else{if(ke(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=we,r=null,a=Se,o=e}var i;return l&&"text/plain"===a&&(o=l,l=void 0),{action:r,method:n.toLowerCase(),encType:a,formData:l,body:o}}function Re(e,t){if(!1===e||null===e||"undefined"===typeof e)throw new Error(t)}async function Pe(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise((()=>{}))}}function Te(e){return null!=e&&"string"===typeof e.page}function Oe(e){return null!=e&&(null==e.href?"preload"===e.rel&&"string"===typeof e.imageSrcSet&&"string"===typeof e.imageSizes:"string"===typeof e.rel&&"string"===typeof e.href)}function Ne(e,t,n,r,a,l){let o=(e,t)=>!n[t]||e.route.id!==n[t].route.id,i=(e,t)=>n[t].pathname!==e.pathname||n[t].route.path?.endsWith("*")&&n[t].params["*"]!==e.params["*"];return"assets"===l?t.filter(((e,t)=>o(e,t)||i(e,t))):"data"===l?t.filter(((t,l)=>{let u=r.routes[t.route.id];if(!u||!u.hasLoader)return!1;if(o(t,l)||i(t,l))return!0;if(t.route.shouldRevalidate){let r=t.route.shouldRevalidate({currentUrl:new URL(a.pathname+a.search+a.hash,window.origin),currentParams:n[0]?.params||{},nextUrl:new URL(e,window.origin),nextParams:t.params,defaultShouldRevalidate:!0});if("boolean"===typeof r)return r}return!0})):[]}function Le(e){return[...new Set(e)]}function ze(e,t){let n=new Set,r=new Set(t);return e.reduce(((e,a)=>{if(t&&!Te(a)&&"script"===a.as&&a.href&&r.has(a.href))return e;let l=JSON.stringify(function(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}(a));return n.has(l)||(n.add(l),e.push({key:l,link:a})),e}),[])}function Ae(e){return{__html:e}}Symbol("SingleFetchRedirect");function Fe(e){let t="string"===typeof e?new URL(e,"undefined"===typeof window?"server://singlefetch/":window.location.origin):e;return"/"===t.pathname?t.pathname="_root.data":t.pathname=`${t.pathname.replace(/\/$/,"")}.data`,t}a.Component;function De(e){let{error:t,isOutsideRemixApp:n}=e;console.error(t);let r,l=a.createElement("script",{dangerouslySetInnerHTML:{__html:'\n        console.log(\n          "\ud83d\udcbf Hey developer \ud83d\udc4b. You can provide a way better UX than this when your app throws errors. Check out https://remix.run/guides/errors for more information."\n        );\n      '}});if(U(t))return a.createElement(je,{title:"Unhandled Thrown Response!"},a.createElement("h1",{style:{fontSize:"24px"}},t.status," ",t.statusText),l);if(t instanceof Error)r=t;else{let e=null==t?"Unknown Error":"object"===typeof t&&"toString"in t?t.toString():JSON.stringify(t);r=new Error(e)}return a.createElement(je,{title:"Application Error!",isOutsideRemixApp:n},a.createElement("h1",{style:{fontSize:"24px"}},"Application Error"),a.createElement("pre",{style:{padding:"2rem",background:"hsla(10, 50%, 50%, 0.1)",color:"red",overflow:"auto"}},r.stack),l)}function je(e){let{title:t,renderScripts:n,isOutsideRemixApp:r,children:l}=e,{routeModules:o}=Be();return o.root?.Layout&&!r?l:a.createElement("html",{lang:"en"},a.createElement("head",null,a.createElement("meta",{charSet:"utf-8"}),a.createElement("meta",{name:"viewport",content:"width=device-width,initial-scale=1,viewport-fit=cover"}),a.createElement("title",null,t)),a.createElement("body",null,a.createElement("main",{style:{fontFamily:"system-ui, sans-serif",padding:"2rem"}},l,n?a.createElement(Ye,null):null)))}function Me(e){return!e}function Ue(){let e=a.useContext(B);return Re(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function Ie(){let e=a.useContext(H);return Re(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var $e=a.createContext(void 0);function Be(){let e=a.useContext($e);return Re(e,"You must render this element inside a <HydratedRouter> element"),e}function He(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function qe(e,t,n){if(n&&!Ke)return[e[0]];if(t){let n=e.findIndex((e=>void 0!==t[e.route.id]));return e.slice(0,n+1)}return e}function We(e){let{page:t,...n}=e,{router:r}=Ue(),l=a.useMemo((()=>m(r.routes,t,r.basename)),[r.routes,t,r.basename]);return l?a.createElement(Qe,{page:t,matches:l,...n}):null}function Ve(e){let{manifest:t,routeModules:n}=Be(),[r,l]=a.useState([]);return a.useEffect((()=>{let r=!1;return async function(e,t,n){return ze((await Promise.all(e.map((async e=>{let r=t.routes[e.route.id];if(r){let e=await Pe(r,n);return e.links?e.links():[]}return[]})))).flat(1).filter(Oe).filter((e=>"stylesheet"===e.rel||"preload"===e.rel)).map((e=>"stylesheet"===e.rel?{...e,rel:"prefetch",as:"style"}:{...e,rel:"prefetch"})))}(e,t,n).then((e=>{r||l(e)})),()=>{r=!0}}),[e,t,n]),r}function Qe(e){let{page:t,matches:n,...r}=e,l=G(),{manifest:o,routeModules:i}=Be(),{loaderData:u,matches:s}=Ie(),c=a.useMemo((()=>Ne(t,n,s,o,l,"data")),[t,n,s,o,l]),f=a.useMemo((()=>Ne(t,n,s,o,l,"assets")),[t,n,s,o,l]),d=a.useMemo((()=>{if(t===l.pathname+l.search+l.hash)return[];let e=new Set,r=!1;if(n.forEach((t=>{let n=o.routes[t.route.id];n&&n.hasLoader&&(!c.some((e=>e.route.id===t.route.id))&&t.route.id in u&&i[t.route.id]?.shouldRevalidate||n.hasClientLoader?r=!0:e.add(t.route.id))})),0===e.size)return[];let a=Fe(t);return r&&e.size>0&&a.searchParams.set("_routes",n.filter((t=>e.has(t.route.id))).map((e=>e.route.id)).join(",")),[a.pathname+a.search]}),[u,l,o,c,n,t,i]),p=a.useMemo((()=>function(e,t){return Le(e.map((e=>{let n=t.routes[e.route.id];if(!n)return[];let r=[n.module];return n.imports&&(r=r.concat(n.imports)),r})).flat(1))}(f,o)),[f,o]),h=Ve(f);return a.createElement(a.Fragment,null,d.map((e=>a.createElement("link",{key:e,rel:"prefetch",as:"fetch",href:e,...r}))),p.map((e=>a.createElement("link",{key:e,rel:"modulepreload",href:e,...r}))),h.map((e=>{let{key:t,link:n}=e;return a.createElement("link",{key:t,...n})})))}$e.displayName="FrameworkContext";var Ke=!1;function Ye(e){let{manifest:t,serverHandoffString:n,isSpaMode:r,renderMeta:l}=Be(),{router:o,static:i,staticContext:u}=Ue(),{matches:s}=Ie(),c=Me(r);l&&(l.didRenderScripts=!0);let f=qe(s,null,r);a.useEffect((()=>{Ke=!0}),[]);let d=a.useMemo((()=>{let r=u?`window.__reactRouterContext = ${n};window.__reactRouterContext.stream = new ReadableStream({start(controller){window.__reactRouterContext.streamController = controller;}}).pipeThrough(new TextEncoderStream());`:" ",l=i?`${t.hmr?.runtime?`import ${JSON.stringify(t.hmr.runtime)};`:""}${c?"":`import ${JSON.stringify(t.url)}`};\n${f.map(((e,n)=>`import * as route${n} from ${JSON.stringify(t.routes[e.route.id].module)};`)).join("\n")}\n  ${c?`window.__reactRouterManifest = ${JSON.stringify(function(e,t){let n=new Set(t.state.matches.map((e=>e.route.id))),r=t.state.location.pathname.split("/").filter(Boolean),a=["/"];for(r.pop();r.length>0;)a.push(`/${r.join("/")}`),r.pop();a.forEach((e=>{let r=m(t.routes,e,t.basename);r&&r.forEach((e=>n.add(e.route.id)))}));let l=[...n].reduce(((t,n)=>Object.assign(t,{[n]:e.routes[n]})),{});return{...e,routes:l}}(t,o),null,2)};`:""}\n  window.__reactRouterRouteModules = {${f.map(((e,t)=>`${JSON.stringify(e.route.id)}:route${t}`)).join(",")}};\n\nimport(${JSON.stringify(t.entry.module)});`:" ";return a.createElement(a.Fragment,null,a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:Ae(r),type:void 0}),a.createElement("script",{...e,suppressHydrationWarning:!0,dangerouslySetInnerHTML:Ae(l),type:"module",async:!0}))}),[]),p=f.map((e=>{let n=t.routes[e.route.id];return n?(n.imports||[]).concat([n.module]):[]})).flat(1),h=Ke?[]:t.entry.imports.concat(p);return Ke?null:a.createElement(a.Fragment,null,c?null:a.createElement("link",{rel:"modulepreload",href:t.url,crossOrigin:e.crossOrigin}),a.createElement("link",{rel:"modulepreload",href:t.entry.module,crossOrigin:e.crossOrigin}),(g=h,[...new Set(g)]).map((t=>a.createElement("link",{key:t,rel:"modulepreload",href:t,crossOrigin:e.crossOrigin}))),d);var g}function Je(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return e=>{t.forEach((t=>{"function"===typeof t?t(e):null!=t&&(t.current=e)}))}}var Xe="undefined"!==typeof window&&"undefined"!==typeof window.document&&"undefined"!==typeof window.document.createElement;try{Xe&&(window.__reactRouterVersion="7.1.5")}catch(Or){}function Ge(e){let{basename:t,children:n,window:r}=e,l=a.useRef();null==l.current&&(l.current=i({window:r,v5Compat:!0}));let o=l.current,[u,s]=a.useState({action:o.action,location:o.location}),c=a.useCallback((e=>{a.startTransition((()=>s(e)))}),[s]);return a.useLayoutEffect((()=>o.listen(c)),[o,c]),a.createElement(ye,{basename:t,children:n,location:u.location,navigationType:u.action,navigator:o})}var Ze=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,et=a.forwardRef((function(e,t){let n,{onClick:r,discover:l="render",prefetch:o="none",relative:i,reloadDocument:c,replace:f,state:p,target:h,to:m,preventScrollReset:g,viewTransition:y,...v}=e,{basename:b}=a.useContext(Q),w="string"===typeof m&&Ze.test(m),S=!1;if("string"===typeof m&&w&&(n=m,Xe))try{let e=new URL(window.location.href),t=m.startsWith("//")?new URL(e.protocol+m):new URL(m),n=O(t.pathname,b);t.origin===e.origin&&null!=n?m=n+t.search+t.hash:S=!0}catch(Or){s(!1,`<Link to="${m}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let k=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};u(X(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=a.useContext(Q),{hash:l,pathname:o,search:i}=ne(e,{relative:t}),s=o;return"/"!==n&&(s="/"===o?n:F([n,o])),r.createHref({pathname:s,search:i,hash:l})}(m,{relative:i}),[E,x,C]=function(e,t){let n=a.useContext($e),[r,l]=a.useState(!1),[o,i]=a.useState(!1),{onFocus:u,onBlur:s,onMouseEnter:c,onMouseLeave:f,onTouchStart:d}=t,p=a.useRef(null);a.useEffect((()=>{if("render"===e&&i(!0),"viewport"===e){let e=new IntersectionObserver((e=>{e.forEach((e=>{i(e.isIntersecting)}))}),{threshold:.5});return p.current&&e.observe(p.current),()=>{e.disconnect()}}}),[e]),a.useEffect((()=>{if(r){let e=setTimeout((()=>{i(!0)}),100);return()=>{clearTimeout(e)}}}),[r]);let h=()=>{l(!0)},m=()=>{l(!1),i(!1)};return n?"intent"!==e?[o,p,{}]:[o,p,{onFocus:He(u,h),onBlur:He(s,m),onMouseEnter:He(c,h),onMouseLeave:He(f,m),onTouchStart:He(d,h)}]:[!1,p,{}]}(o,v),_=function(e){let{target:t,replace:n,state:r,preventScrollReset:l,relative:o,viewTransition:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},u=te(),s=G(),c=ne(e,{relative:o});return a.useCallback((a=>{if(function(e,t){return 0===e.button&&(!t||"_self"===t)&&!function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)}(a,t)){a.preventDefault();let t=void 0!==n?n:d(s)===d(c);u(e,{replace:t,state:r,preventScrollReset:l,relative:o,viewTransition:i})}}),[s,u,c,n,r,t,e,l,o,i])}(m,{replace:f,state:p,target:h,preventScrollReset:g,relative:i,viewTransition:y});let R=a.createElement("a",{...v,...C,href:n||k,onClick:S||c?r:function(e){r&&r(e),e.defaultPrevented||_(e)},ref:Je(t,x),target:h,"data-discover":w||"render"!==l?void 0:"true"});return E&&!w?a.createElement(a.Fragment,null,R,a.createElement(We,{page:k})):R}));et.displayName="Link",a.forwardRef((function(e,t){let{"aria-current":n="page",caseSensitive:r=!1,className:l="",end:o=!1,style:i,to:s,viewTransition:c,children:f,...d}=e,p=ne(s,{relative:d.relative}),h=G(),m=a.useContext(H),{navigator:g,basename:y}=a.useContext(Q),v=null!=m&&function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=a.useContext(q);u(null!=n,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=rt("useViewTransitionState"),l=ne(e,{relative:t.relative});if(!n.isTransitioning)return!1;let o=O(n.currentLocation.pathname,r)||n.currentLocation.pathname,i=O(n.nextLocation.pathname,r)||n.nextLocation.pathname;return null!=P(l.pathname,i)||null!=P(l.pathname,o)}(p)&&!0===c,b=g.encodeLocation?g.encodeLocation(p).pathname:p.pathname,w=h.pathname,S=m&&m.navigation&&m.navigation.location?m.navigation.location.pathname:null;r||(w=w.toLowerCase(),S=S?S.toLowerCase():null,b=b.toLowerCase()),S&&y&&(S=O(S,y)||S);const k="/"!==b&&b.endsWith("/")?b.length-1:b.length;let E,x=w===b||!o&&w.startsWith(b)&&"/"===w.charAt(k),C=null!=S&&(S===b||!o&&S.startsWith(b)&&"/"===S.charAt(b.length)),_={isActive:x,isPending:C,isTransitioning:v},R=x?n:void 0;E="function"===typeof l?l(_):[l,x?"active":null,C?"pending":null,v?"transitioning":null].filter(Boolean).join(" ");let T="function"===typeof i?i(_):i;return a.createElement(et,{...d,"aria-current":R,className:E,ref:t,style:T,to:s,viewTransition:c},"function"===typeof f?f(_):f)})).displayName="NavLink";var tt=a.forwardRef(((e,t)=>{let{discover:n="render",fetcherKey:r,navigate:l,reloadDocument:o,replace:i,state:s,method:c=we,action:f,onSubmit:p,relative:h,preventScrollReset:m,viewTransition:g,...y}=e,v=ot(),b=function(e){let{relative:t}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{basename:n}=a.useContext(Q),r=a.useContext(Y);u(r,"useFormAction must be used inside a RouteContext");let[l]=r.matches.slice(-1),o={...ne(e||".",{relative:t})},i=G();if(null==e){o.search=i.search;let e=new URLSearchParams(o.search),t=e.getAll("index");if(t.some((e=>""===e))){e.delete("index"),t.filter((e=>e)).forEach((t=>e.append("index",t)));let n=e.toString();o.search=n?`?${n}`:""}}e&&"."!==e||!l.route.index||(o.search=o.search?o.search.replace(/^\?/,"?index&"):"?index");"/"!==n&&(o.pathname="/"===o.pathname?n:F([n,o.pathname]));return d(o)}(f,{relative:h}),w="get"===c.toLowerCase()?"get":"post",S="string"===typeof f&&Ze.test(f);return a.createElement("form",{ref:t,method:w,action:b,onSubmit:o?p:e=>{if(p&&p(e),e.defaultPrevented)return;e.preventDefault();let t=e.nativeEvent.submitter,n=t?.getAttribute("formmethod")||c;v(t||e.currentTarget,{fetcherKey:r,method:n,navigate:l,replace:i,state:s,relative:h,preventScrollReset:m,viewTransition:g})},...y,"data-discover":S||"render"!==n?void 0:"true"})}));function nt(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function rt(e){let t=a.useContext(B);return u(t,nt(e)),t}tt.displayName="Form";var at=0,lt=()=>`__${String(++at)}__`;function ot(){let{router:e}=rt("useSubmit"),{basename:t}=a.useContext(Q),n=de("useRouteId");return a.useCallback((async function(r){let a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},{action:l,method:o,encType:i,formData:u,body:s}=_e(r,t);if(!1===a.navigate){let t=a.fetcherKey||lt();await e.fetch(t,n,a.action||l,{preventScrollReset:a.preventScrollReset,formData:u,body:s,formMethod:a.method||o,formEncType:a.encType||i,flushSync:a.flushSync})}else await e.navigate(a.action||l,{preventScrollReset:a.preventScrollReset,formData:u,body:s,formMethod:a.method||o,formEncType:a.encType||i,replace:a.replace,state:a.state,fromRouteId:n,flushSync:a.flushSync,viewTransition:a.viewTransition})}),[e,t,n])}new TextEncoder;function it(e,t){return function(){return e.apply(t,arguments)}}const{toString:ut}=Object.prototype,{getPrototypeOf:st}=Object,ct=(ft=Object.create(null),e=>{const t=ut.call(e);return ft[t]||(ft[t]=t.slice(8,-1).toLowerCase())});var ft;const dt=e=>(e=e.toLowerCase(),t=>ct(t)===e),pt=e=>t=>typeof t===e,{isArray:ht}=Array,mt=pt("undefined");const gt=dt("ArrayBuffer");const yt=pt("string"),vt=pt("function"),bt=pt("number"),wt=e=>null!==e&&"object"===typeof e,St=e=>{if("object"!==ct(e))return!1;const t=st(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)},kt=dt("Date"),Et=dt("File"),xt=dt("Blob"),Ct=dt("FileList"),_t=dt("URLSearchParams"),[Rt,Pt,Tt,Ot]=["ReadableStream","Request","Response","Headers"].map(dt);function Nt(e,t){let n,r,{allOwnKeys:a=!1}=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(null!==e&&"undefined"!==typeof e)if("object"!==typeof e&&(e=[e]),ht(e))for(n=0,r=e.length;n<r;n++)t.call(null,e[n],n,e);else{const r=a?Object.getOwnPropertyNames(e):Object.keys(e),l=r.length;let o;for(n=0;n<l;n++)o=r[n],t.call(null,e[o],o,e)}}function Lt(e,t){t=t.toLowerCase();const n=Object.keys(e);let r,a=n.length;for(;a-- >0;)if(r=n[a],t===r.toLowerCase())return r;return null}const zt="undefined"!==typeof globalThis?globalThis:"undefined"!==typeof self?self:"undefined"!==typeof window?window:global,At=e=>!mt(e)&&e!==zt;const Ft=(Dt="undefined"!==typeof Uint8Array&&st(Uint8Array),e=>Dt&&e instanceof Dt);var Dt;const jt=dt("HTMLFormElement"),Mt=(e=>{let{hasOwnProperty:t}=e;return(e,n)=>t.call(e,n)})(Object.prototype),Ut=dt("RegExp"),It=(e,t)=>{const n=Object.getOwnPropertyDescriptors(e),r={};Nt(n,((n,a)=>{let l;!1!==(l=t(n,a,e))&&(r[a]=l||n)})),Object.defineProperties(e,r)},$t="abcdefghijklmnopqrstuvwxyz",Bt="0123456789",Ht={DIGIT:Bt,ALPHA:$t,ALPHA_DIGIT:$t+$t.toUpperCase()+Bt};const qt=dt("AsyncFunction"),Wt=((e,t)=>{return e?setImmediate:t?(n=`axios@${Math.random()}`,r=[],zt.addEventListener("message",(e=>{let{source:t,data:a}=e;t===zt&&a===n&&r.length&&r.shift()()}),!1),e=>{r.push(e),zt.postMessage(n,"*")}):e=>setTimeout(e);var n,r})("function"===typeof setImmediate,vt(zt.postMessage)),Vt="undefined"!==typeof queueMicrotask?queueMicrotask.bind(zt):"undefined"!==typeof process&&process.nextTick||Wt,Qt={isArray:ht,isArrayBuffer:gt,isBuffer:function(e){return null!==e&&!mt(e)&&null!==e.constructor&&!mt(e.constructor)&&vt(e.constructor.isBuffer)&&e.constructor.isBuffer(e)},isFormData:e=>{let t;return e&&("function"===typeof FormData&&e instanceof FormData||vt(e.append)&&("formdata"===(t=ct(e))||"object"===t&&vt(e.toString)&&"[object FormData]"===e.toString()))},isArrayBufferView:function(e){let t;return t="undefined"!==typeof ArrayBuffer&&ArrayBuffer.isView?ArrayBuffer.isView(e):e&&e.buffer&&gt(e.buffer),t},isString:yt,isNumber:bt,isBoolean:e=>!0===e||!1===e,isObject:wt,isPlainObject:St,isReadableStream:Rt,isRequest:Pt,isResponse:Tt,isHeaders:Ot,isUndefined:mt,isDate:kt,isFile:Et,isBlob:xt,isRegExp:Ut,isFunction:vt,isStream:e=>wt(e)&&vt(e.pipe),isURLSearchParams:_t,isTypedArray:Ft,isFileList:Ct,forEach:Nt,merge:function e(){const{caseless:t}=At(this)&&this||{},n={},r=(r,a)=>{const l=t&&Lt(n,a)||a;St(n[l])&&St(r)?n[l]=e(n[l],r):St(r)?n[l]=e({},r):ht(r)?n[l]=r.slice():n[l]=r};for(let a=0,l=arguments.length;a<l;a++)arguments[a]&&Nt(arguments[a],r);return n},extend:function(e,t,n){let{allOwnKeys:r}=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{};return Nt(t,((t,r)=>{n&&vt(t)?e[r]=it(t,n):e[r]=t}),{allOwnKeys:r}),e},trim:e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,""),stripBOM:e=>(65279===e.charCodeAt(0)&&(e=e.slice(1)),e),inherits:(e,t,n,r)=>{e.prototype=Object.create(t.prototype,r),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),n&&Object.assign(e.prototype,n)},toFlatObject:(e,t,n,r)=>{let a,l,o;const i={};if(t=t||{},null==e)return t;do{for(a=Object.getOwnPropertyNames(e),l=a.length;l-- >0;)o=a[l],r&&!r(o,e,t)||i[o]||(t[o]=e[o],i[o]=!0);e=!1!==n&&st(e)}while(e&&(!n||n(e,t))&&e!==Object.prototype);return t},kindOf:ct,kindOfTest:dt,endsWith:(e,t,n)=>{e=String(e),(void 0===n||n>e.length)&&(n=e.length),n-=t.length;const r=e.indexOf(t,n);return-1!==r&&r===n},toArray:e=>{if(!e)return null;if(ht(e))return e;let t=e.length;if(!bt(t))return null;const n=new Array(t);for(;t-- >0;)n[t]=e[t];return n},forEachEntry:(e,t)=>{const n=(e&&e[Symbol.iterator]).call(e);let r;for(;(r=n.next())&&!r.done;){const n=r.value;t.call(e,n[0],n[1])}},matchAll:(e,t)=>{let n;const r=[];for(;null!==(n=e.exec(t));)r.push(n);return r},isHTMLForm:jt,hasOwnProperty:Mt,hasOwnProp:Mt,reduceDescriptors:It,freezeMethods:e=>{It(e,((t,n)=>{if(vt(e)&&-1!==["arguments","caller","callee"].indexOf(n))return!1;const r=e[n];vt(r)&&(t.enumerable=!1,"writable"in t?t.writable=!1:t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+n+"'")}))}))},toObjectSet:(e,t)=>{const n={},r=e=>{e.forEach((e=>{n[e]=!0}))};return ht(e)?r(e):r(String(e).split(t)),n},toCamelCase:e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,(function(e,t,n){return t.toUpperCase()+n})),noop:()=>{},toFiniteNumber:(e,t)=>null!=e&&Number.isFinite(e=+e)?e:t,findKey:Lt,global:zt,isContextDefined:At,ALPHABET:Ht,generateString:function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:16,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Ht.ALPHA_DIGIT,n="";const{length:r}=t;for(;e--;)n+=t[Math.random()*r|0];return n},isSpecCompliantForm:function(e){return!!(e&&vt(e.append)&&"FormData"===e[Symbol.toStringTag]&&e[Symbol.iterator])},toJSONObject:e=>{const t=new Array(10),n=(e,r)=>{if(wt(e)){if(t.indexOf(e)>=0)return;if(!("toJSON"in e)){t[r]=e;const a=ht(e)?[]:{};return Nt(e,((e,t)=>{const l=n(e,r+1);!mt(l)&&(a[t]=l)})),t[r]=void 0,a}}return e};return n(e,0)},isAsyncFn:qt,isThenable:e=>e&&(wt(e)||vt(e))&&vt(e.then)&&vt(e.catch),setImmediate:Wt,asap:Vt};function Kt(e,t,n,r,a){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack,this.message=e,this.name="AxiosError",t&&(this.code=t),n&&(this.config=n),r&&(this.request=r),a&&(this.response=a,this.status=a.status?a.status:null)}Qt.inherits(Kt,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:Qt.toJSONObject(this.config),code:this.code,status:this.status}}});const Yt=Kt.prototype,Jt={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach((e=>{Jt[e]={value:e}})),Object.defineProperties(Kt,Jt),Object.defineProperty(Yt,"isAxiosError",{value:!0}),Kt.from=(e,t,n,r,a,l)=>{const o=Object.create(Yt);return Qt.toFlatObject(e,o,(function(e){return e!==Error.prototype}),(e=>"isAxiosError"!==e)),Kt.call(o,e.message,t,n,r,a),o.cause=e,o.name=e.name,l&&Object.assign(o,l),o};const Xt=Kt;function Gt(e){return Qt.isPlainObject(e)||Qt.isArray(e)}function Zt(e){return Qt.endsWith(e,"[]")?e.slice(0,-2):e}function en(e,t,n){return e?e.concat(t).map((function(e,t){return e=Zt(e),!n&&t?"["+e+"]":e})).join(n?".":""):t}const tn=Qt.toFlatObject(Qt,{},null,(function(e){return/^is[A-Z]/.test(e)}));const nn=function(e,t,n){if(!Qt.isObject(e))throw new TypeError("target must be an object");t=t||new FormData;const r=(n=Qt.toFlatObject(n,{metaTokens:!0,dots:!1,indexes:!1},!1,(function(e,t){return!Qt.isUndefined(t[e])}))).metaTokens,a=n.visitor||s,l=n.dots,o=n.indexes,i=(n.Blob||"undefined"!==typeof Blob&&Blob)&&Qt.isSpecCompliantForm(t);if(!Qt.isFunction(a))throw new TypeError("visitor must be a function");function u(e){if(null===e)return"";if(Qt.isDate(e))return e.toISOString();if(!i&&Qt.isBlob(e))throw new Xt("Blob is not supported. Use a Buffer instead.");return Qt.isArrayBuffer(e)||Qt.isTypedArray(e)?i&&"function"===typeof Blob?new Blob([e]):Buffer.from(e):e}function s(e,n,a){let i=e;if(e&&!a&&"object"===typeof e)if(Qt.endsWith(n,"{}"))n=r?n:n.slice(0,-2),e=JSON.stringify(e);else if(Qt.isArray(e)&&function(e){return Qt.isArray(e)&&!e.some(Gt)}(e)||(Qt.isFileList(e)||Qt.endsWith(n,"[]"))&&(i=Qt.toArray(e)))return n=Zt(n),i.forEach((function(e,r){!Qt.isUndefined(e)&&null!==e&&t.append(!0===o?en([n],r,l):null===o?n:n+"[]",u(e))})),!1;return!!Gt(e)||(t.append(en(a,n,l),u(e)),!1)}const c=[],f=Object.assign(tn,{defaultVisitor:s,convertValue:u,isVisitable:Gt});if(!Qt.isObject(e))throw new TypeError("data must be an object");return function e(n,r){if(!Qt.isUndefined(n)){if(-1!==c.indexOf(n))throw Error("Circular reference detected in "+r.join("."));c.push(n),Qt.forEach(n,(function(n,l){!0===(!(Qt.isUndefined(n)||null===n)&&a.call(t,n,Qt.isString(l)?l.trim():l,r,f))&&e(n,r?r.concat(l):[l])})),c.pop()}}(e),t};function rn(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,(function(e){return t[e]}))}function an(e,t){this._pairs=[],e&&nn(e,this,t)}const ln=an.prototype;ln.append=function(e,t){this._pairs.push([e,t])},ln.toString=function(e){const t=e?function(t){return e.call(this,t,rn)}:rn;return this._pairs.map((function(e){return t(e[0])+"="+t(e[1])}),"").join("&")};const on=an;function un(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+").replace(/%5B/gi,"[").replace(/%5D/gi,"]")}function sn(e,t,n){if(!t)return e;const r=n&&n.encode||un;Qt.isFunction(n)&&(n={serialize:n});const a=n&&n.serialize;let l;if(l=a?a(t,n):Qt.isURLSearchParams(t)?t.toString():new on(t,n).toString(r),l){const t=e.indexOf("#");-1!==t&&(e=e.slice(0,t)),e+=(-1===e.indexOf("?")?"?":"&")+l}return e}const cn=class{constructor(){this.handlers=[]}use(e,t,n){return this.handlers.push({fulfilled:e,rejected:t,synchronous:!!n&&n.synchronous,runWhen:n?n.runWhen:null}),this.handlers.length-1}eject(e){this.handlers[e]&&(this.handlers[e]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(e){Qt.forEach(this.handlers,(function(t){null!==t&&e(t)}))}},fn={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},dn={isBrowser:!0,classes:{URLSearchParams:"undefined"!==typeof URLSearchParams?URLSearchParams:on,FormData:"undefined"!==typeof FormData?FormData:null,Blob:"undefined"!==typeof Blob?Blob:null},protocols:["http","https","file","blob","url","data"]},pn="undefined"!==typeof window&&"undefined"!==typeof document,hn="object"===typeof navigator&&navigator||void 0,mn=pn&&(!hn||["ReactNative","NativeScript","NS"].indexOf(hn.product)<0),gn="undefined"!==typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope&&"function"===typeof self.importScripts,yn=pn&&window.location.href||"http://localhost",vn={...r,...dn};const bn=function(e){function t(e,n,r,a){let l=e[a++];if("__proto__"===l)return!0;const o=Number.isFinite(+l),i=a>=e.length;if(l=!l&&Qt.isArray(r)?r.length:l,i)return Qt.hasOwnProp(r,l)?r[l]=[r[l],n]:r[l]=n,!o;r[l]&&Qt.isObject(r[l])||(r[l]=[]);return t(e,n,r[l],a)&&Qt.isArray(r[l])&&(r[l]=function(e){const t={},n=Object.keys(e);let r;const a=n.length;let l;for(r=0;r<a;r++)l=n[r],t[l]=e[l];return t}(r[l])),!o}if(Qt.isFormData(e)&&Qt.isFunction(e.entries)){const n={};return Qt.forEachEntry(e,((e,r)=>{t(function(e){return Qt.matchAll(/\w+|\[(\w*)]/g,e).map((e=>"[]"===e[0]?"":e[1]||e[0]))}(e),r,n,0)})),n}return null};const wn={transitional:fn,adapter:["xhr","http","fetch"],transformRequest:[function(e,t){const n=t.getContentType()||"",r=n.indexOf("application/json")>-1,a=Qt.isObject(e);a&&Qt.isHTMLForm(e)&&(e=new FormData(e));if(Qt.isFormData(e))return r?JSON.stringify(bn(e)):e;if(Qt.isArrayBuffer(e)||Qt.isBuffer(e)||Qt.isStream(e)||Qt.isFile(e)||Qt.isBlob(e)||Qt.isReadableStream(e))return e;if(Qt.isArrayBufferView(e))return e.buffer;if(Qt.isURLSearchParams(e))return t.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),e.toString();let l;if(a){if(n.indexOf("application/x-www-form-urlencoded")>-1)return function(e,t){return nn(e,new vn.classes.URLSearchParams,Object.assign({visitor:function(e,t,n,r){return vn.isNode&&Qt.isBuffer(e)?(this.append(t,e.toString("base64")),!1):r.defaultVisitor.apply(this,arguments)}},t))}(e,this.formSerializer).toString();if((l=Qt.isFileList(e))||n.indexOf("multipart/form-data")>-1){const t=this.env&&this.env.FormData;return nn(l?{"files[]":e}:e,t&&new t,this.formSerializer)}}return a||r?(t.setContentType("application/json",!1),function(e,t,n){if(Qt.isString(e))try{return(t||JSON.parse)(e),Qt.trim(e)}catch(Or){if("SyntaxError"!==Or.name)throw Or}return(n||JSON.stringify)(e)}(e)):e}],transformResponse:[function(e){const t=this.transitional||wn.transitional,n=t&&t.forcedJSONParsing,r="json"===this.responseType;if(Qt.isResponse(e)||Qt.isReadableStream(e))return e;if(e&&Qt.isString(e)&&(n&&!this.responseType||r)){const n=!(t&&t.silentJSONParsing)&&r;try{return JSON.parse(e)}catch(Or){if(n){if("SyntaxError"===Or.name)throw Xt.from(Or,Xt.ERR_BAD_RESPONSE,this,null,this.response);throw Or}}}return e}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:vn.classes.FormData,Blob:vn.classes.Blob},validateStatus:function(e){return e>=200&&e<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};Qt.forEach(["delete","get","head","post","put","patch"],(e=>{wn.headers[e]={}}));const Sn=wn,kn=Qt.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),En=Symbol("internals");function xn(e){return e&&String(e).trim().toLowerCase()}function Cn(e){return!1===e||null==e?e:Qt.isArray(e)?e.map(Cn):String(e)}function _n(e,t,n,r,a){return Qt.isFunction(r)?r.call(this,t,n):(a&&(t=n),Qt.isString(t)?Qt.isString(r)?-1!==t.indexOf(r):Qt.isRegExp(r)?r.test(t):void 0:void 0)}class Rn{constructor(e){e&&this.set(e)}set(e,t,n){const r=this;function a(e,t,n){const a=xn(t);if(!a)throw new Error("header name must be a non-empty string");const l=Qt.findKey(r,a);(!l||void 0===r[l]||!0===n||void 0===n&&!1!==r[l])&&(r[l||t]=Cn(e))}const l=(e,t)=>Qt.forEach(e,((e,n)=>a(e,n,t)));if(Qt.isPlainObject(e)||e instanceof this.constructor)l(e,t);else if(Qt.isString(e)&&(e=e.trim())&&!/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim()))l((e=>{const t={};let n,r,a;return e&&e.split("\n").forEach((function(e){a=e.indexOf(":"),n=e.substring(0,a).trim().toLowerCase(),r=e.substring(a+1).trim(),!n||t[n]&&kn[n]||("set-cookie"===n?t[n]?t[n].push(r):t[n]=[r]:t[n]=t[n]?t[n]+", "+r:r)})),t})(e),t);else if(Qt.isHeaders(e))for(const[o,i]of e.entries())a(i,o,n);else null!=e&&a(t,e,n);return this}get(e,t){if(e=xn(e)){const n=Qt.findKey(this,e);if(n){const e=this[n];if(!t)return e;if(!0===t)return function(e){const t=Object.create(null),n=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let r;for(;r=n.exec(e);)t[r[1]]=r[2];return t}(e);if(Qt.isFunction(t))return t.call(this,e,n);if(Qt.isRegExp(t))return t.exec(e);throw new TypeError("parser must be boolean|regexp|function")}}}has(e,t){if(e=xn(e)){const n=Qt.findKey(this,e);return!(!n||void 0===this[n]||t&&!_n(0,this[n],n,t))}return!1}delete(e,t){const n=this;let r=!1;function a(e){if(e=xn(e)){const a=Qt.findKey(n,e);!a||t&&!_n(0,n[a],a,t)||(delete n[a],r=!0)}}return Qt.isArray(e)?e.forEach(a):a(e),r}clear(e){const t=Object.keys(this);let n=t.length,r=!1;for(;n--;){const a=t[n];e&&!_n(0,this[a],a,e,!0)||(delete this[a],r=!0)}return r}normalize(e){const t=this,n={};return Qt.forEach(this,((r,a)=>{const l=Qt.findKey(n,a);if(l)return t[l]=Cn(r),void delete t[a];const o=e?function(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,((e,t,n)=>t.toUpperCase()+n))}(a):String(a).trim();o!==a&&delete t[a],t[o]=Cn(r),n[o]=!0})),this}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.constructor.concat(this,...t)}toJSON(e){const t=Object.create(null);return Qt.forEach(this,((n,r)=>{null!=n&&!1!==n&&(t[r]=e&&Qt.isArray(n)?n.join(", "):n)})),t}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map((e=>{let[t,n]=e;return t+": "+n})).join("\n")}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(e){return e instanceof this?e:new this(e)}static concat(e){const t=new this(e);for(var n=arguments.length,r=new Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];return r.forEach((e=>t.set(e))),t}static accessor(e){const t=(this[En]=this[En]={accessors:{}}).accessors,n=this.prototype;function r(e){const r=xn(e);t[r]||(!function(e,t){const n=Qt.toCamelCase(" "+t);["get","set","has"].forEach((r=>{Object.defineProperty(e,r+n,{value:function(e,n,a){return this[r].call(this,t,e,n,a)},configurable:!0})}))}(n,e),t[r]=!0)}return Qt.isArray(e)?e.forEach(r):r(e),this}}Rn.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]),Qt.reduceDescriptors(Rn.prototype,((e,t)=>{let{value:n}=e,r=t[0].toUpperCase()+t.slice(1);return{get:()=>n,set(e){this[r]=e}}})),Qt.freezeMethods(Rn);const Pn=Rn;function Tn(e,t){const n=this||Sn,r=t||n,a=Pn.from(r.headers);let l=r.data;return Qt.forEach(e,(function(e){l=e.call(n,l,a.normalize(),t?t.status:void 0)})),a.normalize(),l}function On(e){return!(!e||!e.__CANCEL__)}function Nn(e,t,n){Xt.call(this,null==e?"canceled":e,Xt.ERR_CANCELED,t,n),this.name="CanceledError"}Qt.inherits(Nn,Xt,{__CANCEL__:!0});const Ln=Nn;function zn(e,t,n){const r=n.config.validateStatus;n.status&&r&&!r(n.status)?t(new Xt("Request failed with status code "+n.status,[Xt.ERR_BAD_REQUEST,Xt.ERR_BAD_RESPONSE][Math.floor(n.status/100)-4],n.config,n.request,n)):e(n)}const An=function(e,t){e=e||10;const n=new Array(e),r=new Array(e);let a,l=0,o=0;return t=void 0!==t?t:1e3,function(i){const u=Date.now(),s=r[o];a||(a=u),n[l]=i,r[l]=u;let c=o,f=0;for(;c!==l;)f+=n[c++],c%=e;if(l=(l+1)%e,l===o&&(o=(o+1)%e),u-a<t)return;const d=s&&u-s;return d?Math.round(1e3*f/d):void 0}};const Fn=function(e,t){let n,r,a=0,l=1e3/t;const o=function(t){let l=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Date.now();a=l,n=null,r&&(clearTimeout(r),r=null),e.apply(null,t)};return[function(){const e=Date.now(),t=e-a;for(var i=arguments.length,u=new Array(i),s=0;s<i;s++)u[s]=arguments[s];t>=l?o(u,e):(n=u,r||(r=setTimeout((()=>{r=null,o(n)}),l-t)))},()=>n&&o(n)]},Dn=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:3,r=0;const a=An(50,250);return Fn((n=>{const l=n.loaded,o=n.lengthComputable?n.total:void 0,i=l-r,u=a(i);r=l;e({loaded:l,total:o,progress:o?l/o:void 0,bytes:i,rate:u||void 0,estimated:u&&o&&l<=o?(o-l)/u:void 0,event:n,lengthComputable:null!=o,[t?"download":"upload"]:!0})}),n)},jn=(e,t)=>{const n=null!=e;return[r=>t[0]({lengthComputable:n,total:e,loaded:r}),t[1]]},Mn=e=>function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return Qt.asap((()=>e(...n)))},Un=vn.hasStandardBrowserEnv?((e,t)=>n=>(n=new URL(n,vn.origin),e.protocol===n.protocol&&e.host===n.host&&(t||e.port===n.port)))(new URL(vn.origin),vn.navigator&&/(msie|trident)/i.test(vn.navigator.userAgent)):()=>!0,In=vn.hasStandardBrowserEnv?{write(e,t,n,r,a,l){const o=[e+"="+encodeURIComponent(t)];Qt.isNumber(n)&&o.push("expires="+new Date(n).toGMTString()),Qt.isString(r)&&o.push("path="+r),Qt.isString(a)&&o.push("domain="+a),!0===l&&o.push("secure"),document.cookie=o.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read:()=>null,remove(){}};function $n(e,t){return e&&!/^([a-z][a-z\d+\-.]*:)?\/\//i.test(t)?function(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}(e,t):t}const Bn=e=>e instanceof Pn?{...e}:e;function Hn(e,t){t=t||{};const n={};function r(e,t,n,r){return Qt.isPlainObject(e)&&Qt.isPlainObject(t)?Qt.merge.call({caseless:r},e,t):Qt.isPlainObject(t)?Qt.merge({},t):Qt.isArray(t)?t.slice():t}function a(e,t,n,a){return Qt.isUndefined(t)?Qt.isUndefined(e)?void 0:r(void 0,e,0,a):r(e,t,0,a)}function l(e,t){if(!Qt.isUndefined(t))return r(void 0,t)}function o(e,t){return Qt.isUndefined(t)?Qt.isUndefined(e)?void 0:r(void 0,e):r(void 0,t)}function i(n,a,l){return l in t?r(n,a):l in e?r(void 0,n):void 0}const u={url:l,method:l,data:l,baseURL:o,transformRequest:o,transformResponse:o,paramsSerializer:o,timeout:o,timeoutMessage:o,withCredentials:o,withXSRFToken:o,adapter:o,responseType:o,xsrfCookieName:o,xsrfHeaderName:o,onUploadProgress:o,onDownloadProgress:o,decompress:o,maxContentLength:o,maxBodyLength:o,beforeRedirect:o,transport:o,httpAgent:o,httpsAgent:o,cancelToken:o,socketPath:o,responseEncoding:o,validateStatus:i,headers:(e,t,n)=>a(Bn(e),Bn(t),0,!0)};return Qt.forEach(Object.keys(Object.assign({},e,t)),(function(r){const l=u[r]||a,o=l(e[r],t[r],r);Qt.isUndefined(o)&&l!==i||(n[r]=o)})),n}const qn=e=>{const t=Hn({},e);let n,{data:r,withXSRFToken:a,xsrfHeaderName:l,xsrfCookieName:o,headers:i,auth:u}=t;if(t.headers=i=Pn.from(i),t.url=sn($n(t.baseURL,t.url),e.params,e.paramsSerializer),u&&i.set("Authorization","Basic "+btoa((u.username||"")+":"+(u.password?unescape(encodeURIComponent(u.password)):""))),Qt.isFormData(r))if(vn.hasStandardBrowserEnv||vn.hasStandardBrowserWebWorkerEnv)i.setContentType(void 0);else if(!1!==(n=i.getContentType())){const[e,...t]=n?n.split(";").map((e=>e.trim())).filter(Boolean):[];i.setContentType([e||"multipart/form-data",...t].join("; "))}if(vn.hasStandardBrowserEnv&&(a&&Qt.isFunction(a)&&(a=a(t)),a||!1!==a&&Un(t.url))){const e=l&&o&&In.read(o);e&&i.set(l,e)}return t},Wn="undefined"!==typeof XMLHttpRequest&&function(e){return new Promise((function(t,n){const r=qn(e);let a=r.data;const l=Pn.from(r.headers).normalize();let o,i,u,s,c,{responseType:f,onUploadProgress:d,onDownloadProgress:p}=r;function h(){s&&s(),c&&c(),r.cancelToken&&r.cancelToken.unsubscribe(o),r.signal&&r.signal.removeEventListener("abort",o)}let m=new XMLHttpRequest;function g(){if(!m)return;const r=Pn.from("getAllResponseHeaders"in m&&m.getAllResponseHeaders());zn((function(e){t(e),h()}),(function(e){n(e),h()}),{data:f&&"text"!==f&&"json"!==f?m.response:m.responseText,status:m.status,statusText:m.statusText,headers:r,config:e,request:m}),m=null}m.open(r.method.toUpperCase(),r.url,!0),m.timeout=r.timeout,"onloadend"in m?m.onloadend=g:m.onreadystatechange=function(){m&&4===m.readyState&&(0!==m.status||m.responseURL&&0===m.responseURL.indexOf("file:"))&&setTimeout(g)},m.onabort=function(){m&&(n(new Xt("Request aborted",Xt.ECONNABORTED,e,m)),m=null)},m.onerror=function(){n(new Xt("Network Error",Xt.ERR_NETWORK,e,m)),m=null},m.ontimeout=function(){let t=r.timeout?"timeout of "+r.timeout+"ms exceeded":"timeout exceeded";const a=r.transitional||fn;r.timeoutErrorMessage&&(t=r.timeoutErrorMessage),n(new Xt(t,a.clarifyTimeoutError?Xt.ETIMEDOUT:Xt.ECONNABORTED,e,m)),m=null},void 0===a&&l.setContentType(null),"setRequestHeader"in m&&Qt.forEach(l.toJSON(),(function(e,t){m.setRequestHeader(t,e)})),Qt.isUndefined(r.withCredentials)||(m.withCredentials=!!r.withCredentials),f&&"json"!==f&&(m.responseType=r.responseType),p&&([u,c]=Dn(p,!0),m.addEventListener("progress",u)),d&&m.upload&&([i,s]=Dn(d),m.upload.addEventListener("progress",i),m.upload.addEventListener("loadend",s)),(r.cancelToken||r.signal)&&(o=t=>{m&&(n(!t||t.type?new Ln(null,e,m):t),m.abort(),m=null)},r.cancelToken&&r.cancelToken.subscribe(o),r.signal&&(r.signal.aborted?o():r.signal.addEventListener("abort",o)));const y=function(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}(r.url);y&&-1===vn.protocols.indexOf(y)?n(new Xt("Unsupported protocol "+y+":",Xt.ERR_BAD_REQUEST,e)):m.send(a||null)}))},Vn=(e,t)=>{const{length:n}=e=e?e.filter(Boolean):[];if(t||n){let n,r=new AbortController;const a=function(e){if(!n){n=!0,o();const t=e instanceof Error?e:this.reason;r.abort(t instanceof Xt?t:new Ln(t instanceof Error?t.message:t))}};let l=t&&setTimeout((()=>{l=null,a(new Xt(`timeout ${t} of ms exceeded`,Xt.ETIMEDOUT))}),t);const o=()=>{e&&(l&&clearTimeout(l),l=null,e.forEach((e=>{e.unsubscribe?e.unsubscribe(a):e.removeEventListener("abort",a)})),e=null)};e.forEach((e=>e.addEventListener("abort",a)));const{signal:i}=r;return i.unsubscribe=()=>Qt.asap(o),i}},Qn=function*(e,t){let n=e.byteLength;if(!t||n<t)return void(yield e);let r,a=0;for(;a<n;)r=a+t,yield e.slice(a,r),a=r},Kn=async function*(e){if(e[Symbol.asyncIterator])return void(yield*e);const t=e.getReader();try{for(;;){const{done:e,value:n}=await t.read();if(e)break;yield n}}finally{await t.cancel()}},Yn=(e,t,n,r)=>{const a=async function*(e,t){for await(const n of Kn(e))yield*Qn(n,t)}(e,t);let l,o=0,i=e=>{l||(l=!0,r&&r(e))};return new ReadableStream({async pull(e){try{const{done:t,value:r}=await a.next();if(t)return i(),void e.close();let l=r.byteLength;if(n){let e=o+=l;n(e)}e.enqueue(new Uint8Array(r))}catch(t){throw i(t),t}},cancel:e=>(i(e),a.return())},{highWaterMark:2})},Jn="function"===typeof fetch&&"function"===typeof Request&&"function"===typeof Response,Xn=Jn&&"function"===typeof ReadableStream,Gn=Jn&&("function"===typeof TextEncoder?(e=>t=>e.encode(t))(new TextEncoder):async e=>new Uint8Array(await new Response(e).arrayBuffer())),Zn=function(e){try{for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return!!e(...n)}catch(Or){return!1}},er=Xn&&Zn((()=>{let e=!1;const t=new Request(vn.origin,{body:new ReadableStream,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t})),tr=Xn&&Zn((()=>Qt.isReadableStream(new Response("").body))),nr={stream:tr&&(e=>e.body)};var rr;Jn&&(rr=new Response,["text","arrayBuffer","blob","formData","stream"].forEach((e=>{!nr[e]&&(nr[e]=Qt.isFunction(rr[e])?t=>t[e]():(t,n)=>{throw new Xt(`Response type '${e}' is not supported`,Xt.ERR_NOT_SUPPORT,n)})})));const ar=async(e,t)=>{const n=Qt.toFiniteNumber(e.getContentLength());return null==n?(async e=>{if(null==e)return 0;if(Qt.isBlob(e))return e.size;if(Qt.isSpecCompliantForm(e)){const t=new Request(vn.origin,{method:"POST",body:e});return(await t.arrayBuffer()).byteLength}return Qt.isArrayBufferView(e)||Qt.isArrayBuffer(e)?e.byteLength:(Qt.isURLSearchParams(e)&&(e+=""),Qt.isString(e)?(await Gn(e)).byteLength:void 0)})(t):n},lr=Jn&&(async e=>{let{url:t,method:n,data:r,signal:a,cancelToken:l,timeout:o,onDownloadProgress:i,onUploadProgress:u,responseType:s,headers:c,withCredentials:f="same-origin",fetchOptions:d}=qn(e);s=s?(s+"").toLowerCase():"text";let p,h=Vn([a,l&&l.toAbortSignal()],o);const m=h&&h.unsubscribe&&(()=>{h.unsubscribe()});let g;try{if(u&&er&&"get"!==n&&"head"!==n&&0!==(g=await ar(c,r))){let e,n=new Request(t,{method:"POST",body:r,duplex:"half"});if(Qt.isFormData(r)&&(e=n.headers.get("content-type"))&&c.setContentType(e),n.body){const[e,t]=jn(g,Dn(Mn(u)));r=Yn(n.body,65536,e,t)}}Qt.isString(f)||(f=f?"include":"omit");const a="credentials"in Request.prototype;p=new Request(t,{...d,signal:h,method:n.toUpperCase(),headers:c.normalize().toJSON(),body:r,duplex:"half",credentials:a?f:void 0});let l=await fetch(p);const o=tr&&("stream"===s||"response"===s);if(tr&&(i||o&&m)){const e={};["status","statusText","headers"].forEach((t=>{e[t]=l[t]}));const t=Qt.toFiniteNumber(l.headers.get("content-length")),[n,r]=i&&jn(t,Dn(Mn(i),!0))||[];l=new Response(Yn(l.body,65536,n,(()=>{r&&r(),m&&m()})),e)}s=s||"text";let y=await nr[Qt.findKey(nr,s)||"text"](l,e);return!o&&m&&m(),await new Promise(((t,n)=>{zn(t,n,{data:y,headers:Pn.from(l.headers),status:l.status,statusText:l.statusText,config:e,request:p})}))}catch(y){if(m&&m(),y&&"TypeError"===y.name&&/fetch/i.test(y.message))throw Object.assign(new Xt("Network Error",Xt.ERR_NETWORK,e,p),{cause:y.cause||y});throw Xt.from(y,y&&y.code,e,p)}}),or={http:null,xhr:Wn,fetch:lr};Qt.forEach(or,((e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch(Or){}Object.defineProperty(e,"adapterName",{value:t})}}));const ir=e=>`- ${e}`,ur=e=>Qt.isFunction(e)||null===e||!1===e,sr=e=>{e=Qt.isArray(e)?e:[e];const{length:t}=e;let n,r;const a={};for(let l=0;l<t;l++){let t;if(n=e[l],r=n,!ur(n)&&(r=or[(t=String(n)).toLowerCase()],void 0===r))throw new Xt(`Unknown adapter '${t}'`);if(r)break;a[t||"#"+l]=r}if(!r){const e=Object.entries(a).map((e=>{let[t,n]=e;return`adapter ${t} `+(!1===n?"is not supported by the environment":"is not available in the build")}));let n=t?e.length>1?"since :\n"+e.map(ir).join("\n"):" "+ir(e[0]):"as no adapter specified";throw new Xt("There is no suitable adapter to dispatch the request "+n,"ERR_NOT_SUPPORT")}return r};function cr(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Ln(null,e)}function fr(e){cr(e),e.headers=Pn.from(e.headers),e.data=Tn.call(e,e.transformRequest),-1!==["post","put","patch"].indexOf(e.method)&&e.headers.setContentType("application/x-www-form-urlencoded",!1);return sr(e.adapter||Sn.adapter)(e).then((function(t){return cr(e),t.data=Tn.call(e,e.transformResponse,t),t.headers=Pn.from(t.headers),t}),(function(t){return On(t)||(cr(e),t&&t.response&&(t.response.data=Tn.call(e,e.transformResponse,t.response),t.response.headers=Pn.from(t.response.headers))),Promise.reject(t)}))}const dr="1.7.9",pr={};["object","boolean","number","function","string","symbol"].forEach(((e,t)=>{pr[e]=function(n){return typeof n===e||"a"+(t<1?"n ":" ")+e}}));const hr={};pr.transitional=function(e,t,n){function r(e,t){return"[Axios v1.7.9] Transitional option '"+e+"'"+t+(n?". "+n:"")}return(n,a,l)=>{if(!1===e)throw new Xt(r(a," has been removed"+(t?" in "+t:"")),Xt.ERR_DEPRECATED);return t&&!hr[a]&&(hr[a]=!0,console.warn(r(a," has been deprecated since v"+t+" and will be removed in the near future"))),!e||e(n,a,l)}},pr.spelling=function(e){return(t,n)=>(console.warn(`${n} is likely a misspelling of ${e}`),!0)};const mr={assertOptions:function(e,t,n){if("object"!==typeof e)throw new Xt("options must be an object",Xt.ERR_BAD_OPTION_VALUE);const r=Object.keys(e);let a=r.length;for(;a-- >0;){const l=r[a],o=t[l];if(o){const t=e[l],n=void 0===t||o(t,l,e);if(!0!==n)throw new Xt("option "+l+" must be "+n,Xt.ERR_BAD_OPTION_VALUE)}else if(!0!==n)throw new Xt("Unknown option "+l,Xt.ERR_BAD_OPTION)}},validators:pr},gr=mr.validators;class yr{constructor(e){this.defaults=e,this.interceptors={request:new cn,response:new cn}}async request(e,t){try{return await this._request(e,t)}catch(n){if(n instanceof Error){let e={};Error.captureStackTrace?Error.captureStackTrace(e):e=new Error;const t=e.stack?e.stack.replace(/^.+\n/,""):"";try{n.stack?t&&!String(n.stack).endsWith(t.replace(/^.+\n.+\n/,""))&&(n.stack+="\n"+t):n.stack=t}catch(Or){}}throw n}}_request(e,t){"string"===typeof e?(t=t||{}).url=e:t=e||{},t=Hn(this.defaults,t);const{transitional:n,paramsSerializer:r,headers:a}=t;void 0!==n&&mr.assertOptions(n,{silentJSONParsing:gr.transitional(gr.boolean),forcedJSONParsing:gr.transitional(gr.boolean),clarifyTimeoutError:gr.transitional(gr.boolean)},!1),null!=r&&(Qt.isFunction(r)?t.paramsSerializer={serialize:r}:mr.assertOptions(r,{encode:gr.function,serialize:gr.function},!0)),mr.assertOptions(t,{baseUrl:gr.spelling("baseURL"),withXsrfToken:gr.spelling("withXSRFToken")},!0),t.method=(t.method||this.defaults.method||"get").toLowerCase();let l=a&&Qt.merge(a.common,a[t.method]);a&&Qt.forEach(["delete","get","head","post","put","patch","common"],(e=>{delete a[e]})),t.headers=Pn.concat(l,a);const o=[];let i=!0;this.interceptors.request.forEach((function(e){"function"===typeof e.runWhen&&!1===e.runWhen(t)||(i=i&&e.synchronous,o.unshift(e.fulfilled,e.rejected))}));const u=[];let s;this.interceptors.response.forEach((function(e){u.push(e.fulfilled,e.rejected)}));let c,f=0;if(!i){const e=[fr.bind(this),void 0];for(e.unshift.apply(e,o),e.push.apply(e,u),c=e.length,s=Promise.resolve(t);f<c;)s=s.then(e[f++],e[f++]);return s}c=o.length;let d=t;for(f=0;f<c;){const e=o[f++],t=o[f++];try{d=e(d)}catch(p){t.call(this,p);break}}try{s=fr.call(this,d)}catch(p){return Promise.reject(p)}for(f=0,c=u.length;f<c;)s=s.then(u[f++],u[f++]);return s}getUri(e){return sn($n((e=Hn(this.defaults,e)).baseURL,e.url),e.params,e.paramsSerializer)}}Qt.forEach(["delete","get","head","options"],(function(e){yr.prototype[e]=function(t,n){return this.request(Hn(n||{},{method:e,url:t,data:(n||{}).data}))}})),Qt.forEach(["post","put","patch"],(function(e){function t(t){return function(n,r,a){return this.request(Hn(a||{},{method:e,headers:t?{"Content-Type":"multipart/form-data"}:{},url:n,data:r}))}}yr.prototype[e]=t(),yr.prototype[e+"Form"]=t(!0)}));const vr=yr;class br{constructor(e){if("function"!==typeof e)throw new TypeError("executor must be a function.");let t;this.promise=new Promise((function(e){t=e}));const n=this;this.promise.then((e=>{if(!n._listeners)return;let t=n._listeners.length;for(;t-- >0;)n._listeners[t](e);n._listeners=null})),this.promise.then=e=>{let t;const r=new Promise((e=>{n.subscribe(e),t=e})).then(e);return r.cancel=function(){n.unsubscribe(t)},r},e((function(e,r,a){n.reason||(n.reason=new Ln(e,r,a),t(n.reason))}))}throwIfRequested(){if(this.reason)throw this.reason}subscribe(e){this.reason?e(this.reason):this._listeners?this._listeners.push(e):this._listeners=[e]}unsubscribe(e){if(!this._listeners)return;const t=this._listeners.indexOf(e);-1!==t&&this._listeners.splice(t,1)}toAbortSignal(){const e=new AbortController,t=t=>{e.abort(t)};return this.subscribe(t),e.signal.unsubscribe=()=>this.unsubscribe(t),e.signal}static source(){let e;return{token:new br((function(t){e=t})),cancel:e}}}const wr=br;const Sr={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Sr).forEach((e=>{let[t,n]=e;Sr[n]=t}));const kr=Sr;const Er=function e(t){const n=new vr(t),r=it(vr.prototype.request,n);return Qt.extend(r,vr.prototype,n,{allOwnKeys:!0}),Qt.extend(r,n,null,{allOwnKeys:!0}),r.create=function(n){return e(Hn(t,n))},r}(Sn);Er.Axios=vr,Er.CanceledError=Ln,Er.CancelToken=wr,Er.isCancel=On,Er.VERSION=dr,Er.toFormData=nn,Er.AxiosError=Xt,Er.Cancel=Er.CanceledError,Er.all=function(e){return Promise.all(e)},Er.spread=function(e){return function(t){return e.apply(null,t)}},Er.isAxiosError=function(e){return Qt.isObject(e)&&!0===e.isAxiosError},Er.mergeConfig=Hn,Er.AxiosHeaders=Pn,Er.formToJSON=e=>bn(Qt.isHTMLForm(e)?new FormData(e):e),Er.getAdapter=sr,Er.HttpStatusCode=kr,Er.default=Er;const xr=Er;var Cr=n(579);const _r=function(){const[e,t]=(0,a.useState)(""),[n,r]=(0,a.useState)(""),[l,o]=(0,a.useState)(""),[i,u]=(0,a.useState)(""),[s,c]=(0,a.useState)("");return(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("h2",{children:"Client Order UI"}),(0,Cr.jsxs)("form",{onSubmit:async t=>{t.preventDefault();const r={order_id:e,symbol:n,quantity:parseInt(l,10),price:parseFloat(i),business_unit:"BU-001",trader_id:"TRADER001",risk_category:"LOW",processed_timestamp:(new Date).toISOString()};try{const e=await xr.post("/orders",r);c(`Success: ${e.data.message}`)}catch(a){c(`Error: ${a.response?a.response.data.message:a.message}`)}},children:[(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Order ID:"}),(0,Cr.jsx)("input",{type:"text",value:e,onChange:e=>t(e.target.value),required:!0})]}),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Symbol:"}),(0,Cr.jsx)("input",{type:"text",value:n,onChange:e=>r(e.target.value),required:!0})]}),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Quantity:"}),(0,Cr.jsx)("input",{type:"number",value:l,onChange:e=>o(e.target.value),required:!0})]}),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("label",{children:"Price:"}),(0,Cr.jsx)("input",{type:"number",step:"0.01",value:i,onChange:e=>u(e.target.value),required:!0})]}),(0,Cr.jsx)("button",{type:"submit",children:"Submit Order"})]}),s&&(0,Cr.jsx)("p",{children:s})]})};const Rr=function(){const[e,t]=(0,a.useState)([]),n=(0,a.useRef)(null),r=async()=>{try{const e=n.current,r=await xr.get("/logs",{params:e?{since:e}:{}});n.current=r.data.cursor,e?r.data.logs.length>0&&t((e=>[...e,...r.data.logs].slice(-1e3))):t(r.data.logs)}catch(e){console.error("Error fetching logs:",e),t((e=>[...e,`Log entry at ${(new Date).toLocaleTimeString()}: No logs endpoint configured.`]))}};return(0,a.useEffect)((()=>{r();const e=new EventSource("/events");e.addEventListener("order",(e=>{const r=JSON.parse(e.data);n.current=e.lastEventId,t((e=>[...e,`Order ${r.order_id} ingested at ${r.ingested_timestamp}`].slice(-1e3)))})),e.addEventListener("resync",r);const a=setInterval(r,3e4);return()=>{e.close(),clearInterval(a)}}),[]),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("h2",{children:"Server Dashboard"}),(0,Cr.jsx)("div",{style:{border:"1px solid #ccc",padding:"1rem",height:"300px",overflowY:"scroll"},children:e.length>0?e.map(((e,t)=>(0,Cr.jsx)("p",{children:e},t))):(0,Cr.jsx)("p",{children:"No logs available."})})]})};const Pr=function(){const[e,t]=(0,a.useState)({orders:[],nextCursor:null,paged:!1}),{orders:n,nextCursor:r}=e,l=async e=>{const t={limit:100};e&&(t.cursor=e);return(await xr.get("/orders",{params:t})).data},o=async()=>{try{const e=await l(null);t((t=>{if(!t.paged)return{orders:e.orders,nextCursor:e.next_cursor,paged:!1};const n=e.orders[e.orders.length-1],r=new Set(e.orders.map((e=>e.order_id))),a=t.orders.filter((e=>!r.has(e.order_id)&&(!n||e.ingested_timestamp<n.ingested_timestamp)));return{...t,orders:[...e.orders,...a]}}))}catch(e){console.error("Error fetching orders:",e)}};return(0,a.useEffect)((()=>{o();const e=new EventSource("/events");e.addEventListener("order",(e=>{const n=JSON.parse(e.data);t((e=>e.orders.some((e=>e.order_id===n.order_id))?e:{...e,orders:[n,...e.orders]}))})),e.addEventListener("resync",o);const n=setInterval(o,3e4);return()=>{e.close(),clearInterval(n)}}),[]),(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("h2",{children:"Internal System - Order Viewer"}),(0,Cr.jsxs)("table",{border:"1",cellPadding:"5",children:[(0,Cr.jsx)("thead",{children:(0,Cr.jsxs)("tr",{children:[(0,Cr.jsx)("th",{children:"Order ID"}),(0,Cr.jsx)("th",{children:"Symbol"}),(0,Cr.jsx)("th",{children:"Quantity"}),(0,Cr.jsx)("th",{children:"Price"}),(0,Cr.jsx)("th",{children:"Ingested Timestamp"})]})}),(0,Cr.jsx)("tbody",{children:n.length>0?n.map(((e,t)=>(0,Cr.jsxs)("tr",{children:[(0,Cr.jsx)("td",{children:e.order_id}),(0,Cr.jsx)("td",{children:e.symbol}),(0,Cr.jsx)("td",{children:e.quantity}),(0,Cr.jsx)("td",{children:e.price}),(0,Cr.jsx)("td",{children:e.ingested_timestamp})]},t))):(0,Cr.jsx)("tr",{children:(0,Cr.jsx)("td",{colSpan:"5",children:"No orders available."})})})]}),r&&(0,Cr.jsx)("button",{onClick:async()=>{if(r)try{const e=await l(r);t((t=>({orders:[...t.orders,...e.orders],nextCursor:e.next_cursor,paged:!0})))}catch(e){console.error("Error fetching orders:",e)}},children:"Load more"})]})};const Tr=function(){return(0,Cr.jsx)(Ge,{children:(0,Cr.jsxs)("div",{children:[(0,Cr.jsx)("nav",{children:(0,Cr.jsxs)("ul",{children:[(0,Cr.jsx)("li",{children:(0,Cr.jsx)(et,{to:"/",children:"Client Order UI"})}),(0,Cr.jsx)("li",{children:(0,Cr.jsx)(et,{to:"/server",children:"Server Dashboard"})}),(0,Cr.jsx)("li",{children:(0,Cr.jsx)(et,{to:"/internal",children:"Internal System UI"})})]})}),(0,Cr.jsxs)(ve,{children:[(0,Cr.jsx)(ge,{path:"/",element:(0,Cr.jsx)(_r,{})}),(0,Cr.jsx)(ge,{path:"/server",element:(0,Cr.jsx)(Rr,{})}),(0,Cr.jsx)(ge,{path:"/internal",element:(0,Cr.jsx)(Pr,{})})]})]})})};l.createRoot(document.getElementById("root")).render((0,Cr.jsx)(a.StrictMode,{children:(0,Cr.jsx)(Tr,{})}))})();
+//# sourceMappingURL=main.fe4e3515.js.map
\ No newline at end of file
@@ -0,0 +1,108 @@
+import asyncio
+import socket
+import threading
+import time
+import pytest
+from fix_core import build_order_message, reset_sequence
+from fix_server_async import AsyncFixServer
+
+HOST = "localhost"
+HEARTBEAT_INTERVAL = 1
+
+# Run the asyncio acceptor on its own loop in a background thread.
+@pytest.fixture(scope="function")
+def start_async_server():
+    reset_sequence()
+    fix_server = AsyncFixServer(heartbeat_interval=HEARTBEAT_INTERVAL)
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(fix_server.start(HOST, 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield fix_server, port
+    loop.call_soon_threadsafe(server.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+
+def collect_responses(client_socket, timeout=3):
+    client_socket.settimeout(timeout)
+    responses = b""
+    try:
+        while True:
+            part = client_socket.recv(4096)
+            if not part:
+                break
+            responses += part
+    except socket.timeout:
+        pass
+    return responses
+
+def test_async_order_submission_flow(start_async_server):
+    fix_server, port = start_async_server
+    client_socket = socket.create_connection((HOST, port))
+    client_socket.sendall(build_order_message("TEST_ORDER", "BOND_XYZ", "100", "101.50"))
+    responses = collect_responses(client_socket, timeout=0.5)
+    client_socket.close()
+
+    response_str = responses.decode("ascii").replace("\x01", "|")
+    assert "35=8" in response_str
+    assert "11=TEST_ORDER" in response_str
+    assert "55=BOND_XYZ" in response_str
+    assert fix_server.stats()["messages_received"] == 1
+
+def test_async_heartbeat_flow(start_async_server):
+    fix_server, port = start_async_server
+    client_socket = socket.create_connection((HOST, port))
+    time.sleep(HEARTBEAT_INTERVAL + 0.5)
+    responses = collect_responses(client_socket, timeout=0.5)
+    client_socket.close()
+
+    assert "35=0" in responses.decode("ascii").replace("\x01", "|")
+    assert fix_server.stats()["heartbeats_sent"] >= 1
+
+class RecordingPublisher:
+    def __init__(self, fail=False):
+        self.orders = []
+        self.fail = fail
+
+    async def publish(self, order):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("broker unavailable")
+        self.orders.append(order)
+
+def send_order_to_async_server(fix_server, order_id):
+    reset_sequence()
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(fix_server.start(HOST, 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        client_socket = socket.create_connection((HOST, port))
+        client_socket.sendall(build_order_message(order_id, "BOND_XYZ", "100", "101.50"))
+        collect_responses(client_socket, timeout=0.5)
+        client_socket.close()
+    finally:
+        loop.call_soon_threadsafe(server.close)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+def test_async_server_publishes_on_the_loop():
+    publisher = RecordingPublisher()
+    fix_server = AsyncFixServer(heartbeat_interval=HEARTBEAT_INTERVAL, publisher=publisher)
+    send_order_to_async_server(fix_server, "ASYNC_ORDER")
+
+    assert [order["order_id"] for order in publisher.orders] == ["ASYNC_ORDER"]
+    assert publisher.orders[0]["symbol"] == "BOND_XYZ"
+    assert fix_server.stats()["publishes_in_flight"] == 0
+    assert fix_server.stats()["publish_failures"] == 0
+
+def test_async_server_spools_unconfirmed_orders():
+    spooled = []
+    fix_server = AsyncFixServer(heartbeat_interval=HEARTBEAT_INTERVAL, publisher=RecordingPublisher(fail=True),
+                                spool=spooled.extend)
+    send_order_to_async_server(fix_server, "ASYNC_ORDER")
+
+    assert [order["order_id"] for order in spooled] == ["ASYNC_ORDER"]
+    assert fix_server.stats()["publish_failures"] == 1
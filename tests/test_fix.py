@@ -1,7 +1,15 @@
 import unittest
 import simplefix
 import time
-from fix_core import build_order_message
+from fix_core import build_order_message, build_execution_report
+from fix_parser import FixFrameParser, FixMessageView
+from fix_mapping import MappingRegistry
+from fix_transform import numpy, transform_batch, transform_fix_to_json
+
+def parse_with_simplefix(data):
+    parser = simplefix.FixParser()
+    parser.append_buffer(data)
+    return parser.get_message()
 
 class TestFixMessageFunctions(unittest.TestCase):
     def test_build_order_message(self):
@@ -27,7 +35,93 @@ class TestFixMessageFunctions(unittest.TestCase):
         # Optionally, check for presence of a sequence number tag.
         self.assertIn("34=", msg_str)
     
-    # You can add more tests here for parsing, transformation, etc.
+    def test_message_view_first_occurrence_wins(self):
+        view = FixMessageView([(11, b"FIRST"), (55, b"BOND_XYZ"), (11, b"SECOND")])
+        self.assertEqual(view.get(11), b"FIRST")
+        self.assertIsNone(view.get(38))
+        self.assertEqual(list(view), [(11, b"FIRST"), (55, b"BOND_XYZ"), (11, b"SECOND")])
+
+    def test_execution_report_from_indexed_message(self):
+        msg_bytes = build_order_message("TEST_ORDER", "BOND_XYZ", "100", "101.50")
+        report = build_execution_report(FixMessageView(parse_with_simplefix(msg_bytes)))
+        report_str = report.decode("ascii").replace("\x01", "|")
+        self.assertIn("35=8", report_str)
+        self.assertIn("11=TEST_ORDER", report_str)
+        self.assertIn("55=BOND_XYZ|38=100|44=101.50", report_str)
+        # Raw simplefix messages are still accepted and give the same report.
+        self.assertEqual(report, build_execution_report(parse_with_simplefix(msg_bytes)))
+
+    def test_transform_reads_views_and_frames_alike(self):
+        msg_bytes = build_order_message("TEST_ORDER", "BOND_XYZ", "100", "101.50")
+        parser = FixFrameParser()
+        parser.append_buffer(msg_bytes)
+        from_frame = transform_fix_to_json(parser.get_message())
+        from_view = transform_fix_to_json(FixMessageView(parse_with_simplefix(msg_bytes)))
+        for data in (from_frame, from_view):
+            data.pop("processed_timestamp")
+        self.assertEqual(from_frame, from_view)
+        self.assertEqual(from_frame["order_id"], "TEST_ORDER")
+        self.assertEqual(from_frame["quantity"], 100)
+        self.assertEqual(from_frame["price"], 101.5)
+
+    def test_transform_batch_matches_per_message_transform(self):
+        messages = [
+            FixMessageView([(11, b"ORDER1"), (55, b"BOND_XYZ"), (38, b"100"), (44, b"101.50"), (60, b"20250214-12:00:00")]),
+            FixMessageView([(11, b"ORDER2"), (38, b"1.5"), (44, b"abc")]),  # Invalid numbers fall back to defaults.
+            FixMessageView([]),
+        ]
+        columns = transform_batch(messages, backend="list")
+        self.assertEqual(len(set(columns["processed_timestamp"])), 1)
+        for row, msg in enumerate(messages):
+            expected = transform_fix_to_json(msg)
+            expected.pop("processed_timestamp")
+            self.assertEqual({field: values[row] for field, values in columns.items()
+                              if field != "processed_timestamp"}, expected)
+
+    def test_transform_batch_uses_each_counterparty_mapping(self):
+        mappings = MappingRegistry.from_config({
+            "default": {
+                "fields": [{"tag": 11, "name": "order_id", "default": "UNKNOWN"},
+                           {"tag": 38, "name": "quantity", "type": "int", "default": 0}],
+                "enrichment": {"risk_category": "LOW"},
+            },
+            "counterparties": {
+                "CLIENT_A": {
+                    "fields": [{"tag": 11, "name": "order_id", "default": "UNKNOWN"},
+                               {"tag": 38, "name": "quantity", "type": "float", "default": 0.0},
+                               {"tag": 1, "name": "account", "default": None}],
+                    "enrichment": {"risk_category": "HIGH"},
+                },
+            },
+        })
+        messages = [
+            FixMessageView([(11, b"ORDER1"), (49, b"CLIENT_A"), (38, b"100"), (1, b"ACC1")]),
+            FixMessageView([(11, b"ORDER2"), (49, b"CLIENT_B"), (38, b"200")]),
+            FixMessageView([(11, b"ORDER3"), (49, b"CLIENT_A"), (38, b"1.5")]),
+        ]
+        columns = transform_batch(messages, backend="list", mappings=mappings)
+        for row, msg in enumerate(messages):
+            expected = mappings.transform(msg)
+            expected.pop("processed_timestamp")
+            self.assertEqual({field: values[row] for field, values in columns.items()
+                              if field != "processed_timestamp" and field in expected}, expected)
+        self.assertEqual(columns["quantity"], [100.0, 200, 1.5])
+        self.assertEqual(columns["account"], ["ACC1", None, None])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_transform_batch_numpy_dtypes_follow_field_types(self):
+        mappings = MappingRegistry.from_config({"default": {"fields": [
+            {"tag": 11, "name": "order_id", "default": "UNKNOWN"},
+            {"tag": 38, "name": "qty", "type": "int", "default": 0},
+            {"tag": 44, "name": "px", "type": "float", "default": 0.0},
+            {"tag": 99, "name": "stop_px", "type": "float", "default": None},
+        ]}})
+        columns = transform_batch([FixMessageView([(11, b"ORDER1"), (38, b"100"), (44, b"101.50")])],
+                                  backend="numpy", mappings=mappings)
+        self.assertEqual(columns["qty"].dtype, numpy.int64)
+        self.assertEqual(columns["px"].dtype, numpy.float64)
+        self.assertEqual(columns["stop_px"].dtype, object)  # A None default leaves gaps.
+        self.assertEqual(columns["order_id"].dtype, object)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
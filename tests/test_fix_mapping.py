@@ -0,0 +1,48 @@
+import json
+import pytest
+from fix_mapping import MappingRegistry, MappingSpec, compile_mapping, load_mappings
+from fix_parser import FixMessageView
+
+ORDER = [(11, b"ORDER1"), (49, b"CLIENT_A"), (55, b"BOND_XYZ"), (38, b"100"), (44, b"101.50")]
+
+def test_compiled_mapping_casts_and_defaults():
+    spec = MappingSpec(
+        [{"tag": 11, "name": "order_id", "default": "UNKNOWN"},
+         {"tag": 38, "name": "quantity", "type": "int", "default": 0},
+         {"tag": 44, "name": "price", "type": "float", "default": 0.0}],
+        {"desk": "RATES"},
+    )
+    transform = compile_mapping(spec, now=lambda: "NOW")
+    assert transform(FixMessageView(ORDER)) == {
+        "order_id": "ORDER1", "quantity": 100, "price": 101.5, "desk": "RATES", "processed_timestamp": "NOW"}
+    assert transform(FixMessageView([(38, b"1.5"), (44, b"abc")])) == {
+        "order_id": "UNKNOWN", "quantity": 0, "price": 0.0, "desk": "RATES", "processed_timestamp": "NOW"}
+    # Only the field that does not convert falls back to its default.
+    assert transform(FixMessageView([(11, b"ORDER2"), (38, b"7"), (44, b"abc")])) == {
+        "order_id": "ORDER2", "quantity": 7, "price": 0.0, "desk": "RATES", "processed_timestamp": "NOW"}
+    # One guard per message, not one per numeric field.
+    assert transform.source.count("try:") == 1
+
+def test_counterparty_mapping_selected_by_sender_comp_id(tmp_path):
+    config = {
+        "default": {
+            "fields": [{"tag": 11, "name": "order_id", "default": "UNKNOWN"}],
+            "enrichment": {"business_unit": "BU-001", "risk_category": "LOW"},
+        },
+        "counterparties": {
+            "CLIENT_A": {"enrichment": {"risk_category": "HIGH"}},
+        },
+    }
+    path = tmp_path / "mapping.json"
+    path.write_text(json.dumps(config))
+    registry = load_mappings(str(path))
+
+    client_a = registry.transform(ORDER)
+    assert client_a["risk_category"] == "HIGH"
+    assert client_a["business_unit"] == "BU-001"
+    other = registry.transform([(11, b"ORDER2"), (49, b"CLIENT_B")])
+    assert other["risk_category"] == "LOW"
+
+def test_unknown_field_type_is_rejected():
+    with pytest.raises(ValueError):
+        MappingRegistry.from_config({"default": {"fields": [{"tag": 38, "name": "quantity", "type": "decimal"}]}})
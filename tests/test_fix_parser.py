@@ -0,0 +1,57 @@
+import socket
+import simplefix
+from fix_core import build_order_message
+from fix_parser import FixFrameParser
+
+def simplefix_pairs(data):
+    parser = simplefix.FixParser()
+    parser.append_buffer(data)
+    return list(parser.get_message())
+
+def test_frames_split_across_chunks():
+    data = b"".join(build_order_message(f"ORDER{i}", "BOND_XYZ", "100", "101.50") for i in range(3))
+    parser = FixFrameParser(buffer_size=64)  # Smaller than one message: forces growth and compaction.
+    frames = []
+    for i in range(0, len(data), 7):
+        parser.append_buffer(data[i:i + 7])
+        while (frame := parser.get_message()) is not None:
+            frames.append(frame)
+
+    assert [frame.get(11) for frame in frames] == [b"ORDER0", b"ORDER1", b"ORDER2"]
+    assert b"".join(frame.raw for frame in frames) == data
+
+def test_lazy_fields_match_simplefix():
+    data = build_order_message("ORDER1", "BOND_XYZ", "100", "101.50")
+    parser = FixFrameParser()
+    parser.append_buffer(data)
+    frame = parser.get_message()
+
+    assert list(frame) == simplefix_pairs(data)
+    assert frame.get(8) == b"FIX.4.2"
+    assert frame.get(55) == b"BOND_XYZ"
+    assert frame.get(5) is None  # Must not match the "55=" field.
+    assert frame.get(999, b"missing") == b"missing"
+    # Each call gets its own default back, not the first one cached.
+    assert frame.get(999) is None
+    assert frame.get(999, b"X") == b"X"
+
+def test_garbage_and_bad_checksum_are_skipped():
+    good = build_order_message("GOOD", "BOND_XYZ", "100", "101.50")
+    bad = bytearray(build_order_message("BAD", "BOND_XYZ", "100", "101.50"))
+    bad[-4:-1] = b"000" if bad[-4:-1] != b"000" else b"001"
+    parser = FixFrameParser()
+    parser.append_buffer(b"noise" + bytes(bad) + good)
+    frame = parser.get_message()
+    assert frame.get(11) == b"GOOD"
+    assert parser.get_message() is None
+
+def test_recv_into_reads_from_socket():
+    left, right = socket.socketpair()
+    try:
+        left.sendall(build_order_message("ORDER1", "BOND_XYZ", "100", "101.50"))
+        parser = FixFrameParser()
+        assert parser.recv_into(right) > 0
+        assert parser.get_message().get(11) == b"ORDER1"
+    finally:
+        left.close()
+        right.close()
@@ -0,0 +1,41 @@
+import os
+import threading
+from fix_session import SequenceCounter, SessionSequenceStore
+
+def test_sequence_counter_is_thread_safe():
+    counter = SequenceCounter()
+    seen = []
+    lock = threading.Lock()
+
+    def worker():
+        values = [counter.next() for _ in range(1000)]
+        with lock:
+            seen.extend(values)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(seen) == list(range(1, 8001))
+
+def test_session_store_tracks_each_sender():
+    store = SessionSequenceStore()
+    assert store.expected("CLIENT_A") == 1
+    assert store.advance("CLIENT_A", 1) == 2
+    assert store.advance("CLIENT_A", 5) == 6
+    assert store.advance("CLIENT_B") == 2
+    assert store.expected("CLIENT_A") == 6
+    assert store.expected("CLIENT_B") == 2
+
+def test_session_store_is_cleared_in_forked_child():
+    store = SessionSequenceStore()
+    store.advance("CLIENT_A", 10)
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_end, str(store.expected("CLIENT_A")).encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_end, 16) == b"1"
+    assert store.expected("CLIENT_A") == 11
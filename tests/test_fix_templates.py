@@ -0,0 +1,45 @@
+import datetime
+import simplefix
+from fix_core import EXECUTION_REPORT_TEMPLATE, HEARTBEAT_TEMPLATE, NEW_ORDER_SINGLE_TEMPLATE
+from fix_templates import utc_timestamp
+
+TIMESTAMP = 1739534400.125  # 2025-02-14 12:00:00.125 UTC
+
+def simplefix_encode(msg_type, fields, timestamp=None):
+    msg = simplefix.FixMessage()
+    msg.append_pair(8, "FIX.4.2")
+    msg.append_pair(35, msg_type)
+    for tag, value in fields:
+        if tag == 52:
+            msg.append_utc_timestamp(52, timestamp)
+        else:
+            msg.append_pair(tag, value)
+    return msg.encode()
+
+def test_utc_timestamp_matches_simplefix():
+    msg = simplefix.FixMessage()
+    msg.append_utc_timestamp(52, TIMESTAMP)
+    assert utc_timestamp(TIMESTAMP) == msg.get(52)
+
+def test_new_order_single_matches_simplefix():
+    encoded = NEW_ORDER_SINGLE_TEMPLATE.encode(
+        order_id="ORDER1", msg_seq_num=7, sending_time=utc_timestamp(TIMESTAMP),
+        symbol="BOND_XYZ", quantity="100", price="101.50")
+    expected = simplefix_encode("D", [
+        (11, "ORDER1"), (34, "7"), (49, "SENDER"), (56, "TARGET"), (52, None),
+        (55, "BOND_XYZ"), (38, "100"), (44, "101.50"), (98, "0"), (108, "30")], TIMESTAMP)
+    assert encoded == expected
+
+def test_execution_report_matches_simplefix_with_optional_fields():
+    full = EXECUTION_REPORT_TEMPLATE.encode(cl_ord_id=b"ORDER1", msg_seq_num=3,
+                                            symbol=b"BOND_XYZ", quantity=b"100", price=b"101.50")
+    assert full == simplefix_encode("8", [
+        (11, "ORDER1"), (34, "3"), (17, "EXEC456"), (39, "2"), (150, "F"),
+        (55, "BOND_XYZ"), (38, "100"), (44, "101.50")])
+
+    sparse = EXECUTION_REPORT_TEMPLATE.encode(cl_ord_id="UNKNOWN")
+    assert sparse == simplefix_encode("8", [(11, "UNKNOWN"), (17, "EXEC456"), (39, "2"), (150, "F")])
+
+def test_heartbeat_matches_simplefix():
+    encoded = HEARTBEAT_TEMPLATE.encode(sending_time=utc_timestamp(TIMESTAMP))
+    assert encoded == simplefix_encode("0", [(52, None)], TIMESTAMP)
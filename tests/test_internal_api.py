@@ -1,4 +1,6 @@
+import datetime
 import json
+import time
 import pytest
 from internal_api import create_app, db
 
@@ -100,4 +102,311 @@ def test_delete_order_not_found(client):
     data = response.get_json()
     assert response.status_code == 404
     assert data["status"] == "error"
-    assert "not found" in data["message"]
\ No newline at end of file
+    assert "not found" in data["message"]
+
+def post_order(client, order_id, symbol="BOND_XYZ", trader_id="TRADER001", risk_category="LOW"):
+    order = {"order_id": order_id, "symbol": symbol, "quantity": 100, "price": 101.5,
+             "trader_id": trader_id, "risk_category": risk_category}
+    response = client.post("/orders", data=json.dumps(order), content_type='application/json')
+    assert response.status_code == 200
+
+def test_list_orders_keyset_pagination(client):
+    for i in range(5):
+        post_order(client, f"ORDER{i}")
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/orders?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        data = client.get(url).get_json()
+        assert len(data["orders"]) <= 2
+        seen += [order["order_id"] for order in data["orders"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    # Newest first, every order exactly once.
+    assert seen == [f"ORDER{i}" for i in reversed(range(5))]
+
+def test_list_orders_filters(client):
+    post_order(client, "ORDER1", symbol="BOND_XYZ")
+    post_order(client, "ORDER2", symbol="STOCK_ABC", risk_category="HIGH")
+    post_order(client, "ORDER3", symbol="STOCK_ABC", trader_id="TRADER002")
+
+    data = client.get("/orders?symbol=STOCK_ABC").get_json()
+    assert [order["order_id"] for order in data["orders"]] == ["ORDER3", "ORDER2"]
+    data = client.get("/orders?symbol=STOCK_ABC&risk_category=HIGH").get_json()
+    assert [order["order_id"] for order in data["orders"]] == ["ORDER2"]
+    data = client.get("/orders?trader_id=TRADER002").get_json()
+    assert [order["order_id"] for order in data["orders"]] == ["ORDER3"]
+    data = client.get("/orders?since=2999-01-01T00:00:00Z").get_json()
+    assert data["orders"] == []
+    data = client.get("/orders?until=2999-01-01T00:00:00%2B00:00").get_json()
+    assert len(data["orders"]) == 3
+
+def test_list_orders_rejects_bad_cursor(client):
+    response = client.get("/orders?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.get_json()["status"] == "error"
+
+def test_export_orders_ndjson_and_csv(client):
+    for i in range(3):
+        post_order(client, f"ORDER{i}", symbol="STOCK_ABC" if i == 1 else "BOND_XYZ")
+
+    response = client.get("/exports/orders")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row["order_id"] for row in rows] == ["ORDER0", "ORDER1", "ORDER2"]
+    assert rows[0]["symbol"] == "BOND_XYZ"
+
+    response = client.get("/exports/orders?format=csv&symbol=STOCK_ABC")
+    assert response.mimetype == "text/csv"
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0].startswith("order_id,ingested_timestamp,symbol")
+    assert len(lines) == 2 and lines[1].startswith("ORDER1,")
+
+def test_order_named_export_is_reachable(client):
+    post_order(client, "export")
+    response = client.get("/orders/export")
+    assert response.status_code == 200
+    assert response.get_json()["order"]["order_id"] == "export"
+
+def test_export_orders_rejects_unknown_format(client):
+    response = client.get("/exports/orders?format=xml")
+    assert response.status_code == 400
+
+def test_bulk_ingest_array_and_ndjson(client, monkeypatch):
+    published = []
+    monkeypatch.setattr("internal_api.publish_orders",
+                        lambda orders: published.extend(orders) or [True] * len(orders))
+    post_order(client, "EXISTING")
+
+    body = [
+        {"order_id": "BULK1", "symbol": "BOND_XYZ", "quantity": 100, "price": 101.5},
+        {"order_id": "BULK2", "symbol": "STOCK_ABC", "quantity": 5, "price": 50.25},
+        {"order_id": "BULK1", "symbol": "BOND_XYZ"},
+        {"order_id": "EXISTING"},
+        {"symbol": "NO_ID"},
+        {"order_id": "BAD_QTY", "quantity": "ten"},
+    ]
+    response = client.post("/orders/bulk", data=json.dumps(body), content_type='application/json')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [result["status"] for result in data["results"]] == [
+        "inserted", "inserted", "duplicate", "duplicate", "invalid", "invalid"]
+    assert data["results"][0]["published"] is True
+    assert data["counts"] == {"inserted": 2, "duplicate": 2, "invalid": 2}
+    assert [order["order_id"] for order in published] == ["BULK1", "BULK2"]
+
+    ndjson = '{"order_id": "BULK3", "quantity": 1}\nnot json\n{"order_id": "BULK2"}\n'
+    response = client.post("/orders/bulk", data=ndjson, content_type='application/x-ndjson')
+    statuses = [result["status"] for result in response.get_json()["results"]]
+    assert statuses == ["inserted", "invalid", "duplicate"]
+
+    orders = client.get("/orders?limit=100").get_json()["orders"]
+    assert sorted(order["order_id"] for order in orders) == ["BULK1", "BULK2", "BULK3", "EXISTING"]
+
+def test_logs_since_cursor_returns_only_new_entries(client):
+    data = client.get("/logs").get_json()
+    assert data["logs"] == ["No orders ingested yet."]
+    assert data["cursor"] is None
+
+    post_order(client, "ORDER1")
+    post_order(client, "ORDER2")
+    data = client.get("/logs").get_json()
+    assert [line.split()[1] for line in data["logs"]] == ["ORDER1", "ORDER2"]
+    cursor = data["cursor"]
+
+    data = client.get(f"/logs?since={cursor}").get_json()
+    assert data["logs"] == []
+    assert data["cursor"] == cursor
+
+    post_order(client, "ORDER3")
+    data = client.get(f"/logs?since={cursor}").get_json()
+    assert [line.split()[1] for line in data["logs"]] == ["ORDER3"]
+    assert data["cursor"] != cursor
+
+def read_sse_event(chunks):
+    for chunk in chunks:
+        chunk = chunk.decode()
+        if chunk.startswith("id:") or chunk.startswith("event:"):
+            return dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+
+def test_events_stream_pushes_new_orders_and_replays_missed(client):
+    post_order(client, "ORDER1")
+    response = client.get("/events")
+    assert response.mimetype == "text/event-stream"
+    chunks = iter(response.response)
+    assert next(chunks) == b"retry: 2000\n\n"
+
+    post_order(client, "ORDER2")
+    event = read_sse_event(chunks)
+    assert event["event"] == "order"
+    assert json.loads(event["data"])["order_id"] == "ORDER2"
+    response.close()
+
+    # Reconnecting with Last-Event-ID replays what was stored since.
+    cursor = event["id"]
+    post_order(client, "ORDER3")
+    response = client.get("/events", headers={"Last-Event-ID": cursor})
+    event = read_sse_event(iter(response.response))
+    assert json.loads(event["data"])["order_id"] == "ORDER3"
+    response.close()
+
+def test_events_streams_over_the_limit_are_told_to_poll(client):
+    client.application.config['EVENTS_MAX_STREAMS'] = 1
+    client.application.config['EVENTS_BUSY_RETRY_MS'] = 5000
+    first = client.get("/events")
+    assert next(iter(first.response)) == b"retry: 2000\n\n"
+
+    busy = client.get("/events")
+    assert busy.mimetype == "text/event-stream"
+    assert busy.get_data(as_text=True) == "retry: 5000\n\nevent: resync\ndata: {}\n\n"
+    first.close()
+
+    # Closing the first stream frees its slot.
+    second = client.get("/events")
+    assert next(iter(second.response)) == b"retry: 2000\n\n"
+    second.close()
+
+def test_invalid_numeric_settings_fall_back_to_defaults(monkeypatch):
+    from internal_api import DEFAULT_DB_POOL_SIZE, DEFAULT_ORDERS_PAGE_SIZE, engine_options
+    monkeypatch.setenv("DB_POOL_SIZE", "five")
+    monkeypatch.setenv("ORDERS_PAGE_SIZE", "")
+    assert engine_options("postgresql://localhost/db")["pool_size"] == DEFAULT_DB_POOL_SIZE
+    assert create_app().config['ORDERS_PAGE_SIZE'] == DEFAULT_ORDERS_PAGE_SIZE
+
+def test_hot_fields_are_promoted_to_columns(client, monkeypatch):
+    from internal_api import Order
+    monkeypatch.setattr("internal_api.publish_orders", lambda orders: [True] * len(orders))
+    post_order(client, "ORDER1", symbol="BOND_XYZ", trader_id="TRADER007", risk_category="HIGH")
+    body = [{"order_id": "ORDER2", "symbol": "STOCK_ABC", "quantity": 5, "price": 50.25,
+             "processed_timestamp": "2025-02-14T12:30:00Z"}]
+    client.post("/orders/bulk", data=json.dumps(body), content_type='application/json')
+
+    first = Order.query.filter_by(order_id="ORDER1").one()
+    assert (first.symbol, first.quantity, first.price, first.trader_id, first.risk_category) == \
+        ("BOND_XYZ", 100, 101.5, "TRADER007", "HIGH")
+    second = Order.query.filter_by(order_id="ORDER2").one()
+    assert (second.symbol, second.quantity, second.price) == ("STOCK_ABC", 5, 50.25)
+    assert second.processed_timestamp.isoformat() == "2025-02-14T12:30:00"
+
+def test_non_integral_quantities_are_never_truncated():
+    from internal_api import promoted_columns, validate_order
+    assert promoted_columns({"quantity": 2.0})["quantity"] == 2
+    assert promoted_columns({"quantity": 1.5})["quantity"] is None
+    assert promoted_columns({"quantity": "1.5"})["quantity"] is None
+    assert validate_order({"order_id": "ORDER1", "quantity": 1.5}) == "quantity must be a whole number"
+    assert validate_order({"order_id": "ORDER1", "quantity": 2.0}) is None
+
+def test_receive_order_rejects_duplicate_order_id(client):
+    post_order(client, "ORDER1")
+    order = {"order_id": "ORDER1", "symbol": "BOND_XYZ"}
+    response = client.post("/orders", data=json.dumps(order), content_type='application/json')
+    assert response.status_code == 409
+    assert response.get_json()["status"] == "error"
+
+def test_list_orders_revalidates_with_etag_until_a_write(client):
+    post_order(client, "ORDER1")
+    first = client.get("/orders")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    unchanged = client.get("/orders", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+
+    post_order(client, "ORDER2")
+    changed = client.get("/orders", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [o["order_id"] for o in changed.get_json()["orders"]] == ["ORDER2", "ORDER1"]
+
+    client.delete("/orders/ORDER2")
+    after_delete = client.get("/orders", headers={"If-None-Match": changed.headers["ETag"]})
+    assert after_delete.status_code == 200
+    assert [o["order_id"] for o in after_delete.get_json()["orders"]] == ["ORDER1"]
+
+def test_list_orders_etag_changes_after_a_write_the_cache_did_not_see(monkeypatch):
+    from internal_api import Order
+    monkeypatch.setenv("ORDER_CACHE_TTL", "0.05")
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        try:
+            client = app.test_client()
+            post_order(client, "ORDER1")
+            etag = client.get("/orders").headers["ETag"]
+            # Stored the way PostgresOrderSink stores orders: straight into the
+            # table, from another process, without touching this API's cache.
+            db.session.add(Order(order_id="ORDER2", ingested_timestamp=datetime.datetime.now(),
+                                 additional_data={"order_id": "ORDER2"}))
+            db.session.commit()
+            time.sleep(0.1)
+
+            response = client.get("/orders", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+            assert [o["order_id"] for o in response.get_json()["orders"]] == ["ORDER2", "ORDER1"]
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+def test_order_events_from_other_processes_invalidate_the_cache(client):
+    from internal_api import Order
+    from order_events import format_event, get_broker
+    post_order(client, "ORDER1")
+    etag = client.get("/orders").headers["ETag"]
+    db.session.add(Order(order_id="ORDER2", ingested_timestamp=datetime.datetime.now(),
+                         additional_data={"order_id": "ORDER2"}))
+    db.session.commit()
+    # What the fanout bridge does when the order sink broadcasts ORDER2.
+    get_broker().publish(format_event("order", {"order_id": "ORDER2"}))
+
+    response = client.get("/orders", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [o["order_id"] for o in response.get_json()["orders"]] == ["ORDER2", "ORDER1"]
+
+def test_get_order_by_id_is_cached_and_invalidated_on_delete(client):
+    post_order(client, "ORDER1", symbol="BOND_XYZ")
+    response = client.get("/orders/ORDER1")
+    assert response.status_code == 200
+    assert response.get_json()["order"]["symbol"] == "BOND_XYZ"
+    assert client.get("/orders/ORDER1", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+    client.delete("/orders/ORDER1")
+    assert client.get("/orders/ORDER1").status_code == 404
+    assert client.get("/orders/MISSING").status_code == 404
+
+def test_engine_options_from_environment(monkeypatch):
+    from internal_api import engine_options
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    options = engine_options("postgresql://localhost/orders")
+    assert options["pool_size"] == 20 and options["max_overflow"] == 0
+    assert options["pool_pre_ping"] is False
+    # SQLite keeps its default pool, which takes no size settings.
+    assert "pool_size" not in engine_options("sqlite:///orders.db")
+
+def test_async_ingest_mode_only_publishes(monkeypatch):
+    from internal_api import Order
+    monkeypatch.setenv("ORDERS_INGEST_MODE", "async")
+    published = []
+    monkeypatch.setattr("internal_api.publish_orders",
+                        lambda orders: published.extend(orders) or [o["order_id"] != "NACKED" for o in orders])
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        client = app.test_client()
+        response = client.post("/orders", data=json.dumps({"order_id": "ORDER1"}), content_type='application/json')
+        assert response.status_code == 202
+        response = client.post("/orders", data=json.dumps({"order_id": "NACKED"}), content_type='application/json')
+        assert response.status_code == 503
+        body = [{"order_id": "ORDER2"}, {"order_id": "NACKED"}, {"symbol": "X"}]
+        response = client.post("/orders/bulk", data=json.dumps(body), content_type='application/json')
+        assert response.status_code == 202
+        assert [r["status"] for r in response.get_json()["results"]] == ["accepted", "failed", "invalid"]
+        assert [o["order_id"] for o in published] == ["ORDER1", "NACKED", "ORDER2", "NACKED"]
+        assert Order.query.count() == 0
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,50 @@
+import time
+
+from order_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, LISTS, ORDERS, OrderCache, SharedGenerations
+
+def test_entries_are_stale_after_a_generation_bump():
+    cache = OrderCache()
+    cache.put(LISTS, "page", "value", cache.generation(LISTS))
+    cache.put(ORDERS, "ORDER1", "order", cache.generation(ORDERS))
+    assert cache.get(LISTS, "page") == "value"
+
+    cache.orders_changed()
+    assert cache.get(LISTS, "page") is None
+    assert cache.get(ORDERS, "ORDER1") == "order"
+
+    cache.order_deleted("ORDER1")
+    assert cache.get(ORDERS, "ORDER1") is None
+
+def test_lru_eviction_and_ttl():
+    cache = OrderCache(max_entries=2, ttl=0.05)
+    for key in ("a", "b"):
+        cache.put(LISTS, key, key, cache.generation(LISTS))
+    cache.get(LISTS, "a")
+    cache.put(LISTS, "c", "c", cache.generation(LISTS))
+    assert cache.get(LISTS, "b") is None
+    assert cache.get(LISTS, "a") == "a"
+    time.sleep(0.06)
+    assert cache.get(LISTS, "a") is None
+
+def test_shared_generations_are_seen_by_every_cache(tmp_path):
+    path = str(tmp_path / "generations")
+    first = OrderCache(generations=SharedGenerations(path))
+    second = OrderCache(generations=SharedGenerations(path))
+    assert first.generation(LISTS) == second.generation(LISTS)
+    second.put(LISTS, "page", "value", second.generation(LISTS))
+
+    first.orders_changed()
+    assert second.get(LISTS, "page") is None
+    assert first.generation(LISTS) == second.generation(LISTS) == 1
+
+def test_etags_follow_the_body():
+    assert OrderCache.etag(LISTS, b'{"orders":[]}') == OrderCache.etag(LISTS, b'{"orders":[]}')
+    assert OrderCache.etag(LISTS, b'{"orders":[]}') != OrderCache.etag(LISTS, b'{"orders":[1]}')
+    assert OrderCache.etag(LISTS, b"{}") != OrderCache.etag(ORDERS, b"{}")
+
+def test_from_env_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.delenv("ORDER_CACHE_SHARED_PATH", raising=False)
+    monkeypatch.setenv("ORDER_CACHE_SIZE", "1k")
+    monkeypatch.setenv("ORDER_CACHE_TTL", "soon")
+    cache = OrderCache.from_env()
+    assert (cache.max_entries, cache.ttl) == (DEFAULT_MAX_ENTRIES, DEFAULT_TTL)
@@ -0,0 +1,53 @@
+import time
+
+from order_dedup import DEFAULT_MAX_ENTRIES, BloomFilter, OrderDeduplicator
+
+def test_claim_complete_and_release():
+    dedup = OrderDeduplicator()
+    assert dedup.claim("ORDER1")
+    assert not dedup.claim("ORDER1")  # still in flight
+    dedup.release("ORDER1")
+    assert dedup.claim("ORDER1")  # a failed order is processed again
+    dedup.complete("ORDER1")
+    assert not dedup.claim("ORDER1")
+    assert dedup.claim(None) and dedup.claim(None)
+    assert dedup.stats() == {"hits": 2, "misses": 2, "bloom_hits": 0, "entries": 1, "in_flight": 0}
+
+def test_entries_expire_and_are_bounded():
+    dedup = OrderDeduplicator(max_entries=2, ttl=0.05)
+    for order_id in ("A", "B", "C"):
+        dedup.claim(order_id)
+        dedup.complete(order_id)
+    assert dedup.claim("A")  # evicted
+    assert not dedup.claim("C")
+    time.sleep(0.06)
+    assert dedup.claim("C")  # expired
+
+def test_bloom_hits_are_never_dropped():
+    dedup = OrderDeduplicator(max_entries=1, bloom_capacity=1000)
+    for order_id in ("A", "B"):
+        dedup.claim(order_id)
+        dedup.complete(order_id)
+    assert not dedup.claim("B")  # confirmed by the exact set
+    assert dedup.claim("A")  # gone from the LRU: only the filter remembers it
+    dedup.release("A")
+    # A false positive for a new order is processed too.
+    dedup.bloom.add("NEW")
+    assert dedup.claim("NEW")
+    assert dedup.stats()["bloom_hits"] == 2
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(10_000, 0.001)
+    keys = [f"ORDER{i}" for i in range(10_000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"OTHER{i}" in bloom for i in range(10_000))
+    assert false_positives < 50
+
+def test_from_env_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv("DEDUP_MAX_ENTRIES", "10k")
+    monkeypatch.setenv("DEDUP_TTL", "60")
+    dedup = OrderDeduplicator.from_env()
+    assert dedup.max_entries == DEFAULT_MAX_ENTRIES
+    assert dedup.ttl == 60.0
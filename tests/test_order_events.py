@@ -0,0 +1,29 @@
+from order_events import KEEPALIVE_FRAME, RESYNC_FRAME, OrderEventBroker, format_event
+
+def test_broker_fans_out_one_frame_to_every_subscriber():
+    broker = OrderEventBroker(keepalive=0.01)
+    first, second = broker.subscribe(), broker.subscribe()
+    frame = format_event("order", {"order_id": "ORDER1"}, "cursor1")
+    broker.publish(frame)
+    assert next(iter(first)) is frame
+    assert next(iter(second)) is frame
+    assert next(iter(first)) == KEEPALIVE_FRAME
+
+    second.close()
+    assert broker.subscriber_count == 1
+
+def test_slow_subscriber_gets_resync():
+    broker = OrderEventBroker(max_pending=2, keepalive=0.01)
+    subscription = broker.subscribe()
+    for i in range(5):
+        broker.publish(format_event("order", {"order_id": f"ORDER{i}"}))
+    frames = iter(subscription)
+    assert next(frames) == RESYNC_FRAME
+    assert next(frames) == KEEPALIVE_FRAME
+
+def test_listeners_see_every_published_frame():
+    seen = []
+    broker = OrderEventBroker(listeners=[seen.append, lambda frame: 1 / 0])
+    frame = format_event("order", {"order_id": "ORDER1"})
+    broker.publish(frame)  # A failing listener does not stop delivery.
+    assert seen == [frame]
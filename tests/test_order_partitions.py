@@ -0,0 +1,96 @@
+import datetime
+import os
+
+import pytest
+import sqlalchemy as sa
+
+from order_partitions import (RETENTION_DROP, apply_retention, ensure_partitions, expired_partitions, is_partitioned,
+                              list_partitions, maintain_partitions, missing_partition_days, partition_day,
+                              partition_name)
+
+TODAY = datetime.date(2025, 2, 14)
+
+def test_partition_names_round_trip():
+    assert partition_name(TODAY) == "orders_p20250214"
+    assert partition_day("orders_p20250214") == TODAY
+    assert partition_day("orders_default") is None
+
+def test_missing_partition_days_skips_existing():
+    existing = ["orders_default", "orders_p20250214", "orders_p20250216"]
+    assert missing_partition_days(existing, TODAY, 3) == [
+        datetime.date(2025, 2, 15), datetime.date(2025, 2, 17)]
+
+def test_expired_partitions_respects_retention():
+    existing = ["orders_default", "orders_p20250110", "orders_p20250113", "orders_p20250114", "orders_p20250214"]
+    assert expired_partitions(existing, TODAY, 31) == ["orders_p20250110", "orders_p20250113"]
+    assert expired_partitions(existing, TODAY, 0) == []
+
+def test_maintain_partitions_falls_back_on_invalid_settings(monkeypatch):
+    monkeypatch.setenv("ORDERS_PARTITION_DAYS_AHEAD", "soon")
+    monkeypatch.setenv("ORDERS_RETENTION_DAYS", "")
+    # SQLite has no partitioned orders table, so the pass only reads the settings.
+    assert maintain_partitions(sa.create_engine("sqlite://")) == ([], [])
+
+# The tests below run the migrations against an empty Postgres database named
+# by TEST_POSTGRES_URL (e.g. postgresql://localhost/orders_test) and
+# downgrade it again afterwards.
+requires_postgres = pytest.mark.skipif(not os.environ.get("TEST_POSTGRES_URL"),
+                                       reason="TEST_POSTGRES_URL is not set")
+
+@pytest.fixture
+def partitioned_db(monkeypatch):
+    from flask_migrate import downgrade, upgrade
+    from internal_api import create_app, db
+    monkeypatch.setenv("DATABASE_URL", os.environ["TEST_POSTGRES_URL"])
+    app = create_app()
+    with app.app_context():
+        upgrade()
+        yield db.engine
+        db.session.remove()
+        downgrade(revision="base")
+
+def insert_order(connection, order_id, ingested):
+    return connection.execute(sa.text(
+        "INSERT INTO orders (order_id, ingested_timestamp) VALUES (:order_id, :ingested) RETURNING id"
+    ), {"order_id": order_id, "ingested": ingested}).first()
+
+def order_ids(connection):
+    return set(connection.execute(sa.text("SELECT order_id FROM order_ids")).scalars())
+
+@requires_postgres
+def test_triggers_claim_and_release_order_ids(partitioned_db):
+    now = datetime.datetime.now()
+    with partitioned_db.begin() as connection:
+        assert is_partitioned(connection)
+        assert insert_order(connection, "ORDER1", now) is not None
+        # The same order_id on another day lands in another partition; the claim trigger skips it.
+        assert insert_order(connection, "ORDER1", now + datetime.timedelta(days=1)) is None
+        assert order_ids(connection) == {"ORDER1"}
+        connection.execute(sa.text("DELETE FROM orders WHERE order_id = 'ORDER1'"))
+        assert order_ids(connection) == set()
+
+@requires_postgres
+def test_retention_only_releases_ids_of_removed_partitions(partitioned_db):
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    old_day = today - datetime.timedelta(days=35)
+    with partitioned_db.begin() as connection:
+        # No partition covers this day yet, so the row goes to the default partition.
+        insert_order(connection, "IN_DEFAULT", datetime.datetime.combine(today - datetime.timedelta(days=40),
+                                                                          datetime.time()))
+        ensure_partitions(connection, 0, today=old_day)
+        insert_order(connection, "EXPIRED", datetime.datetime.combine(old_day, datetime.time(12)))
+        insert_order(connection, "CURRENT", datetime.datetime.combine(today, datetime.time()))
+
+        assert apply_retention(connection, 30, RETENTION_DROP, today=today) == [partition_name(old_day)]
+        assert order_ids(connection) == {"IN_DEFAULT", "CURRENT"}
+        assert partition_name(old_day) not in list_partitions(connection)
+
+@requires_postgres
+def test_maintain_partitions_creates_days_ahead(partitioned_db, monkeypatch):
+    monkeypatch.setenv("ORDERS_PARTITION_DAYS_AHEAD", "10")
+    created, removed = maintain_partitions(partitioned_db)
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    assert partition_name(today + datetime.timedelta(days=10)) in created
+    assert removed == []
+    with partitioned_db.connect() as connection:
+        assert missing_partition_days(list_partitions(connection), today, 10) == []
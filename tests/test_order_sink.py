@@ -0,0 +1,92 @@
+import datetime
+import types
+
+import pytest
+import sqlalchemy as sa
+
+from order_cache import LISTS, SharedGenerations
+from order_sink import PostgresOrderSink, copy_buffer, copy_value, order_row
+
+NOW = datetime.datetime(2025, 2, 14, 12, 0)
+
+def test_order_row_matches_the_promoted_columns():
+    order = {"order_id": "ORDER1", "symbol": "BOND_XYZ", "quantity": 100, "price": 101.5,
+             "ingested_timestamp": "2025-02-14T13:30:00+01:00", "processed_timestamp": "2025-02-14T12:30:00Z"}
+    row = order_row(order, NOW)
+    assert row[:8] == ("ORDER1", datetime.datetime(2025, 2, 14, 12, 30), "BOND_XYZ", 100, 101.5, None, None,
+                       datetime.datetime(2025, 2, 14, 12, 30))
+    assert order_row({"order_id": "ORDER2"}, NOW)[1] == NOW
+
+def test_copy_text_format_escapes_values():
+    assert copy_value(None) == "\\N"
+    assert copy_value(NOW) == "2025-02-14 12:00:00"
+    assert copy_value('a\tb\nc\\d') == "a\\tb\\nc\\\\d"
+    buffer = copy_buffer([("ORDER1", None, 5), ("ORDER2", NOW, 1.5)])
+    assert buffer.read() == "ORDER1\t\\N\t5\nORDER2\t2025-02-14 12:00:00\t1.5\n"
+
+def test_sink_requires_postgres():
+    with pytest.raises(ValueError):
+        PostgresOrderSink(sa.create_engine("sqlite://"))
+
+class FakeCursor:
+    def __init__(self, inserted):
+        self.inserted = inserted
+
+    def execute(self, sql, params=None):
+        pass
+
+    def copy_expert(self, sql, buffer):
+        pass
+
+    def fetchall(self):
+        return self.inserted
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, inserted):
+        self.inserted = inserted
+        self.committed = False
+
+    def cursor(self):
+        return FakeCursor(self.inserted)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+class FakeEngine:
+    # Just enough of a psycopg2 engine for PostgresOrderSink.write().
+    def __init__(self, inserted):
+        dbapi = types.SimpleNamespace(DataError=type("DataError", (Exception,), {}),
+                                      IntegrityError=type("IntegrityError", (Exception,), {}))
+        self.dialect = types.SimpleNamespace(name="postgresql", driver="psycopg2", dbapi=dbapi)
+        self.connection = FakeConnection(inserted)
+
+    def raw_connection(self):
+        return self.connection
+
+def test_sink_invalidates_caches_and_broadcasts_events(tmp_path, monkeypatch):
+    monkeypatch.delenv("ORDER_EVENTS_FANOUT", raising=False)
+    monkeypatch.setenv("ORDER_CACHE_SHARED_PATH", str(tmp_path / "generations"))
+    broadcasts = []
+    monkeypatch.setattr("order_sink.get_publisher", lambda: types.SimpleNamespace(
+        broadcast=lambda frames, exchange: broadcasts.append((frames, exchange))))
+    api_generations = SharedGenerations(str(tmp_path / "generations"))
+
+    engine = FakeEngine(inserted=[(1, "ORDER1", NOW)])
+    sink = PostgresOrderSink(engine)
+    assert sink.write([{"order_id": "ORDER1", "symbol": "BOND_XYZ"}]) == 1
+    assert engine.connection.committed
+
+    # Seen by an API process on this host, and by every API process through fanout.
+    assert api_generations.get(LISTS) == 1
+    [(frames, exchange)] = broadcasts
+    assert exchange == "order_events"
+    assert frames[0].startswith("id: ") and '"order_id":"ORDER1"' in frames[0]
@@ -0,0 +1,134 @@
+import json
+import time
+import pytest
+
+from publish_queue import PublishQueue, PublishQueueFull
+
+class RecordingPublisher:
+    def __init__(self, fail_ids=()):
+        self.batches = []
+        self.fail_ids = set(fail_ids)
+
+    def __call__(self, orders, queue_name):
+        self.batches.append(list(orders))
+        return [order["order_id"] not in self.fail_ids for order in orders]
+
+def test_orders_are_published_in_order(tmp_path):
+    publisher = RecordingPublisher()
+    pq = PublishQueue(max_size=100, policy="block", spool_path=str(tmp_path / "spool"),
+                      publish_batch=publisher).start()
+    for i in range(10):
+        pq.submit({"order_id": f"ORDER{i}"})
+    pq.join()
+    pq.stop()
+
+    published = [order["order_id"] for batch in publisher.batches for order in batch]
+    assert published == [f"ORDER{i}" for i in range(10)]
+    stats = pq.stats()
+    assert stats["published"] == 10
+    assert stats["depth"] == 0
+
+def test_reject_policy_raises_when_full(tmp_path):
+    pq = PublishQueue(max_size=1, policy="reject", spool_path=str(tmp_path / "spool"),
+                      publish_batch=RecordingPublisher())
+    # The worker is not started, so the queue stays full after one order.
+    pq.submit({"order_id": "ORDER1"})
+    with pytest.raises(PublishQueueFull):
+        pq.submit({"order_id": "ORDER2"})
+    assert pq.stats()["rejected"] == 1
+    assert pq.depth == 1
+
+def test_disk_policy_spools_and_replays(tmp_path):
+    spool_path = tmp_path / "spool"
+    pq = PublishQueue(max_size=1, policy="disk", spool_path=str(spool_path),
+                      publish_batch=RecordingPublisher(fail_ids={"ORDER3"}))
+    pq.submit({"order_id": "ORDER1"})
+    pq.submit({"order_id": "ORDER2"})  # Queue full: goes to disk.
+    assert [json.loads(line)["order_id"] for line in spool_path.read_text().splitlines()] == ["ORDER2"]
+
+    publisher = RecordingPublisher(fail_ids={"ORDER3"})
+    replaying = PublishQueue(max_size=10, policy="disk", spool_path=str(spool_path),
+                             publish_batch=publisher).start()
+    replaying.submit({"order_id": "ORDER3"})
+    replaying.join()
+    replaying.stop()
+
+    published = [order["order_id"] for batch in publisher.batches for order in batch]
+    assert published == ["ORDER2", "ORDER3"]
+    # The unconfirmed order is spooled again rather than lost.
+    assert [json.loads(line)["order_id"] for line in spool_path.read_text().splitlines()] == ["ORDER3"]
+
+class FlakyPublisher(RecordingPublisher):
+    # Fails each order in fail_ids the first time it is published.
+    def __call__(self, orders, queue_name):
+        results = super().__call__(orders, queue_name)
+        self.fail_ids -= {order["order_id"] for order in orders}
+        return results
+
+def test_spooled_orders_are_replayed_while_running(tmp_path):
+    spool_path = tmp_path / "spool"
+    publisher = FlakyPublisher(fail_ids={"ORDER1"})
+    pq = PublishQueue(max_size=10, policy="disk", spool_path=str(spool_path),
+                      publish_batch=publisher, replay_interval=0.1).start()
+    pq.submit({"order_id": "ORDER1"})
+    pq.join()
+    deadline = time.monotonic() + 5
+    while pq.stats()["published"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    pq.stop()
+
+    published = [order["order_id"] for batch in publisher.batches for order in batch]
+    assert published == ["ORDER1", "ORDER1"]
+    assert not spool_path.exists() or spool_path.read_text() == ""
+
+def test_interrupted_replay_is_resumed(tmp_path):
+    spool_path = tmp_path / "spool"
+    # Left behind by a process that crashed while replaying.
+    (tmp_path / "spool.replay").write_text('{"order_id": "ORDER1"}\n')
+    spool_path.write_text('{"order_id": "ORDER2"}\n')
+    publisher = FlakyPublisher(fail_ids={"ORDER1"})
+    pq = PublishQueue(max_size=10, policy="block", spool_path=str(spool_path), publish_batch=publisher)
+    pq.replay_spool()
+
+    # The unconfirmed order goes back to the spool even under the block policy.
+    assert not (tmp_path / "spool.replay").exists()
+    lines = [json.loads(line)["order_id"] for line in spool_path.read_text().splitlines()]
+    assert lines == ["ORDER2", "ORDER1"]
+    pq.replay_spool()
+    published = [order["order_id"] for batch in publisher.batches for order in batch]
+    assert published == ["ORDER1", "ORDER2", "ORDER1"]
+
+def test_non_blocking_submit_spools_under_block_policy(tmp_path):
+    spool_path = tmp_path / "spool"
+    pq = PublishQueue(max_size=1, policy="block", spool_path=str(spool_path),
+                      publish_batch=RecordingPublisher())
+    pq.submit({"order_id": "ORDER1"}, block=False)
+    # Full, and the worker is not started: an event loop caller must not wait.
+    pq.submit({"order_id": "ORDER2"}, block=False)
+    assert [json.loads(line)["order_id"] for line in spool_path.read_text().splitlines()] == ["ORDER2"]
+    assert pq.stats()["spooled"] == 1
+
+def test_torn_spool_line_is_set_aside(tmp_path):
+    spool_path = tmp_path / "spool"
+    # The last line was cut off by a crash in the middle of a write.
+    spool_path.write_text('{"order_id": "ORDER1"}\n{"order_id":"B')
+    publisher = RecordingPublisher()
+    pq = PublishQueue(max_size=10, policy="block", spool_path=str(spool_path), publish_batch=publisher).start()
+    pq.submit({"order_id": "ORDER2"})
+    pq.join()
+    assert pq._worker.is_alive()
+    pq.stop()
+
+    published = [order["order_id"] for batch in publisher.batches for order in batch]
+    assert published == ["ORDER1", "ORDER2"]
+    assert (tmp_path / "spool.bad").read_text() == '{"order_id":"B\n'
+    assert not (tmp_path / "spool.replay").exists()
+
+def test_unconfirmed_orders_are_spooled_under_every_policy(tmp_path):
+    spool_path = tmp_path / "spool"
+    pq = PublishQueue(max_size=10, policy="block", spool_path=str(spool_path),
+                      publish_batch=RecordingPublisher(fail_ids={"ORDER1"})).start()
+    pq.submit({"order_id": "ORDER1"})
+    pq.join()
+    pq.stop()
+    assert [json.loads(line)["order_id"] for line in spool_path.read_text().splitlines()] == ["ORDER1"]
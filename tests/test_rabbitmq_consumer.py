@@ -3,6 +3,7 @@ import time
 import threading
 import pytest
 import logging
+from types import SimpleNamespace
 
 import pika
 from rabbitmq_consumer import get_rabbitmq_connection, start_order_consumer
@@ -49,4 +50,163 @@ def test_consumer_process_order(publish_test_order):
 
     expected_order_id = publish_test_order.get("order_id")
     assert any(order.get("order_id") == expected_order_id for order in processed_orders), \
-        "Consumer did not process the order as expected."
\ No newline at end of file
+        "Consumer did not process the order as expected."
+
+class FakeConnection:
+    def __init__(self):
+        self.timers = {}
+        self.callbacks = []
+        self.callbacks_lock = threading.Lock()
+
+    def add_callback_threadsafe(self, callback):
+        with self.callbacks_lock:
+            self.callbacks.append(callback)
+
+    def process_data_events(self, time_limit=None):
+        with self.callbacks_lock:
+            callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def call_later(self, delay, callback):
+        timer = len(self.timers) + 1
+        self.timers[timer] = callback
+        return timer
+
+    def remove_timeout(self, timer):
+        self.timers.pop(timer, None)
+
+    def fire_timers(self):
+        timers, self.timers = self.timers, {}
+        for callback in timers.values():
+            callback()
+
+
+class FakeChannel:
+    def __init__(self):
+        self.settled = []
+
+    def basic_ack(self, delivery_tag, multiple=False):
+        self.settled.append(("ack", delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag, multiple=False, requeue=True):
+        self.settled.append(("nack", delivery_tag, multiple, requeue))
+
+
+def deliver(batcher, channel, tag, body):
+    batcher.on_message(channel, SimpleNamespace(delivery_tag=tag), None, body)
+
+def test_batcher_acks_full_batches_with_one_multiple_ack():
+    from rabbitmq_consumer import OrderBatcher
+    connection, channel, batches = FakeConnection(), FakeChannel(), []
+    batcher = OrderBatcher(connection, channel, lambda orders: batches.append(orders) or len(orders), batch_size=3)
+    for tag in (1, 2, 3, 4):
+        deliver(batcher, channel, tag, json.dumps({"order_id": f"ORDER{tag}"}))
+    assert [[o["order_id"] for o in batch] for batch in batches] == [["ORDER1", "ORDER2", "ORDER3"]]
+    assert channel.settled == [("ack", 3, True)]
+
+    # The partial batch is flushed by the timer.
+    connection.fire_timers()
+    assert channel.settled[-1] == ("ack", 4, True)
+    assert batcher.stats["acked"] == 4
+
+def test_batcher_rejects_the_failed_order_and_requeues_the_tail():
+    from rabbitmq_consumer import OrderBatcher
+    connection, channel = FakeConnection(), FakeChannel()
+    batcher = OrderBatcher(connection, channel, lambda orders: 2, batch_size=5)
+    deliver(batcher, channel, 1, b"not json")
+    for tag in range(2, 7):
+        deliver(batcher, channel, tag, json.dumps({"order_id": f"ORDER{tag}"}))
+    assert channel.settled == [
+        ("nack", 1, False, False),  # undecodable
+        ("ack", 3, True),
+        ("nack", 4, False, False),
+        ("nack", 6, True, True),
+    ]
+    assert batcher.stats == {"batches": 1, "acked": 2, "rejected": 2, "requeued": 2, "duplicates": 0}
+
+def test_batcher_rejects_orders_that_do_not_fit_the_schema():
+    from rabbitmq_consumer import OrderBatcher
+    connection, channel, batches = FakeConnection(), FakeChannel(), []
+    batcher = OrderBatcher(connection, channel, lambda orders: batches.append(orders) or len(orders), batch_size=2)
+    deliver(batcher, channel, 1, json.dumps({"order_id": "ORDER1", "quantity": "ten"}))
+    deliver(batcher, channel, 2, json.dumps({"order_id": "ORDER2", "quantity": 5}))
+    deliver(batcher, channel, 3, json.dumps({"order_id": "ORDER3", "desk": "RATES"}))
+    assert channel.settled == [("nack", 1, False, False), ("ack", 3, True)]
+    assert batches == [[{"order_id": "ORDER2", "quantity": 5}, {"order_id": "ORDER3", "desk": "RATES"}]]
+
+def test_process_orders_returns_the_processed_prefix(monkeypatch):
+    import rabbitmq_consumer
+
+    def process_order(order, processed_orders=None):
+        if order["order_id"] == "BAD":
+            raise RuntimeError("boom")
+        processed_orders.append(order)
+
+    monkeypatch.setattr(rabbitmq_consumer, "process_order", process_order)
+    processed = []
+    orders = [{"order_id": "A"}, {"order_id": "BAD"}, {"order_id": "C"}]
+    assert rabbitmq_consumer.process_orders(orders, processed) == 1
+    assert processed == [{"order_id": "A"}]
+
+def test_dispatcher_keeps_per_key_order_and_acks_on_the_connection_thread():
+    from rabbitmq_consumer import KeyedWorkerPool, OrderDispatcher
+    connection, channel = FakeConnection(), FakeChannel()
+    seen, seen_lock = {}, threading.Lock()
+
+    def process(order):
+        if order["order_id"] == "BAD":
+            raise RuntimeError("boom")
+        time.sleep(0.001)
+        with seen_lock:
+            seen.setdefault(order["symbol"], []).append(order["order_id"])
+
+    dispatcher = OrderDispatcher(connection, channel, KeyedWorkerPool(4), process)
+    orders = [{"order_id": f"{symbol}-{i}", "symbol": symbol} for i in range(20) for symbol in ("A", "B", "C")]
+    orders.insert(7, {"order_id": "BAD", "symbol": "A"})
+    for tag, order in enumerate(orders, start=1):
+        deliver(dispatcher, channel, tag, json.dumps(order))
+    # Workers only queue settlements; nothing touches the channel until the connection thread runs them.
+    assert channel.settled == []
+    dispatcher.drain()
+
+    for symbol in ("A", "B", "C"):
+        assert seen[symbol] == [f"{symbol}-{i}" for i in range(20)]
+    bad_tag = orders.index({"order_id": "BAD", "symbol": "A"}) + 1
+    assert sorted(entry[1] for entry in channel.settled if entry[0] == "ack") == \
+        [tag for tag in range(1, len(orders) + 1) if tag != bad_tag]
+    assert ("nack", bad_tag, False, False) in channel.settled
+    assert dispatcher.stats == {"dispatched": 61, "acked": 60, "rejected": 1, "duplicates": 0}
+
+def test_batcher_acks_duplicates_without_processing_them():
+    from order_dedup import OrderDeduplicator
+    from rabbitmq_consumer import OrderBatcher
+    connection, channel, processed = FakeConnection(), FakeChannel(), []
+    batcher = OrderBatcher(connection, channel, lambda orders: processed.extend(orders) or len(orders),
+                           batch_size=2, dedup=OrderDeduplicator())
+    for tag, order_id in enumerate(["ORDER1", "ORDER1", "ORDER2", "ORDER1"], start=1):
+        deliver(batcher, channel, tag, json.dumps({"order_id": order_id}))
+    assert [order["order_id"] for order in processed] == ["ORDER1", "ORDER2"]
+    assert channel.settled == [("ack", 2, False), ("ack", 3, True), ("ack", 4, False)]
+    assert batcher.stats["duplicates"] == 2
+
+def test_batcher_requeues_the_whole_batch_and_pauses_when_the_hook_raises():
+    from rabbitmq_consumer import OrderBatcher
+    connection, channel, calls = FakeConnection(), FakeChannel(), []
+
+    def process(orders):
+        calls.append(len(orders))
+        if len(calls) == 1:
+            raise ConnectionError("database is down")
+        return len(orders)
+
+    batcher = OrderBatcher(connection, channel, process, batch_size=2, retry_delay_ms=10_000)
+    for tag in (1, 2, 3, 4):
+        deliver(batcher, channel, tag, json.dumps({"order_id": f"ORDER{tag}"}))
+    # The second full batch waits out the pause instead of hitting the database again.
+    assert calls == [2]
+    assert channel.settled == [("nack", 2, True, True)]
+    batcher._paused_until = 0
+    connection.fire_timers()
+    assert calls == [2, 2]
+    assert channel.settled[-1] == ("ack", 4, True)
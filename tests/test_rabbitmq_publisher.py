@@ -0,0 +1,103 @@
+import json
+import pika
+import pytest
+
+from rabbitmq_publisher import RabbitMQPublisher
+
+
+class FakeChannel:
+    def __init__(self, connection):
+        self.connection = connection
+        self.is_open = True
+        self.confirming = False
+        self.declared = []
+        self.published = []
+
+    def confirm_delivery(self):
+        self.confirming = True
+
+    def queue_declare(self, queue, durable):
+        self.declared.append(queue)
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        if self.connection.fail_next_publish:
+            self.connection.fail_next_publish = False
+            self.connection.is_open = False
+            raise pika.exceptions.StreamLostError("connection reset")
+        order = json.loads(body)
+        self.published.append((routing_key, order))
+        # Like BlockingChannel in confirm mode: a nacked publish raises.
+        if self.confirming and order.get("reject"):
+            raise pika.exceptions.NackError([])
+
+
+class FakeConnection:
+    def __init__(self):
+        self.is_open = True
+        self.fail_next_publish = False
+        self.channels = []
+
+    def channel(self):
+        ch = FakeChannel(self)
+        self.channels.append(ch)
+        return ch
+
+    def process_data_events(self, time_limit=None):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture
+def connections():
+    return []
+
+@pytest.fixture
+def publisher(connections):
+    def factory():
+        conn = FakeConnection()
+        connections.append(conn)
+        return conn
+    return RabbitMQPublisher(pool_size=1, connection_factory=factory)
+
+def test_publisher_reuses_connection_and_declares_once(publisher, connections):
+    for i in range(3):
+        publisher.publish({"order_id": f"ORDER{i}"}, queue_name="orders")
+
+    assert len(connections) == 1
+    channel = connections[0].channels[0]
+    assert channel.declared == ["orders"]
+    assert [order["order_id"] for _, order in channel.published] == ["ORDER0", "ORDER1", "ORDER2"]
+
+def test_publisher_reconnects_after_broker_drop(publisher, connections):
+    publisher.publish({"order_id": "ORDER1"})
+    connections[0].fail_next_publish = True
+    publisher.publish({"order_id": "ORDER2"})
+
+    assert len(connections) == 2
+    # The queue is declared again on the fresh connection.
+    assert connections[1].channels[0].declared == ["orders"]
+    assert connections[1].channels[0].published == [("orders", {"order_id": "ORDER2"})]
+
+def test_publish_batch_reports_per_message_confirms(publisher, connections):
+    orders = [{"order_id": "ORDER1"}, {"order_id": "ORDER2", "reject": True}, {"order_id": "ORDER3"}]
+    results = publisher.publish_batch(iter(orders), queue_name="orders")
+
+    assert results == [True, False, True]
+    confirm_channel = connections[0].channels[1]
+    assert confirm_channel.confirming
+    assert [order["order_id"] for _, order in confirm_channel.published] == ["ORDER1", "ORDER2", "ORDER3"]
+
+def test_publish_batch_fails_the_rest_when_the_connection_drops(publisher, connections):
+    publisher.publish_batch([{"order_id": "ORDER0"}])
+    connections[0].fail_next_publish = True
+    results = publisher.publish_batch([{"order_id": "ORDER1"}, {"order_id": "ORDER2"}])
+    assert results == [False, False]
+    # The next batch reconnects and opens a fresh confirm channel.
+    assert publisher.publish_batch([{"order_id": "ORDER3"}]) == [True]
+    assert len(connections) == 2
+
+def test_publish_batch_marks_unserializable_orders_failed(publisher):
+    results = publisher.publish_batch([{"order_id": "ORDER1"}, {"order_id": object()}])
+    assert results == [True, False]
@@ -0,0 +1,40 @@
+import datetime
+import decimal
+
+import pytest
+
+import serializer
+
+ORDER = {"order_id": "ORDER1", "symbol": "BOND_XYZ", "quantity": 100, "price": 101.5,
+         "business_unit": "BU-001", "extra": {"nested": [1, 2]}}
+
+@pytest.mark.parametrize("backend", sorted(serializer.CODECS))
+def test_every_backend_round_trips_orders(backend):
+    dumps, loads = serializer.CODECS[backend]
+    encoded = dumps(ORDER)
+    assert isinstance(encoded, bytes)
+    assert loads(encoded) == ORDER
+    assert loads(encoded.decode()) == ORDER
+    assert loads(dumps({"at": datetime.datetime(2025, 2, 14, 12, 30), "price": decimal.Decimal("1.5")})) == \
+        {"at": "2025-02-14T12:30:00", "price": 1.5}
+    with pytest.raises(ValueError):
+        loads(b"{not json")
+    with pytest.raises(TypeError):
+        dumps({"order": object()})
+
+def test_decode_order_into_typed_struct():
+    order = serializer.decode_order(serializer.dumps(ORDER))
+    assert (order.order_id, order.symbol, order.quantity, order.price) == ("ORDER1", "BOND_XYZ", 100, 101.5)
+    assert serializer.order_to_dict(order) == {k: v for k, v in ORDER.items() if k != "extra"}
+    orders = serializer.decode_orders(serializer.dumps([ORDER, {"order_id": "ORDER2", "price": 5}]))
+    assert [o.order_id for o in orders] == ["ORDER1", "ORDER2"]
+    assert orders[1].price == 5.0
+    with pytest.raises(ValueError):
+        serializer.decode_order(b'{"order_id": "ORDER3", "quantity": "many"}')
+
+def test_decode_order_dict_checks_types_but_keeps_custom_fields():
+    assert serializer.decode_order_dict(serializer.dumps(ORDER)) == ORDER
+    assert serializer.decode_order_dict(b'{"order_id": "ORDER2", "price": 5}') == {"order_id": "ORDER2", "price": 5.0}
+    for body in (b'{"order_id": "ORDER3", "quantity": "many"}', b'{"symbol": "NO_ID"}', b'[1]', b'{not json'):
+        with pytest.raises(ValueError):
+            serializer.decode_order_dict(body)
@@ -0,0 +1,10 @@
+"""
+WSGI entry point for production serving:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from internal_api import create_app
+
+app = create_app()
+
+__all__ = ["app"]